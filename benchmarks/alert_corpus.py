@@ -0,0 +1,281 @@
+"""
+Labeled frame corpus for AlertDetector benchmarks.
+
+Corpus layout (one directory per sequence):
+
+    corpus/
+      <sequence_name>/
+        labels.json
+        0000.png
+        0001.png
+        ...
+
+labels.json:
+
+    {
+      "description": "free text",
+      "frames": [
+        {"file": "0000.png", "label": "any"},
+        {"file": "0001.png", "label": "none"},
+        {"file": "0002.png", "label": "high"}
+      ]
+    }
+
+Labels are the expected AlertDetector output for that frame:
+- "none": no alert expected (an alert here is a false positive)
+- "low" / "medium" / "high": that alert level expected
+- "any": don't care (detector warmup, a change settling into the background)
+
+generate_sequences() builds synthetic EVE-like sequences procedurally, so
+benchmarks run without recorded footage; save_corpus() writes them out in
+the format above for inspection or hand editing.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+LABELS = ("none", "low", "medium", "high", "any")
+WARMUP_FRAMES = 10  # Frames labeled "any" while a detector learns the scene
+SETTLE_FRAMES = 40  # Frames labeled "any" while a persistent change is absorbed
+
+
+@dataclass
+class FrameSequence:
+    """A named sequence of frames with one expected label per frame"""
+
+    name: str
+    frames: List[Image.Image] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+    description: str = ""
+
+    def append(self, frame: Image.Image, label: str):
+        """Add a frame and its expected label"""
+        if label not in LABELS:
+            raise ValueError(f"Unknown label '{label}', expected one of {LABELS}")
+        self.frames.append(frame)
+        self.labels.append(label)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+def load_sequence(path: Path) -> FrameSequence:
+    """Load one sequence directory (labels.json + frame files)"""
+    path = Path(path)
+    data = json.loads((path / "labels.json").read_text())
+    sequence = FrameSequence(name=path.name, description=data.get("description", ""))
+    for entry in data["frames"]:
+        with Image.open(path / entry["file"]) as img:
+            sequence.append(img.convert("RGB"), entry.get("label", "none"))
+    return sequence
+
+
+def load_corpus(root: Path) -> List[FrameSequence]:
+    """Load every sequence directory under root, sorted by name"""
+    root = Path(root)
+    return [
+        load_sequence(child)
+        for child in sorted(root.iterdir())
+        if child.is_dir() and (child / "labels.json").exists()
+    ]
+
+
+def save_corpus(sequences: List[FrameSequence], root: Path):
+    """Write sequences in corpus layout under root"""
+    root = Path(root)
+    for sequence in sequences:
+        seq_dir = root / sequence.name
+        seq_dir.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for index, (frame, label) in enumerate(zip(sequence.frames, sequence.labels)):
+            filename = f"{index:04d}.png"
+            frame.save(seq_dir / filename)
+            entries.append({"file": filename, "label": label})
+        (seq_dir / "labels.json").write_text(
+            json.dumps({"description": sequence.description, "frames": entries}, indent=2)
+        )
+
+
+# ---------------------------------------------------------------------------
+# Synthetic EVE-like scenes
+# ---------------------------------------------------------------------------
+
+
+class _SceneBuilder:
+    """Renders a space backdrop with UI chrome, plus per-frame effects"""
+
+    def __init__(self, size: Tuple[int, int], rng: np.random.Generator):
+        width, height = size
+        self.size = size
+        self.rng = rng
+
+        # Dark space with a faint nebula gradient and a star field
+        yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+        nebula = 18 * np.exp(
+            -(((xx - width * 0.3) ** 2 + (yy - height * 0.4) ** 2) / (0.1 * width**2))
+        )
+        base = np.zeros((height, width, 3), dtype=np.float32)
+        base[..., 0] = 8 + nebula * 0.6
+        base[..., 1] = 10 + nebula * 0.4
+        base[..., 2] = 18 + nebula
+        star_count = width * height // 400
+        sy = rng.integers(0, height, star_count)
+        sx = rng.integers(0, width, star_count)
+        base[sy, sx] = rng.integers(120, 255, (star_count, 1))
+
+        # UI chrome: overview panel, HUD, chat/Local window
+        self._panel(base, 0.78, 0.08, 0.2, 0.6)
+        self._panel(base, 0.35, 0.82, 0.3, 0.16)
+        self._panel(base, 0.01, 0.55, 0.18, 0.4)
+        self.base = base
+
+        # Planet pixels (precomputed so per-frame work only touches the disc)
+        cx, cy, r = width * 0.45, height * 0.5, 0.55 * height
+        inside = (xx - cx) ** 2 + (yy - cy) ** 2 < r * r
+        self._planet_mask = inside
+        self._planet_v = (yy[inside] - cy) / r * 12
+        self._planet_u = (xx[inside] - cx) / r * 3
+
+        # Bank of capture-noise fields, cycled per frame (cheaper than fresh noise)
+        self._noise = [rng.normal(0, 3, base.shape).astype(np.float32) for _ in range(8)]
+        self._frame_index = 0
+
+    def _panel(self, arr: np.ndarray, x: float, y: float, w: float, h: float):
+        width, height = self.size
+        x0, y0 = int(x * width), int(y * height)
+        x1, y1 = int((x + w) * width), int((y + h) * height)
+        arr[y0:y1, x0:x1] = (28, 30, 34)
+        # Text-like rows
+        for row in range(y0 + 6, y1 - 4, 12):
+            arr[row : row + 4, x0 + 6 : x1 - int(self.rng.integers(6, max(7, (x1 - x0) // 2)))] = (
+                150,
+                155,
+                160,
+            )
+
+    def render(self, arr: np.ndarray) -> Image.Image:
+        """Add capture noise and convert to an RGB image"""
+        arr += self._noise[self._frame_index % len(self._noise)]
+        self._frame_index += 1
+        return Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8))
+
+    def planet(self, arr: np.ndarray, phase: float):
+        """Draw a large banded planet whose surface changes with phase"""
+        bands = 0.5 + 0.5 * np.sin(self._planet_v + np.sin(self._planet_u + phase) * 4)
+        arr[self._planet_mask] = np.stack(
+            [60 + 150 * bands, 50 + 90 * bands, 40 + 60 * bands], axis=1
+        )
+
+    def red_flash(self, arr: np.ndarray):
+        """Damage flash - the client tints the whole view red"""
+        arr[..., 0] = 225 + arr[..., 0] * 0.1
+        arr[..., 1] *= 0.15
+        arr[..., 2] *= 0.15
+
+    def popup(self, arr: np.ndarray):
+        """A large modal window (e.g. fleet invite, market) opens"""
+        width, height = self.size
+        arr[int(0.15 * height) : int(0.85 * height), int(0.15 * width) : int(0.75 * width)] = (
+            190,
+            192,
+            196,
+        )
+
+
+def _sequence_idle(builder: _SceneBuilder, length: int) -> FrameSequence:
+    seq = FrameSequence("idle_space", description="Static space view with UI; no alerts")
+    for i in range(length):
+        seq.append(builder.render(builder.base.copy()), "any" if i < WARMUP_FRAMES else "none")
+    return seq
+
+
+def _sequence_planet(builder: _SceneBuilder, length: int) -> FrameSequence:
+    seq = FrameSequence(
+        "planet_spin", description="Large animated planet/ship spin; animation must not alert"
+    )
+    for i in range(length):
+        arr = builder.base.copy()
+        builder.planet(arr, phase=i * 1.3)
+        seq.append(builder.render(arr), "any" if i < WARMUP_FRAMES else "none")
+    return seq
+
+
+def _sequence_damage(builder: _SceneBuilder, length: int) -> FrameSequence:
+    seq = FrameSequence("damage_flash", description="Red damage flashes on a static view")
+    flashes = {length // 3, (2 * length) // 3}
+    for i in range(length):
+        arr = builder.base.copy()
+        if i in flashes:
+            builder.red_flash(arr)
+            label = "high"
+        elif i - 1 in flashes or i < WARMUP_FRAMES:
+            label = "any"  # Recovery frame after a flash
+        else:
+            label = "none"
+        seq.append(builder.render(arr), label)
+    return seq
+
+
+def _sequence_popup(builder: _SceneBuilder, length: int) -> FrameSequence:
+    seq = FrameSequence("popup", description="Large window opens and stays open")
+    onset = length // 3
+    for i in range(length):
+        arr = builder.base.copy()
+        if i >= onset:
+            builder.popup(arr)
+        if i == onset:
+            label = "medium"
+        elif i < WARMUP_FRAMES or onset < i <= onset + SETTLE_FRAMES:
+            label = "any"
+        else:
+            label = "none"
+        seq.append(builder.render(arr), label)
+    return seq
+
+
+def _sequence_planet_damage(builder: _SceneBuilder, length: int) -> FrameSequence:
+    seq = FrameSequence(
+        "planet_damage", description="Damage flash while an animated planet is on screen"
+    )
+    flash = length // 2
+    for i in range(length):
+        arr = builder.base.copy()
+        builder.planet(arr, phase=i * 1.3)
+        if i == flash:
+            builder.red_flash(arr)
+            label = "high"
+        elif i < WARMUP_FRAMES or i == flash + 1:
+            label = "any"
+        else:
+            label = "none"
+        seq.append(builder.render(arr), label)
+    return seq
+
+
+def generate_sequences(
+    size: Tuple[int, int] = (960, 540), length: int = 60, seed: Optional[int] = 0
+) -> List[FrameSequence]:
+    """
+    Procedurally generate labeled EVE-like sequences
+
+    Args:
+        size: Frame size (width, height)
+        length: Frames per sequence
+        seed: RNG seed (None for a random corpus)
+
+    Returns:
+        List of FrameSequence
+    """
+    builder = _SceneBuilder(size, np.random.default_rng(seed))
+    return [
+        _sequence_idle(builder, length),
+        _sequence_planet(builder, length),
+        _sequence_damage(builder, length),
+        _sequence_popup(builder, length),
+        _sequence_planet_damage(builder, length),
+    ]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Accuracy and throughput benchmark for AlertDetector.
+
+Runs every detector configuration over a labeled frame corpus and reports
+frames/sec, p50/p99 analyze_frame latency and per-level precision/recall.
+
+Run with:
+    python benchmarks/benchmark_alerts.py                  # synthetic corpus
+    python benchmarks/benchmark_alerts.py --corpus DIR     # recorded corpus
+    python benchmarks/benchmark_alerts.py --generate DIR   # write synthetic corpus
+
+See benchmarks/alert_corpus.py for the corpus format.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from alert_corpus import (  # noqa: E402
+    FrameSequence,
+    generate_sequences,
+    load_corpus,
+    save_corpus,
+)
+
+from argus_overview.core.alert_detector import AlertConfig, AlertDetector  # noqa: E402
+
+# Detector configurations to compare (name -> AlertConfig overrides)
+CONFIGURATIONS: Dict[str, dict] = {
+    "default": {},
+    "sensitive": {"change_threshold": 0.15, "red_flash_threshold": 0.5},
+    "strict": {"change_threshold": 0.45, "red_flash_threshold": 0.85},
+    "fast-adapt": {"background_learning_rate": 0.15},
+}
+
+SCORED_LEVELS = ("low", "medium", "high")
+
+
+@dataclass
+class Counts:
+    """Confusion counts for one label class"""
+
+    tp: int = 0
+    fp: int = 0
+    fn: int = 0
+
+    @property
+    def precision(self) -> float:
+        return self.tp / (self.tp + self.fp) if self.tp + self.fp else 1.0
+
+    @property
+    def recall(self) -> float:
+        return self.tp / (self.tp + self.fn) if self.tp + self.fn else 1.0
+
+
+@dataclass
+class RunResult:
+    """Result of one configuration over the corpus"""
+
+    name: str
+    latencies_ms: List[float] = field(default_factory=list)
+    per_level: Dict[str, Counts] = field(default_factory=dict)
+    any_alert: Counts = field(default_factory=Counts)
+    false_positives: Dict[str, int] = field(default_factory=dict)  # sequence -> count
+
+    @property
+    def fps(self) -> float:
+        total_s = sum(self.latencies_ms) / 1000
+        return len(self.latencies_ms) / total_s if total_s else 0.0
+
+    def percentile(self, pct: float) -> float:
+        ordered = sorted(self.latencies_ms)
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+def score_frame(result: RunResult, sequence: str, expected: str, predicted: str):
+    """Update confusion counts for one frame ("any" frames are skipped)"""
+    if expected == "any":
+        return
+
+    for level in SCORED_LEVELS:
+        counts = result.per_level.setdefault(level, Counts())
+        if predicted == level and expected == level:
+            counts.tp += 1
+        elif predicted == level:
+            counts.fp += 1
+        elif expected == level:
+            counts.fn += 1
+
+    alert_expected = expected != "none"
+    alert_predicted = predicted != "none"
+    if alert_expected and alert_predicted:
+        result.any_alert.tp += 1
+    elif alert_predicted:
+        result.any_alert.fp += 1
+        result.false_positives[sequence] = result.false_positives.get(sequence, 0) + 1
+    elif alert_expected:
+        result.any_alert.fn += 1
+
+
+def run_configuration(name: str, overrides: dict, sequences: List[FrameSequence]) -> RunResult:
+    """Run one detector configuration over every sequence"""
+    result = RunResult(name=name)
+    for sequence in sequences:
+        # Fresh detector per sequence - each sequence is an independent client
+        detector = AlertDetector()
+        detector.set_config(AlertConfig(**overrides))
+        for frame, expected in zip(sequence.frames, sequence.labels):
+            start = time.perf_counter_ns()
+            level = detector.analyze_frame(sequence.name, frame)
+            result.latencies_ms.append((time.perf_counter_ns() - start) / 1_000_000)
+            score_frame(result, sequence.name, expected, level.value if level else "none")
+    return result
+
+
+def print_result(result: RunResult):
+    """Print one configuration's throughput and accuracy"""
+    print(f"\n{'=' * 60}")
+    print(f"Configuration: {result.name}")
+    print(f"{'=' * 60}")
+    print(f"  Frames:      {len(result.latencies_ms):,}")
+    print(f"  Throughput:  {result.fps:.1f} frames/sec")
+    print(f"  p50:         {result.percentile(50):.4f} ms")
+    print(f"  p99:         {result.percentile(99):.4f} ms")
+    print(f"  Mean:        {statistics.mean(result.latencies_ms):.4f} ms")
+    print(
+        f"  Any alert:   precision {result.any_alert.precision:.3f}  "
+        f"recall {result.any_alert.recall:.3f}"
+    )
+    for level in SCORED_LEVELS:
+        counts = result.per_level.get(level)
+        if counts is None or counts.tp + counts.fp + counts.fn == 0:
+            continue
+        print(
+            f"  {level.upper():<11}  precision {counts.precision:.3f}  recall {counts.recall:.3f}"
+            f"  (tp={counts.tp} fp={counts.fp} fn={counts.fn})"
+        )
+    if result.false_positives:
+        worst = ", ".join(f"{seq}={n}" for seq, n in sorted(result.false_positives.items()))
+        print(f"  False positives by sequence: {worst}")
+
+
+def main(argv=None) -> int:
+    """Run the alert accuracy/throughput benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--corpus", type=Path, help="Labeled corpus directory to benchmark")
+    parser.add_argument("--generate", type=Path, help="Write the synthetic corpus here and exit")
+    parser.add_argument("--length", type=int, default=60, help="Synthetic frames per sequence")
+    parser.add_argument("--width", type=int, default=960, help="Synthetic frame width")
+    parser.add_argument("--height", type=int, default=540, help="Synthetic frame height")
+    parser.add_argument(
+        "--config",
+        action="append",
+        choices=sorted(CONFIGURATIONS),
+        help="Configuration(s) to run (default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        sequences = load_corpus(args.corpus)
+        source = str(args.corpus)
+    else:
+        sequences = generate_sequences(size=(args.width, args.height), length=args.length)
+        source = f"synthetic {args.width}x{args.height}"
+
+    if args.generate:
+        save_corpus(sequences, args.generate)
+        print(f"Wrote {len(sequences)} sequences to {args.generate}")
+        return 0
+
+    if not sequences:
+        print("No sequences found")
+        return 1
+
+    print("\n" + "=" * 60)
+    print("ARGUS OVERVIEW ALERT DETECTOR BENCHMARK")
+    print("=" * 60)
+    print(f"Corpus: {source} - {len(sequences)} sequences, {sum(map(len, sequences))} frames")
+
+    for name in args.config or list(CONFIGURATIONS):
+        print_result(run_configuration(name, CONFIGURATIONS[name], sequences))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,8 +6,18 @@ Run with: python benchmarks/benchmark_core.py
 
 Tests performance-critical paths:
 - Alert detection (frame analysis)
+- Template matching (icon zones)
+- Hostile-in-Local color LUT
 - Image conversion (PIL to QImage)
+- Thumbnail renderers (widget per client vs single canvas)
+- Animation clock wakeups
+- Preview add/remove churn (widget pool)
+- FlowLayout re-flow (cached hints, row-break index)
 - wmctrl caching
+- Window activation (xdotool vs EWMH client message)
+- Key broadcast (xdotool per window vs one X batch)
+- Bulk window operations (serial vs pooled)
+- Hung client on a single capture worker (no breaker vs circuit breaker)
 - Window capture processing
 """
 
@@ -15,6 +25,7 @@ import gc
 import statistics
 import sys
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Callable, List
 from unittest.mock import MagicMock, patch
@@ -92,9 +103,451 @@ def benchmark_alert_detection():
     print_results("Alert Detection - Red Frame", results)
 
 
+def benchmark_change_regions():
+    """Benchmark change-region localization against the background update."""
+    import numpy as np
+
+    from argus_overview.core.background_model import BackgroundModel, find_change_regions
+
+    model = BackgroundModel((90, 160))
+    frame = np.full((90, 160), 50, dtype=np.uint8)
+    model.update(frame)
+
+    def update_model():
+        model.update(frame)
+
+    results = benchmark(update_model, iterations=2000)
+    print_results("Background Model Update - 160x90", results)
+
+    mask = np.zeros((90, 160), dtype=bool)
+    mask[10:40, 20:60] = True
+    mask[50:90, 120:160] = True
+
+    def localize():
+        find_change_regions(mask)
+
+    results = benchmark(localize, iterations=2000)
+    print_results("Change Regions - 160x90 Mask, 2 Regions", results)
+
+
+def benchmark_template_matching():
+    """Benchmark template matching against a single icon zone."""
+    import numpy as np
+    from PIL import Image
+
+    from argus_overview.core.template_detector import TemplateMatcher, TemplateZone
+
+    # Noisy 1080p frame with a 24x24 icon planted inside the zone
+    rng = np.random.default_rng(0)
+    frame = Image.fromarray(rng.integers(0, 60, (1080, 1920, 3), dtype=np.uint8))
+    icon = np.zeros((24, 24, 3), dtype=np.uint8)
+    icon[4:20, 4:20] = (220, 40, 40)
+    icon[8:16, 8:16] = (255, 255, 255)
+    icon_image = Image.fromarray(icon)
+    frame.paste(icon_image, (1000, 800))
+
+    matcher = TemplateMatcher()
+    matcher.add_template("icon", icon_image)
+    zone = TemplateZone(name="hud", region=(0.45, 0.65, 0.15, 0.15), templates=["icon"])
+
+    def match_zone():
+        matcher.match_zone(frame, zone)
+
+    results = benchmark(match_zone, iterations=500)
+    print_results("Template Matching - 288x162 Zone, 1 Template", results)
+
+
+def benchmark_local_detection():
+    """Benchmark Hostile-in-Local LUT counting on a Local list region."""
+    from PIL import Image, ImageDraw
+
+    from argus_overview.core.local_detector import LocalDetector
+
+    detector = LocalDetector()
+    local_region = Image.new("RGB", (250, 600), color=(20, 20, 25))
+    draw = ImageDraw.Draw(local_region)
+    for y in range(0, 600, 40):
+        draw.rectangle([5, y, 14, y + 9], fill=(191, 0, 0))
+
+    def analyze_local():
+        detector.analyze("test_window", local_region)
+
+    results = benchmark(analyze_local, iterations=500)
+    print_results("Local Detection - 250x600 Region", results)
+
+
+def benchmark_alert_sampling_rates():
+    """Benchmark the full cost of the alert scheduler at each sampling rate.
+
+    Every sample goes through the real capture_sample_sync path. ImageMagick
+    `import` is replaced by a child process that box-scales a 1920x1080 frame
+    to 25% and writes it as PNG on stdout, so process spawn, scaling, encoding
+    and the in-process PNG decode are all counted. CPU is reported separately
+    for this process (scheduling, decode, analysis) and for the capture
+    children, together with the per-window rate actually achieved. The child
+    pays Python and PIL startup, so its CPU is an upper bound for a real grab.
+    """
+    import os
+    import subprocess
+
+    from argus_overview.core.alert_detector import AlertDetector
+    from argus_overview.core.alert_scheduler import AlertScheduler
+    from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+    windows = [f"0x{i:08x}" for i in range(1, 5)]
+    duration_s = 3.0
+    grab = (
+        "import sys; from PIL import Image; "
+        "Image.new('RGB', (1920, 1080), (30, 30, 40)).reduce(4).save(sys.stdout.buffer, 'PNG')"
+    )
+    real_run = subprocess.run
+
+    def simulated_import(cmd, **kwargs):
+        # Stand-in for `import -window <id> -silent -scale 25% png:-`
+        return real_run([sys.executable, "-c", grab], **kwargs)
+
+    capture = WindowCaptureThreaded()
+
+    print(f"\n{'=' * 60}")
+    print(f"Alert Sampling - cost per rate ({len(windows)} windows, simulated 25% grabs)")
+    print(f"{'=' * 60}")
+    print(
+        f"  {'Rate':>6}  {'Achieved/win':>12}  {'App CPU ms/s':>12}  "
+        f"{'Grab CPU ms/s':>13}  {'CPU/sample':>10}"
+    )
+
+    with patch(
+        "argus_overview.core.window_capture_threaded.subprocess.run", side_effect=simulated_import
+    ):
+        for rate_hz in (1, 2, 5, 10):
+            detector = AlertDetector()
+            scheduler = AlertScheduler(capture.capture_sample_sync, rate_hz=rate_hz)
+            scheduler.sample_ready.connect(detector.analyze_frame)
+            for window_id in windows:
+                scheduler.watch(window_id)
+
+            times_start = os.times()
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            scheduler.start()
+            time.sleep(duration_s)
+            achieved = scheduler.achieved_rate_hz()
+            scheduler.stop()
+            time.sleep(0.5)  # Let captures still running finish and be reaped
+            wall_s = time.perf_counter() - wall_start
+            app_ms = (time.process_time() - cpu_start) * 1000
+            times_end = os.times()
+            grab_ms = (
+                (times_end.children_user - times_start.children_user)
+                + (times_end.children_system - times_start.children_system)
+            ) * 1000
+
+            samples = scheduler.samples_taken
+            per_sample = (app_ms + grab_ms) / samples if samples else 0.0
+            print(
+                f"  {rate_hz:>4} Hz  {achieved:>9.2f} Hz  {app_ms / wall_s:>12.1f}  "
+                f"{grab_ms / wall_s:>13.1f}  {per_sample:>7.1f} ms"
+            )
+
+
+def benchmark_thumbnail_renderers():
+    """Benchmark widget-per-client previews against the single-canvas wall.
+
+    Each round pushes a new frame to every client, or to one client, and
+    then flushes the resulting paint events, so the numbers include layout,
+    the opacity effects and painting.
+    """
+    from PIL import Image
+    from PySide6.QtWidgets import QApplication, QScrollArea, QWidget
+
+    from argus_overview.ui.main_tab import FlowLayout, WindowPreviewWidget
+    from argus_overview.ui.thumbnail_wall import ThumbnailTile, ThumbnailWall
+
+    app = QApplication.instance()
+    frame = Image.new("RGB", (276, 155), color=(30, 30, 40))
+
+    def build_widgets(count):
+        container = QWidget()
+        layout = FlowLayout(margin=15, spacing=15)
+        container.setLayout(layout)
+        frames = []
+        for i in range(count):
+            widget = WindowPreviewWidget(f"0x{i:08x}", f"Pilot {i}", MagicMock())
+            layout.addWidget(widget)
+            frames.append(widget)
+        return container, frames
+
+    def build_wall(count):
+        wall = ThumbnailWall()
+        frames = []
+        for i in range(count):
+            tile = ThumbnailTile(f"0x{i:08x}", f"Pilot {i}", MagicMock())
+            wall.add_tile(tile)
+            frames.append(tile)
+        return wall, frames
+
+    print(f"\n{'=' * 60}")
+    print("Thumbnail renderers - frame update + repaint")
+    print(f"{'=' * 60}")
+    print(f"  {'Clients':>7}  {'Renderer':>8}  {'All frames':>11}  {'One frame':>10}")
+
+    for count in (10, 20, 40):
+        for name, build in (("widgets", build_widgets), ("canvas", build_wall)):
+            content, frames = build(count)
+            scroll = QScrollArea()
+            scroll.setWidgetResizable(True)
+            scroll.setWidget(content)
+            scroll.resize(1600, 1200)
+            scroll.show()
+            app.processEvents()
+
+            def update_all(frames=frames):
+                for preview in frames:
+                    preview.update_frame(frame)
+                app.processEvents()
+
+            def update_one(preview=frames[0]):
+                preview.update_frame(frame)
+                app.processEvents()
+
+            all_ms = benchmark(update_all, iterations=50)["mean_ms"]
+            one_ms = benchmark(update_one, iterations=200)["mean_ms"]
+            print(f"  {count:>7}  {name:>8}  {all_ms:>8.3f} ms  {one_ms:>7.3f} ms")
+
+            scroll.close()
+            scroll.deleteLater()
+            app.processEvents()
+
+
+def benchmark_preview_churn():
+    """Benchmark removing and re-adding 30 previews (clients relogging).
+
+    Without the pool every cycle deletes 30 WindowPreviewWidgets and builds
+    30 new ones (labels, layout, opacity effect); with it they are reset and
+    rebound. Each cycle includes the deferred deletes and the relayout.
+    """
+    from PySide6.QtCore import QEvent
+    from PySide6.QtWidgets import QApplication, QScrollArea, QWidget
+
+    from argus_overview.ui.main_tab import FlowLayout, WindowManager
+
+    app = QApplication.instance()
+    clients = 30
+
+    print(f"\n{'=' * 60}")
+    print(f"Preview churn - remove + re-add {clients} clients")
+    print(f"{'=' * 60}")
+
+    for label, pool_size in (("new widgets", 0), ("pooled", clients)):
+        alert_detector = MagicMock()
+        alert_detector.config.alert_cooldown = 5
+        manager = WindowManager(MagicMock(), MagicMock(), alert_detector)
+        manager.MAX_POOLED_FRAMES = pool_size
+
+        content = QWidget()
+        layout = FlowLayout(margin=15, spacing=15)
+        content.setLayout(layout)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(content)
+        scroll.resize(1600, 1200)
+        scroll.show()
+
+        def add_all(manager=manager, layout=layout):
+            for i in range(clients):
+                layout.addWidget(manager.add_window(f"0x{i:08x}", f"Pilot {i}"))
+
+        def churn(manager=manager, add_all=add_all):
+            for window_id in list(manager.preview_frames):
+                manager.remove_window(window_id)
+            add_all()
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+            app.processEvents()
+
+        add_all()
+        app.processEvents()
+        result = benchmark(churn, iterations=30, warmup=3)
+        print(
+            f"  {label:>11}: {result['mean_ms']:7.2f} ms/cycle "
+            f"(median {result['median_ms']:.2f} ms), "
+            f"{manager.frames_created} widgets built, {manager.frames_reused} reused"
+        )
+
+        scroll.close()
+        scroll.deleteLater()
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def benchmark_flow_layout():
+    """Benchmark FlowLayout caching against full re-layouts, 40 previews.
+
+    The uncached variant reproduces the previous behavior: every
+    heightForWidth and minimumSize query walks all items and every
+    setGeometry re-places every item.
+    """
+    from PySide6.QtCore import QRect
+    from PySide6.QtWidgets import QApplication, QScrollArea, QWidget
+
+    from argus_overview.ui.main_tab import FlowLayout, WindowPreviewWidget
+
+    class UncachedFlowLayout(FlowLayout):
+        def heightForWidth(self, width):
+            return self._do_layout(QRect(0, 0, width, 0), test_only=True)
+
+        def minimumSize(self):
+            self._min_size = None
+            return super().minimumSize()
+
+        def _first_dirty_row(self, rect):
+            return 0
+
+    app = QApplication.instance()
+    clients = 40
+
+    print(f"\n{'=' * 60}")
+    print(f"FlowLayout - {clients} previews")
+    print(f"{'=' * 60}")
+    print(f"  {'Layout':>9}  {'Re-add last':>12}  {'Resize':>10}  {'Items placed':>13}")
+
+    for label, layout_class in (("full", UncachedFlowLayout), ("cached", FlowLayout)):
+        content = QWidget()
+        layout = layout_class(margin=15, spacing=15)
+        content.setLayout(layout)
+        previews = [
+            WindowPreviewWidget(f"0x{i:08x}", f"Pilot {i}", MagicMock()) for i in range(clients)
+        ]
+        for preview in previews:
+            layout.addWidget(preview)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(content)
+        scroll.resize(1600, 1200)
+        scroll.show()
+        app.processEvents()
+
+        def readd_last(layout=layout, preview=previews[-1]):
+            layout.removeWidget(preview)
+            layout.addWidget(preview)
+            app.processEvents()
+
+        widths = iter([1500, 1600] * 1000)
+
+        def resize(scroll=scroll, widths=widths):
+            scroll.resize(next(widths), 1200)
+            app.processEvents()
+
+        layout.items_placed = 0
+        readd_ms = benchmark(readd_last, iterations=100, warmup=0)["mean_ms"]
+        placed = layout.items_placed / 100
+        resize_ms = benchmark(resize, iterations=100, warmup=0)["mean_ms"]
+        print(f"  {label:>9}  {readd_ms:>9.3f} ms  {resize_ms:>7.3f} ms  {placed:>10.1f}/op")
+
+        scroll.close()
+        scroll.deleteLater()
+        app.processEvents()
+
+
+def benchmark_animation_wakeups():
+    """Measure animation-clock wakeups for 40 previews.
+
+    Before the shared clock, each preview ran its own 10 Hz flash timer
+    while alerting, plus a session timer. The clock wakes at 10 Hz only
+    while something flashes, whatever the client count.
+    """
+    from PySide6.QtWidgets import QApplication
+
+    from argus_overview.core.alert_detector import AlertLevel
+    from argus_overview.ui.animation_clock import AnimationClock
+    from argus_overview.ui.main_tab import WindowPreviewWidget
+
+    app = QApplication.instance()
+    AnimationClock.reset_instance()
+    clock = AnimationClock.get_instance()
+    widgets = [WindowPreviewWidget(f"0x{i:08x}", f"Pilot {i}", MagicMock()) for i in range(40)]
+    duration_s = 1.0
+
+    def run(label, alerting):
+        for widget in widgets[:alerting]:
+            widget.set_alert(AlertLevel.HIGH)
+        start_ticks = clock.ticks
+        deadline = time.perf_counter() + duration_s
+        while time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.005)
+        wakeups = (clock.ticks - start_ticks) / duration_s
+        print(f"  {label:<22}  {wakeups:>8.1f}/s  (per-widget timers: {alerting * 10}/s)")
+
+    print(f"\n{'=' * 60}")
+    print(f"Animation clock - wakeups ({len(widgets)} previews)")
+    print(f"{'=' * 60}")
+    run("idle", 0)
+    run("1 alerting", 1)
+    run(f"{len(widgets)} alerting", len(widgets))
+
+    for widget in widgets:
+        widget.deleteLater()
+    AnimationClock.reset_instance()
+
+
+@contextmanager
+def count_frame_copies():
+    """Count full-frame pixel passes made through PIL/Qt while active.
+
+    Yields a dict with:
+      pack    - PIL tobytes() (pixels copied out of PIL)
+      convert - QImage format conversions (explicit)
+      scale   - PIL/QImage/QPixmap rescales
+      upload  - QPixmap.fromImage calls
+      upload_convert - uploads that also need a format conversion
+    """
+    from PIL import Image
+    from PySide6.QtGui import QImage, QPixmap
+
+    from argus_overview.core.window_capture_threaded import NATIVE_QIMAGE_FORMATS
+
+    counts = dict.fromkeys(("pack", "convert", "scale", "upload", "upload_convert"), 0)
+
+    def counted(key, original):
+        def wrapper(*args, **kwargs):
+            counts[key] += 1
+            return original(*args, **kwargs)
+
+        return wrapper
+
+    original_from_image = QPixmap.fromImage
+
+    def from_image(image, *args, **kwargs):
+        counts["upload"] += 1
+        if image.format() not in NATIVE_QIMAGE_FORMATS:
+            counts["upload_convert"] += 1
+        return original_from_image(image, *args, **kwargs)
+
+    originals = [
+        (Image.Image, "tobytes", counted("pack", Image.Image.tobytes)),
+        (Image.Image, "resize", counted("scale", Image.Image.resize)),
+        (QImage, "convertToFormat", counted("convert", QImage.convertToFormat)),
+        (QImage, "convertTo", counted("convert", QImage.convertTo)),
+        (QImage, "scaled", counted("scale", QImage.scaled)),
+        (QPixmap, "scaled", counted("scale", QPixmap.scaled)),
+        (QPixmap, "fromImage", staticmethod(from_image)),
+    ]
+    saved = [(owner, name, owner.__dict__[name]) for owner, name, _ in originals]
+    for owner, name, replacement in originals:
+        setattr(owner, name, replacement)
+    try:
+        yield counts
+    finally:
+        for owner, name, original in saved:
+            setattr(owner, name, original)
+
+
 def benchmark_pil_to_qimage():
-    """Benchmark PIL to QImage conversion."""
+    """Benchmark PIL to QImage conversion and per-frame copy counts."""
+    import io
+
     from PIL import Image
+    from PySide6.QtCore import QSize, Qt
+    from PySide6.QtGui import QImage, QPixmap
 
     from argus_overview.ui.main_tab import pil_to_qimage
 
@@ -121,32 +574,87 @@ def benchmark_pil_to_qimage():
     results = benchmark(convert_large, iterations=500)
     print_results("PIL->QImage - 1920x1080 (full)", results)
 
+    # Full frame path: capture (1080p PNG) -> 320x180 preview label
+    label = QSize(320, 180)
+    buffer = io.BytesIO()
+    large_image.save(buffer, "PNG")
+    png = buffer.getvalue()
+    zoomed = large_image.resize((576, 324))  # What the PIL worker hands over at zoom 0.3
+
+    def legacy_worker():
+        Image.open(io.BytesIO(png)).resize(zoomed.size, Image.Resampling.LANCZOS)
+
+    def legacy_gui():
+        # Previous update_frame: RGB888 QImage over tobytes(), upload, scale on the GUI thread
+        qimage = QImage(
+            zoomed.tobytes(), zoomed.width, zoomed.height, 3 * zoomed.width,
+            QImage.Format.Format_RGB888,
+        )  # fmt: skip
+        QPixmap.fromImage(qimage).scaled(
+            label, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
+        )
+
+    def native_worker():
+        qimage = QImage.fromData(png, "PNG")
+        return qimage.scaled(
+            qimage.size().scaled(label, Qt.AspectRatioMode.KeepAspectRatio),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    ready = native_worker()
+
+    def native_gui():
+        QPixmap.fromImage(ready)
+
+    paths = [
+        ("legacy (PIL on GUI thread)", legacy_worker, legacy_gui),
+        ("worker QImage (RGB32)", native_worker, native_gui),
+    ]
+
+    print(f"\n{'=' * 60}")
+    print("Frame path - copies per frame (1080p capture -> 320x180 label)")
+    print(f"{'=' * 60}")
+    print(f"  {'Path':<28} {'GUI copies':>10} {'Worker':>7} {'GUI ms':>8}")
+    for name, worker_stage, gui_stage in paths:
+        with count_frame_copies() as counts:
+            worker_stage()
+        worker_copies = counts["convert"] + counts["scale"] + counts["pack"]
+        with count_frame_copies() as counts:
+            gui_stage()
+        gui_copies = counts["pack"] + counts["convert"] + counts["scale"] + counts["upload_convert"]
+        gui_ms = benchmark(gui_stage, iterations=300)["mean_ms"]
+        print(f"  {name:<28} {gui_copies:>10} {worker_copies:>7} {gui_ms:>8.4f}")
+    print("  (copies exclude PNG decode and the pixmap upload itself)")
+
 
 def benchmark_wmctrl_cache():
-    """Benchmark wmctrl result caching."""
+    """Benchmark the shared window registry snapshot (one wmctrl query per TTL)."""
     from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+    from argus_overview.core.window_registry import WindowRegistry
 
     # Mock subprocess to avoid actual system calls
     mock_result = MagicMock()
     mock_result.returncode = 0
-    mock_result.stdout = """0x12345678  0 desktop  Window 1
-0x87654321  0 desktop  Window 2
-0x11111111  0 desktop  EVE - Character Name
+    mock_result.stdout = """0x12345678  0 1001 0    0    800  600  desktop Window 1
+0x87654321  0 1002 800 0    800  600  desktop Window 2
+0x11111111  0 1003 0    600  1920 1080 desktop EVE - Character Name
 """
 
+    WindowRegistry.reset_instance()
+    registry = WindowRegistry.get_instance()
     capture = WindowCaptureThreaded()
 
     with patch("subprocess.run", return_value=mock_result):
-        # First call - cache miss
+        # First call - snapshot expired
         def get_windows_cold():
-            capture._wmctrl_cache = {}  # Clear cache
-            capture._wmctrl_cache_time = 0
+            registry.invalidate()
             return capture.get_window_list()
 
         results = benchmark(get_windows_cold, iterations=500)
         print_results("wmctrl - Cache Miss (cold)", results)
 
-        # Subsequent calls - cache hit
+        # Subsequent calls - shared snapshot
         capture.get_window_list()  # Prime the cache
 
         def get_windows_cached():
@@ -155,6 +663,247 @@ def benchmark_wmctrl_cache():
         results = benchmark(get_windows_cached, iterations=5000)
         print_results("wmctrl - Cache Hit (warm)", results)
 
+        print(f"  wmctrl queries: {registry.queries} for {500 + 1 + 5000} window list reads")
+
+    WindowRegistry.reset_instance()
+
+
+def benchmark_window_activation():
+    """Benchmark activating a client: xdotool spawn vs EWMH client message."""
+    import subprocess
+
+    from argus_overview.utils.window_control import WindowControl
+
+    # Spawn floor - every xdotool/wmctrl call pays at least this before doing anything
+    def spawn():
+        subprocess.run(["true"], capture_output=True)
+
+    results = benchmark(spawn, iterations=200)
+    print_results("Activation - subprocess spawn floor", results)
+
+    # Client message over the persistent connection (display mocked, python-xlib encoding)
+    display = MagicMock()
+    display.intern_atom.side_effect = lambda name: 1
+    WindowControl.reset_instance()
+    with patch("argus_overview.utils.window_control.open_display", return_value=display):
+        control = WindowControl.get_instance()
+        if not control.available:
+            print("\n  (python-xlib not installed, skipping EWMH activation)")
+            return
+
+        results = benchmark(lambda: control.activate("0x03800003"), iterations=5000)
+        print_results("Activation - EWMH client message", results)
+    WindowControl.reset_instance()
+
+    # End-to-end on a real desktop: request until _NET_ACTIVE_WINDOW reports it
+    from argus_overview.core.window_events import ActiveWindowWatcher
+    from argus_overview.core.window_registry import WindowRegistry
+
+    watcher = ActiveWindowWatcher()
+    if not watcher.start():
+        print("  (no X display, skipping end-to-end activation latency)")
+        return
+    try:
+        windows = [info.window_id for info in WindowRegistry.get_instance().snapshot()]
+        if len(windows) < 2:
+            print("  (fewer than two windows, skipping end-to-end activation latency)")
+            return
+
+        def wait_active(window_id: str) -> float:
+            start = time.perf_counter()
+            while watcher.active_window() != window_id and time.perf_counter() - start < 1.0:
+                time.sleep(0.0005)
+            return (time.perf_counter() - start) * 1000
+
+        previous = watcher.active_window()
+        control = WindowControl.get_instance()
+        for name, activate in (
+            ("xdotool", lambda wid: subprocess.run(["xdotool", "windowactivate", wid])),
+            ("EWMH", control.activate),
+        ):
+            times = []
+            for i in range(20):
+                window_id = windows[i % 2]
+                start = time.perf_counter()
+                activate(window_id)
+                times.append((time.perf_counter() - start) * 1000 + wait_active(window_id))
+            print(f"  {name} activate -> _NET_ACTIVE_WINDOW: {statistics.mean(times):.2f}ms mean")
+        if previous:
+            control.activate(previous)
+    finally:
+        watcher.stop()
+        WindowControl.reset_instance()
+
+
+def benchmark_key_broadcast():
+    """Benchmark broadcasting F1 to 20 clients: xdotool per window vs one X batch."""
+    import subprocess
+
+    from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+    from argus_overview.utils.window_control import WindowControl
+
+    window_ids = [f"0x{0x03800003 + i * 0x200000:08x}" for i in range(20)]
+    capture = WindowCaptureThreaded()
+    real_run = subprocess.run
+
+    def spawn_true(*_args, **_kwargs):
+        # Process spawn floor instead of xdotool (no X server needed)
+        return real_run(["true"], capture_output=True)
+
+    WindowControl.reset_instance()
+    with patch("argus_overview.utils.window_control.open_display", return_value=None), patch(
+        "argus_overview.core.window_capture_threaded.subprocess.run", spawn_true
+    ):
+        skews = []
+
+        def broadcast_subprocess():
+            capture.broadcast_key(window_ids, "F1")
+            skews.append(capture.last_broadcast_skew_ms)
+
+        results = benchmark(broadcast_subprocess, iterations=20, warmup=2)
+        print_results("Broadcast F1 x20 - subprocess per window", results)
+        print(f"  First-to-last client skew: {statistics.mean(skews):.2f}ms mean")
+    WindowControl.reset_instance()
+
+    class Window:
+        """Stand-in for an Xlib window: packs the event like send_event would"""
+
+        def __init__(self, xid):
+            self.id = xid
+
+        def send_event(self, event, event_mask=0, propagate=False):
+            return event._binary
+
+    # Plain stand-ins rather than MagicMock, whose call recording would dominate
+    display = MagicMock()
+    display.keysym_to_keycode.return_value = 67
+    display.keycode_to_keysym.return_value = 0xFFBE  # F1
+    display.screen.return_value.root = Window(0x1E3)
+    display.create_resource_object = lambda _kind, xid: Window(xid)
+    display.flush = lambda: None
+    with patch("argus_overview.utils.window_control.open_display", return_value=display):
+        if not WindowControl.get_instance().available:
+            print("\n  (python-xlib not installed, skipping X batch broadcast)")
+            return
+        skews = []
+
+        def broadcast_batch():
+            capture.broadcast_key(window_ids, "F1")
+            skews.append(capture.last_broadcast_skew_ms)
+
+        results = benchmark(broadcast_batch, iterations=500)
+        print_results("Broadcast F1 x20 - one X batch", results)
+        print(f"  First-to-last client skew: {statistics.mean(skews):.3f}ms mean, one flush")
+    WindowControl.reset_instance()
+
+
+def benchmark_bulk_window_ops():
+    """Benchmark minimize-all over 20 clients: serial subprocess calls vs BulkWindowOps."""
+    import subprocess
+
+    from argus_overview.core.window_ops import BulkWindowOps
+    from argus_overview.utils.window_control import WindowControl
+
+    window_ids = [f"0x{0x03800003 + i * 0x200000:08x}" for i in range(20)]
+
+    def minimize(_window_id):
+        # Stand-in for xdotool windowminimize: a process that waits ~5ms on the WM
+        return subprocess.run(["sleep", "0.005"], capture_output=True).returncode == 0
+
+    def serial():
+        return [minimize(window_id) for window_id in window_ids]
+
+    results = benchmark(serial, iterations=20, warmup=2)
+    print_results("Minimize all x20 - serial subprocess", results)
+
+    WindowControl.reset_instance()
+    with patch("argus_overview.utils.window_control.open_display", return_value=None):
+        ops = BulkWindowOps()
+        results = benchmark(lambda: ops.execute(window_ids, minimize), iterations=20, warmup=2)
+        print_results("Minimize all x20 - BulkWindowOps pool", results)
+    WindowControl.reset_instance()
+
+
+def benchmark_hung_window_capture():
+    """Benchmark one capture cycle of 10 clients on one worker while one client hangs."""
+    import subprocess
+
+    from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+    window_ids = [f"0x{0x03800003 + i * 0x200000:08x}" for i in range(10)]
+    hung = window_ids[0]
+    capture = WindowCaptureThreaded(max_workers=1)
+    capture.CAPTURE_TIMEOUT_S = 0.1  # Scaled down from 1s to keep the run short
+
+    def run(cmd, **kwargs):
+        # Stand-in for import: ~5ms per grab, the hung client blocks until the timeout
+        if cmd[2] == hung:
+            time.sleep(kwargs["timeout"])
+            raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+        time.sleep(0.005)
+        return MagicMock(returncode=0, stdout=b"png")
+
+    def cycle():
+        return [capture._capture_window_sync(window_id, 1.0) for window_id in window_ids]
+
+    with patch(
+        "argus_overview.core.window_capture_threaded.subprocess.run", side_effect=run
+    ), patch("argus_overview.core.window_capture_threaded.Image"), patch.object(
+        capture, "_ensure_prober"
+    ):
+        with patch.object(capture.breaker, "allow", return_value=True):
+            results = benchmark(cycle, iterations=10, warmup=1)
+            print_results("Capture cycle x10, 1 hung - no breaker", results)
+
+        capture.breaker.BACKOFF_BASE_S = 0.0  # Reach quarantine during warmup
+        results = benchmark(cycle, iterations=10, warmup=capture.breaker.QUARANTINE_AFTER)
+        print_results("Capture cycle x10, 1 hung - circuit breaker", results)
+        print(f"  Quarantined: {sorted(capture.unresponsive_windows())}")
+
+
+def benchmark_layout_apply():
+    """Benchmark a 20-client grid apply: serial --sync moves vs one LayoutTransaction."""
+    import subprocess
+
+    from argus_overview.core.layout_transaction import LayoutTransaction
+    from argus_overview.utils.window_control import WindowControl
+
+    window_ids = [f"0x{0x03800003 + i * 0x200000:08x}" for i in range(20)]
+    targets = {
+        window_id: ((i % 5) * 400, (i // 5) * 300, 400, 300)
+        for i, window_id in enumerate(window_ids)
+    }
+    # Re-applying after one client moved: half the grid is already in place
+    current = {
+        window_id: target if i % 2 else (0, 0, 640, 480)
+        for i, (window_id, target) in enumerate(targets.items())
+    }
+
+    def move_resize(_window_id, _x, _y, _w, _h):
+        # Stand-in for xdotool windowmove --sync + windowsize --sync, ~5ms each on the WM
+        subprocess.run(["sleep", "0.005"], capture_output=True)
+        return subprocess.run(["sleep", "0.005"], capture_output=True).returncode == 0
+
+    def serial():
+        return [move_resize(window_id, *targets[window_id]) for window_id in window_ids]
+
+    results = benchmark(serial, iterations=10, warmup=1)
+    print_results("Grid apply x20 - serial --sync", results)
+
+    def transaction():
+        layout = LayoutTransaction(move_resize)
+        for window_id, target in targets.items():
+            layout.add(window_id, *target)
+        return layout.commit()
+
+    WindowControl.reset_instance()
+    with patch("argus_overview.utils.window_control.open_display", return_value=None), patch.object(
+        LayoutTransaction, "_read_geometries", return_value=current
+    ):
+        results = benchmark(transaction, iterations=10, warmup=1)
+        print_results("Grid apply x20 - LayoutTransaction (10 unchanged)", results)
+    WindowControl.reset_instance()
+
 
 def benchmark_capture_queue():
     """Benchmark capture result queue processing."""
@@ -219,8 +968,8 @@ def benchmark_window_id_validation():
 
 
 def benchmark_screen_geometry():
-    """Benchmark screen geometry parsing."""
-    from argus_overview.utils.screen import get_screen_geometry
+    """Benchmark screen geometry: xrandr parse per call vs the monitor cache."""
+    from argus_overview.utils.screen import MonitorCache, get_screen_geometry
 
     mock_result = MagicMock()
     mock_result.returncode = 0
@@ -231,14 +980,28 @@ DP-2 connected 1920x1080+1920+0 (normal left inverted right x axis y axis) 527mm
    1920x1080     60.00*+
 """
 
-    with patch("subprocess.run", return_value=mock_result):
+    MonitorCache.reset_instance()
+    cache = MonitorCache.get_instance()
+    with patch("argus_overview.utils.screen.open_display", return_value=None), patch(
+        "subprocess.run", return_value=mock_result
+    ):
+
+        def get_geometry_uncached():
+            # Every call queries, as before the cache (a screen change each time)
+            cache.invalidate()
+            return get_screen_geometry(0)
+
+        results = benchmark(get_geometry_uncached, iterations=500)
+        print_results("Screen Geometry - xrandr parse (mocked spawn)", results)
 
         def get_geometry():
-            # Clear any caching by reimporting (if cached)
             return get_screen_geometry(0)
 
-        results = benchmark(get_geometry, iterations=500)
-        print_results("Screen Geometry - xrandr parse", results)
+        queries = cache.queries
+        results = benchmark(get_geometry, iterations=10000)
+        print_results("Screen Geometry - monitor cache hit", results)
+        print(f"  xrandr queries during cached lookups: {cache.queries - queries}")
+    MonitorCache.reset_instance()
 
 
 def main():
@@ -255,8 +1018,21 @@ def main():
     try:
         benchmark_window_id_validation()
         benchmark_wmctrl_cache()
+        benchmark_window_activation()
+        benchmark_key_broadcast()
+        benchmark_bulk_window_ops()
+        benchmark_hung_window_capture()
+        benchmark_layout_apply()
         benchmark_pil_to_qimage()
+        benchmark_thumbnail_renderers()
+        benchmark_animation_wakeups()
+        benchmark_preview_churn()
+        benchmark_flow_layout()
         benchmark_alert_detection()
+        benchmark_change_regions()
+        benchmark_template_matching()
+        benchmark_local_detection()
+        benchmark_alert_sampling_rates()
         benchmark_capture_queue()
         benchmark_screen_geometry()
 
@@ -274,9 +1050,23 @@ def main():
     # Performance targets
     print("\n📊 Performance Targets:")
     print("  - Alert detection: < 1ms per frame")
+    print("  - Change regions: <= background model update")
+    print("  - Template matching: < 1ms per zone")
+    print("  - Local detection (250x600): < 3ms")
+    print("  - Alert sampling (4 windows @ 5 Hz): < 20ms CPU per second")
     print("  - PIL->QImage (320x240): < 0.5ms")
+    print("  - Preview frame on GUI thread: 0 copies besides the pixmap upload")
+    print("  - Canvas renderer (40 clients, all frames): < widget renderer")
+    print("  - Preview churn (30 clients): pooled < new widgets")
+    print("  - FlowLayout re-add (40 previews): re-places only the last row")
+    print("  - Animation wakeups: 0/s idle, <= 10/s while alerting (any client count)")
     print("  - wmctrl cache hit: < 0.01ms")
+    print("  - Window activation: EWMH message << subprocess spawn floor")
+    print("  - Key broadcast (20 clients): one X flush, skew < 1ms")
+    print("  - Minimize all (20 clients): off the GUI thread, pool < serial")
+    print("  - Grid apply (20 clients): unchanged windows skipped, transaction < serial")
     print("  - Window ID validation: < 0.001ms")
+    print("  - Screen geometry (cached): < 0.01ms, no xrandr after the first lookup")
 
     return 0
 
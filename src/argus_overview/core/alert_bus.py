@@ -0,0 +1,163 @@
+"""
+Alert Event Bus - Cooldown enforcement and burst coalescing for visual alerts
+Sits between AlertDetector callbacks and the preview widgets so a burst of
+alerting frames turns into one batched UI update instead of a repaint storm
+"""
+
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from argus_overview.core.alert_detector import LEVEL_RANK, AlertLevel
+
+
+class AlertEventBus(QObject):
+    """
+    Coalescing event bus for visual alerts.
+
+    Features:
+    - Per-window, per-level cooldown (AlertConfig.alert_cooldown)
+    - A lower level is also suppressed while a higher one is cooling down
+    - Bursts posted within one flush interval collapse to a single event per
+      window, keeping the highest level
+    - One alerts_ready emission per flush for all windows (batched UI update)
+    """
+
+    alerts_ready = Signal(dict)  # {window_id: AlertLevel}
+
+    DEFAULT_FLUSH_INTERVAL_MS = 100
+
+    def __init__(
+        self,
+        cooldown_seconds: float = 5.0,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.cooldown = max(0.0, float(cooldown_seconds))
+        self.flush_interval_ms = flush_interval_ms
+
+        # State
+        self._last_fired: Dict[Tuple[str, AlertLevel], float] = {}
+        self._pending: Dict[str, AlertLevel] = {}
+
+        # Counters (for diagnostics and benchmarks)
+        self.posted_count = 0
+        self.suppressed_count = 0
+        self.delivered_count = 0
+        self.flush_count = 0
+
+        # Single-shot flush timer - armed by the first alert of a burst
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def set_cooldown(self, seconds: float):
+        """
+        Set the per-window, per-level cooldown
+
+        Args:
+            seconds: Minimum seconds between two alerts of the same level
+        """
+        self.cooldown = max(0.0, float(seconds))
+
+    def post(self, window_id: str, level: AlertLevel, now: Optional[float] = None) -> bool:
+        """
+        Post an alert for a window
+
+        Args:
+            window_id: Window that raised the alert
+            level: AlertLevel detected
+            now: Monotonic timestamp (defaults to time.monotonic())
+
+        Returns:
+            True if the alert was accepted, False if suppressed by cooldown
+        """
+        if level is None:
+            return False
+
+        self.posted_count += 1
+        if now is None:
+            now = time.monotonic()
+
+        if self._in_cooldown(window_id, level, now):
+            self.suppressed_count += 1
+            return False
+
+        self._last_fired[(window_id, level)] = now
+
+        # Coalesce: keep the highest level posted for this window in this burst
+        current = self._pending.get(window_id)
+        if current is None or LEVEL_RANK[level] > LEVEL_RANK[current]:
+            self._pending[window_id] = level
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(self.flush_interval_ms)
+
+        return True
+
+    def _in_cooldown(self, window_id: str, level: AlertLevel, now: float) -> bool:
+        """Check whether this level (or a higher one) fired within the cooldown"""
+        if self.cooldown <= 0:
+            return False
+
+        rank = LEVEL_RANK[level]
+        for other, other_rank in LEVEL_RANK.items():
+            if other_rank < rank:
+                continue
+            fired_at = self._last_fired.get((window_id, other))
+            if fired_at is not None and now - fired_at < self.cooldown:
+                return True
+        return False
+
+    def flush(self):
+        """Deliver all pending alerts as one batch"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = {}
+        self.flush_count += 1
+        self.delivered_count += len(batch)
+
+        self.logger.debug(f"Delivering {len(batch)} coalesced alert(s)")
+        self.alerts_ready.emit(batch)
+
+    def has_pending(self) -> bool:
+        """Check if alerts are waiting for the next flush"""
+        return bool(self._pending)
+
+    def clear(self, window_id: Optional[str] = None):
+        """
+        Clear cooldown and pending state
+
+        Args:
+            window_id: Specific window to clear, or None for all
+        """
+        if window_id is None:
+            self._last_fired.clear()
+            self._pending.clear()
+            self._flush_timer.stop()
+            return
+
+        self._pending.pop(window_id, None)
+        for key in [k for k in self._last_fired if k[0] == window_id]:
+            del self._last_fired[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get bus counters
+
+        Returns:
+            Dict with posted, suppressed, delivered and flushes counts
+        """
+        return {
+            "posted": self.posted_count,
+            "suppressed": self.suppressed_count,
+            "delivered": self.delivered_count,
+            "flushes": self.flush_count,
+        }
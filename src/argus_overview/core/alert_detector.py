@@ -4,13 +4,16 @@ Monitors windows for visual changes and triggers alerts
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 import numpy as np
 from PIL import Image
 
+from argus_overview.core.background_model import BackgroundModel, Region, find_change_regions
+
 
 class AlertLevel(Enum):
     """Alert severity levels"""
@@ -20,6 +23,30 @@ class AlertLevel(Enum):
     HIGH = "high"
 
 
+# Severity ordering used when combining detector results
+LEVEL_RANK = {AlertLevel.LOW: 0, AlertLevel.MEDIUM: 1, AlertLevel.HIGH: 2}
+
+
+def red_fraction(rgb: np.ndarray) -> float:
+    """Fraction of pixels that are red-dominant (damage flash color)
+
+    Args:
+        rgb: (..., 3) uint8 RGB array
+
+    Returns:
+        Fraction (0-1) of pixels with R > G+B and R > 200
+    """
+    r = rgb[..., 0].astype(np.int16)
+    g = rgb[..., 1].astype(np.int16)
+    b = rgb[..., 2].astype(np.int16)
+
+    # Red flash: R > G+B and R > threshold
+    red_dominant = (r > (g + b)) & (r > 200)
+    if red_dominant.size == 0:
+        return 0.0
+    return float(np.count_nonzero(red_dominant)) / red_dominant.size
+
+
 @dataclass
 class AlertConfig:
     """Configuration for alert detection"""
@@ -27,6 +54,8 @@ class AlertConfig:
     enabled: bool = True
     red_flash_threshold: float = 0.7  # Threshold for red flash detection
     change_threshold: float = 0.3  # Threshold for general screen change
+    background_learning_rate: float = 0.05  # EWMA weight of each frame in the background model
+    change_cell_size: int = 10  # Block size (comparison pixels) for change-region boxes
     alert_cooldown: int = 5  # Seconds between same alerts
     sound_enabled: bool = False
     visual_border: bool = True
@@ -37,20 +66,23 @@ class AlertConfig:
 class AlertDetector:
     """Detects visual activity in window captures"""
 
-    # Size for storing comparison frames (small to save memory)
-    COMPARISON_SIZE = (100, 100)
-
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.config = AlertConfig()
-        self.previous_frames = {}  # window_id -> small grayscale image for comparison
-        self.last_alert_times = {}  # window_id -> timestamp
+        self.background_models = {}  # window_id -> BackgroundModel of the small grayscale frame
+        self.change_regions = {}  # window_id -> regions of the last detected screen change
+        self.last_alert_times = {}  # window_id -> monotonic timestamp of last detected alert
         self.alert_callbacks = {}  # window_id -> callback function
+        self.template_matcher = None  # Optional TemplateMatcher for icon zones
 
     def set_config(self, config: AlertConfig):
         """Update alert configuration"""
         self.config = config
 
+    def set_template_matcher(self, matcher):
+        """Set (or clear with None) the TemplateMatcher used for icon zones"""
+        self.template_matcher = matcher
+
     def register_callback(self, window_id: str, callback: Callable):
         """Register callback for window alerts
 
@@ -63,15 +95,31 @@ class AlertDetector:
     def unregister_callback(self, window_id: str):
         """Unregister alert callback and clean up all window data"""
         self.alert_callbacks.pop(window_id, None)
-        self.previous_frames.pop(window_id, None)
+        self.background_models.pop(window_id, None)
+        self.change_regions.pop(window_id, None)
         self.last_alert_times.pop(window_id, None)
 
-    def analyze_frame(self, window_id: str, image: Image.Image) -> Optional[AlertLevel]:
+    def get_change_regions(self, window_id: str) -> List[Region]:
+        """Get bounding boxes of the last detected screen change
+
+        Args:
+            window_id: Window to query
+
+        Returns:
+            List of (x, y, width, height) fractions of the frame, largest first
+        """
+        return self.change_regions.get(window_id, [])
+
+    def analyze_frame(
+        self, window_id: str, image: Image.Image, frame_scale: float = 1.0
+    ) -> Optional[AlertLevel]:
         """Analyze a frame for alert conditions
 
         Args:
             window_id: Window being analyzed
             image: Current frame
+            frame_scale: Size of the frame relative to the window (alert samples
+                are downscaled); template zones are matched at this scale
 
         Returns:
             AlertLevel if alert detected, None otherwise
@@ -90,20 +138,32 @@ class AlertDetector:
             alert_level = AlertLevel.HIGH
             self.logger.info(f"RED FLASH detected in window {window_id}")
 
-        # Check for significant screen change
+        # Check for significant screen change against the window's background model
         # Convert to grayscale for comparison (reuse resized image)
         small_frame = small_rgb.convert("L")
 
-        if window_id in self.previous_frames:
-            if self._detect_screen_change_fast(small_frame, self.previous_frames[window_id]):
-                if alert_level is None:  # Don't downgrade from HIGH
-                    alert_level = AlertLevel.MEDIUM
-                self.logger.debug(f"Screen change detected in window {window_id}")
+        if self._detect_background_change(window_id, small_frame):
+            if alert_level is None:  # Don't downgrade from HIGH
+                alert_level = AlertLevel.MEDIUM
+            self.logger.debug(f"Screen change detected in window {window_id}")
+
+        # Template zones (standing tags, scram icon, ...) - may escalate the level
+        if self.template_matcher is not None and self.template_matcher.has_zones():
+            try:
+                for match in self.template_matcher.analyze(image, frame_scale):
+                    self.logger.debug(
+                        f"Template '{match.template}' matched in zone '{match.zone}' "
+                        f"of window {window_id} (score {match.score:.2f})"
+                    )
+                    if alert_level is None or LEVEL_RANK[match.level] > LEVEL_RANK[alert_level]:
+                        alert_level = match.level
+            except Exception as e:
+                self.logger.error(f"Template matching error: {e}")
 
-        # Store small frame for next comparison (~10KB vs ~6MB)
-        self.previous_frames[window_id] = small_frame
+        if alert_level:
+            self.last_alert_times[window_id] = time.monotonic()
 
-        # Trigger callback if alert detected
+        # Trigger callback if alert detected (cooldown/coalescing is AlertEventBus's job)
         if alert_level and window_id in self.alert_callbacks:
             try:
                 self.alert_callbacks[window_id](alert_level)
@@ -128,27 +188,33 @@ class AlertDetector:
             # Convert to RGB array (already small)
             img_array = np.array(small_rgb)
 
-            # Extract color channels
-            r = img_array[:, :, 0].astype(np.int16)
-            g = img_array[:, :, 1].astype(np.int16)
-            b = img_array[:, :, 2].astype(np.int16)
-
-            # Calculate red dominance
-            # Red flash: R > G+B and R > threshold
-            red_dominant = (r > (g + b)) & (r > 200)
-
-            # Calculate percentage of red pixels
-            total_pixels = r.size
-            red_pixels = np.sum(red_dominant)
-            red_percentage = red_pixels / total_pixels
-
             # Alert if significant portion is red
-            return red_percentage > self.config.red_flash_threshold
+            return red_fraction(img_array) > self.config.red_flash_threshold
 
         except Exception as e:
             self.logger.error(f"Red flash detection error: {e}")
             return False
 
+    def analyze_probe(self, pixels: np.ndarray) -> Optional[AlertLevel]:
+        """Classify sparse probe pixels (red flash only)
+
+        Keeps no per-window state, so it is safe to call from a probe thread.
+
+        Args:
+            pixels: (..., 3) RGB uint8 array of sampled pixels
+
+        Returns:
+            AlertLevel.HIGH if a red flash is detected, None otherwise
+        """
+        if not self.config.enabled or pixels.size == 0:
+            return None
+        try:
+            if red_fraction(pixels) > self.config.red_flash_threshold:
+                return AlertLevel.HIGH
+        except Exception as e:
+            self.logger.error(f"Probe analysis error: {e}")
+        return None
+
     def _detect_red_flash(self, image: Image.Image) -> bool:
         """Detect red flash in image (damage indicator)
 
@@ -187,53 +253,38 @@ class AlertDetector:
             self.logger.error(f"Red flash detection error: {e}")
             return False
 
-    def _detect_screen_change_fast(
-        self, current_small: Image.Image, previous_small: Image.Image
-    ) -> bool:
-        """Detect significant change between pre-resized frames
+    def _detect_background_change(self, window_id: str, small_frame: Image.Image) -> bool:
+        """Detect significant change against the window's EWMA background model
+
+        The first frame of a window only seeds the model. When change is
+        detected, its bounding boxes are stored for get_change_regions().
 
         Args:
-            current_small: Current frame (already resized to COMPARISON_SIZE, grayscale)
-            previous_small: Previous frame (already resized to COMPARISON_SIZE, grayscale)
+            window_id: Window being analyzed
+            small_frame: Current frame (RED_FLASH_SIZE, grayscale)
 
         Returns:
             True if significant change detected
         """
         try:
-            # Convert to arrays (already correct size and grayscale)
-            current_array = np.array(current_small).astype(np.int16)
-            previous_array = np.array(previous_small).astype(np.int16)
-
-            # Calculate difference
-            diff = np.abs(current_array - previous_array)
-
-            # Calculate percentage of changed pixels
-            total_pixels = diff.size
-            changed_pixels = np.sum(diff > 30)  # Threshold for pixel change
-            change_percentage = changed_pixels / total_pixels
-
-            # Alert if significant change
-            return change_percentage > self.config.change_threshold
-
-        except Exception as e:
-            self.logger.error(f"Screen change detection error: {e}")
+            frame_array = np.asarray(small_frame)
+            model = self.background_models.get(window_id)
+            if model is None or model.shape != frame_array.shape:
+                model = BackgroundModel(
+                    frame_array.shape, learning_rate=self.config.background_learning_rate
+                )
+                self.background_models[window_id] = model
+
+            change_percentage = model.update(frame_array)
+            if change_percentage > self.config.change_threshold:
+                self.change_regions[window_id] = find_change_regions(
+                    model.foreground, self.config.change_cell_size
+                )
+                return True
+
+            self.change_regions.pop(window_id, None)
             return False
 
-    def _detect_screen_change(self, current: Image.Image, previous: Image.Image) -> bool:
-        """Detect significant change between frames (legacy method)
-
-        Args:
-            current: Current frame
-            previous: Previous frame
-
-        Returns:
-            True if significant change detected
-        """
-        try:
-            # Resize and convert for comparison
-            current_small = current.resize(self.COMPARISON_SIZE).convert("L")
-            previous_small = previous.resize(self.COMPARISON_SIZE).convert("L")
-            return self._detect_screen_change_fast(current_small, previous_small)
         except Exception as e:
             self.logger.error(f"Screen change detection error: {e}")
             return False
@@ -245,8 +296,10 @@ class AlertDetector:
             window_id: Specific window to clear, or None for all
         """
         if window_id:
-            self.previous_frames.pop(window_id, None)
+            self.background_models.pop(window_id, None)
+            self.change_regions.pop(window_id, None)
             self.last_alert_times.pop(window_id, None)
         else:
-            self.previous_frames.clear()
+            self.background_models.clear()
+            self.change_regions.clear()
             self.last_alert_times.clear()
@@ -0,0 +1,202 @@
+"""
+Alert Probe - Sparse red-flash sampling over the native X connection
+Reads a handful of 1-pixel strips from each client instead of a full
+capture + resize, so damage alerts keep working at a high rate even when
+previews are slow or disabled
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+from argus_overview.core.alert_detector import AlertDetector, AlertLevel
+from argus_overview.utils.x11 import (
+    ALL_PLANES,
+    XLIB_AVAILABLE,
+    X,
+    XError,
+    open_display,
+    window_id_to_int,
+)
+
+
+class AlertProbe(QObject):
+    """
+    Samples a fixed lattice of horizontal strips from each watched window.
+
+    Features:
+    - Own X connection and thread, independent of the preview capture loop
+    - STRIP_COUNT full-width, 1-pixel-high strips per window per probe
+    - Window geometry cached and refreshed every GEOMETRY_REFRESH_S
+    - Results classified by AlertDetector.analyze_probe (red flash -> HIGH)
+    """
+
+    alert_detected = Signal(str, object)  # window_id, AlertLevel
+
+    DEFAULT_INTERVAL_MS = 100  # 10 Hz
+    STRIP_COUNT = 6
+    GEOMETRY_REFRESH_S = 2.0
+
+    def __init__(
+        self,
+        alert_detector: AlertDetector,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        strip_count: int = STRIP_COUNT,
+        parent=None,
+    ):
+        """
+        Args:
+            alert_detector: Detector whose config/thresholds classify probes
+            interval_ms: Probe interval per window
+            strip_count: Strips sampled per window
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.alert_detector = alert_detector
+        self.interval_ms = max(20, interval_ms)
+        self.strip_count = max(1, strip_count)
+
+        self._windows: List[str] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._stop_event.set()  # Start in stopped state
+        self._thread: Optional[threading.Thread] = None
+        self._display: Optional[Any] = None
+        self._geometry: Dict[str, Tuple[int, int, float]] = {}  # window_id -> (w, h, fetched_at)
+
+        # Counters (for diagnostics and benchmarks)
+        self.probe_count = 0
+        self.error_count = 0
+
+    @property
+    def running(self) -> bool:
+        """Thread-safe check if the probe thread is running"""
+        return not self._stop_event.is_set()
+
+    def watch(self, window_id: str):
+        """Start probing a window"""
+        with self._lock:
+            if window_id not in self._windows:
+                self._windows.append(window_id)
+
+    def unwatch(self, window_id: str):
+        """Stop probing a window"""
+        with self._lock:
+            if window_id in self._windows:
+                self._windows.remove(window_id)
+            self._geometry.pop(window_id, None)
+
+    def watched_windows(self) -> List[str]:
+        """Get a snapshot of watched window IDs"""
+        with self._lock:
+            return list(self._windows)
+
+    def start(self) -> bool:
+        """
+        Open the X connection and start the probe thread
+
+        Returns:
+            True if running (python-xlib available and display opened)
+        """
+        if self.running:
+            return True
+        if not XLIB_AVAILABLE:
+            self.logger.warning("python-xlib not available, alert probe disabled")
+            return False
+
+        self._display = open_display()
+        if self._display is None:
+            self.logger.warning("Could not open X display, alert probe disabled")
+            return False
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Alert probe started ({1000 // self.interval_ms} Hz)")
+        return True
+
+    def stop(self):
+        """Stop the probe thread and close the X connection"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._display is not None:
+            try:
+                self._display.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing probe display: {e}")
+            self._display = None
+
+    def _run(self):
+        """Probe thread loop"""
+        while not self._stop_event.wait(self.interval_ms / 1000.0):
+            self.poll_once()
+
+    def poll_once(self):
+        """Probe every watched window once"""
+        for window_id in self.watched_windows():
+            pixels = self.sample_window(window_id)
+            if pixels is None:
+                continue
+
+            self.probe_count += 1
+            level: Optional[AlertLevel] = self.alert_detector.analyze_probe(pixels)
+            if level is not None:
+                self.alert_detected.emit(window_id, level)
+
+    def strip_rows(self, height: int) -> List[int]:
+        """Evenly spaced strip rows, away from the window edges"""
+        step = height / (self.strip_count + 1)
+        return [int(step * (i + 1)) for i in range(self.strip_count)]
+
+    def sample_window(self, window_id: str) -> Optional[np.ndarray]:
+        """
+        Read the strip lattice of one window
+
+        Args:
+            window_id: X11 window ID
+
+        Returns:
+            (strip_count, width, 3) RGB array, or None if the window can't be read
+        """
+        if self._display is None:
+            return None
+
+        try:
+            window = self._display.create_resource_object("window", window_id_to_int(window_id))
+            width, height = self._window_size(window_id, window)
+            if width <= 0 or height <= 0:
+                return None
+
+            strips = np.empty((self.strip_count, width, 3), dtype=np.uint8)
+            for i, row in enumerate(self.strip_rows(height)):
+                reply = window.get_image(0, row, width, 1, X.ZPixmap, ALL_PLANES)
+                data = np.frombuffer(reply.data, dtype=np.uint8)
+                if data.size < width * 4:
+                    return None
+                # 24/32-bit ZPixmap is BGRX in memory
+                strips[i] = data[: width * 4].reshape(width, 4)[:, 2::-1]
+            return strips
+
+        except (XError, ValueError) as e:
+            # Unmapped/minimized or destroyed window - refetch geometry next time
+            self.error_count += 1
+            self._geometry.pop(window_id, None)
+            self.logger.debug(f"Probe failed for {window_id}: {e}")
+            return None
+
+    def _window_size(self, window_id: str, window) -> Tuple[int, int]:
+        """Cached window size, refreshed every GEOMETRY_REFRESH_S"""
+        now = time.monotonic()
+        cached = self._geometry.get(window_id)
+        if cached is not None and now - cached[2] < self.GEOMETRY_REFRESH_S:
+            return cached[0], cached[1]
+
+        geometry = window.get_geometry()
+        self._geometry[window_id] = (geometry.width, geometry.height, now)
+        return geometry.width, geometry.height
@@ -0,0 +1,214 @@
+"""
+Alert Scheduler - Alert sampling decoupled from the preview refresh rate
+Grabs low-resolution frames for alert analysis on its own threads, at its own
+per-window rate, so previews can run at 1 FPS (or be off entirely) while
+alerts are still sampled at several Hz
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Set
+
+from PIL import Image
+from PySide6.QtCore import QObject, Signal
+
+# (window_id, scale) -> low-res image or None
+SampleCapture = Callable[[str, float], Optional[Image.Image]]
+
+
+class AlertScheduler(QObject):
+    """
+    Per-window, concurrent low-res sampler feeding AlertDetector.
+
+    Each tick (1 / rate_hz) starts a capture of every watched window on a
+    small thread pool (captures are ImageMagick subprocesses, so they overlap)
+    and waits up to budget_ms for them. A capture still running when the next
+    tick comes - a slow or hung client - keeps only its own window out of
+    that tick; the others are sampled at rate_hz regardless. Frames are
+    emitted to the GUI thread, where they are analyzed.
+    """
+
+    sample_ready = Signal(str, object)  # window_id, PIL Image
+
+    DEFAULT_RATE_HZ = 5.0
+    DEFAULT_BUDGET_MS = 50.0
+    DEFAULT_SCALE = 0.25
+    MAX_RATE_HZ = 20.0
+    MAX_CONCURRENT = 4  # Captures running at once
+
+    def __init__(
+        self,
+        capture_sample: SampleCapture,
+        rate_hz: float = DEFAULT_RATE_HZ,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        scale: float = DEFAULT_SCALE,
+        parent=None,
+    ):
+        """
+        Args:
+            capture_sample: Callable(window_id, scale) -> low-res Image or None
+            rate_hz: Sampling rate per window
+            budget_ms: How long a tick waits for its captures; slower ones
+                finish in the background and their window skips ticks until then
+            scale: Capture scale passed to capture_sample
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.capture_sample = capture_sample
+        self.rate_hz = min(self.MAX_RATE_HZ, max(0.1, float(rate_hz)))
+        self.budget_ms = max(1.0, float(budget_ms))
+        self.scale = min(1.0, max(0.05, float(scale)))
+
+        self._windows: List[str] = []
+        self._in_flight: Set[str] = set()  # Windows with a capture still running
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._stop_event.set()  # Start in stopped state
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # Counters (for diagnostics and benchmarks)
+        self.samples_taken = 0
+        self.samples_deferred = 0  # Window ticks skipped because a capture was still running
+        self.cpu_seconds = 0.0  # Scheduler and capture thread CPU time
+        self._window_samples: Dict[str, int] = {}
+        self._counting_since = time.monotonic()
+
+    @property
+    def running(self) -> bool:
+        """Thread-safe check if the scheduler thread is running"""
+        return not self._stop_event.is_set()
+
+    @property
+    def interval_s(self) -> float:
+        """Tick interval in seconds"""
+        return 1.0 / self.rate_hz
+
+    def watch(self, window_id: str):
+        """Start sampling a window"""
+        with self._lock:
+            if window_id not in self._windows:
+                self._windows.append(window_id)
+
+    def unwatch(self, window_id: str):
+        """Stop sampling a window"""
+        with self._lock:
+            if window_id in self._windows:
+                self._windows.remove(window_id)
+
+    def watched_windows(self) -> List[str]:
+        """Get a snapshot of watched window IDs"""
+        with self._lock:
+            return list(self._windows)
+
+    def achieved_rates(self) -> Dict[str, float]:
+        """
+        Samples per second actually delivered for each watched window
+
+        Counted since start() (or construction); compare with rate_hz.
+
+        Returns:
+            Dict of window_id -> Hz
+        """
+        elapsed = max(1e-6, time.monotonic() - self._counting_since)
+        with self._lock:
+            return {
+                window_id: self._window_samples.get(window_id, 0) / elapsed
+                for window_id in self._windows
+            }
+
+    def achieved_rate_hz(self) -> float:
+        """Mean achieved per-window sampling rate (0 with nothing watched)"""
+        rates = self.achieved_rates()
+        return sum(rates.values()) / len(rates) if rates else 0.0
+
+    def start(self):
+        """Start the sampling thread"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        with self._lock:
+            self._window_samples.clear()
+        self._counting_since = time.monotonic()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.logger.info(
+            f"Alert scheduler started ({self.rate_hz:g} Hz, {self.budget_ms:g}ms budget)"
+        )
+
+    def stop(self):
+        """Stop the sampling thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)  # Running captures end on their own timeout
+            self._pool = None
+        rate = self.achieved_rate_hz()
+        if rate:
+            self.logger.info(
+                f"Alert scheduler stopped (achieved {rate:.2f} Hz per window "
+                f"of {self.rate_hz:g} Hz)"
+            )
+
+    def _run(self):
+        """Scheduler thread loop - fixed-rate ticks, skipping missed ones"""
+        next_tick = time.monotonic()
+        while True:
+            next_tick += self.interval_s
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Overran (slow captures) - realign instead of bursting
+                next_tick = time.monotonic()
+                delay = 0
+            if self._stop_event.wait(delay):
+                break
+
+            cpu_start = time.thread_time()
+            self.tick()
+            with self._lock:
+                self.cpu_seconds += time.thread_time() - cpu_start
+
+    def tick(self) -> int:
+        """
+        Start a capture of every watched window that isn't still being captured
+
+        Waits up to budget_ms for them; the rest finish in the background.
+
+        Returns:
+            Number of captures started
+        """
+        with self._lock:
+            due = [window_id for window_id in self._windows if window_id not in self._in_flight]
+            self.samples_deferred += len(self._windows) - len(due)
+            self._in_flight.update(due)
+        if not due:
+            return 0
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.MAX_CONCURRENT, thread_name_prefix="alert-sample"
+            )
+        futures: List[Future] = [self._pool.submit(self._sample, window_id) for window_id in due]
+        wait(futures, timeout=self.budget_ms / 1000.0)
+        return len(due)
+
+    def _sample(self, window_id: str):
+        """Capture one window on a pool thread and emit the sample"""
+        cpu_start = time.thread_time()
+        try:
+            image = self.capture_sample(window_id, self.scale)
+            if image is not None:
+                with self._lock:
+                    self.samples_taken += 1
+                    self._window_samples[window_id] = self._window_samples.get(window_id, 0) + 1
+                self.sample_ready.emit(window_id, image)
+        except Exception as e:
+            self.logger.error(f"Alert sample failed for {window_id}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(window_id)
+                self.cpu_seconds += time.thread_time() - cpu_start
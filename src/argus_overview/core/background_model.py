@@ -0,0 +1,207 @@
+"""
+Background Model - Per-window EWMA background with per-pixel variance
+Change is measured against a running model instead of the last frame, so
+animated content (planets, ship spin) raises its own threshold while slow
+drifts still accumulate into a detectable difference
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# (x, y, width, height) as fractions of the frame
+Region = Tuple[float, float, float, float]
+
+
+def find_change_regions(
+    mask: np.ndarray, cell_size: int = 10, min_fill: float = 0.25
+) -> List[Region]:
+    """
+    Bounding boxes of changed areas in a foreground mask
+
+    The mask is reduced to a grid of cell_size x cell_size blocks with two
+    reshape/sum passes; blocks at least min_fill changed are labeled as
+    4-connected components by merging horizontal runs of active blocks
+    between adjacent rows. No per-pixel Python loops.
+
+    Args:
+        mask: Boolean foreground mask
+        cell_size: Block edge in mask pixels
+        min_fill: Fraction of a block that must be changed for it to count
+
+    Returns:
+        List of (x, y, width, height) fractions, largest first
+    """
+    rows, cols = mask.shape[0] // cell_size, mask.shape[1] // cell_size
+    if rows == 0 or cols == 0:
+        return []
+
+    # Block reduction: sum cell rows, then cell columns
+    trimmed = mask[: rows * cell_size, : cols * cell_size].view(np.uint8)
+    blocks = (
+        trimmed.reshape(rows, cell_size, cols * cell_size)
+        .sum(axis=1, dtype=np.uint16)
+        .reshape(rows, cols, cell_size)
+        .sum(axis=2)
+    )
+    active = blocks >= max(1, int(min_fill * cell_size * cell_size))
+    if not active.any():
+        return []
+
+    # Horizontal runs of active blocks, ordered by row then column
+    padded = np.zeros((rows, cols + 2), dtype=np.int8)
+    padded[:, 1:-1] = active
+    edges = np.diff(padded, axis=1)
+    run_rows, run_starts = (a.tolist() for a in np.nonzero(edges == 1))
+    run_ends = np.nonzero(edges == -1)[1].tolist()  # Exclusive
+
+    # Union-find: join overlapping runs on adjacent rows
+    parent = list(range(len(run_rows)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    prev_lo = prev_hi = 0  # Runs of the previous row
+    i = 0
+    while i < len(run_rows):
+        row = run_rows[i]
+        j = i
+        while j < len(run_rows) and run_rows[j] == row:
+            j += 1
+        if prev_hi > prev_lo and run_rows[prev_lo] == row - 1:
+            a, b = prev_lo, i
+            while a < prev_hi and b < j:
+                if run_starts[a] < run_ends[b] and run_starts[b] < run_ends[a]:
+                    root_a, root_b = find(a), find(b)
+                    if root_a != root_b:
+                        parent[root_b] = root_a
+                if run_ends[a] < run_ends[b]:
+                    a += 1
+                else:
+                    b += 1
+        prev_lo, prev_hi = i, j
+        i = j
+
+    # Bounding box per component: [cells, top, left, bottom, right_exclusive]
+    boxes: Dict[int, List[int]] = {}
+    for k, row in enumerate(run_rows):
+        cells = run_ends[k] - run_starts[k]
+        box = boxes.get(find(k))
+        if box is None:
+            boxes[find(k)] = [cells, row, run_starts[k], row, run_ends[k]]
+        else:
+            box[0] += cells
+            box[1] = min(box[1], row)
+            box[2] = min(box[2], run_starts[k])
+            box[3] = max(box[3], row)
+            box[4] = max(box[4], run_ends[k])
+
+    ordered = sorted(boxes.values(), key=lambda box: box[0], reverse=True)
+    return [
+        (left / cols, top / rows, (right - left) / cols, (bottom - top + 1) / rows)
+        for _, top, left, bottom, right in ordered
+    ]
+
+
+class BackgroundModel:
+    """
+    Exponentially weighted running mean and per-pixel variance of a small
+    grayscale frame.
+
+    The mean tracks the slowly varying background. The variance tracks
+    frame-to-frame fluctuation (half the EWMA of squared temporal
+    differences), so pixels that animate every frame get a wide threshold
+    while a slow drift - small steps, large accumulated offset - still stands
+    out against the lagging mean.
+
+    All arrays are float32 and allocated once; update() works in place, so
+    the per-frame cost is a fixed handful of vectorized passes over the
+    (tiny) comparison frame.
+    """
+
+    DEFAULT_LEARNING_RATE = 0.05  # ~20 frames to absorb a persistent change
+    DEFAULT_SIGMA = 2.5  # Pixel is foreground if |x - mean| > sigma * std
+    MIN_STD = 12.0  # Floor so static scenes still need a ~30 level change
+    INITIAL_STD = 15.0
+
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        learning_rate: float = DEFAULT_LEARNING_RATE,
+        sigma: float = DEFAULT_SIGMA,
+    ):
+        """
+        Args:
+            shape: (rows, cols) of the frames fed to update()
+            learning_rate: EWMA weight of each new frame (0-1]
+            sigma: Foreground threshold in standard deviations
+        """
+        self.shape = tuple(shape)
+        self.learning_rate = min(1.0, max(0.001, learning_rate))
+        self.sigma = sigma
+        self.initialized = False
+        self.frame_count = 0
+
+        # Model state
+        self.mean = np.zeros(self.shape, dtype=np.float32)
+        self.variance = np.full(self.shape, self.INITIAL_STD**2, dtype=np.float32)
+        self._previous = np.zeros(self.shape, dtype=np.float32)
+
+        # Scratch buffers reused every frame
+        self._frame = np.empty(self.shape, dtype=np.float32)
+        self._diff = np.empty(self.shape, dtype=np.float32)
+        self._scratch = np.empty(self.shape, dtype=np.float32)
+        self._threshold = np.empty(self.shape, dtype=np.float32)
+        self.foreground = np.zeros(self.shape, dtype=bool)  # Mask from the last update
+
+    def reset(self):
+        """Forget the model; the next frame re-seeds it"""
+        self.initialized = False
+        self.frame_count = 0
+        self.variance.fill(self.INITIAL_STD**2)
+        self.foreground.fill(False)
+
+    def update(self, frame: np.ndarray) -> float:
+        """
+        Compare a frame against the model, then fold it in
+
+        Args:
+            frame: uint8/float grayscale array of `shape`
+
+        Returns:
+            Fraction of pixels (0-1) that differ from the background
+        """
+        np.copyto(self._frame, frame, casting="unsafe")
+        self.frame_count += 1
+
+        if not self.initialized:
+            np.copyto(self.mean, self._frame)
+            np.copyto(self._previous, self._frame)
+            self.initialized = True
+            self.foreground.fill(False)
+            return 0.0
+
+        # Foreground: (x - mean)^2 > sigma^2 * max(var, MIN_STD^2)
+        np.subtract(self._frame, self.mean, out=self._diff)
+        np.multiply(self._diff, self._diff, out=self._scratch)
+        np.maximum(self.variance, self.MIN_STD**2, out=self._threshold)
+        self._threshold *= self.sigma * self.sigma
+        np.greater(self._scratch, self._threshold, out=self.foreground)
+
+        # Variance: var = (1-a) * var + a * (x - x_prev)^2 / 2
+        a = self.learning_rate
+        np.subtract(self._frame, self._previous, out=self._scratch)
+        self._scratch *= self._scratch
+        self._scratch *= 0.5 * a
+        self.variance *= 1.0 - a
+        self.variance += self._scratch
+
+        # Mean: mean += a * (x - mean)
+        self._diff *= a
+        self.mean += self._diff
+        np.copyto(self._previous, self._frame)
+
+        return float(np.count_nonzero(self.foreground)) / self.foreground.size
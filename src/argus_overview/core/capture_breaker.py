@@ -0,0 +1,181 @@
+"""
+Capture Breaker - Per-window circuit breaker for the capture workers
+A frozen Wine client makes `import` block until its 1s timeout, and with the
+default single capture worker every other preview waits behind it. The breaker
+tracks consecutive failures per window, backs off exponentially after
+timeouts, lets one trial capture through at a time, and quarantines a
+window after repeated timeouts. Quarantined windows get no captures at all;
+the owner probes them every few seconds until they respond again.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+
+@dataclass
+class WindowHealth:
+    """Failure state of one window"""
+
+    failures: int = 0  # Consecutive failed captures
+    timeouts: int = 0  # Consecutive captures that hit the timeout
+    retry_at: float = 0.0  # Monotonic time before which no capture is attempted (timeouts only)
+    in_flight: bool = False  # A trial capture is running
+    quarantined: bool = False
+    probed_at: float = 0.0  # Monotonic time of the last liveness probe
+
+
+class CaptureBreaker:
+    """
+    Circuit breaker keyed by window ID.
+
+    Features:
+    - Healthy windows pass with one dict lookup and no bookkeeping
+    - After a timeout, the next attempt waits BACKOFF_BASE_S, doubling per
+      consecutive timeout up to BACKOFF_MAX_S; fast failures (e.g. a client
+      minimized mid-capture) cost nothing to retry and go again next cycle
+    - Only one trial capture of a failing window runs at a time, so several
+      workers can't all block on the same client
+    - QUARANTINE_AFTER consecutive timeouts quarantine the window until a
+      liveness probe succeeds (due_probes / record_probe)
+    - Thread-safe (capture workers, alert sampling and the prober call in)
+
+    Usage:
+        if breaker.allow(window_id):
+            ...capture...
+            breaker.record_success(window_id)  # or record_failure(window_id, timed_out)
+    """
+
+    BACKOFF_BASE_S = 0.5
+    BACKOFF_MAX_S = 8.0
+    QUARANTINE_AFTER = 3  # Consecutive timeouts
+    PROBE_INTERVAL_S = 5.0
+
+    def __init__(self):
+        self._health: Dict[str, WindowHealth] = {}
+        self._lock = threading.Lock()
+
+        # Counters (for diagnostics and benchmarks)
+        self.skipped = 0  # Captures refused while backing off or quarantined
+        self.quarantines = 0
+        self.recoveries = 0
+        self.probes = 0
+
+    def allow(self, window_id: str, now: Optional[float] = None) -> bool:
+        """
+        Whether a capture of this window may run now
+
+        A True for a failing window claims its trial slot; the caller must
+        report the outcome with record_success or record_failure.
+
+        Args:
+            window_id: X11 window ID
+            now: Monotonic time (defaults to time.monotonic())
+
+        Returns:
+            True if the capture should run
+        """
+        with self._lock:
+            health = self._health.get(window_id)
+            if health is None:
+                return True
+            now = time.monotonic() if now is None else now
+            if health.quarantined or health.in_flight or now < health.retry_at:
+                self.skipped += 1
+                return False
+            health.in_flight = True
+            return True
+
+    def record_success(self, window_id: str) -> bool:
+        """
+        Clear a window's failure state after a capture worked
+
+        Returns:
+            True if the window was failing before
+        """
+        with self._lock:
+            return self._health.pop(window_id, None) is not None
+
+    def record_failure(self, window_id: str, timed_out: bool, now: Optional[float] = None) -> bool:
+        """
+        Count a failed capture and schedule the next attempt (backoff only after a timeout)
+
+        Args:
+            window_id: X11 window ID
+            timed_out: True if the capture hit its timeout (client hung)
+            now: Monotonic time (defaults to time.monotonic())
+
+        Returns:
+            True if this failure quarantined the window
+        """
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            health = self._health.setdefault(window_id, WindowHealth())
+            health.in_flight = False
+            health.failures += 1
+            if timed_out:
+                health.timeouts += 1
+                backoff = self.BACKOFF_BASE_S * 2 ** min(health.timeouts - 1, 16)
+                health.retry_at = now + min(backoff, self.BACKOFF_MAX_S)
+            else:
+                health.timeouts = 0
+                health.retry_at = now
+
+            if health.quarantined or health.timeouts < self.QUARANTINE_AFTER:
+                return False
+            health.quarantined = True
+            health.probed_at = now
+            self.quarantines += 1
+            return True
+
+    def due_probes(self, now: Optional[float] = None) -> List[str]:
+        """
+        Quarantined windows whose next liveness probe is due (marked as probed)
+
+        Args:
+            now: Monotonic time (defaults to time.monotonic())
+
+        Returns:
+            Window IDs to probe
+        """
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            due = []
+            for window_id, health in self._health.items():
+                if health.quarantined and now - health.probed_at >= self.PROBE_INTERVAL_S:
+                    health.probed_at = now
+                    due.append(window_id)
+            return due
+
+    def record_probe(self, window_id: str, responding: bool) -> bool:
+        """
+        Apply a liveness probe result; a responding window leaves quarantine
+
+        Returns:
+            True if the window recovered
+        """
+        with self._lock:
+            self.probes += 1
+            health = self._health.get(window_id)
+            if health is None or not health.quarantined or not responding:
+                return False
+            del self._health[window_id]
+            self.recoveries += 1
+            return True
+
+    def is_quarantined(self, window_id: str) -> bool:
+        """Whether a window is quarantined"""
+        with self._lock:
+            health = self._health.get(window_id)
+            return health is not None and health.quarantined
+
+    def quarantined(self) -> Set[str]:
+        """All quarantined window IDs"""
+        with self._lock:
+            return {window_id for window_id, health in self._health.items() if health.quarantined}
+
+    def forget(self, window_id: str):
+        """Drop a window's state (window closed or removed)"""
+        with self._lock:
+            self._health.pop(window_id, None)
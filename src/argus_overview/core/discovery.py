@@ -5,41 +5,14 @@ v2.2 Feature: Automatic detection of new EVE clients
 
 import logging
 import re
-import subprocess
-import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from PySide6.QtCore import QObject, QTimer, Signal
 
-# Module-level cache for wmctrl results (reduces subprocess calls)
-_wmctrl_cache: Dict[str, tuple] = {"result": None, "timestamp": 0.0}
-_WMCTRL_CACHE_TTL = 1.0  # seconds
-
-
-def _clear_wmctrl_cache() -> None:
-    """Clear wmctrl cache (for testing)"""
-    _wmctrl_cache["result"] = None
-    _wmctrl_cache["timestamp"] = 0.0
-
-
-def _get_wmctrl_window_list() -> str:
-    """Get wmctrl -l output with caching (1 second TTL)"""
-    now = time.monotonic()
-    if _wmctrl_cache["result"] is not None and now - _wmctrl_cache["timestamp"] < _WMCTRL_CACHE_TTL:
-        return _wmctrl_cache["result"]
-
-    try:
-        result = subprocess.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=2)
-        if result.returncode == 0:
-            _wmctrl_cache["result"] = result.stdout
-            _wmctrl_cache["timestamp"] = now
-            return result.stdout
-    except (subprocess.TimeoutExpired, OSError):
-        pass
-
-    return _wmctrl_cache["result"] or ""
+from argus_overview.core.window_events import ClientListWatcher
+from argus_overview.core.window_registry import EVE_TITLE_PATTERNS, WindowRegistry
 
 
 @dataclass
@@ -58,7 +31,11 @@ class AutoDiscovery(QObject):
     Background service to automatically detect new EVE windows.
 
     Features:
-    - Scans for EVE windows every N seconds (configurable)
+    - Event-driven mode: reacts to X client-list and title changes within
+      milliseconds with no idle polling (ClientListWatcher, optionally one
+      shared with the owner)
+    - Scans for EVE windows every N seconds (configurable) otherwise, or when
+      window events are unavailable
     - Detects new characters that weren't seen before
     - Emits signals when new characters are found
     - Tracks known characters with timestamps
@@ -71,10 +48,7 @@ class AutoDiscovery(QObject):
     scan_completed = Signal(int)  # total_windows_found
 
     # EVE window detection patterns
-    EVE_TITLE_PATTERNS = [
-        r"^EVE - (.+)$",  # Standard: "EVE - Character Name"
-        r"^EVE Online - (.+)$",  # Alternative: "EVE Online - Character Name"
-    ]
+    EVE_TITLE_PATTERNS = EVE_TITLE_PATTERNS
 
     EVE_WM_CLASS_PATTERNS = [
         "eve",
@@ -82,13 +56,20 @@ class AutoDiscovery(QObject):
         "wine",
     ]
 
-    def __init__(self, interval_seconds: int = 5, parent=None):
+    def __init__(
+        self,
+        interval_seconds: int = 5,
+        event_driven: bool = False,
+        parent=None,
+        watcher: Optional[ClientListWatcher] = None,
+    ):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
 
         # Configuration
         self.interval = interval_seconds * 1000  # Convert to milliseconds
         self.enabled = True
+        self.event_driven = event_driven  # Prefer X events over polling
 
         # State
         self.known_characters: Dict[str, DiscoveredCharacter] = {}
@@ -101,14 +82,27 @@ class AutoDiscovery(QObject):
         self.scan_timer = QTimer(self)
         self.scan_timer.timeout.connect(self._scan_cycle)
 
+        # X event watcher (event-driven mode only); a shared one is used if given
+        self._watcher: Optional[ClientListWatcher] = None
+        self._shared_watcher = watcher
+
         self.logger.info(f"AutoDiscovery initialized with {interval_seconds}s interval")
 
+    @property
+    def running(self) -> bool:
+        """Whether discovery is active (polling or watching window events)"""
+        return self.scan_timer.isActive() or self._watcher is not None
+
     def start(self):
         """Start the auto-discovery background process"""
         if not self.enabled:
             self.logger.info("AutoDiscovery is disabled")
             return
 
+        if self.event_driven and self._start_watcher():
+            self.logger.info("AutoDiscovery started (window events)")
+            return
+
         # Do an initial scan immediately
         self._scan_cycle()
 
@@ -119,8 +113,63 @@ class AutoDiscovery(QObject):
     def stop(self):
         """Stop the auto-discovery process"""
         self.scan_timer.stop()
+        self._release_watcher()
         self.logger.info("AutoDiscovery stopped")
 
+    def _start_watcher(self) -> bool:
+        """
+        Switch to event-driven discovery
+
+        Returns:
+            True if the window event watcher is running
+        """
+        watcher = self._shared_watcher or ClientListWatcher(self)
+        if not watcher.start():
+            self.logger.info("Window events unavailable, falling back to polling")
+            return False
+
+        watcher.windows_changed.connect(self._on_windows_changed)
+        watcher.watch_lost.connect(self._on_watch_lost)
+        self._watcher = watcher
+        self._on_windows_changed(watcher.windows())
+        return True
+
+    def _release_watcher(self):
+        """Disconnect from the watcher, stopping it unless it's shared (its owner stops it)"""
+        watcher = self._watcher
+        if watcher is None:
+            return
+        self._watcher = None
+        if watcher is self._shared_watcher:
+            watcher.windows_changed.disconnect(self._on_windows_changed)
+            watcher.watch_lost.disconnect(self._on_watch_lost)
+        else:
+            watcher.stop()
+
+    def _on_windows_changed(self, windows: List[Tuple[str, str]]):
+        """
+        Client list or a title changed (event-driven mode)
+
+        Args:
+            windows: Every client as (window_id, window_title)
+        """
+        # The registry's snapshot is now stale too
+        WindowRegistry.get_instance().invalidate()
+        try:
+            self._process_windows(
+                [(window_id, title) for window_id, title in windows if self._is_eve_window(title)]
+            )
+        except Exception as e:
+            self.logger.error(f"Window event handling error: {e}")
+
+    def _on_watch_lost(self):
+        """Watcher lost its X connection - continue by polling"""
+        self.logger.warning("Window events lost, falling back to polling")
+        self._release_watcher()
+        if self.enabled:
+            self._scan_cycle()
+            self.scan_timer.start(self.interval)
+
     def set_interval(self, seconds: int):
         """
         Set the scan interval
@@ -141,9 +190,9 @@ class AutoDiscovery(QObject):
             enabled: True to enable
         """
         self.enabled = enabled
-        if not enabled and self.scan_timer.isActive():
+        if not enabled and self.running:
             self.stop()
-        elif enabled and not self.scan_timer.isActive():
+        elif enabled and not self.running:
             self.start()
 
     def set_on_new_callback(self, callback: Callable):
@@ -158,59 +207,66 @@ class AutoDiscovery(QObject):
     def _scan_cycle(self):
         """Perform one scan cycle"""
         try:
-            windows = self._get_eve_windows()
-            current_ids = set()
+            self._process_windows(self._get_eve_windows())
+        except Exception as e:
+            self.logger.error(f"Scan cycle error: {e}")
+
+    def _process_windows(self, windows: List[Tuple[str, str]]):
+        """
+        Diff the current EVE windows against the active set and emit changes
 
-            for window_id, window_title in windows:
-                current_ids.add(window_id)
+        Args:
+            windows: EVE windows as (window_id, window_title)
+        """
+        current_ids = set()
 
-                # Extract character name
-                char_name = self._extract_character_name(window_title)
-                if not char_name:
-                    continue
+        for window_id, window_title in windows:
+            current_ids.add(window_id)
 
-                # Check if this is a new character
-                is_new = window_id not in self.active_window_ids
+            # Extract character name
+            char_name = self._extract_character_name(window_title)
+            if not char_name:
+                continue
 
-                if is_new:
-                    # New character found
-                    self.logger.info(f"New EVE character detected: {char_name} ({window_id})")
+            # Check if this is a new character
+            is_new = window_id not in self.active_window_ids
 
-                    # Add to known characters
-                    self.known_characters[window_id] = DiscoveredCharacter(
-                        name=char_name, window_id=window_id, window_title=window_title
-                    )
+            if is_new:
+                # New character found
+                self.logger.info(f"New EVE character detected: {char_name} ({window_id})")
 
-                    # Emit signal
-                    self.new_character_found.emit(char_name, window_id, window_title)
+                # Add to known characters
+                self.known_characters[window_id] = DiscoveredCharacter(
+                    name=char_name, window_id=window_id, window_title=window_title
+                )
 
-                    # Call callback if set
-                    if self._on_new_callback:
-                        try:
-                            self._on_new_callback(char_name, window_id, window_title)
-                        except Exception as e:
-                            self.logger.error(f"Callback error: {e}")
+                # Emit signal
+                self.new_character_found.emit(char_name, window_id, window_title)
 
-                elif window_id in self.known_characters:
-                    # Update last seen
-                    self.known_characters[window_id].last_seen = datetime.now()
+                # Call callback if set
+                if self._on_new_callback:
+                    try:
+                        self._on_new_callback(char_name, window_id, window_title)
+                    except Exception as e:
+                        self.logger.error(f"Callback error: {e}")
 
-            # Check for characters that went away
-            gone_ids = self.active_window_ids - current_ids
-            for window_id in gone_ids:
-                if window_id in self.known_characters:
-                    char = self.known_characters[window_id]
-                    self.logger.info(f"EVE character gone: {char.name} ({window_id})")
-                    self.character_gone.emit(char.name, window_id)
+            elif window_id in self.known_characters:
+                # Update last seen
+                self.known_characters[window_id].last_seen = datetime.now()
 
-            # Update active window set
-            self.active_window_ids = current_ids
+        # Check for characters that went away
+        gone_ids = self.active_window_ids - current_ids
+        for window_id in gone_ids:
+            if window_id in self.known_characters:
+                char = self.known_characters[window_id]
+                self.logger.info(f"EVE character gone: {char.name} ({window_id})")
+                self.character_gone.emit(char.name, window_id)
 
-            # Emit scan completed
-            self.scan_completed.emit(len(windows))
+        # Update active window set
+        self.active_window_ids = current_ids
 
-        except Exception as e:
-            self.logger.error(f"Scan cycle error: {e}")
+        # Emit scan completed
+        self.scan_completed.emit(len(windows))
 
     def _get_eve_windows(self) -> List[Tuple[str, str]]:
         """
@@ -219,28 +275,15 @@ class AutoDiscovery(QObject):
         Returns:
             List of (window_id, window_title) tuples
         """
-        eve_windows = []
-
         try:
-            # Use cached wmctrl output
-            output = _get_wmctrl_window_list()
-
-            for line in output.strip().split("\n"):
-                if not line:
-                    continue
-
-                parts = line.split(None, 3)
-                if len(parts) >= 4:
-                    window_id = parts[0]
-                    window_title = parts[3]
-
-                    # Check if it's an EVE window
-                    if self._is_eve_window(window_title):
-                        eve_windows.append((window_id, window_title))
+            return [
+                (info.window_id, info.title)
+                for info in WindowRegistry.get_instance().snapshot()
+                if self._is_eve_window(info.title)
+            ]
         except Exception as e:
             self.logger.error(f"Failed to get EVE windows: {e}")
-
-        return eve_windows
+            return []
 
     def _is_eve_window(self, title: str) -> bool:
         """
@@ -366,31 +409,12 @@ def scan_eve_windows() -> List[Tuple[str, str, str]]:
         List of (window_id, window_title, character_name) tuples
     """
     logger = logging.getLogger(__name__)
-    results = []
 
     try:
-        # Use cached wmctrl output
-        output = _get_wmctrl_window_list()
-
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
-
-            parts = line.split(None, 3)
-            if len(parts) >= 4:
-                window_id = parts[0]
-                window_title = parts[3]
-
-                # Check EVE patterns
-                for pattern in AutoDiscovery.EVE_TITLE_PATTERNS:
-                    match = re.match(pattern, window_title)
-                    if match:
-                        char_name = match.group(1).strip()
-                        if char_name:  # Skip empty character names
-                            results.append((window_id, window_title, char_name))
-                        break
-
+        return [
+            (info.window_id, info.title, info.character)
+            for info in WindowRegistry.get_instance().eve_windows()
+        ]
     except Exception as e:
         logger.error(f"scan_eve_windows failed: {e}")
-
-    return results
+        return []
@@ -0,0 +1,295 @@
+"""
+Layout Transaction - Apply a set of window moves as one batch
+Applying a grid layout used to run `xdotool windowmove --sync` and
+`windowsize --sync` one window at a time (with sleeps when Wine clients ignored
+--sync). A LayoutTransaction collects every target geometry first, reads the
+current geometries once, skips windows already in place, issues the remaining
+configure requests together (one X flush, or a bounded pool of xdotool calls)
+and then waits once for all of them to settle. LayoutCommitter runs the commit
+on a worker thread so the GUI thread never waits for the window manager
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from argus_overview.core.window_ops import run_concurrently
+from argus_overview.core.window_registry import WindowRegistry
+from argus_overview.utils.window_control import WindowControl
+
+
+class WindowTarget(NamedTuple):
+    """Where one window should go; width/height None keeps the current size"""
+
+    x: int
+    y: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+
+    def matches(self, geometry: Tuple[int, int, int, int]) -> bool:
+        """Whether a current (x, y, width, height) already satisfies this target"""
+        x, y, width, height = geometry
+        if (x, y) != (self.x, self.y):
+            return False
+        if self.width is not None and width != self.width:
+            return False
+        return self.height is None or height == self.height
+
+
+@dataclass
+class LayoutResult:
+    """Outcome and timing of one LayoutTransaction.commit()"""
+
+    moved: int = 0  # Configure requests issued
+    unchanged: int = 0  # Already in place, skipped
+    failed: int = 0  # Request couldn't be issued
+    settled: bool = True  # All moved windows reached their target before the timeout
+    read_ms: float = 0.0
+    issue_ms: float = 0.0
+    settle_ms: float = 0.0
+
+    @property
+    def total_ms(self) -> float:
+        return self.read_ms + self.issue_ms + self.settle_ms
+
+    def summary(self) -> str:
+        """One-line description for logs"""
+        text = (
+            f"{self.moved} moved, {self.unchanged} unchanged, {self.failed} failed "
+            f"in {self.total_ms:.1f}ms (read {self.read_ms:.1f}, issue {self.issue_ms:.1f}, "
+            f"settle {self.settle_ms:.1f})"
+        )
+        return text if self.settled else text + ", not all windows settled"
+
+
+class LayoutTransaction:
+    """
+    Collects window moves and applies them together.
+
+    Features:
+    - Current geometries read once: over X when window control has a
+      connection, else from the shared window registry (one wmctrl query)
+    - Windows already at their target are skipped
+    - Remaining moves go out in one X flush, or concurrently through xdotool
+    - One settle wait for the whole set (X only; xdotool waits per call)
+    - Timing per phase in the returned LayoutResult
+
+    Usage:
+        transaction = LayoutTransaction(self._move_window, self._move_window_position_only)
+        transaction.add(window_id, x, y, width, height)
+        result = transaction.commit()
+    """
+
+    SETTLE_TIMEOUT_S = 0.5
+    SETTLE_POLL_S = 0.01
+
+    def __init__(
+        self,
+        move_resize: Callable[[str, int, int, int, int], bool],
+        move_only: Optional[Callable[[str, int, int], bool]] = None,
+    ):
+        """
+        Args:
+            move_resize: Moves and resizes one window (EWMH first, xdotool fallback)
+            move_only: Moves one window keeping its size (defaults to an EWMH
+                move without xdotool fallback)
+        """
+        self.logger = logging.getLogger(__name__)
+        self._move_resize = move_resize
+        self._move_only = move_only
+        self._targets: Dict[str, WindowTarget] = {}
+
+    def add(
+        self,
+        window_id: str,
+        x: int,
+        y: int,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ):
+        """
+        Queue a window move (a later add for the same window replaces it)
+
+        Args:
+            window_id: X11 window ID
+            x: Target X position
+            y: Target Y position
+            width: Target width (None keeps the current size)
+            height: Target height (None keeps the current size)
+        """
+        self._targets[window_id] = WindowTarget(x, y, width, height)
+
+    def __len__(self) -> int:
+        """Number of queued moves"""
+        return len(self._targets)
+
+    def commit(self) -> LayoutResult:
+        """
+        Apply every queued move
+
+        Returns:
+            LayoutResult with counts and per-phase timing
+        """
+        result = LayoutResult()
+        if not self._targets:
+            return result
+
+        start = time.perf_counter()
+        before = self._read_geometries(list(self._targets))
+        pending = [
+            window_id
+            for window_id, target in self._targets.items()
+            if window_id not in before or not target.matches(before[window_id])
+        ]
+        result.unchanged = len(self._targets) - len(pending)
+        issued = time.perf_counter()
+        result.read_ms = (issued - start) * 1000
+
+        outcomes = run_concurrently(pending, self._issue)
+        moved = [window_id for window_id, ok in outcomes.items() if ok]
+        result.moved = len(moved)
+        result.failed = len(pending) - len(moved)
+        result.issue_ms = (time.perf_counter() - issued) * 1000
+
+        if moved and WindowControl.get_instance().available:
+            settle_start = time.perf_counter()
+            result.settled = self._wait_settled(moved, before)
+            result.settle_ms = (time.perf_counter() - settle_start) * 1000
+
+        if moved:
+            WindowRegistry.get_instance().invalidate()
+        self._targets.clear()
+        self.logger.info(f"Layout applied: {result.summary()}")
+        return result
+
+    def _issue(self, window_id: str) -> bool:
+        """Send one window's configure request"""
+        target = self._targets[window_id]
+        if target.width is None or target.height is None:
+            if self._move_only is not None:
+                return bool(self._move_only(window_id, target.x, target.y))
+            return WindowControl.get_instance().move_resize(window_id, target.x, target.y)
+        return bool(self._move_resize(window_id, target.x, target.y, target.width, target.height))
+
+    def _read_geometries(self, window_ids: List[str]) -> Dict[str, Tuple[int, int, int, int]]:
+        """Current geometry per window; windows that can't be read are left out"""
+        control = WindowControl.get_instance()
+        if control.available:
+            return control.get_geometries(window_ids)
+
+        wanted = set(window_ids)
+        return {
+            info.window_id: info.geometry
+            for info in WindowRegistry.get_instance().snapshot(max_age=0)
+            if info.window_id in wanted
+        }
+
+    def _wait_settled(
+        self, window_ids: List[str], before: Dict[str, Tuple[int, int, int, int]]
+    ) -> bool:
+        """
+        Poll until every moved window reached its target or stopped changing
+
+        A window that moved but can't reach its target exactly (size hints,
+        Wine) counts as settled once two polls agree.
+
+        Args:
+            window_ids: Windows that were sent a configure request
+            before: Their geometries before the request
+
+        Returns:
+            True if all settled within SETTLE_TIMEOUT_S
+        """
+        control = WindowControl.get_instance()
+        waiting = set(window_ids)
+        last: Dict[str, Tuple[int, int, int, int]] = {}
+        deadline = time.perf_counter() + self.SETTLE_TIMEOUT_S
+        while waiting:
+            current = control.get_geometries(sorted(waiting))
+            for window_id in list(waiting):
+                geometry = current.get(window_id)
+                if geometry is None:
+                    waiting.discard(window_id)  # Closed meanwhile
+                elif self._targets[window_id].matches(geometry) or (
+                    geometry != before.get(window_id) and geometry == last.get(window_id)
+                ):
+                    waiting.discard(window_id)
+            last = current
+            if not waiting or time.perf_counter() >= deadline:
+                break
+            time.sleep(self.SETTLE_POLL_S)
+        return not waiting
+
+
+class LayoutCommitter(QObject):
+    """
+    Commits layout transactions off the GUI thread.
+
+    Features:
+    - Never blocks the caller; the commit (reads, requests and settle wait)
+      runs on a daemon thread
+    - layout_committed(name, LayoutResult) on completion, delivered on the
+      receiver's (GUI) thread
+
+    Usage:
+        committer = LayoutCommitter(self)
+        committer.layout_committed.connect(self._on_layout_committed)
+        committer.run("2x2 Grid", transaction)
+    """
+
+    layout_committed = Signal(str, object)  # name, LayoutResult
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+        # Counters (for diagnostics and benchmarks)
+        self.commits_run = 0
+        self.last_result: Optional[LayoutResult] = None
+
+    def run(self, name: str, transaction: LayoutTransaction):
+        """
+        Start committing a transaction without waiting for it
+
+        Args:
+            name: Reported back with the result (e.g. the layout pattern)
+            transaction: Transaction with its moves queued
+        """
+        thread = threading.Thread(target=self._run, args=(name, transaction), daemon=True)
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+
+    def wait(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for running commits to finish (for shutdown and tests)
+
+        Args:
+            timeout: Seconds to wait per commit
+
+        Returns:
+            True if nothing is running anymore
+        """
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+        return not any(thread.is_alive() for thread in threads)
+
+    def _run(self, name: str, transaction: LayoutTransaction):
+        """Worker thread: commit and report"""
+        try:
+            result = transaction.commit()
+        except Exception as e:
+            self.logger.error(f"Failed to apply layout {name}: {e}")
+            result = LayoutResult(failed=len(transaction))
+        self.last_result = result
+        self.commits_run += 1
+        self.layout_committed.emit(name, result)
@@ -0,0 +1,280 @@
+"""
+Hostile-in-Local Detector
+Counts red/orange standing tags in the Local chat member list using a
+precomputed color lookup table, and watches that region at its own rate
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+from PySide6.QtCore import QObject, Signal
+
+from argus_overview.core.alert_detector import AlertLevel
+
+# Standing tag colors as rendered by the EVE client (terrible / bad / outlaw)
+DEFAULT_HOSTILE_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    (191, 0, 0),  # -10 terrible standing (red)
+    (255, 89, 0),  # -5 bad standing (orange)
+    (230, 40, 20),  # Outlaw / criminal flag
+)
+
+_QUANT_SHIFT = 3  # 8 -> 5 bits per channel
+_QUANT_BITS = 8 - _QUANT_SHIFT
+LUT_SIZE = 1 << (3 * _QUANT_BITS)  # 32768 entries
+
+
+def build_color_lut(colors: Sequence[Tuple[int, int, int]], tolerance: float) -> np.ndarray:
+    """
+    Build a 32k-entry lookup table over 5-bit quantized RGB
+
+    Args:
+        colors: Reference RGB colors that count as hostile
+        tolerance: Max Euclidean RGB distance from a reference color
+
+    Returns:
+        uint8 array of LUT_SIZE entries (1 = hostile)
+    """
+    lut = np.zeros(LUT_SIZE, dtype=np.uint8)
+    if not colors:
+        return lut
+
+    # Center of each quantization bin, in index order (r << 10 | g << 5 | b)
+    levels = (np.arange(1 << _QUANT_BITS, dtype=np.float32) + 0.5) * (1 << _QUANT_SHIFT)
+    r, g, b = np.meshgrid(levels, levels, levels, indexing="ij")
+    centers = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+
+    refs = np.asarray(colors, dtype=np.float32)
+    for ref in refs:
+        distance_sq = np.sum((centers - ref) ** 2, axis=1)
+        lut |= (distance_sq <= tolerance * tolerance).astype(np.uint8)
+    return lut
+
+
+@dataclass
+class LocalReport:
+    """Result of analyzing one Local list capture"""
+
+    hostile_count: int  # Distinct tagged entries (runs of hostile rows)
+    previous_count: int
+    row_counts: np.ndarray  # Hostile pixels per row
+    level: Optional[AlertLevel] = None
+
+    @property
+    def delta(self) -> int:
+        """Change in hostile count since the previous capture"""
+        return self.hostile_count - self.previous_count
+
+
+class LocalDetector:
+    """
+    Color-key detector for hostile standing tags in the Local member list.
+
+    Pixels are mapped through a 32k-entry LUT on quantized RGB, so the cost is
+    one shift/or per pixel plus a table gather - no per-pixel color math.
+    Per-row counts are reduced to a number of tagged entries so callers can
+    alert on "local spikes" rather than just presence.
+    """
+
+    DEFAULT_TOLERANCE = 48.0
+    DEFAULT_MIN_ROW_PIXELS = 2  # Hostile pixels needed for a row to count
+    DEFAULT_SPIKE_THRESHOLD = 2  # New hostiles in one step that count as a spike
+
+    def __init__(
+        self,
+        colors: Sequence[Tuple[int, int, int]] = DEFAULT_HOSTILE_COLORS,
+        tolerance: float = DEFAULT_TOLERANCE,
+        min_row_pixels: int = DEFAULT_MIN_ROW_PIXELS,
+        spike_threshold: int = DEFAULT_SPIKE_THRESHOLD,
+    ):
+        """
+        Args:
+            colors: Reference RGB colors that count as hostile
+            tolerance: Max RGB distance from a reference color
+            min_row_pixels: Hostile pixels needed for a row to count
+            spike_threshold: Increase in hostile count that raises HIGH
+        """
+        self.logger = logging.getLogger(__name__)
+        self.lut = build_color_lut(colors, tolerance)
+        self.min_row_pixels = max(1, min_row_pixels)
+        self.spike_threshold = max(1, spike_threshold)
+        self.previous_counts: Dict[str, int] = {}  # window_id -> last hostile count
+
+    def row_counts(self, image: Image.Image) -> np.ndarray:
+        """
+        Count hostile-colored pixels in each row
+
+        Args:
+            image: Local list capture
+
+        Returns:
+            int array with one count per row
+        """
+        arr = np.asarray(image.convert("RGB") if image.mode != "RGB" else image)
+        index = (arr[:, :, 0].astype(np.uint16) >> _QUANT_SHIFT) << (2 * _QUANT_BITS)
+        index |= (arr[:, :, 1].astype(np.uint16) >> _QUANT_SHIFT) << _QUANT_BITS
+        index |= arr[:, :, 2] >> _QUANT_SHIFT
+        return self.lut[index].sum(axis=1, dtype=np.int32)
+
+    def count_hostiles(self, row_counts: np.ndarray) -> int:
+        """
+        Count tagged entries - runs of consecutive hostile rows
+
+        Args:
+            row_counts: Output of row_counts()
+
+        Returns:
+            Number of distinct hostile entries
+        """
+        hostile_rows = row_counts >= self.min_row_pixels
+        if not hostile_rows.any():
+            return 0
+        # A run starts where a hostile row follows a non-hostile one
+        starts = hostile_rows[1:] & ~hostile_rows[:-1]
+        return int(starts.sum()) + int(hostile_rows[0])
+
+    def analyze(self, window_id: str, image: Image.Image) -> LocalReport:
+        """
+        Analyze a Local list capture
+
+        Args:
+            window_id: Window the capture came from
+            image: Local list capture
+
+        The first capture of a window only records its count as the baseline,
+        so hostiles already in Local when watching starts don't alert.
+
+        Returns:
+            LocalReport - level is HIGH on a spike, MEDIUM on any increase
+        """
+        counts = self.row_counts(image)
+        hostile_count = self.count_hostiles(counts)
+        previous = self.previous_counts.get(window_id, hostile_count)
+        self.previous_counts[window_id] = hostile_count
+
+        report = LocalReport(
+            hostile_count=hostile_count, previous_count=previous, row_counts=counts
+        )
+        if report.delta >= self.spike_threshold:
+            report.level = AlertLevel.HIGH
+        elif report.delta > 0:
+            report.level = AlertLevel.MEDIUM
+        return report
+
+    def clear_history(self, window_id: Optional[str] = None):
+        """
+        Clear previous counts
+
+        Args:
+            window_id: Specific window to clear, or None for all
+        """
+        if window_id is None:
+            self.previous_counts.clear()
+        else:
+            self.previous_counts.pop(window_id, None)
+
+
+class LocalWatcher(QObject):
+    """
+    Captures only the Local list region of watched windows on a dedicated
+    thread, at a higher rate than the preview loop.
+
+    Region captures are small, so they stay cheap even at several Hz; reports
+    are delivered to the UI thread through Qt signals.
+    """
+
+    report_ready = Signal(str, object)  # window_id, LocalReport
+    hostile_count_changed = Signal(str, int)  # window_id, hostile_count
+
+    DEFAULT_INTERVAL_MS = 250  # 4 Hz
+
+    def __init__(
+        self,
+        capture_region: Callable[[str, Tuple[int, int, int, int]], Optional[Image.Image]],
+        region: Tuple[int, int, int, int],
+        detector: Optional[LocalDetector] = None,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+        parent=None,
+    ):
+        """
+        Args:
+            capture_region: Callable(window_id, (x, y, w, h)) -> Image or None
+            region: Local list region in window pixels (x, y, width, height)
+            detector: LocalDetector to use (default settings if None)
+            interval_ms: Capture interval per window
+        """
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.capture_region = capture_region
+        self.region = tuple(int(v) for v in region)
+        self.detector = detector or LocalDetector()
+        self.interval_ms = max(50, interval_ms)
+
+        self._windows: List[str] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._stop_event.set()  # Start in stopped state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Thread-safe check if the watcher thread is running"""
+        return not self._stop_event.is_set()
+
+    def watch(self, window_id: str):
+        """Start watching a window's Local list"""
+        with self._lock:
+            if window_id not in self._windows:
+                self._windows.append(window_id)
+
+    def unwatch(self, window_id: str):
+        """Stop watching a window"""
+        with self._lock:
+            if window_id in self._windows:
+                self._windows.remove(window_id)
+        self.detector.clear_history(window_id)
+
+    def watched_windows(self) -> List[str]:
+        """Get a snapshot of watched window IDs"""
+        with self._lock:
+            return list(self._windows)
+
+    def start(self):
+        """Start the watcher thread"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Local watcher started ({1000 // self.interval_ms} Hz)")
+
+    def stop(self):
+        """Stop the watcher thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self):
+        """Watcher thread loop"""
+        while not self._stop_event.wait(self.interval_ms / 1000.0):
+            self.poll_once()
+
+    def poll_once(self):
+        """Capture and analyze every watched window once"""
+        for window_id in self.watched_windows():
+            try:
+                image = self.capture_region(window_id, self.region)
+                if image is None:
+                    continue
+
+                first = window_id not in self.detector.previous_counts
+                report = self.detector.analyze(window_id, image)
+                if first or report.delta != 0:
+                    self.hostile_count_changed.emit(window_id, report.hostile_count)
+                self.report_ready.emit(window_id, report)
+            except Exception as e:
+                self.logger.error(f"Local watch failed for {window_id}: {e}")
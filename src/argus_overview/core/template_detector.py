@@ -0,0 +1,340 @@
+"""
+Template Matching Detector
+Finds small reference icons (standing tags, warp-scrambled indicator, ...)
+inside configured zones of a window capture using normalized cross-correlation
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from argus_overview.core.alert_detector import AlertLevel
+
+
+@dataclass
+class TemplateZone:
+    """A region of the window to search for one or more templates"""
+
+    name: str
+    region: Tuple[float, float, float, float]  # x, y, width, height as fractions of the frame
+    templates: List[str] = field(default_factory=list)
+    threshold: float = 0.85  # Minimum NCC score (0-1) to count as a match
+    level: AlertLevel = AlertLevel.HIGH
+
+
+@dataclass
+class TemplateMatch:
+    """A template found inside a zone"""
+
+    zone: str
+    template: str
+    score: float
+    x: int  # Top-left corner in full-frame pixel coordinates
+    y: int
+    level: AlertLevel
+
+
+@dataclass
+class _PreparedTemplate:
+    """Zero-mean template at one UI scale, ready for correlation"""
+
+    zero_mean: np.ndarray  # float32, downsampled
+    norm: float  # sqrt(sum(zero_mean ** 2))
+    spectra: Dict[Tuple[int, int], np.ndarray] = field(default_factory=dict)  # crop shape -> FFT
+
+
+class TemplateMatcher:
+    """
+    Normalized cross-correlation (NCC) matcher for EVE UI icons.
+
+    Crops are taken per zone from the full frame and downsampled by `scale`
+    before matching. Frames that are already downscaled (alert samples) pass
+    their `frame_scale`; crops and templates are then matched at the smaller
+    of the two scales, with templates prepared for it on first use. The correlation numerator uses an FFT against the cached
+    template spectrum; the per-window statistics come from integral images, so
+    each zone costs a couple of small FFTs regardless of template size.
+    """
+
+    DEFAULT_SCALE = 0.5  # Downsample factor applied to crops and templates
+    MIN_TEMPLATE_SIZE = 4  # Templates smaller than this (after downsampling) are rejected
+
+    def __init__(self, scale: float = DEFAULT_SCALE, ui_scales: Sequence[float] = (1.0,)):
+        """
+        Args:
+            scale: Downsample factor for crops and templates (0-1]
+            ui_scales: EVE UI scale factors to precompute templates for
+        """
+        self.logger = logging.getLogger(__name__)
+        self.scale = min(1.0, max(0.1, scale))
+        self.ui_scales = tuple(ui_scales) or (1.0,)
+        self.templates: Dict[str, List[_PreparedTemplate]] = {}
+        self.zones: List[TemplateZone] = []
+        self._sources: Dict[str, Image.Image] = {}  # Grayscale originals, for other scales
+        # Templates prepared for scales other than `scale`: scale -> name -> prepared
+        self._rescaled: Dict[float, Dict[str, List[_PreparedTemplate]]] = {}
+
+    @classmethod
+    def from_config(cls, templates: Dict[str, str], zones: List[Dict]) -> "TemplateMatcher":
+        """
+        Build a matcher from settings
+
+        Args:
+            templates: {template_name: image_path}
+            zones: List of zone dicts (name, region, templates, threshold, level)
+
+        Returns:
+            TemplateMatcher with all loadable templates and valid zones
+        """
+        matcher = cls()
+        for name, path in templates.items():
+            matcher.load_template(name, path)
+
+        for zone_data in zones:
+            try:
+                matcher.add_zone(
+                    TemplateZone(
+                        name=zone_data["name"],
+                        region=tuple(zone_data["region"]),
+                        templates=list(zone_data.get("templates", [])),
+                        threshold=float(zone_data.get("threshold", 0.85)),
+                        level=AlertLevel(zone_data.get("level", "high")),
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                matcher.logger.error(f"Invalid template zone {zone_data}: {e}")
+
+        return matcher
+
+    def load_template(self, name: str, path) -> bool:
+        """
+        Load a template image from disk
+
+        Args:
+            name: Template name referenced by zones
+            path: Image file path
+
+        Returns:
+            True if loaded
+        """
+        try:
+            with Image.open(Path(path).expanduser()) as img:
+                return self.add_template(name, img)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Failed to load template '{name}' from {path}: {e}")
+            return False
+
+    def add_template(self, name: str, image: Image.Image) -> bool:
+        """
+        Add a template and precompute it for every UI scale
+
+        Args:
+            name: Template name referenced by zones
+            image: Reference icon at 100% UI scale
+
+        Returns:
+            True if at least one scale could be prepared
+        """
+        gray = image.convert("L")
+        prepared = self._prepare(gray, self.scale)
+        if not prepared:
+            self.logger.warning(f"Template '{name}' is too small or flat to match")
+            return False
+
+        self.templates[name] = prepared
+        self._sources[name] = gray
+        self._rescaled.clear()
+        return True
+
+    def _prepare(self, gray: Image.Image, scale: float) -> List[_PreparedTemplate]:
+        """Downsample a grayscale template by `scale` for every UI scale"""
+        prepared = []
+        for ui_scale in self.ui_scales:
+            factor = scale * ui_scale
+            size = (round(gray.width * factor), round(gray.height * factor))
+            if min(size) < self.MIN_TEMPLATE_SIZE:
+                continue
+
+            arr = np.asarray(gray.resize(size, Image.Resampling.BOX), dtype=np.float32)
+            zero_mean = arr - arr.mean()
+            norm = float(np.sqrt(np.sum(zero_mean * zero_mean)))
+            if norm == 0:
+                continue  # Flat template can't be correlated
+            prepared.append(_PreparedTemplate(zero_mean=zero_mean, norm=norm))
+        return prepared
+
+    def _templates_at(self, scale: float) -> Dict[str, List[_PreparedTemplate]]:
+        """Templates prepared for a matching scale (cached per scale)"""
+        if scale == self.scale:
+            return self.templates
+        templates = self._rescaled.get(scale)
+        if templates is None:
+            templates = {name: self._prepare(gray, scale) for name, gray in self._sources.items()}
+            self._rescaled[scale] = templates
+        return templates
+
+    def add_zone(self, zone: TemplateZone):
+        """Add a zone to search on every frame"""
+        self.zones.append(zone)
+
+    def has_zones(self) -> bool:
+        """Check if there is anything to match"""
+        return bool(self.zones and self.templates)
+
+    def analyze(self, image: Image.Image, frame_scale: float = 1.0) -> List[TemplateMatch]:
+        """
+        Match all zones against a frame
+
+        Args:
+            image: Window capture
+            frame_scale: Size of the capture relative to the window (1.0 = full resolution)
+
+        Returns:
+            List of matches above each zone's threshold
+        """
+        matches = []
+        for zone in self.zones:
+            match = self.match_zone(image, zone, frame_scale)
+            if match:
+                matches.append(match)
+        return matches
+
+    def match_zone(
+        self, image: Image.Image, zone: TemplateZone, frame_scale: float = 1.0
+    ) -> Optional[TemplateMatch]:
+        """
+        Find the best template match inside one zone
+
+        Args:
+            image: Window capture
+            zone: Zone to search
+            frame_scale: Size of the capture relative to the window (1.0 = full resolution)
+
+        Returns:
+            Best TemplateMatch above threshold, or None (x/y in window pixels)
+        """
+        left, top, right, bottom = self._zone_box(image.size, zone.region)
+        if right - left < 1 or bottom - top < 1:
+            return None
+
+        # Match at the template scale, or at the frame's own if it's smaller
+        match_scale = min(self.scale, frame_scale)
+        crop_factor = match_scale / frame_scale  # Further downsampling of the crop
+        templates = self._templates_at(match_scale)
+        crop_arr = self._downsampled_crop(image, (left, top, right, bottom), crop_factor)
+
+        # Per-crop work shared by every template: spectrum and integral images
+        crop_spectrum = np.fft.rfft2(crop_arr)
+        integral = self._integral(crop_arr)
+        sq_integral = self._integral(crop_arr * crop_arr)
+
+        best: Optional[TemplateMatch] = None
+        for template_name in zone.templates:
+            for prepared in templates.get(template_name, []):
+                result = self._best_ncc(
+                    crop_arr.shape, crop_spectrum, integral, sq_integral, prepared
+                )
+                if result is None:
+                    continue
+                score, (row, col) = result
+                if score >= zone.threshold and (best is None or score > best.score):
+                    best = TemplateMatch(
+                        zone=zone.name,
+                        template=template_name,
+                        score=score,
+                        x=round((left + col / crop_factor) / frame_scale),
+                        y=round((top + row / crop_factor) / frame_scale),
+                        level=zone.level,
+                    )
+
+        return best
+
+    @staticmethod
+    def _zone_box(
+        frame_size: Tuple[int, int], region: Tuple[float, float, float, float]
+    ) -> Tuple[int, int, int, int]:
+        """Convert a fractional region to a clamped pixel box"""
+        width, height = frame_size
+        x, y, w, h = region
+        left = max(0, min(width, int(x * width)))
+        top = max(0, min(height, int(y * height)))
+        right = max(left, min(width, int((x + w) * width)))
+        bottom = max(top, min(height, int((y + h) * height)))
+        return left, top, right, bottom
+
+    @staticmethod
+    def _downsampled_crop(
+        image: Image.Image, box: Tuple[int, int, int, int], scale: float
+    ) -> np.ndarray:
+        """Crop a zone, downsample it by `scale` and return it as float32 grayscale"""
+        crop = image.crop(box)
+        factor = 1.0 / scale
+        if factor.is_integer() and factor > 1:
+            crop = crop.reduce(int(factor))  # Box filter, faster than resize
+        elif factor != 1:
+            size = (max(1, round(crop.width * scale)), max(1, round(crop.height * scale)))
+            crop = crop.resize(size, Image.Resampling.BOX)
+        return np.asarray(crop.convert("L"), dtype=np.float32)
+
+    @staticmethod
+    def _integral(arr: np.ndarray) -> np.ndarray:
+        """Integral image with a zero row/column prepended"""
+        integral = np.zeros((arr.shape[0] + 1, arr.shape[1] + 1), dtype=np.float64)
+        np.cumsum(np.cumsum(arr, axis=0, dtype=np.float64), axis=1, out=integral[1:, 1:])
+        return integral
+
+    @staticmethod
+    def _window_sums(integral: np.ndarray, th: int, tw: int) -> np.ndarray:
+        """Sum of every th x tw window, read from an integral image"""
+        return integral[th:, tw:] - integral[:-th, tw:] - integral[th:, :-tw] + integral[:-th, :-tw]
+
+    def _best_ncc(
+        self,
+        crop_shape: Tuple[int, int],
+        crop_spectrum: np.ndarray,
+        integral: np.ndarray,
+        sq_integral: np.ndarray,
+        prepared: _PreparedTemplate,
+    ) -> Optional[Tuple[float, Tuple[int, int]]]:
+        """
+        Compute the NCC map of a template over a crop and return its peak
+
+        Args:
+            crop_shape: (rows, cols) of the downsampled crop
+            crop_spectrum: rfft2 of the crop
+            integral: Integral image of the crop
+            sq_integral: Integral image of the squared crop
+            prepared: Precomputed template
+
+        Returns:
+            (score, (row, col)) of the best match, or None if template doesn't fit
+        """
+        th, tw = prepared.zero_mean.shape
+        ch, cw = crop_shape
+        if th > ch or tw > cw:
+            return None
+
+        # Numerator: cross-correlation with the zero-mean template via FFT.
+        # Valid (non-wrapping) offsets are the top-left (ch-th+1, cw-tw+1) block.
+        spectrum = prepared.spectra.get(crop_shape)
+        if spectrum is None:
+            spectrum = np.conj(np.fft.rfft2(prepared.zero_mean, s=crop_shape))
+            prepared.spectra[crop_shape] = spectrum
+        corr = np.fft.irfft2(crop_spectrum * spectrum, s=crop_shape)
+        numerator = corr[: ch - th + 1, : cw - tw + 1]
+
+        # Denominator: window standard deviation (unnormalized) from integral images
+        n = th * tw
+        sums = self._window_sums(integral, th, tw)
+        variance = np.maximum(self._window_sums(sq_integral, th, tw) - sums * sums / n, 0.0)
+        denominator = np.sqrt(variance) * prepared.norm
+
+        scores = np.zeros_like(numerator)
+        np.divide(numerator, denominator, out=scores, where=denominator > 1e-6)
+
+        flat_index = int(np.argmax(scores))
+        row, col = divmod(flat_index, scores.shape[1])
+        return float(scores[row, col]), (row, col)
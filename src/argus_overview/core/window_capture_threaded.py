@@ -1,6 +1,8 @@
 """
 Threaded Window Capture System
-High-performance capture with background threading
+High-performance capture with background threading. Every `import` goes
+through a per-window CaptureBreaker, so a hung client is backed off and then
+quarantined instead of stalling the workers on its 1s timeout
 """
 
 import io
@@ -8,15 +10,25 @@ import logging
 import re
 import subprocess
 import threading
+import time
 import uuid
 from queue import Empty, Queue
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Set, Tuple, Union
 
 from PIL import Image
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage
+
+from argus_overview.core.capture_breaker import CaptureBreaker
+from argus_overview.core.window_registry import WindowRegistry
+from argus_overview.utils.window_control import WindowControl
 
 # X11 window ID pattern: 0x followed by hex digits
 _WINDOW_ID_PATTERN = re.compile(r"^0x[0-9a-fA-F]+$")
 
+# Formats QPixmap.fromImage uploads without a conversion pass
+NATIVE_QIMAGE_FORMATS = (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32_Premultiplied)
+
 
 def _is_valid_window_id(window_id: str) -> bool:
     """Validate X11 window ID format."""
@@ -26,6 +38,10 @@ def _is_valid_window_id(window_id: str) -> bool:
 class WindowCaptureThreaded:
     """Thread-safe window capture system"""
 
+    CAPTURE_TIMEOUT_S = 1.0
+    PROBE_TIMEOUT_S = 0.5  # Liveness probe of a quarantined window
+    PROBE_TICK_S = 1.0  # How often the prober checks for due probes
+
     def __init__(self, max_workers: int = 4):
         self.logger = logging.getLogger(__name__)
         self.max_workers = max_workers
@@ -35,6 +51,15 @@ class WindowCaptureThreaded:
         self._stop_event = threading.Event()
         self._stop_event.set()  # Start in stopped state
 
+        # Time between the first and last client of the last broadcast_key (for diagnostics)
+        self.last_broadcast_skew_ms = 0.0
+
+        # Hung-window circuit breaker; the prober thread runs only while
+        # something is quarantined
+        self.breaker = CaptureBreaker()
+        self._prober: Optional[threading.Thread] = None
+        self._prober_lock = threading.Lock()
+
     @property
     def running(self) -> bool:
         """Thread-safe check if workers are running"""
@@ -48,6 +73,8 @@ class WindowCaptureThreaded:
             worker.start()
             self.workers.append(worker)
         self.logger.info(f"Started {self.max_workers} capture workers")
+        if self.breaker.quarantined():
+            self._ensure_prober()
 
     def stop(self):
         """Stop worker threads"""
@@ -66,8 +93,11 @@ class WindowCaptureThreaded:
                 if task is None:
                     break
 
-                window_id, scale, request_id = task
-                image = self._capture_window_sync(window_id, scale)
+                window_id, scale, request_id, target_size = task
+                if target_size is not None:
+                    image = self._capture_window_qimage_sync(window_id, target_size)
+                else:
+                    image = self._capture_window_sync(window_id, scale)
                 self.result_queue.put((request_id, window_id, image))
 
             except Empty:
@@ -75,9 +105,21 @@ class WindowCaptureThreaded:
             except Exception as e:
                 self.logger.error(f"Worker error: {e}")
 
-    def capture_window_async(self, window_id: str, scale: float = 1.0) -> str:
+    def capture_window_async(
+        self,
+        window_id: str,
+        scale: float = 1.0,
+        target_size: Optional[Tuple[int, int]] = None,
+    ) -> str:
         """Request async window capture
 
+        Args:
+            window_id: X11 window ID
+            scale: Scale for the PIL result
+            target_size: If set, the worker returns a display-ready QImage
+                (native RGB32, fitted to this (width, height)) instead of a
+                PIL image, so the GUI thread only uploads it
+
         Returns:
             request_id to retrieve result later (empty string if invalid window_id)
         """
@@ -85,29 +127,124 @@ class WindowCaptureThreaded:
             self.logger.warning(f"Invalid window ID format for capture: {window_id}")
             return ""
         request_id = str(uuid.uuid4())
-        self.capture_queue.put((window_id, scale, request_id))
+        self.capture_queue.put((window_id, scale, request_id, target_size))
         return request_id
 
-    def get_result(self, timeout: float = 0.1) -> Optional[Tuple[str, str, Image.Image]]:
+    def get_result(
+        self, timeout: float = 0.1
+    ) -> Optional[Tuple[str, str, Union[Image.Image, QImage, None]]]:
         """Get capture result if available
 
         Returns:
-            Tuple of (request_id, window_id, image) or None
+            Tuple of (request_id, window_id, image) or None. image is a QImage
+            for requests made with target_size, a PIL Image otherwise
         """
         try:
             return self.result_queue.get(timeout=timeout)
         except Empty:
             return None
 
-    def _capture_window_sync(self, window_id: str, scale: float) -> Optional[Image.Image]:
-        """Synchronous window capture"""
+    def pending_results(self) -> int:
+        """Approximate number of finished captures waiting to be collected"""
+        return self.result_queue.qsize()
+
+    def unresponsive_windows(self) -> Set[str]:
+        """Windows quarantined by the circuit breaker (not captured until they respond)"""
+        return self.breaker.quarantined()
+
+    def _run_import(self, window_id: str, args: List[str]) -> Optional[bytes]:
+        """
+        Run ImageMagick `import` for one window through the circuit breaker
+
+        Args:
+            window_id: X11 window ID
+            args: Options between the window and the png:- output
+
+        Returns:
+            PNG bytes, or None if the capture was refused or failed
+
+        Raises:
+            subprocess.TimeoutExpired and other subprocess errors, after they
+            were recorded as failures
+        """
+        if not self.breaker.allow(window_id):
+            return None
         try:
             result = subprocess.run(
-                ["import", "-window", window_id, "-silent", "png:-"], capture_output=True, timeout=1
+                ["import", "-window", window_id, "-silent", *args, "png:-"],
+                capture_output=True,
+                timeout=self.CAPTURE_TIMEOUT_S,
             )
+        except subprocess.TimeoutExpired:
+            if self.breaker.record_failure(window_id, timed_out=True):
+                self.logger.warning(f"Window {window_id} not responding, capture quarantined")
+                self._ensure_prober()
+            raise
+        except Exception:
+            self.breaker.record_failure(window_id, timed_out=False)
+            raise
+
+        if result.returncode == 0 and result.stdout:
+            if self.breaker.record_success(window_id):
+                self.logger.debug(f"Capture of {window_id} working again")
+            return result.stdout
+        self.breaker.record_failure(window_id, timed_out=False)
+        return None
+
+    def _ensure_prober(self):
+        """Start the liveness prober unless it's already running"""
+        with self._prober_lock:
+            if self._prober is not None:
+                return
+            self._prober = threading.Thread(target=self._probe_loop, daemon=True)
+            self._prober.start()
+
+    def _probe_loop(self):
+        """Probe quarantined windows until none are left or capture stops"""
+        while not self._stop_event.wait(self.PROBE_TICK_S):
+            for window_id in self.breaker.due_probes():
+                if self.breaker.record_probe(window_id, self._probe_window(window_id)):
+                    self.logger.info(f"Window {window_id} responding again, capture resumed")
+            with self._prober_lock:
+                if not self.breaker.quarantined():
+                    self._prober = None
+                    return
+        with self._prober_lock:
+            self._prober = None
+
+    def _probe_window(self, window_id: str) -> bool:
+        """
+        Cheap liveness probe: grab a single pixel with a short timeout
+
+        Property reads are answered by the X server even for a frozen client,
+        so they can't tell; the 1x1 grab exercises the same path that hung.
+        Any answer short of a timeout (including BadWindow for a closed
+        client) counts as responding and hands the window back to normal
+        backoff.
+
+        Returns:
+            False if the grab timed out
+        """
+        try:
+            subprocess.run(
+                ["import", "-window", window_id, "-silent", "-crop", "1x1+0+0", "png:-"],
+                capture_output=True,
+                timeout=self.PROBE_TIMEOUT_S,
+            )
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+        except Exception as e:
+            self.logger.debug(f"Liveness probe failed for {window_id}: {e}")
+            return True
+
+    def _capture_window_sync(self, window_id: str, scale: float) -> Optional[Image.Image]:
+        """Synchronous window capture"""
+        try:
+            data = self._run_import(window_id, [])
 
-            if result.returncode == 0 and result.stdout:
-                img: Image.Image = Image.open(io.BytesIO(result.stdout))
+            if data:
+                img: Image.Image = Image.open(io.BytesIO(data))
 
                 if scale != 1.0:
                     new_size = (int(img.width * scale), int(img.height * scale))
@@ -119,22 +256,120 @@ class WindowCaptureThreaded:
 
         return None
 
+    def _capture_window_qimage_sync(
+        self, window_id: str, target_size: Tuple[int, int]
+    ) -> Optional[QImage]:
+        """Synchronous capture straight into a display-ready QImage
+
+        The PNG is decoded by Qt directly into a QImage it owns (RGB32 for
+        opaque windows), then fitted to target_size here on the worker. No
+        PIL image or intermediate byte copy is made.
+
+        Args:
+            window_id: X11 window ID
+            target_size: (width, height) box to fit, keeping aspect ratio
+
+        Returns:
+            QImage in a native format, or None
+        """
+        try:
+            data = self._run_import(window_id, [])
+            if not data:
+                return None
+
+            qimage = QImage.fromData(data, "PNG")
+            if qimage.isNull():
+                return None
+            if qimage.format() not in NATIVE_QIMAGE_FORMATS:
+                qimage.convertTo(
+                    QImage.Format.Format_ARGB32_Premultiplied
+                    if qimage.hasAlphaChannel()
+                    else QImage.Format.Format_RGB32
+                )
+
+            target = QSize(*target_size)
+            if not target.isEmpty():
+                fitted = qimage.size().scaled(target, Qt.AspectRatioMode.KeepAspectRatio)
+                if fitted != qimage.size():
+                    qimage = qimage.scaled(
+                        fitted,
+                        Qt.AspectRatioMode.IgnoreAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation,
+                    )
+            return qimage
+        except Exception as e:
+            self.logger.debug(f"QImage capture failed for {window_id}: {e}")
+
+        return None
+
+    def capture_sample_sync(self, window_id: str, scale: float = 0.25) -> Optional[Image.Image]:
+        """Synchronous low-resolution capture for alert sampling
+
+        ImageMagick box-averages the grab down before encoding, so only a small
+        PNG crosses the pipe and no full-size resize runs in Python. Averaging
+        (rather than point sampling) keeps small icons matchable by template
+        zones at the sample scale.
+
+        Args:
+            window_id: X11 window ID
+            scale: Output scale (0-1]
+
+        Returns:
+            Downsampled image or None
+        """
+        if not _is_valid_window_id(window_id):
+            return None
+        percent = max(1, min(100, round(scale * 100)))
+
+        try:
+            data = self._run_import(window_id, ["-scale", f"{percent}%"])
+
+            if data:
+                img: Image.Image = Image.open(io.BytesIO(data))
+                return img
+        except Exception as e:
+            self.logger.debug(f"Sample capture failed for {window_id}: {e}")
+
+        return None
+
+    def capture_region_sync(
+        self, window_id: str, region: Tuple[int, int, int, int]
+    ) -> Optional[Image.Image]:
+        """Synchronous capture of a sub-rectangle of a window
+
+        Only the region is grabbed and encoded, which keeps high-rate watchers
+        (e.g. the Local list) far cheaper than a full-window capture.
+
+        Args:
+            window_id: X11 window ID
+            region: (x, y, width, height) in window pixels
+
+        Returns:
+            Cropped image or None
+        """
+        if not _is_valid_window_id(window_id):
+            return None
+        x, y, width, height = region
+        if width <= 0 or height <= 0:
+            return None
+
+        try:
+            data = self._run_import(window_id, ["-crop", f"{width}x{height}+{x}+{y}", "+repage"])
+
+            if data:
+                img: Image.Image = Image.open(io.BytesIO(data))
+                return img
+        except Exception as e:
+            self.logger.debug(f"Region capture failed for {window_id}: {e}")
+
+        return None
+
     def get_window_list(self) -> List[Tuple[str, str]]:
-        """Get list of all windows"""
+        """Get list of all windows (from the shared window registry snapshot)"""
         try:
-            result = subprocess.run(["wmctrl", "-l"], capture_output=True, text=True, timeout=2)
-
-            windows = []
-            if result.returncode == 0:
-                for line in result.stdout.strip().split("\n"):
-                    if line:
-                        parts = line.split(None, 3)
-                        if len(parts) >= 4:
-                            window_id = parts[0]
-                            window_title = parts[3]
-                            windows.append((window_id, window_title))
-
-            return windows
+            return [
+                (info.window_id, info.title) for info in WindowRegistry.get_instance().snapshot()
+            ]
         except Exception as e:
             self.logger.error(f"Failed to get window list: {e}")
             return []
@@ -144,6 +379,8 @@ class WindowCaptureThreaded:
         if not _is_valid_window_id(window_id):
             self.logger.warning(f"Invalid window ID format: {window_id}")
             return False
+        if WindowControl.get_instance().activate(window_id):
+            return True
         try:
             result = subprocess.run(
                 ["wmctrl", "-i", "-a", window_id], capture_output=True, timeout=1
@@ -158,6 +395,8 @@ class WindowCaptureThreaded:
         if not _is_valid_window_id(window_id):
             self.logger.warning(f"Invalid window ID format: {window_id}")
             return False
+        if WindowControl.get_instance().minimize(window_id):
+            return True
         try:
             result = subprocess.run(
                 ["xdotool", "windowminimize", window_id], capture_output=True, timeout=1
@@ -172,6 +411,8 @@ class WindowCaptureThreaded:
         if not _is_valid_window_id(window_id):
             self.logger.warning(f"Invalid window ID format: {window_id}")
             return False
+        if WindowControl.get_instance().restore(window_id):
+            return True
         try:
             result = subprocess.run(
                 ["xdotool", "windowactivate", window_id], capture_output=True, timeout=1
@@ -211,6 +452,10 @@ class WindowCaptureThreaded:
     def broadcast_key(self, window_ids: list, key: str) -> int:
         """Send a keystroke to multiple windows
 
+        Sends every client's key events in one X batch when possible, otherwise
+        runs xdotool per window. The spread between the first and last client
+        is kept in last_broadcast_skew_ms.
+
         Args:
             window_ids: List of X11 window IDs
             key: Key to send (e.g., "F1", "Return")
@@ -222,8 +467,29 @@ class WindowCaptureThreaded:
             self.logger.warning(f"Invalid key for broadcast: {key}")
             return 0
 
-        count = 0
-        for window_id in window_ids:
-            if self.send_key_to_window(window_id, key):
-                count += 1
+        valid_ids = [window_id for window_id in window_ids if _is_valid_window_id(window_id)]
+        if len(valid_ids) != len(window_ids):
+            self.logger.warning(f"Skipping {len(window_ids) - len(valid_ids)} invalid window IDs")
+
+        control = WindowControl.get_instance()
+        count = control.send_key(valid_ids, key)
+        if count:
+            self.last_broadcast_skew_ms = control.last_broadcast_skew_ms
+            method = "X batch"
+        else:
+            # No X connection or unknown key - one xdotool per window
+            delivered = []
+            for window_id in valid_ids:
+                if self.send_key_to_window(window_id, key):
+                    delivered.append(time.perf_counter())
+            count = len(delivered)
+            self.last_broadcast_skew_ms = (
+                (delivered[-1] - delivered[0]) * 1000 if delivered else 0.0
+            )
+            method = "xdotool"
+
+        self.logger.debug(
+            f"Broadcast '{key}' to {count} windows via {method}, "
+            f"skew {self.last_broadcast_skew_ms:.2f}ms"
+        )
         return count
@@ -0,0 +1,496 @@
+"""
+Window Events - Event-driven window tracking over native X
+Listens for PropertyNotify on the root window (_NET_CLIENT_LIST,
+_NET_ACTIVE_WINDOW) and on each client (_NET_WM_NAME / WM_NAME,
+_NET_WM_STATE), for clients being mapped and unmapped, and for RandR screen
+changes, instead of polling wmctrl, xdotool or xrandr, so windows that appear,
+close, get renamed, take focus or get minimized and monitors that are added,
+removed or rearranged are reported within milliseconds and nothing runs while
+the desktop is idle
+"""
+
+import logging
+import os
+import select
+import threading
+from abc import abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from argus_overview.core.window_registry import WindowRegistry
+from argus_overview.utils.screen import MonitorCache
+from argus_overview.utils.x11 import (
+    XLIB_AVAILABLE,
+    X,
+    XError,
+    int_to_window_id,
+    open_display,
+    randr,
+)
+
+
+class _RootPropertyWatcher(QObject):
+    """
+    Base for watchers driven by PropertyNotify events.
+
+    Owns an X connection and an event thread (python-xlib connections aren't
+    thread-safe) that blocks in select() on the X socket; stop() wakes it
+    through a pipe. Subclasses list the atoms they need, read their initial
+    state in _setup(), handle events in _handle_event() and emit in
+    _emit_changed(). These hooks are abstract; Qt's metaclass skips ABCMeta's
+    check, so __init__ enforces it and a missing override fails on construction.
+    """
+
+    watch_lost = Signal()  # X connection failed; the owner should fall back to polling
+
+    ATOMS: Tuple[str, ...] = ()
+    NAME = "window events"
+    ROOT_PROPERTY_EVENTS = True  # Select PropertyNotify on the root window
+
+    def __init__(self, parent=None):
+        missing = [
+            name
+            for name in ("_setup", "_handle_event", "_emit_changed")
+            if getattr(getattr(type(self), name), "__isabstractmethod__", False)
+        ]
+        if missing:
+            raise TypeError(f"{type(self).__name__} must implement {', '.join(missing)}")
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+
+        self._display: Optional[Any] = None
+        self._root: Optional[Any] = None
+        self._atoms: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._stop_event.set()  # Start in stopped state
+        self._thread: Optional[threading.Thread] = None
+        self._wake_fds: Optional[Tuple[int, int]] = None
+
+        # Counters (for diagnostics and benchmarks)
+        self.events_handled = 0
+        self.wakeups = 0
+        self.error_count = 0
+
+    @property
+    def running(self) -> bool:
+        """Thread-safe check if the watcher thread is running"""
+        return not self._stop_event.is_set()
+
+    def start(self) -> bool:
+        """
+        Open the X connection, read the initial state and start the event thread
+
+        Returns:
+            True if running (python-xlib available, display opened, WM support present)
+        """
+        if self.running:
+            return True
+        if not XLIB_AVAILABLE:
+            self.logger.warning(f"python-xlib not available, {self.NAME} disabled")
+            return False
+
+        self._display = open_display()
+        if self._display is None:
+            self.logger.warning(f"Could not open X display, {self.NAME} disabled")
+            return False
+
+        try:
+            self._display.set_error_handler(self._on_async_error)
+            self._root = self._display.screen().root
+            for name in self.ATOMS:
+                self._atoms[name] = self._display.intern_atom(name)
+            # Subscribe before the initial read so no change slips in between
+            if self.ROOT_PROPERTY_EVENTS:
+                self._root.change_attributes(event_mask=X.PropertyChangeMask)
+            if not self._setup():
+                self._close_display()
+                return False
+            self._display.flush()
+        except (XError, OSError) as e:
+            self.logger.warning(f"{self.NAME.capitalize()} unavailable: {e}")
+            self._close_display()
+            return False
+
+        self._wake_fds = os.pipe()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.logger.info(f"{self.NAME.capitalize()} watcher started")
+        return True
+
+    def stop(self):
+        """Stop the event thread and close the X connection"""
+        self._stop_event.set()
+        if self._wake_fds is not None:
+            os.write(self._wake_fds[1], b"\0")
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._wake_fds is not None:
+            for fd in self._wake_fds:
+                os.close(fd)
+            self._wake_fds = None
+        self._close_display()
+
+    def _close_display(self):
+        """Close the X connection if open"""
+        if self._display is not None:
+            try:
+                self._display.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing event display: {e}")
+            self._display = None
+
+    def _run(self):
+        """Event thread loop - sleeps in select() until X or stop() has something"""
+        x_fd = self._display.fileno()
+        wake_fd = self._wake_fds[0]
+        while not self._stop_event.is_set():
+            try:
+                if not self._display.pending_events():
+                    readable, _, _ = select.select([x_fd, wake_fd], [], [])
+                    self.wakeups += 1
+                    if wake_fd in readable:
+                        break
+                self.process_pending()
+            except XError as e:
+                self.error_count += 1
+                self.logger.error(f"Window event error: {e}")
+            except Exception as e:
+                # Connection closed (X server gone) - hand over to polling
+                self.error_count += 1
+                self.logger.error(f"Window event watcher lost the X connection: {e}")
+                self._stop_event.set()
+                self.watch_lost.emit()
+                break
+
+    def process_pending(self) -> bool:
+        """
+        Handle every queued X event, then emit once if anything changed
+
+        Returns:
+            True if the watched state changed
+        """
+        changed = False
+        while self._display.pending_events():
+            event = self._display.next_event()
+            self.events_handled += 1
+            if self._accepts(event):
+                changed |= self._handle_event(event)
+
+        if changed:
+            self._emit_changed()
+        return changed
+
+    @abstractmethod
+    def _setup(self) -> bool:
+        """Read the initial state; False if the window manager doesn't support it"""
+
+    def _accepts(self, event) -> bool:
+        """Whether an event goes to _handle_event (PropertyNotify by default)"""
+        return event.type == X.PropertyNotify
+
+    @abstractmethod
+    def _handle_event(self, event) -> bool:
+        """Handle one accepted event; True if the watched state changed"""
+
+    @abstractmethod
+    def _emit_changed(self):
+        """Emit the subclass's change signal with the current state"""
+
+    def _read_client_list(self) -> Optional[List[int]]:
+        """
+        Window IDs from the root _NET_CLIENT_LIST (needs it in ATOMS)
+
+        Returns:
+            XIDs in client-list order, or None if the WM doesn't set it
+        """
+        prop = self._root.get_full_property(self._atoms["_NET_CLIENT_LIST"], X.AnyPropertyType)
+        if prop is None:
+            return None
+        return [int(xid) for xid in prop.value]
+
+    def _on_async_error(self, error, request):
+        """Errors from requests without replies (e.g. selecting events on a closed window)"""
+        self.error_count += 1
+        self.logger.debug(f"X error: {error}")
+
+
+class ClientListWatcher(_RootPropertyWatcher):
+    """
+    Tracks the window manager's client list, titles and map state via X events.
+
+    Features:
+    - Own X connection and thread (see _RootPropertyWatcher)
+    - Re-reads _NET_CLIENT_LIST only when the root property changes
+    - Re-reads a title only when that client's name property changes
+    - Emits the full (window_id, title) list, in client-list order, on change
+    - Reads each client's map state and _NET_WM_STATE_HIDDEN once when it
+      appears, then follows Map/UnmapNotify and _NET_WM_STATE changes into
+      the WindowRegistry's map-state table (cleared again on stop())
+    """
+
+    windows_changed = Signal(list)  # [(window_id, window_title), ...]
+
+    ATOMS = (
+        "_NET_CLIENT_LIST",
+        "_NET_WM_NAME",
+        "WM_NAME",
+        "UTF8_STRING",
+        "_NET_WM_STATE",
+        "_NET_WM_STATE_HIDDEN",
+    )
+    NAME = "window events"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._titles: Dict[str, str] = {}  # window_id -> title, in client-list order
+
+    def windows(self) -> List[Tuple[str, str]]:
+        """Get a snapshot of (window_id, window_title) for every client"""
+        with self._lock:
+            return list(self._titles.items())
+
+    def stop(self):
+        """Stop watching; the registry stops treating clients as minimized"""
+        super().stop()
+        WindowRegistry.get_instance().set_client_states({})
+
+    def _setup(self) -> bool:
+        """Read the client list and every title and map state"""
+        if self._read_client_list() is None:
+            self.logger.warning("Window manager has no _NET_CLIENT_LIST, window events disabled")
+            return False
+        self.refresh_client_list()
+        return True
+
+    def _accepts(self, event) -> bool:
+        return event.type in (X.PropertyNotify, X.MapNotify, X.UnmapNotify)
+
+    def _handle_event(self, event) -> bool:
+        """
+        Client list changes on the root; name, map and _NET_WM_STATE changes on clients
+
+        Map state goes straight to the registry, so only list and title
+        changes count as changed (and emit windows_changed).
+        """
+        if event.type != X.PropertyNotify:
+            WindowRegistry.get_instance().update_client_state(
+                int_to_window_id(event.window.id), mapped=event.type == X.MapNotify
+            )
+            return False
+        if event.window.id == self._root.id:
+            if event.atom == self._atoms["_NET_CLIENT_LIST"]:
+                return self.refresh_client_list()
+        elif event.atom in (self._atoms["_NET_WM_NAME"], self._atoms["WM_NAME"]):
+            return self._refresh_title(int_to_window_id(event.window.id))
+        elif event.atom == self._atoms["_NET_WM_STATE"]:
+            self._refresh_hidden(event.window)
+        return False
+
+    def _emit_changed(self):
+        self.windows_changed.emit(self.windows())
+
+    def refresh_client_list(self) -> bool:
+        """
+        Re-read _NET_CLIENT_LIST, subscribing to and reading new clients
+
+        Returns:
+            True if clients were added or removed
+        """
+        xids = self._read_client_list() or []
+        registry = WindowRegistry.get_instance()
+
+        with self._lock:
+            known = dict(self._titles)
+        known_states = registry.client_states()
+        titles: Dict[str, str] = {}
+        states: Dict[str, Tuple[bool, bool]] = {}
+        for xid in xids:
+            window_id = int_to_window_id(xid)
+            if window_id in known and window_id in known_states:
+                titles[window_id] = known[window_id]
+                states[window_id] = known_states[window_id]
+                continue
+            window = self._display.create_resource_object("window", xid)
+            try:
+                # Subscribe before reading so no change slips in between
+                window.change_attributes(event_mask=X.StructureNotifyMask | X.PropertyChangeMask)
+                titles[window_id] = self._read_title(window)
+                # The client's own map state, which is what Map/UnmapNotify report
+                mapped = window.get_attributes().map_state != X.IsUnmapped
+                states[window_id] = (mapped, self._read_hidden(window))
+            except XError as e:
+                titles.pop(window_id, None)
+                self.error_count += 1  # Closed between the list and the lookup
+                self.logger.debug(f"Skipping vanished window {window_id}: {e}")
+        self._display.flush()
+        registry.set_client_states(states)
+
+        with self._lock:
+            changed = list(titles) != list(self._titles)
+            self._titles = titles
+        return changed
+
+    def _refresh_title(self, window_id: str) -> bool:
+        """Re-read one client's title; True if it changed"""
+        with self._lock:
+            if window_id not in self._titles:
+                return False
+        window = self._display.create_resource_object("window", int(window_id, 16))
+        try:
+            title = self._read_title(window)
+        except XError as e:
+            self.error_count += 1
+            self.logger.debug(f"Title lookup failed for {window_id}: {e}")
+            return False
+
+        with self._lock:
+            if window_id not in self._titles or self._titles[window_id] == title:
+                return False
+            self._titles[window_id] = title
+        return True
+
+    def _refresh_hidden(self, window):
+        """Re-read one client's _NET_WM_STATE_HIDDEN into the registry"""
+        try:
+            hidden = self._read_hidden(window)
+        except XError as e:
+            self.error_count += 1
+            self.logger.debug(f"State lookup failed for {window.id:#x}: {e}")
+            return
+        WindowRegistry.get_instance().update_client_state(
+            int_to_window_id(window.id), hidden=hidden
+        )
+
+    def _read_hidden(self, window) -> bool:
+        """Whether a client's _NET_WM_STATE contains _NET_WM_STATE_HIDDEN"""
+        prop = window.get_full_property(self._atoms["_NET_WM_STATE"], X.AnyPropertyType)
+        return prop is not None and self._atoms["_NET_WM_STATE_HIDDEN"] in prop.value
+
+    def _read_title(self, window) -> str:
+        """_NET_WM_NAME (UTF-8), falling back to WM_NAME"""
+        prop = window.get_full_property(self._atoms["_NET_WM_NAME"], self._atoms["UTF8_STRING"])
+        if prop is None or not prop.value:
+            prop = window.get_full_property(self._atoms["WM_NAME"], X.AnyPropertyType)
+        if prop is None or not prop.value:
+            return ""
+        value = prop.value
+        if isinstance(value, bytes):
+            return value.decode("utf-8", errors="replace")
+        return str(value)
+
+
+class ActiveWindowWatcher(_RootPropertyWatcher):
+    """
+    Tracks the focused window from _NET_ACTIVE_WINDOW changes on the root.
+
+    Replaces `xdotool getwindowfocus` calls: the active window is pushed as it
+    changes (active_changed) and readable at any time (active_window()).
+
+    Usage:
+        watcher = ActiveWindowWatcher()
+        watcher.active_changed.connect(on_focus)
+        watcher.start()
+    """
+
+    active_changed = Signal(str)  # window_id, "" when nothing is active
+
+    ATOMS = ("_NET_ACTIVE_WINDOW",)
+    NAME = "focus tracking"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._active: Optional[str] = None
+
+    def active_window(self) -> Optional[str]:
+        """Get the active window ID ("0x%08x"), or None if nothing is active"""
+        with self._lock:
+            return self._active
+
+    def _setup(self) -> bool:
+        """Read the current active window"""
+        prop = self._root.get_full_property(self._atoms["_NET_ACTIVE_WINDOW"], X.AnyPropertyType)
+        if prop is None:
+            self.logger.warning("Window manager has no _NET_ACTIVE_WINDOW, focus tracking disabled")
+            return False
+        self._set_active(prop)
+        return True
+
+    def _handle_event(self, event) -> bool:
+        """_NET_ACTIVE_WINDOW changes on the root"""
+        if event.window.id != self._root.id or event.atom != self._atoms["_NET_ACTIVE_WINDOW"]:
+            return False
+        return self._set_active(
+            self._root.get_full_property(self._atoms["_NET_ACTIVE_WINDOW"], X.AnyPropertyType)
+        )
+
+    def _emit_changed(self):
+        self.active_changed.emit(self.active_window() or "")
+
+    def _set_active(self, prop) -> bool:
+        """Store the window from a _NET_ACTIVE_WINDOW property; True if it changed"""
+        xid = int(prop.value[0]) if prop is not None and len(prop.value) else 0
+        active = int_to_window_id(xid) if xid else None
+        with self._lock:
+            if active == self._active:
+                return False
+            self._active = active
+        return True
+
+
+class ScreenChangeWatcher(_RootPropertyWatcher):
+    """
+    Invalidates the monitor cache when the RandR screen configuration changes.
+
+    Selects RRScreenChangeNotify plus CRTC/output change notifications on the
+    root window, so monitors being plugged in, unplugged, resized or moved
+    expire MonitorCache right away (on the event thread) and screens_changed
+    tells the GUI.
+
+    Usage:
+        watcher = ScreenChangeWatcher()
+        watcher.screens_changed.connect(on_screens_changed)
+        watcher.start()
+    """
+
+    screens_changed = Signal()
+
+    NAME = "monitor tracking"
+    ROOT_PROPERTY_EVENTS = False
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._event_types: Tuple[int, ...] = ()
+
+    def _setup(self) -> bool:
+        """Select RandR change events on the root"""
+        extension = self._display.query_extension("RANDR")
+        if extension is None:
+            self.logger.warning("X server has no RandR, monitor tracking disabled")
+            return False
+        # Computed from the extension's event base: python-xlib only registers
+        # RandR event classes for servers with RandR 1.5+
+        self._event_types = (
+            extension.first_event + randr.RRScreenChangeNotify,
+            extension.first_event + randr.RRNotify,
+        )
+        self._root.xrandr_select_input(
+            randr.RRScreenChangeNotifyMask
+            | randr.RRCrtcChangeNotifyMask
+            | randr.RROutputChangeNotifyMask
+        )
+        return True
+
+    def _accepts(self, event) -> bool:
+        return event.type in self._event_types
+
+    def _handle_event(self, event) -> bool:
+        """Any screen change expires the cached monitor layout"""
+        MonitorCache.get_instance().invalidate()
+        return True
+
+    def _emit_changed(self):
+        self.screens_changed.emit()
@@ -0,0 +1,150 @@
+"""
+Bulk Window Operations - Run one window operation across many windows off the GUI thread
+Minimize/restore all and auto-minimize used to call the capture system once per
+window on the GUI thread, each call possibly a blocking xdotool subprocess.
+BulkWindowOps runs the whole set on a worker thread: as one batch of EWMH
+messages (single flush) when WindowControl has an X connection, otherwise on a
+bounded thread pool so the subprocess fallbacks overlap. Per-window results are
+reported back through operation_finished
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from PySide6.QtCore import QObject, Signal
+
+from argus_overview.utils.window_control import WindowControl
+
+logger = logging.getLogger(__name__)
+
+
+def run_concurrently(
+    window_ids: List[str], func: Callable[[str], bool], max_workers: int = 8
+) -> Dict[str, bool]:
+    """
+    Run a per-window operation across windows and wait for the results
+
+    With an X connection the EWMH requests func sends are queued and written
+    with one flush; otherwise the calls (usually subprocess fallbacks) overlap
+    on a bounded thread pool.
+
+    Args:
+        window_ids: Windows to operate on
+        func: Per-window operation returning True on success
+        max_workers: Thread pool bound for the fallback
+
+    Returns:
+        Dict of window_id -> success, in window_ids order (exceptions count as failure)
+    """
+    if not window_ids:
+        return {}
+
+    control = WindowControl.get_instance()
+    if control.available:
+        with control.batch():
+            return {window_id: _call(func, window_id) for window_id in window_ids}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(window_ids))) as pool:
+        results = pool.map(lambda window_id: _call(func, window_id), window_ids)
+        return dict(zip(window_ids, results))
+
+
+def _call(func: Callable[[str], bool], window_id: str) -> bool:
+    """Call func for one window; errors count as failure"""
+    try:
+        return bool(func(window_id))
+    except Exception as e:
+        logger.error(f"Window operation failed for {window_id}: {e}")
+        return False
+
+
+class BulkWindowOps(QObject):
+    """
+    Executes a per-window operation across a window set concurrently.
+
+    Features:
+    - Never blocks the caller; work runs on a daemon thread
+    - One X batch when window control is available, else a bounded pool
+    - operation_finished(operation, {window_id: success}) on completion,
+      delivered on the owner's (GUI) thread
+
+    Usage:
+        ops = BulkWindowOps(self)
+        ops.operation_finished.connect(self._on_bulk_finished)
+        ops.run("minimize_all", window_ids, capture_system.minimize_window)
+    """
+
+    operation_finished = Signal(str, dict)  # operation, {window_id: success}
+
+    MAX_WORKERS = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+        # Counters (for diagnostics and benchmarks)
+        self.operations_run = 0
+        self.last_duration_ms = 0.0
+
+    def run(self, operation: str, window_ids: List[str], func: Callable[[str], bool]):
+        """
+        Start an operation on every window without waiting for it
+
+        Args:
+            operation: Name reported back with the results (e.g. "minimize_all")
+            window_ids: Windows to operate on
+            func: Per-window operation returning True on success
+        """
+        thread = threading.Thread(
+            target=self._run, args=(operation, list(window_ids), func), daemon=True
+        )
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+
+    def wait(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for running operations to finish (for shutdown and tests)
+
+        Args:
+            timeout: Seconds to wait per operation
+
+        Returns:
+            True if nothing is running anymore
+        """
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+        return not any(thread.is_alive() for thread in threads)
+
+    def execute(self, window_ids: List[str], func: Callable[[str], bool]) -> Dict[str, bool]:
+        """
+        Run an operation on every window and wait for the results
+
+        Args:
+            window_ids: Windows to operate on
+            func: Per-window operation returning True on success
+
+        Returns:
+            Dict of window_id -> success, in window_ids order
+        """
+        return run_concurrently(window_ids, func, self.MAX_WORKERS)
+
+    def _run(self, operation: str, window_ids: List[str], func: Callable[[str], bool]):
+        """Worker thread: execute and report"""
+        start = time.perf_counter()
+        results = self.execute(window_ids, func)
+        self.last_duration_ms = (time.perf_counter() - start) * 1000
+        self.operations_run += 1
+        self.logger.debug(
+            f"{operation}: {sum(results.values())}/{len(results)} windows "
+            f"in {self.last_duration_ms:.1f}ms"
+        )
+        self.operation_finished.emit(operation, results)
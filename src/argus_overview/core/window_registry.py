@@ -0,0 +1,253 @@
+"""
+Window Registry - One shared snapshot of the desktop's top-level windows
+Discovery, one-click import and the add-window dialog used to each run and
+parse their own wmctrl query; the registry runs one `wmctrl -lpG` per refresh,
+keeps the result for a short TTL, and counts real changes in a generation
+number. It also holds the clients' map state, which the X client-list watcher
+keeps current from events
+"""
+
+import logging
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+# EVE window title patterns - the capture group is the character name
+EVE_TITLE_PATTERNS = [
+    r"^EVE - (.+)$",  # Standard: "EVE - Character Name"
+    r"^EVE Online - (.+)$",  # Alternative: "EVE Online - Character Name"
+]
+
+
+def character_from_title(title: str) -> Optional[str]:
+    """
+    Extract the EVE character name from a window title
+
+    Args:
+        title: Window title
+
+    Returns:
+        Character name, or None for non-EVE windows and empty names
+    """
+    for pattern in EVE_TITLE_PATTERNS:
+        match = re.match(pattern, title)
+        if match:
+            return match.group(1).strip() or None
+    return None
+
+
+@dataclass(frozen=True)
+class WindowInfo:
+    """One top-level window as seen by the last registry refresh"""
+
+    window_id: str
+    title: str
+    character: Optional[str] = None  # EVE character name, None for other windows
+    desktop: int = 0  # -1 for sticky windows
+    geometry: Tuple[int, int, int, int] = (0, 0, 0, 0)  # x, y, width, height
+    pid: int = 0  # 0 if the client doesn't set _NET_WM_PID
+
+
+class WindowRegistry:
+    """
+    Owns the current window snapshot for the whole app.
+
+    Features:
+    - One `wmctrl -lpG` query per refresh (id, desktop, pid, geometry, title)
+    - Snapshots are reused for max_age seconds, so consumers polling at the
+      same time share one query
+    - generation increments only when the window set actually changed
+    - One map-state table (mapped, _NET_WM_STATE_HIDDEN) per client, written
+      by ClientListWatcher from X events; minimized() reads it without a query
+
+    Usage:
+        registry = WindowRegistry.get_instance()
+        for info in registry.snapshot():
+            ...
+    """
+
+    DEFAULT_MAX_AGE_S = 1.0
+
+    _instance = None
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+        self._windows: Dict[str, WindowInfo] = {}  # window_id -> info, in stacking order
+        self._lock = threading.RLock()
+        self._refreshed_at: Optional[float] = None
+        self.generation = 0
+
+        # window_id -> (mapped, hidden), empty unless X events are tracked
+        self._client_states: Dict[str, Tuple[bool, bool]] = {}
+
+        # Counters (for diagnostics and benchmarks)
+        self.queries = 0
+        self.query_failures = 0
+        self.last_query_ms = 0.0
+
+    @classmethod
+    def get_instance(cls) -> "WindowRegistry":
+        """Get singleton instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)"""
+        cls._instance = None
+
+    def snapshot(self, max_age: Optional[float] = None) -> List[WindowInfo]:
+        """
+        Get every window, refreshing first if the snapshot is older than max_age
+
+        Args:
+            max_age: Seconds a snapshot may be reused (defaults to DEFAULT_MAX_AGE_S)
+
+        Returns:
+            List of WindowInfo in window manager stacking order
+        """
+        if max_age is None:
+            max_age = self.DEFAULT_MAX_AGE_S
+        with self._lock:
+            if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= max_age:
+                self.refresh()
+            return list(self._windows.values())
+
+    def eve_windows(self, max_age: Optional[float] = None) -> List[WindowInfo]:
+        """Like snapshot(), but only windows with an EVE character name"""
+        return [info for info in self.snapshot(max_age) if info.character]
+
+    def get(self, window_id: str) -> Optional[WindowInfo]:
+        """Get a window from the current snapshot without refreshing"""
+        with self._lock:
+            return self._windows.get(window_id)
+
+    def invalidate(self):
+        """Expire the snapshot so the next read queries again (e.g. on an X event)"""
+        with self._lock:
+            self._refreshed_at = None
+
+    def minimized(self) -> Set[str]:
+        """Get the IDs ("0x%08x") of clients that are unmapped or hidden"""
+        with self._lock:
+            return {
+                window_id
+                for window_id, (mapped, hidden) in self._client_states.items()
+                if not mapped or hidden
+            }
+
+    def client_states(self) -> Dict[str, Tuple[bool, bool]]:
+        """Get a copy of the map-state table (window_id -> (mapped, hidden))"""
+        with self._lock:
+            return dict(self._client_states)
+
+    def set_client_states(self, states: Dict[str, Tuple[bool, bool]]):
+        """
+        Replace the map-state table (new client list, or tracking stopped)
+
+        Args:
+            states: window_id -> (mapped, hidden) for every client
+        """
+        with self._lock:
+            self._client_states = dict(states)
+
+    def update_client_state(
+        self, window_id: str, mapped: Optional[bool] = None, hidden: Optional[bool] = None
+    ) -> bool:
+        """
+        Store part of one client's map state
+
+        Args:
+            window_id: Client ID ("0x%08x")
+            mapped: New map state, or None to keep it
+            hidden: New _NET_WM_STATE_HIDDEN state, or None to keep it
+
+        Returns:
+            True if the client became or stopped being minimized
+        """
+        with self._lock:
+            state = self._client_states.get(window_id)
+            if state is None:
+                return False
+            new_state = (
+                state[0] if mapped is None else mapped,
+                state[1] if hidden is None else hidden,
+            )
+            self._client_states[window_id] = new_state
+            return (not state[0] or state[1]) != (not new_state[0] or new_state[1])
+
+    def refresh(self) -> bool:
+        """
+        Query the window list now
+
+        Returns:
+            True if windows were added, removed or changed
+        """
+        with self._lock:
+            windows = self._query()
+            self._refreshed_at = time.monotonic()
+            if windows is None:
+                return False  # Keep the last good snapshot
+
+            current = {info.window_id: info for info in windows}
+            # Dict equality ignores order, so a restack alone isn't a change
+            if current == self._windows:
+                self._windows = current
+                return False
+            self._windows = current
+            self.generation += 1
+            return True
+
+    def _query(self) -> Optional[List[WindowInfo]]:
+        """Run the shared window query; None if it failed"""
+        start = time.perf_counter()
+        self.queries += 1
+        try:
+            result = subprocess.run(["wmctrl", "-lpG"], capture_output=True, text=True, timeout=2)
+            if result.returncode != 0:
+                self.query_failures += 1
+                return None
+            return self._parse(result.stdout)
+        except Exception as e:
+            self.query_failures += 1
+            self.logger.error(f"Failed to list windows: {e}")
+            return None
+        finally:
+            self.last_query_ms = (time.perf_counter() - start) * 1000
+
+    def _parse(self, output: str) -> List[WindowInfo]:
+        """
+        Parse `wmctrl -lpG` output
+
+        Args:
+            output: Lines of "id desktop pid x y width height host title"
+
+        Returns:
+            List of WindowInfo (malformed lines skipped)
+        """
+        windows = []
+        for line in output.strip().split("\n"):
+            parts = line.split(None, 8)
+            if len(parts) < 9:
+                continue
+            try:
+                desktop, pid, x, y, width, height = (int(value) for value in parts[1:7])
+            except ValueError:
+                continue
+            title = parts[8]
+            windows.append(
+                WindowInfo(
+                    window_id=parts[0],
+                    title=title,
+                    character=character_from_title(title),
+                    desktop=desktop,
+                    geometry=(x, y, width, height),
+                    pid=pid,
+                )
+            )
+        return windows
@@ -0,0 +1,169 @@
+"""
+Animation Clock - One application-wide driver for preview animations
+Replaces the per-preview flash and session QTimers: a single timer that
+wakes at 10 Hz only while an alert border is flashing, otherwise only when a
+session label or activity indicator is due to change, and not at all when
+every client is idle
+"""
+
+import logging
+import time
+from typing import Dict, List
+
+from PySide6.QtCore import QObject, QTimer
+
+# Seconds after activity that the indicator shows "recent" before turning idle
+RECENT_ACTIVITY_S = 5
+
+
+class AnimationClock(QObject):
+    """
+    Shared tick source for WindowPreviewWidget and ThumbnailTile.
+
+    Items register what they need:
+    - start_flash(item): item.flash_tick() -> bool is called every
+      FLASH_INTERVAL_MS until it returns False
+    - add_session(item): item.session_tick() is called every SESSION_INTERVAL_S
+    - schedule_repaint(item, delay_s): item.update() once after the delay
+      (activity indicator turning idle)
+
+    All items due on the same tick are advanced together and their update()
+    calls land in the same event-loop pass, so Qt paints them in one batch.
+
+    Usage:
+        clock = AnimationClock.get_instance()
+        clock.start_flash(widget)
+    """
+
+    FLASH_INTERVAL_MS = 100  # 10 Hz alert border flash
+    SESSION_INTERVAL_S = 60.0  # Session labels show minutes
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+
+        self._flashing: List = []
+        self._session: List = []
+        self._repaint_due: Dict = {}  # item -> monotonic time of its repaint
+        self._next_session = 0.0
+
+        # Single-shot, re-armed for the next thing that is due
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+
+        # Counters (for diagnostics and benchmarks)
+        self.ticks = 0
+
+    @classmethod
+    def get_instance(cls) -> "AnimationClock":
+        """Get singleton instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)"""
+        if cls._instance is not None:
+            cls._instance._timer.stop()
+        cls._instance = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the clock has a wakeup scheduled"""
+        return self._timer.isActive()
+
+    def start_flash(self, item):
+        """Tick item.flash_tick() at FLASH_INTERVAL_MS until it returns False"""
+        if item not in self._flashing:
+            self._flashing.append(item)
+        self._schedule()
+
+    def add_session(self, item):
+        """Call item.session_tick() every SESSION_INTERVAL_S"""
+        if item in self._session:
+            return
+        if not self._session:
+            self._next_session = time.monotonic() + self.SESSION_INTERVAL_S
+        self._session.append(item)
+        self._schedule()
+
+    def schedule_repaint(self, item, delay_s: float):
+        """Call item.update() once, delay_s from now (keeps the earliest request)"""
+        due = time.monotonic() + max(0.0, delay_s)
+        current = self._repaint_due.get(item)
+        if current is None or due < current:
+            self._repaint_due[item] = due
+        self._schedule()
+
+    def forget(self, item):
+        """Drop every registration of an item (call before deleting it)"""
+        if item in self._flashing:
+            self._flashing.remove(item)
+        if item in self._session:
+            self._session.remove(item)
+        self._repaint_due.pop(item, None)
+        self._schedule()
+
+    def is_flashing(self, item) -> bool:
+        """Whether the item is currently registered for flash ticks"""
+        return item in self._flashing
+
+    def _schedule(self):
+        """Arm the timer for the next due item, or stop it when idle"""
+        if self._flashing:
+            delay_ms = self.FLASH_INTERVAL_MS
+        else:
+            deadlines = list(self._repaint_due.values())
+            if self._session:
+                deadlines.append(self._next_session)
+            if not deadlines:
+                self._timer.stop()
+                return
+            delay_ms = max(0, int((min(deadlines) - time.monotonic()) * 1000))
+
+        # Don't push back a wakeup that is already sooner
+        if self._timer.isActive() and self._timer.remainingTime() <= delay_ms:
+            return
+        self._timer.start(delay_ms)
+
+    def _tick(self):
+        """Advance everything that is due, then repaint it in one pass"""
+        self.ticks += 1
+        now = time.monotonic()
+        dirty: List = []
+
+        for item in list(self._flashing):
+            try:
+                still_flashing = item.flash_tick()
+            except RuntimeError:  # Underlying Qt object already deleted
+                self.forget(item)
+                continue
+            if not still_flashing:
+                self._flashing.remove(item)
+            dirty.append(item)
+
+        if self._session and now >= self._next_session:
+            self._next_session = now + self.SESSION_INTERVAL_S
+            for item in list(self._session):
+                try:
+                    item.session_tick()
+                except RuntimeError:
+                    self.forget(item)
+
+        for item, due in list(self._repaint_due.items()):
+            if due <= now:
+                del self._repaint_due[item]
+                if item not in dirty:
+                    dirty.append(item)
+
+        for item in dirty:
+            try:
+                item.update()
+            except RuntimeError:
+                self.forget(item)
+
+        self._schedule()
@@ -6,7 +6,7 @@ Supports grid patterns, stacking, and custom positioning
 import logging
 import re
 import subprocess
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor
@@ -27,8 +27,10 @@ from PySide6.QtWidgets import (
 )
 
 from argus_overview.core.layout_manager import GridPattern
+from argus_overview.core.layout_transaction import LayoutCommitter, LayoutResult, LayoutTransaction
 from argus_overview.ui.main_tab import get_pattern_positions
 from argus_overview.utils.screen import ScreenGeometry, get_screen_geometry
+from argus_overview.utils.window_control import WindowControl
 
 
 def get_all_patterns():
@@ -257,17 +259,18 @@ class ArrangementGrid(QWidget):
 
 
 class GridApplier:
-    """Applies grid patterns to actual windows using xdotool"""
+    """Applies grid patterns to actual windows (one layout transaction per apply)"""
 
     def __init__(self, layout_manager):
         self.layout_manager = layout_manager
         self.logger = logging.getLogger(__name__)
+        self.last_result: Optional[LayoutResult] = None  # Timing of the last apply
 
     def get_screen_geometry(self, monitor: int = 0) -> ScreenGeometry:
         """Get screen geometry for a monitor (delegates to shared utility)"""
         return get_screen_geometry(monitor)
 
-    def apply_arrangement(
+    def build_transaction(
         self,
         arrangement: Dict[str, Tuple[int, int]],
         window_map: Dict[str, str],
@@ -276,9 +279,9 @@ class GridApplier:
         grid_cols: int,
         spacing: int = 10,
         stacked: bool = False,
-    ) -> bool:
+    ) -> Optional[LayoutTransaction]:
         """
-        Apply arrangement to windows
+        Collect the moves an arrangement needs without applying them
 
         Args:
             arrangement: {char_name: (row, col)}
@@ -287,8 +290,12 @@ class GridApplier:
             grid_rows, grid_cols: Grid dimensions
             spacing: Spacing between windows
             stacked: If True, all windows at same position
+
+        Returns:
+            LayoutTransaction to commit, or None if the layout can't be computed
         """
         try:
+            transaction = LayoutTransaction(self._move_window)
             if stacked:
                 # All windows same size and position
                 for _char_name, window_id in window_map.items():
@@ -297,7 +304,7 @@ class GridApplier:
                     w = screen.width - spacing * 2
                     h = screen.height - spacing * 2
 
-                    self._move_window(window_id, x, y, w, h)
+                    transaction.add(window_id, x, y, w, h)
             else:
                 # Grid-based arrangement
                 cell_width = (screen.width - spacing * (grid_cols + 1)) // grid_cols
@@ -312,49 +319,91 @@ class GridApplier:
                     x = screen.x + spacing + col * (cell_width + spacing)
                     y = screen.y + spacing + row * (cell_height + spacing)
 
-                    self._move_window(window_id, x, y, cell_width, cell_height)
-
-            self.logger.info(f"Applied arrangement to {len(window_map)} windows")
-            return True
+                    transaction.add(window_id, x, y, cell_width, cell_height)
+            return transaction
 
         except Exception as e:
             self.logger.error(f"Failed to apply arrangement: {e}")
+            return None
+
+    def apply_arrangement(
+        self,
+        arrangement: Dict[str, Tuple[int, int]],
+        window_map: Dict[str, str],
+        screen: ScreenGeometry,
+        grid_rows: int,
+        grid_cols: int,
+        spacing: int = 10,
+        stacked: bool = False,
+    ) -> bool:
+        """
+        Apply arrangement to windows and wait for it (the tab commits off the GUI thread instead)
+
+        Args:
+            arrangement: {char_name: (row, col)}
+            window_map: {char_name: window_id}
+            screen: Screen geometry
+            grid_rows, grid_cols: Grid dimensions
+            spacing: Spacing between windows
+            stacked: If True, all windows at same position
+        """
+        transaction = self.build_transaction(
+            arrangement, window_map, screen, grid_rows, grid_cols, spacing, stacked
+        )
+        if transaction is None:
             return False
 
-    def _move_window(self, window_id: str, x: int, y: int, w: int, h: int):
+        self.last_result = transaction.commit()
+        if self.last_result.failed:
+            self.logger.error(f"Failed to apply arrangement to {self.last_result.failed} windows")
+            return False
+        self.logger.info(f"Applied arrangement to {len(window_map)} windows")
+        return True
+
+    def _move_window(self, window_id: str, x: int, y: int, w: int, h: int) -> bool:
         """Move and resize a single window, with fallback for Wine/Proton windows"""
         import time
 
         # Validate window ID format (X11: 0x followed by hex digits)
         if not window_id or not re.match(r"^0x[0-9a-fA-F]+$", window_id):
             self.logger.warning(f"Invalid window ID format: {window_id}")
-            return
+            return False
+
+        if WindowControl.get_instance().move_resize(window_id, x, y, w, h):
+            return True
 
-        # Try with --sync first, fallback to no-sync for Wine/Proton windows
+        # No X connection - xdotool, trying with --sync first (no-sync for Wine/Proton)
         try:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowmove", "--sync", window_id, str(x), str(y)],
                 capture_output=True,
                 timeout=2,
             )
         except subprocess.TimeoutExpired:
             # Wine windows don't respond to sync, retry without it
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowmove", window_id, str(x), str(y)], capture_output=True, timeout=2
             )
             time.sleep(0.1)  # Brief pause for window to settle
+        if result.returncode != 0:
+            self.logger.warning(f"xdotool windowmove failed for {window_id}")
+            return False
 
         try:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowsize", "--sync", window_id, str(w), str(h)],
                 capture_output=True,
                 timeout=2,
             )
         except subprocess.TimeoutExpired:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowsize", window_id, str(w), str(h)], capture_output=True, timeout=2
             )
             time.sleep(0.1)
+        if result.returncode != 0:
+            self.logger.warning(f"xdotool windowsize failed for {window_id}")
+            return False
+        return True
 
 
 class LayoutsTab(QWidget):
@@ -371,6 +420,10 @@ class LayoutsTab(QWidget):
         self.logger = logging.getLogger(__name__)
 
         self.grid_applier = GridApplier(layout_manager)
+
+        # Layout moves are committed off the GUI thread
+        self.layout_committer = LayoutCommitter(self)
+        self.layout_committer.layout_committed.connect(self._on_layout_committed)
         self.cycling_groups: Dict[str, List[str]] = {}
 
         self._load_groups()
@@ -670,8 +723,8 @@ class LayoutsTab(QWidget):
             QMessageBox.warning(self, "Error", "Could not get screen geometry")
             return
 
-        # Apply arrangement
-        success = self.grid_applier.apply_arrangement(
+        # Collect the moves here, apply them on a worker thread
+        transaction = self.grid_applier.build_transaction(
             arrangement=arrangement,
             window_map=window_map,
             screen=screen,
@@ -681,13 +734,28 @@ class LayoutsTab(QWidget):
             stacked=self.stack_checkbox.isChecked(),
         )
 
-        if success:
-            QMessageBox.information(
-                self, "Success", f"Applied layout to {len(window_map)} windows!"
-            )
-            self.layout_applied.emit(self.pattern_combo.currentText())
-        else:
+        if transaction is None:
+            QMessageBox.warning(self, "Error", "Failed to apply layout. Check logs for details.")
+            return
+
+        self.layout_committer.run(self.pattern_combo.currentText(), transaction)
+
+    def _on_layout_committed(self, pattern: str, result: LayoutResult):
+        """
+        Show the outcome of a layout applied by the layout committer
+
+        Args:
+            pattern: Layout pattern name
+            result: Counts and timing of the commit
+        """
+        if result.failed:
+            self.logger.error(f"Failed to apply arrangement to {result.failed} windows")
             QMessageBox.warning(self, "Error", "Failed to apply layout. Check logs for details.")
+            return
+
+        count = result.moved + result.unchanged
+        QMessageBox.information(self, "Success", f"Applied layout to {count} windows!")
+        self.layout_applied.emit(pattern)
 
     def refresh_groups_from_settings(self):
         """Called when groups change in hotkeys tab"""
@@ -8,11 +8,14 @@ v2.3: Merged layouts functionality - group-based window arrangement
 import logging
 import subprocess
 import threading
+import time
+from bisect import bisect_right
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 from PIL import Image
 from PySide6.QtCore import (
+    SIGNAL,
     QPoint,
     QRect,
     QSize,
@@ -45,17 +48,39 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from argus_overview.core.alert_bus import AlertEventBus
 from argus_overview.core.alert_detector import AlertLevel
+from argus_overview.core.alert_probe import AlertProbe
+from argus_overview.core.alert_scheduler import AlertScheduler
 from argus_overview.core.discovery import scan_eve_windows
+from argus_overview.core.layout_transaction import LayoutCommitter, LayoutResult, LayoutTransaction
+from argus_overview.core.local_detector import LocalDetector, LocalReport, LocalWatcher
+from argus_overview.core.window_ops import BulkWindowOps
+from argus_overview.core.window_registry import WindowRegistry
 from argus_overview.ui.action_registry import PrimaryHome
+from argus_overview.ui.animation_clock import RECENT_ACTIVITY_S, AnimationClock
 from argus_overview.ui.menu_builder import ContextMenuBuilder, ToolbarBuilder
+from argus_overview.ui.thumbnail_wall import (
+    RENDERER_CANVAS,
+    RENDERER_WIDGETS,
+    ThumbnailTile,
+    ThumbnailWall,
+    paint_status_overlay,
+)
 from argus_overview.utils.screen import ScreenGeometry, get_screen_geometry
+from argus_overview.utils.window_control import WindowControl
+from argus_overview.utils.window_utils import get_focused_window
 
 
 class FlowLayout(QLayout):
     """
     A layout that arranges widgets in a flow pattern, wrapping to new rows
     when the available width is exceeded. Perfect for thumbnail grids.
+
+    Item size hints, minimumSize and heightForWidth (per width) are cached
+    until Qt invalidates the layout. The rows of the last applied layout are
+    kept as a row-break index, so adding, removing or resizing an item
+    re-flows only from that item's row onward.
     """
 
     def __init__(self, parent=None, margin=10, spacing=10):
@@ -63,9 +88,23 @@ class FlowLayout(QLayout):
         self._item_list = []
         self._margin = margin
         self._spacing = spacing
+        self._reset_caches()
+
+    def _reset_caches(self):
+        """Drop cached hints, heights and the row-break index"""
+        self._hints: Dict[object, QSize] = {}  # item -> cached sizeHint
+        self._placed_hints: Dict[object, QSize] = {}  # item -> sizeHint it was last placed with
+        self._height_cache: Dict[int, int] = {}  # width -> heightForWidth
+        self._min_size: Optional[QSize] = None
+        self._rows: List[Tuple[int, int]] = []  # (first item index, y) per applied row
+        self._laid_out_rect: Optional[QRect] = None
+        self._laid_out_height = 0
+        self._dirty_from: Optional[int] = 0  # First item whose position may have changed
+        self.items_placed = 0  # Counter (for diagnostics and benchmarks)
 
     def addItem(self, item):
         self._item_list.append(item)
+        self._structure_changed(len(self._item_list) - 1)
 
     def count(self):
         return len(self._item_list)
@@ -77,9 +116,20 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self._item_list):
-            return self._item_list.pop(index)
+            item = self._item_list.pop(index)
+            self._hints.pop(item, None)
+            self._placed_hints.pop(item, None)
+            self._structure_changed(index)
+            return item
         return None
 
+    def invalidate(self):
+        """A child's size hint or visibility may have changed - re-read hints"""
+        self._hints.clear()
+        self._height_cache.clear()
+        self._min_size = None
+        super().invalidate()
+
     def expandingDirections(self):
         return Qt.Orientation(0)
 
@@ -87,7 +137,11 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        return self._do_layout(QRect(0, 0, width, 0), test_only=True)
+        height = self._height_cache.get(width)
+        if height is None:
+            height = self._do_layout(QRect(0, 0, width, 0), test_only=True)
+            self._height_cache[width] = height
+        return height
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
@@ -97,24 +151,83 @@ class FlowLayout(QLayout):
         return self.minimumSize()
 
     def minimumSize(self):
-        size = QSize()
-        for item in self._item_list:
-            size = size.expandedTo(item.minimumSize())
-        size += QSize(2 * self._margin, 2 * self._margin)
-        return size
+        if self._min_size is None:
+            size = QSize()
+            for item in self._item_list:
+                size = size.expandedTo(item.minimumSize())
+            size += QSize(2 * self._margin, 2 * self._margin)
+            self._min_size = size
+        return QSize(self._min_size)
+
+    def _structure_changed(self, index: int):
+        """An item was inserted or removed at index"""
+        if self._dirty_from is None or index < self._dirty_from:
+            self._dirty_from = index
+        self._height_cache.clear()
+        self._min_size = None
+
+    def _hint(self, item) -> QSize:
+        """Cached item size hint"""
+        hint = self._hints.get(item)
+        if hint is None:
+            hint = self._hints[item] = item.sizeHint()
+        return hint
+
+    def _first_dirty_row(self, rect) -> Optional[int]:
+        """
+        Row of the last applied layout to re-flow from
+
+        Returns:
+            Row index, or None if the applied layout is still current
+        """
+        if not self._rows or rect != self._laid_out_rect:
+            return 0
+
+        start = len(self._item_list) if self._dirty_from is None else self._dirty_from
+        for index in range(start):  # An earlier item's size hint may have changed
+            item = self._item_list[index]
+            if item.widget() is not None and self._hint(item) != self._placed_hints.get(item):
+                start = index
+                break
+
+        if self._dirty_from is None and start >= len(self._item_list):
+            return None
+        if not self._item_list:
+            return 0
+
+        # Re-flow the row holding the first changed item (the last row after a tail
+        # removal), or the row before it if the item starts its row and may now fit there
+        start = min(start, len(self._item_list) - 1)
+        row_starts = [first for first, _ in self._rows]
+        row = bisect_right(row_starts, start) - 1
+        if row > 0 and row_starts[row] == start:
+            row -= 1
+        return max(0, row)
 
     def _do_layout(self, rect, test_only):
+        start_row = 0 if test_only else self._first_dirty_row(rect)
+        if start_row is None:
+            return self._laid_out_height
+
+        if start_row:
+            first, y = self._rows[start_row]
+        else:
+            first, y = 0, rect.y() + self._margin
+        if not test_only:
+            del self._rows[start_row:]
+
         x = rect.x() + self._margin
-        y = rect.y() + self._margin
         line_height = 0
         row_items = []
+        row_first = first
 
-        for item in self._item_list:
+        for index in range(first, len(self._item_list)):
+            item = self._item_list[index]
             widget = item.widget()
             if widget is None:
                 continue
 
-            item_size = item.sizeHint()
+            item_size = self._hint(item)
             next_x = x + item_size.width() + self._spacing
 
             # Check if we need to wrap to next row
@@ -122,7 +235,9 @@ class FlowLayout(QLayout):
                 # Center the current row before moving to next
                 if not test_only:
                     self._center_row(row_items, rect, y, line_height)
+                    self._rows.append((row_first, y))
                 row_items = []
+                row_first = index
                 x = rect.x() + self._margin
                 y = y + line_height + self._spacing
                 next_x = x + item_size.width() + self._spacing
@@ -130,6 +245,7 @@ class FlowLayout(QLayout):
 
             if not test_only:
                 row_items.append((item, x, item_size))
+                self._placed_hints[item] = item_size
 
             x = next_x
             line_height = max(line_height, item_size.height())
@@ -137,8 +253,14 @@ class FlowLayout(QLayout):
         # Center the last row
         if not test_only and row_items:
             self._center_row(row_items, rect, y, line_height)
+            self._rows.append((row_first, y))
 
-        return y + line_height - rect.y() + self._margin
+        height = y + line_height - rect.y() + self._margin
+        if not test_only:
+            self._laid_out_rect = QRect(rect)
+            self._laid_out_height = height
+            self._dirty_from = None
+        return height
 
     def _center_row(self, row_items, rect, y, line_height):
         """Center items in a row"""
@@ -158,6 +280,7 @@ class FlowLayout(QLayout):
         for item, _, size in row_items:
             item.setGeometry(QRect(QPoint(x, y), size))
             x += size.width() + self._spacing
+        self.items_placed += len(row_items)
 
 
 def get_all_layout_patterns():
@@ -443,16 +566,17 @@ class ArrangementGrid(QWidget):
 
 
 class GridApplier:
-    """Applies grid patterns to actual windows using xdotool"""
+    """Applies grid patterns to actual windows (one layout transaction per apply)"""
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.last_result: Optional[LayoutResult] = None  # Timing of the last apply
 
     def get_screen_geometry(self, monitor: int = 0) -> ScreenGeometry:
         """Get screen geometry for a monitor (delegates to shared utility)"""
         return get_screen_geometry(monitor)
 
-    def apply_arrangement(
+    def build_transaction(
         self,
         arrangement: Dict[str, Tuple[int, int]],
         window_map: Dict[str, str],
@@ -462,12 +586,19 @@ class GridApplier:
         spacing: int = 10,
         stacked: bool = False,
         stacked_use_grid_size: bool = True,
-    ) -> bool:
+    ) -> Optional[LayoutTransaction]:
+        """
+        Collect the moves an arrangement needs without applying them
+
+        Returns:
+            LayoutTransaction to commit, or None if the layout can't be computed
+        """
         try:
             # Calculate grid cell size (used for both grid and optionally stacked)
             cell_width = (screen.width - spacing * (grid_cols + 1)) // grid_cols
             cell_height = (screen.height - spacing * (grid_rows + 1)) // grid_rows
 
+            transaction = LayoutTransaction(self._move_window, self._move_window_position_only)
             if stacked:
                 # Stack all windows at same position
                 x = screen.x + spacing
@@ -476,10 +607,10 @@ class GridApplier:
                 for _char_name, window_id in window_map.items():
                     if stacked_use_grid_size:
                         # Use grid cell size for stacked windows
-                        self._move_window(window_id, x, y, cell_width, cell_height)
+                        transaction.add(window_id, x, y, cell_width, cell_height)
                     else:
                         # Keep current size, just move to stack position
-                        self._move_window_position_only(window_id, x, y)
+                        transaction.add(window_id, x, y)
             else:
                 for char_name, (row, col) in arrangement.items():
                     if char_name not in window_map:
@@ -488,65 +619,117 @@ class GridApplier:
                     window_id = window_map[char_name]
                     x = screen.x + spacing + col * (cell_width + spacing)
                     y = screen.y + spacing + row * (cell_height + spacing)
-                    self._move_window(window_id, x, y, cell_width, cell_height)
-
-            self.logger.info(f"Applied arrangement to {len(window_map)} windows")
-            return True
+                    transaction.add(window_id, x, y, cell_width, cell_height)
+            return transaction
 
         except Exception as e:
             self.logger.error(f"Failed to apply arrangement: {e}")
+            return None
+
+    def apply_arrangement(
+        self,
+        arrangement: Dict[str, Tuple[int, int]],
+        window_map: Dict[str, str],
+        screen: ScreenGeometry,
+        grid_rows: int,
+        grid_cols: int,
+        spacing: int = 10,
+        stacked: bool = False,
+        stacked_use_grid_size: bool = True,
+    ) -> bool:
+        """Apply an arrangement and wait for it (the tab commits off the GUI thread instead)"""
+        transaction = self.build_transaction(
+            arrangement,
+            window_map,
+            screen,
+            grid_rows,
+            grid_cols,
+            spacing,
+            stacked,
+            stacked_use_grid_size,
+        )
+        if transaction is None:
+            return False
+
+        self.last_result = transaction.commit()
+        if self.last_result.failed:
+            self.logger.error(f"Failed to apply arrangement to {self.last_result.failed} windows")
             return False
+        self.logger.info(f"Applied arrangement to {len(window_map)} windows")
+        return True
 
-    def _move_window(self, window_id: str, x: int, y: int, w: int, h: int):
+    def _move_window(self, window_id: str, x: int, y: int, w: int, h: int) -> bool:
         """Move and resize a window, with fallback for Wine/Proton windows"""
         import time
 
-        # Try with --sync first, fallback to no-sync for Wine/Proton windows
+        if WindowControl.get_instance().move_resize(window_id, x, y, w, h):
+            return True
+
+        # No X connection - xdotool, trying with --sync first, fallback to no-sync for Wine/Proton windows
         try:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowmove", "--sync", window_id, str(x), str(y)],
                 capture_output=True,
                 timeout=2,
             )
         except subprocess.TimeoutExpired:
             # Wine windows don't respond to sync, retry without it
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowmove", window_id, str(x), str(y)], capture_output=True, timeout=2
             )
             time.sleep(0.1)  # Brief pause for window to settle
+        if result.returncode != 0:
+            self.logger.warning(f"xdotool windowmove failed for {window_id}")
+            return False
 
         try:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowsize", "--sync", window_id, str(w), str(h)],
                 capture_output=True,
                 timeout=2,
             )
         except subprocess.TimeoutExpired:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowsize", window_id, str(w), str(h)], capture_output=True, timeout=2
             )
             time.sleep(0.1)
+        if result.returncode != 0:
+            self.logger.warning(f"xdotool windowsize failed for {window_id}")
+            return False
+        return True
 
-    def _move_window_position_only(self, window_id: str, x: int, y: int):
+    def _move_window_position_only(self, window_id: str, x: int, y: int) -> bool:
         """Move a window without resizing (keeps current size)"""
         import time
 
+        if WindowControl.get_instance().move_resize(window_id, x, y):
+            return True
+
         try:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowmove", "--sync", window_id, str(x), str(y)],
                 capture_output=True,
                 timeout=2,
             )
         except subprocess.TimeoutExpired:
-            subprocess.run(
+            result = subprocess.run(
                 ["xdotool", "windowmove", window_id, str(x), str(y)], capture_output=True, timeout=2
             )
             time.sleep(0.1)
+        if result.returncode != 0:
+            self.logger.warning(f"xdotool windowmove failed for {window_id}")
+            return False
+        return True
 
 
 def pil_to_qimage(pil_image: Image.Image) -> QImage:
     """
-    Convert PIL Image to QImage
+    Convert PIL Image to a QImage in a native display format
+
+    The pixels are packed once by PIL into a buffer the QImage keeps alive,
+    in a layout QPixmap.fromImage uploads without another conversion:
+    RGB -> Format_RGB32 (one swizzle by Qt), RGBA -> premultiplied ARGB32
+    (packed directly). Safe to call from worker threads.
 
     Args:
         pil_image: PIL Image object
@@ -556,23 +739,14 @@ def pil_to_qimage(pil_image: Image.Image) -> QImage:
     """
     if pil_image is None:
         return None
-    if pil_image.mode == "RGB":
-        bytes_per_line = 3 * pil_image.width
+    if pil_image.mode == "RGBA":
+        # PIL premultiplies while packing - no second pass
         return QImage(
-            pil_image.tobytes(),
+            pil_image.tobytes("raw", "BGRa"),
             pil_image.width,
             pil_image.height,
-            bytes_per_line,
-            QImage.Format.Format_RGB888,
-        )
-    elif pil_image.mode == "RGBA":
-        bytes_per_line = 4 * pil_image.width
-        return QImage(
-            pil_image.tobytes(),
-            pil_image.width,
-            pil_image.height,
-            bytes_per_line,
-            QImage.Format.Format_RGBA8888,
+            4 * pil_image.width,
+            QImage.Format.Format_ARGB32_Premultiplied,
         )
     elif pil_image.mode == "L":
         bytes_per_line = pil_image.width
@@ -583,17 +757,16 @@ def pil_to_qimage(pil_image: Image.Image) -> QImage:
             bytes_per_line,
             QImage.Format.Format_Grayscale8,
         )
-    else:
-        # Convert to RGB if unknown mode
-        rgb_image = pil_image.convert("RGB")
-        bytes_per_line = 3 * rgb_image.width
-        return QImage(
-            rgb_image.tobytes(),
-            rgb_image.width,
-            rgb_image.height,
-            bytes_per_line,
-            QImage.Format.Format_RGB888,
-        )
+
+    rgb_image = pil_image if pil_image.mode == "RGB" else pil_image.convert("RGB")
+    # PIL stores RGB as RGBX internally, so this pack is a straight copy
+    return QImage(
+        rgb_image.tobytes("raw", "RGBX"),
+        rgb_image.width,
+        rgb_image.height,
+        4 * rgb_image.width,
+        QImage.Format.Format_RGBX8888,
+    ).convertToFormat(QImage.Format.Format_RGB32)
 
 
 class WindowPreviewWidget(QWidget):
@@ -624,6 +797,8 @@ class WindowPreviewWidget(QWidget):
         # State
         self.current_pixmap: Optional[QPixmap] = None
         self.alert_level: Optional[AlertLevel] = None
+        # Changed areas, as fractions of the frame
+        self.alert_regions: List[Tuple[float, float, float, float]] = []
         self.alert_flash_counter = 0
         self.zoom_factor = 0.3  # 30% scale
 
@@ -632,6 +807,8 @@ class WindowPreviewWidget(QWidget):
         self.session_start: datetime = datetime.now()
         self.last_activity: datetime = datetime.now()
         self.is_focused: bool = False
+        self.is_minimized: bool = False  # Not captured; last frame shown with an overlay
+        self.is_unresponsive: bool = False  # Quarantined by the capture breaker, same overlay
         self._is_hovered: bool = False
         self._positions_locked: bool = False
 
@@ -674,21 +851,74 @@ class WindowPreviewWidget(QWidget):
         self.timer_label.setVisible(self._show_session_timer)
         layout.addWidget(self.timer_label)
 
-        # Alert flash timer
-        self.flash_timer = QTimer()
-        self.flash_timer.timeout.connect(self._flash_tick)
-
-        # Session timer update (every minute)
-        self.session_timer = QTimer()
-        self.session_timer.timeout.connect(self._update_session_timer)
+        # Alert flash, session label and activity dot are driven by the shared clock
+        self.animation_clock = AnimationClock.get_instance()
         if self._show_session_timer:
-            self.session_timer.start(60000)  # Update every minute
+            self.animation_clock.add_session(self)
 
         # Opacity effect for hover
         self.opacity_effect = QGraphicsOpacityEffect(self)
         self.opacity_effect.setOpacity(1.0)
         self.setGraphicsEffect(self.opacity_effect)
 
+    def _reset_state(self):
+        """Per-window state for a freshly bound preview"""
+        self.current_pixmap = None
+        self.alert_level = None
+        self.alert_regions = []
+        self.alert_flash_counter = 0
+        self.zoom_factor = 0.3  # 30% scale
+        self.custom_label = None
+        self.session_start = datetime.now()
+        self.last_activity = datetime.now()
+        self.is_focused = False
+        self.is_minimized = False  # Not captured; last frame shown with an overlay
+        self.is_unresponsive = False  # Quarantined by the capture breaker, same overlay
+        self._is_hovered = False
+        self._drag_start_pos = None
+
+    def rebind(self, window_id: str, character_name: str):
+        """
+        Reset a pooled preview and bind it to another window
+
+        Args:
+            window_id: X11 window ID
+            character_name: Character name
+        """
+        self.window_id = window_id
+        self.character_name = character_name
+        self._reset_state()
+        self._load_settings()
+
+        self.image_label.clear()
+        self.image_label.setText("Loading...")
+        self.info_label.setText(self._get_display_name())
+        self.timer_label.setText("")
+        self.timer_label.setVisible(self._show_session_timer)
+        self.opacity_effect.setOpacity(1.0)
+        self._update_tooltip()
+
+        if self._show_session_timer:
+            self.animation_clock.add_session(self)
+        if self.parentWidget() is not None:
+            self.show()
+
+    def release(self):
+        """Detach from the clock, signal receivers and layout so the widget can be pooled"""
+        self.animation_clock.forget(self)
+        for signal, signature in (
+            (self.window_activated, "window_activated(QString)"),
+            (self.window_removed, "window_removed(QString)"),
+            (self.label_changed, "label_changed(QString,QString)"),
+        ):
+            if self.receivers(SIGNAL(signature)) > 0:
+                signal.disconnect()
+
+        parent = self.parentWidget()
+        if parent is not None and parent.layout() is not None:
+            parent.layout().removeWidget(self)
+        self.hide()
+
     def _load_settings(self):
         """Load settings from settings_manager"""
         if self.settings_manager:
@@ -721,25 +951,38 @@ class WindowPreviewWidget(QWidget):
         tooltip += "\nClick to activate | Right-click for menu"
         self.setToolTip(tooltip)
 
-    def update_frame(self, image: Image.Image):
+    def preview_size(self) -> QSize:
+        """Size available for the preview image"""
+        return self.image_label.size()
+
+    def update_frame(self, image: Union[Image.Image, QImage, None]):
         """
         Update preview with new captured frame
 
         Args:
-            image: PIL Image
+            image: PIL Image, or a display-ready QImage from a capture worker
         """
+        if self.is_minimized:
+            return  # Keep the last good frame; late captures of a minimized client are blank
+
         try:
-            # Convert PIL to QImage
-            qimage = pil_to_qimage(image)
+            # Worker-produced QImages are already native-format and fitted
+            qimage = image if isinstance(image, QImage) else pil_to_qimage(image)
             if qimage is None:
                 return  # Skip frame if capture failed
 
-            # Convert to pixmap
+            # Upload to pixmap
             self.current_pixmap = QPixmap.fromImage(qimage)
 
-            # Scale to fit widget while maintaining aspect ratio
+            # Scale to fit widget while maintaining aspect ratio (only if not fitted yet)
+            target = self.image_label.size()
+            fitted = qimage.size().scaled(target, Qt.AspectRatioMode.KeepAspectRatio)
+            if fitted == qimage.size():
+                self.image_label.setPixmap(self.current_pixmap)
+                return
+
             scaled_pixmap = self.current_pixmap.scaled(
-                self.image_label.size(),
+                target,
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.FastTransformation,
             )
@@ -749,28 +992,40 @@ class WindowPreviewWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Failed to update frame for {self.window_id}: {e}")
 
-    def set_alert(self, level: AlertLevel):
+    def set_alert(
+        self, level: AlertLevel, regions: Optional[List[Tuple[float, float, float, float]]] = None
+    ):
         """
         Set alert and start border flash
 
         Args:
             level: AlertLevel enum
+            regions: Optional changed areas to highlight, as (x, y, w, h) fractions
         """
         self.alert_level = level
+        self.alert_regions = list(regions) if regions else []
         self.alert_flash_counter = 30  # 3 seconds at 10 Hz
-        if not self.flash_timer.isActive():
-            self.flash_timer.start(100)  # 100ms = 10 Hz flash
+        self.animation_clock.start_flash(self)
 
         self.logger.debug(f"Alert set for {self.window_id}: {level}")
 
-    def _flash_tick(self):
-        """Flash timer tick"""
+    def flash_tick(self) -> bool:
+        """
+        Advance the alert flash by one clock tick (the clock repaints)
+
+        Returns:
+            True while the flash is still running
+        """
         self.alert_flash_counter -= 1
         if self.alert_flash_counter <= 0:
-            self.flash_timer.stop()
             self.alert_level = None
+            self.alert_regions = []
+            return False
+        return True
 
-        self.update()  # Trigger repaint
+    def session_tick(self):
+        """Session clock tick"""
+        self._update_session_timer()
 
     def _update_session_timer(self):
         """Update the session timer display"""
@@ -813,11 +1068,73 @@ class WindowPreviewWidget(QWidget):
         if focused:
             self.last_activity = datetime.now()
         self.update()
+        self._schedule_idle_repaint()
+
+    def set_minimized(self, minimized: bool):
+        """
+        Set whether the client is minimized
+
+        While minimized the last frame stays up, dimmed with a "Minimized" label.
+
+        Args:
+            minimized: True when the window manager reports the client minimized
+        """
+        if minimized == self.is_minimized:
+            return
+        self.is_minimized = minimized
+        self._show_status()
+
+    def set_unresponsive(self, unresponsive: bool):
+        """
+        Set whether the client stopped responding to captures
+
+        Args:
+            unresponsive: True while the capture breaker has the client quarantined
+        """
+        if unresponsive == self.is_unresponsive:
+            return
+        self.is_unresponsive = unresponsive
+        self._show_status()
+
+    def status_text(self) -> Optional[str]:
+        """Overlay text for a preview that isn't being captured, or None"""
+        if self.is_minimized:
+            return "Minimized"
+        if self.is_unresponsive:
+            return "Not responding"
+        return None
+
+    def _show_status(self):
+        """Redraw the last frame with (or without) the status overlay"""
+        status = self.status_text()
+        if self.current_pixmap is None:
+            self.image_label.setText(status or "Loading...")
+            return
+
+        pixmap = self.current_pixmap.scaled(
+            self.image_label.size(),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+        if status:
+            painter = QPainter(pixmap)
+            paint_status_overlay(painter, pixmap.rect(), status)
+            painter.end()
+        self.image_label.setPixmap(pixmap)
 
     def mark_activity(self):
         """Mark that activity occurred on this window"""
         self.last_activity = datetime.now()
         self.update()
+        self._schedule_idle_repaint()
+
+    def _schedule_idle_repaint(self):
+        """Have the clock repaint when the 'recent' indicator turns idle"""
+        if self.is_focused:
+            return
+        remaining = RECENT_ACTIVITY_S - (datetime.now() - self.last_activity).total_seconds()
+        if remaining > 0:
+            self.animation_clock.schedule_repaint(self, remaining)
 
     def get_activity_state(self) -> str:
         """
@@ -830,10 +1147,15 @@ class WindowPreviewWidget(QWidget):
             return "focused"
 
         elapsed = (datetime.now() - self.last_activity).total_seconds()
-        if elapsed < 5:
+        if elapsed < RECENT_ACTIVITY_S:
             return "recent"
         return "idle"
 
+    def deleteLater(self):
+        """Unregister from the animation clock, then schedule deletion"""
+        self.animation_clock.forget(self)
+        super().deleteLater()
+
     def enterEvent(self, event):
         """Handle mouse enter - apply hover effects"""
         self._is_hovered = True
@@ -875,6 +1197,19 @@ class WindowPreviewWidget(QWidget):
             painter.setPen(pen)
             painter.drawRect(2, 2, self.width() - 4, self.height() - 4)
 
+            # Outline where the change happened
+            if self.alert_regions:
+                image_rect = self._displayed_image_rect()
+                pen.setWidth(2)
+                painter.setPen(pen)
+                for x, y, w, h in self.alert_regions:
+                    painter.drawRect(
+                        image_rect.x() + int(x * image_rect.width()),
+                        image_rect.y() + int(y * image_rect.height()),
+                        int(w * image_rect.width()),
+                        int(h * image_rect.height()),
+                    )
+
         # Draw activity indicator (v2.2)
         if self._show_activity_indicator:
             activity = self.get_activity_state()
@@ -897,6 +1232,22 @@ class WindowPreviewWidget(QWidget):
 
         painter.end()
 
+    def _displayed_image_rect(self) -> QRect:
+        """Rect of the scaled preview pixmap in widget coordinates"""
+        label_rect = self.image_label.geometry()
+        pixmap = self.image_label.pixmap()
+        if pixmap is None or pixmap.isNull():
+            return label_rect
+
+        # Label centers the aspect-preserving pixmap
+        size = pixmap.size()
+        return QRect(
+            label_rect.x() + (label_rect.width() - size.width()) // 2,
+            label_rect.y() + (label_rect.height() - size.height()) // 2,
+            size.width(),
+            size.height(),
+        )
+
     def mousePressEvent(self, event):
         """Handle mouse click - start drag or activate"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -982,9 +1333,10 @@ class WindowPreviewWidget(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                subprocess.run(
-                    ["wmctrl", "-i", "-c", self.window_id], capture_output=True, timeout=2
-                )
+                if not WindowControl.get_instance().close(self.window_id):
+                    subprocess.run(
+                        ["wmctrl", "-i", "-c", self.window_id], capture_output=True, timeout=2
+                    )
                 self.logger.info(f"Closed window: {self.window_id}")
                 self.window_removed.emit(self.window_id)
             except Exception as e:
@@ -1013,6 +1365,9 @@ class WindowManager:
     v2.2: Added settings_manager support for thumbnail settings
     """
 
+    DEFAULT_RESULT_BUDGET_MS = 4.0
+    MAX_POOLED_FRAMES = 8  # Released preview widgets kept for reuse
+
     def __init__(self, character_manager, capture_system, alert_detector, settings_manager=None):
         self.logger = logging.getLogger(__name__)
         self.character_manager = character_manager
@@ -1021,19 +1376,73 @@ class WindowManager:
         self.settings_manager = settings_manager
 
         # State
-        self.preview_frames: Dict[str, WindowPreviewWidget] = {}
+        self.preview_frames: Dict[str, Union[WindowPreviewWidget, ThumbnailTile]] = {}
         self.pending_requests: Dict[str, str] = {}  # request_id -> window_id
         self._pending_lock = threading.Lock()  # Protect pending_requests access
+
+        # Scroll-area viewport (in preview content coordinates), set by MainTab.
+        # Previews outside it keep their last frame and are not captured.
+        self.viewport_provider: Optional[Callable[[], Optional[QRect]]] = None
+        self._offscreen: Set[str] = set()  # Previews skipped for being scrolled out
+        self.captures_skipped_offscreen = 0
+
+        # Minimized clients (the registry's map state, kept current from X
+        # events) aren't captured; their previews keep the last frame
+        self.skip_minimized = True
+        if settings_manager:
+            self.skip_minimized = settings_manager.get("performance.skip_minimized", True)
+        self.captures_skipped_minimized = 0
+        # Clients quarantined by the capture breaker (hung) aren't requested
+        # until its liveness probe sees them respond
+        self.captures_skipped_unresponsive = 0
         # Read refresh rate from settings (default 5 FPS for efficiency)
         if settings_manager:
             self.refresh_rate = settings_manager.get("performance.default_refresh_rate", 5)
         else:
             self.refresh_rate = 5  # Low default for efficiency
 
+        # GUI time per tick for applying finished captures; the rest wait a tick
+        self.result_budget_ms = float(self.DEFAULT_RESULT_BUDGET_MS)
+        if settings_manager:
+            self.set_result_budget(
+                settings_manager.get("performance.result_budget_ms", self.DEFAULT_RESULT_BUDGET_MS)
+            )
+        self.reset_drain_stats()
+
+        # Thumbnail renderer: one widget per client, or tiles on one canvas (restart to change)
+        self.renderer = RENDERER_WIDGETS
+        if settings_manager:
+            self.renderer = settings_manager.get("thumbnails.renderer", RENDERER_WIDGETS)
+
+        # Removed preview widgets, reset and rebound by add_window instead of rebuilt
+        self._frame_pool: List[WindowPreviewWidget] = []
+        self.frames_created = 0
+        self.frames_reused = 0
+
+        # Active window, pushed by the main window's _NET_ACTIVE_WINDOW watcher
+        self.focused_window_id: Optional[str] = None
+        self.focus_tracked = False  # False: get_focused_window() asks xdotool
+
         # Timer for capture loop
         self.capture_timer = QTimer()
         self.capture_timer.timeout.connect(self._capture_cycle)
 
+        # Alert bus: enforces cooldowns and batches alerts into one UI update per flush
+        self.alert_bus = AlertEventBus(cooldown_seconds=alert_detector.config.alert_cooldown)
+        self.alert_bus.alerts_ready.connect(self._on_alerts_ready)
+
+        # Hostile-in-Local watcher: region-only captures on its own thread and rate
+        self.local_watcher: Optional[LocalWatcher] = None
+        self.configure_local_watch()
+
+        # Sparse red-flash probe over the native X connection (works with previews off)
+        self.alert_probe: Optional[AlertProbe] = None
+        self.configure_alert_probe()
+
+        # Alert sampling at its own rate/budget; when running, preview frames aren't analyzed
+        self.alert_scheduler: Optional[AlertScheduler] = None
+        self.configure_alert_scheduler()
+
         self.logger.info("WindowManager initialized")
 
     def start_capture_loop(self):
@@ -1059,7 +1468,18 @@ class WindowManager:
             self.stop_capture_loop()
             self.start_capture_loop()
 
-    def add_window(self, window_id: str, character_name: str) -> Optional[WindowPreviewWidget]:
+    def set_result_budget(self, budget_ms: float):
+        """
+        Set the GUI time spent applying capture results per tick
+
+        Args:
+            budget_ms: Milliseconds (1-50)
+        """
+        self.result_budget_ms = max(1.0, min(50.0, float(budget_ms)))
+
+    def add_window(
+        self, window_id: str, character_name: str
+    ) -> Optional[Union[WindowPreviewWidget, ThumbnailTile]]:
         """
         Add window to preview
 
@@ -1068,25 +1488,34 @@ class WindowManager:
             character_name: Character name
 
         Returns:
-            WindowPreviewWidget or None
+            WindowPreviewWidget (or ThumbnailTile with the canvas renderer) or None
         """
         if window_id in self.preview_frames:
             self.logger.warning(f"Window {window_id} already in preview")
             return None
 
         # Create preview widget with settings_manager for v2.2 features
-        frame = WindowPreviewWidget(
-            window_id, character_name, self.capture_system, settings_manager=self.settings_manager
-        )
+        frame = self._acquire_frame(window_id, character_name)
         self.preview_frames[window_id] = frame
+        if self.focused_window_id is not None and self._same_window(
+            window_id, self.focused_window_id
+        ):
+            frame.set_focused(True)
 
-        # Register alert callback
+        # Register alert callback - routed through the bus for cooldown/coalescing
         def alert_callback(level: AlertLevel):
             if window_id in self.preview_frames:
-                self.preview_frames[window_id].set_alert(level)
+                self.alert_bus.post(window_id, level)
 
         self.alert_detector.register_callback(window_id, alert_callback)
 
+        if self.local_watcher is not None:
+            self.local_watcher.watch(window_id)
+        if self.alert_probe is not None:
+            self.alert_probe.watch(window_id)
+        if self.alert_scheduler is not None:
+            self.alert_scheduler.watch(window_id)
+
         self.logger.info(f"Added window {window_id} ({character_name}) to preview")
         return frame
 
@@ -1098,43 +1527,242 @@ class WindowManager:
             window_id: X11 window ID
         """
         if window_id in self.preview_frames:
-            # Unregister alert callback
+            # Unregister alert callback and drop cooldown/pending alert state
             self.alert_detector.unregister_callback(window_id)
+            self.alert_bus.clear(window_id)
+            if self.local_watcher is not None:
+                self.local_watcher.unwatch(window_id)
+            if self.alert_probe is not None:
+                self.alert_probe.unwatch(window_id)
+            if self.alert_scheduler is not None:
+                self.alert_scheduler.unwatch(window_id)
+            self.capture_system.breaker.forget(window_id)
 
             # Remove from dict
             frame = self.preview_frames.pop(window_id)
-            frame.deleteLater()
+            self._release_frame(frame)
 
             self.logger.info(f"Removed window {window_id} from preview")
 
+    def _acquire_frame(
+        self, window_id: str, character_name: str
+    ) -> Union[WindowPreviewWidget, ThumbnailTile]:
+        """Rebind a pooled preview widget, or build a new frame for the renderer"""
+        if self.renderer == RENDERER_CANVAS:
+            self.frames_created += 1
+            return ThumbnailTile(
+                window_id,
+                character_name,
+                self.capture_system,
+                settings_manager=self.settings_manager,
+            )
+
+        while self._frame_pool:
+            frame = self._frame_pool.pop()
+            try:
+                frame.rebind(window_id, character_name)
+            except RuntimeError:  # Underlying Qt object already deleted
+                continue
+            self.frames_reused += 1
+            return frame
+
+        self.frames_created += 1
+        return WindowPreviewWidget(
+            window_id, character_name, self.capture_system, settings_manager=self.settings_manager
+        )
+
+    def _release_frame(self, frame: Union[WindowPreviewWidget, ThumbnailTile]):
+        """Return a preview widget to the pool, or delete it when the pool is full"""
+        if (
+            isinstance(frame, WindowPreviewWidget)
+            and len(self._frame_pool) < self.MAX_POOLED_FRAMES
+        ):
+            try:
+                frame.release()
+            except RuntimeError:
+                return
+            self._frame_pool.append(frame)
+            return
+        frame.deleteLater()
+
+    def set_focused_window(self, window_id: Optional[str]) -> Optional[str]:
+        """
+        Move the activity indicator's focus to a window
+
+        Args:
+            window_id: Active window ID in any hex spelling, or ""/None for none
+
+        Returns:
+            The preview key of the newly focused window, or None if it has no preview
+        """
+        key = self._preview_key(window_id) if window_id else None
+        previous = self._preview_key(self.focused_window_id) if self.focused_window_id else None
+        self.focused_window_id = key or window_id or None
+        if previous != key:
+            if previous is not None:
+                self.preview_frames[previous].set_focused(False)
+            if key is not None:
+                self.preview_frames[key].set_focused(True)
+        return key
+
+    def get_focused_window(self) -> Optional[str]:
+        """
+        Get the active window (as its preview key when it has one)
+
+        Returns:
+            Window ID, or None if unknown
+        """
+        if self.focus_tracked:
+            return self.focused_window_id
+        window_id = get_focused_window()  # No watcher - one xdotool call
+        if window_id is None:
+            return None
+        return self._preview_key(window_id) or window_id
+
+    def _preview_key(self, window_id: str) -> Optional[str]:
+        """Find the preview key for a window ID ("0x3800003" matches "0x03800003")"""
+        if window_id in self.preview_frames:
+            return window_id
+        for key in self.preview_frames:
+            if self._same_window(key, window_id):
+                return key
+        return None
+
+    @staticmethod
+    def _same_window(a: str, b: str) -> bool:
+        """Compare window IDs numerically"""
+        try:
+            return int(a, 16) == int(b, 16)
+        except (TypeError, ValueError):
+            return a == b
+
     def _capture_cycle(self):
         """
         Capture cycle - called by timer
 
         Requests captures for all visible frames, then polls for results
         """
-        # Request captures for all visible preview frames
+        # Request captures for all visible preview frames. While the alert
+        # scheduler does the analysis, previews only need display pixels, so
+        # workers return ready-to-upload QImages fitted to the label, and
+        # previews scrolled out of the viewport aren't captured at all.
+        display_only = self.alert_scheduler is not None
+        viewport = self._current_viewport() if display_only else None
+        minimized = self._minimized_windows()
+        unresponsive = self.capture_system.unresponsive_windows()
+
         for window_id, frame in self.preview_frames.items():
-            if frame.isVisible():
-                try:
-                    request_id = self.capture_system.capture_window_async(
-                        window_id, scale=frame.zoom_factor
-                    )
-                    with self._pending_lock:
-                        self.pending_requests[request_id] = window_id
-                except Exception as e:
-                    self.logger.error(f"Failed to request capture for {window_id}: {e}")
+            if not frame.isVisible():
+                continue
+            if frame.is_minimized != (window_id in minimized):
+                frame.set_minimized(window_id in minimized)
+            if frame.is_unresponsive != (window_id in unresponsive):
+                frame.set_unresponsive(window_id in unresponsive)
+            if window_id in minimized:
+                self.captures_skipped_minimized += 1
+                continue
+            if window_id in unresponsive:
+                self.captures_skipped_unresponsive += 1
+                continue
+            if viewport is not None:
+                if not viewport.intersects(frame.geometry()):
+                    self._offscreen.add(window_id)
+                    self.captures_skipped_offscreen += 1
+                    continue
+                self._offscreen.discard(window_id)
+            self._request_capture(window_id, frame, display_only)
 
         # Poll for results (non-blocking)
         self._process_capture_results()
 
+    def _minimized_windows(self) -> Set[str]:
+        """
+        Previews whose client is minimized, per the window registry's map state
+
+        The focused window is never treated as minimized (it was just restored).
+
+        Returns:
+            Set of preview keys to skip this cycle
+        """
+        if not self.skip_minimized:
+            return set()
+        minimized = set()
+        for window_id in WindowRegistry.get_instance().minimized():
+            key = self._preview_key(window_id)
+            if key is not None and key != self.focused_window_id:
+                minimized.add(key)
+        return minimized
+
+    def _current_viewport(self) -> Optional[QRect]:
+        """Visible viewport rect in preview content coordinates, or None if unknown"""
+        if self.viewport_provider is None:
+            return None
+        try:
+            return self.viewport_provider()
+        except Exception as e:
+            self.logger.debug(f"Viewport unavailable: {e}")
+            return None
+
+    def _request_capture(
+        self, window_id: str, frame: Union[WindowPreviewWidget, ThumbnailTile], display_only: bool
+    ):
+        """Queue an async capture for one preview"""
+        try:
+            if display_only:
+                preview_size = frame.preview_size()
+                request_id = self.capture_system.capture_window_async(
+                    window_id, target_size=(preview_size.width(), preview_size.height())
+                )
+            else:
+                request_id = self.capture_system.capture_window_async(
+                    window_id, scale=frame.zoom_factor
+                )
+            with self._pending_lock:
+                self.pending_requests[request_id] = window_id
+        except Exception as e:
+            self.logger.error(f"Failed to request capture for {window_id}: {e}")
+
+    def on_viewport_changed(self):
+        """
+        Refresh previews scrolled back into view
+
+        They already show their last frame; this requests a fresh one right
+        away instead of waiting for the next capture cycle.
+        """
+        if not self._offscreen or self.alert_scheduler is None:
+            return
+        viewport = self._current_viewport()
+        if viewport is None:
+            return
+
+        for window_id in list(self._offscreen):
+            frame = self.preview_frames.get(window_id)
+            if frame is None:
+                self._offscreen.discard(window_id)
+                continue
+            if frame.isVisible() and viewport.intersects(frame.geometry()):
+                self._offscreen.discard(window_id)
+                self._request_capture(window_id, frame, display_only=True)
+
     def _process_capture_results(self):
-        """Poll and process capture results from worker threads"""
-        # Process up to 10 results per cycle to avoid blocking UI
-        max_per_cycle = 10
+        """
+        Apply finished captures until the per-tick GUI budget is spent
+
+        At least one result is applied per tick; whatever is still queued when
+        the budget runs out is picked up first on the next tick.
+        """
+        start = time.perf_counter()
+        deadline = start + self.result_budget_ms / 1000.0
         processed = 0
 
-        for _ in range(max_per_cycle):
+        while True:
+            if processed and time.perf_counter() >= deadline:
+                deferred = self._queued_results()
+                if deferred:
+                    self.drain_budget_exhausted += 1
+                    self.results_deferred += deferred
+                break
+
             result = self.capture_system.get_result(timeout=0.0)  # Non-blocking
             if not result:
                 break
@@ -1147,11 +1775,10 @@ class WindowManager:
                 try:
                     self.preview_frames[window_id].update_frame(image)
 
-                    # Analyze for alerts
-                    if image:
-                        alert_level = self.alert_detector.analyze_frame(window_id, image)
-                        if alert_level:
-                            self.preview_frames[window_id].set_alert(alert_level)
+                    # Analyze for alerts (delivered via the registered callback -> alert bus)
+                    # unless the alert scheduler samples this window on its own
+                    if image and self.alert_scheduler is None and not isinstance(image, QImage):
+                        self.alert_detector.analyze_frame(window_id, image)
 
                 except Exception as e:
                     self.logger.error(f"Failed to process frame for {window_id}: {e}")
@@ -1160,8 +1787,203 @@ class WindowManager:
             with self._pending_lock:
                 self.pending_requests.pop(request_id, None)
 
+        self.drain_cycles += 1
+        self.results_processed += processed
+        self.last_drain_ms = (time.perf_counter() - start) * 1000
+
         if processed > 0:
-            self.logger.debug(f"Processed {processed} capture results")
+            self.logger.debug(
+                f"Processed {processed} capture results in {self.last_drain_ms:.1f}ms"
+            )
+
+    def _queued_results(self) -> int:
+        """Number of capture results still waiting (0 if the backend can't tell)"""
+        try:
+            return int(self.capture_system.pending_results())
+        except Exception:
+            return 0
+
+    def reset_drain_stats(self):
+        """Zero the capture result drain counters"""
+        self.drain_cycles = 0
+        self.drain_budget_exhausted = 0  # Ticks that stopped with results still queued
+        self.results_deferred = 0  # Queued results left behind by those ticks
+        self.results_processed = 0
+        self.last_drain_ms = 0.0
+
+    def get_drain_stats(self) -> Dict[str, float]:
+        """
+        Get capture result drain instrumentation
+
+        Returns:
+            Dict with cycles, budget-exhausted count, deferred/processed totals,
+            the configured budget and the duration of the last drain
+        """
+        return {
+            "cycles": self.drain_cycles,
+            "budget_exhausted": self.drain_budget_exhausted,
+            "results_deferred": self.results_deferred,
+            "results_processed": self.results_processed,
+            "budget_ms": self.result_budget_ms,
+            "last_drain_ms": self.last_drain_ms,
+        }
+
+    def _on_alerts_ready(self, alerts: Dict[str, AlertLevel]):
+        """
+        Apply a coalesced batch of alerts from the alert bus
+
+        Args:
+            alerts: {window_id: AlertLevel}
+        """
+        for window_id, level in alerts.items():
+            frame = self.preview_frames.get(window_id)
+            if frame is not None:
+                frame.set_alert(level, self.alert_detector.get_change_regions(window_id))
+
+    def configure_local_watch(self):
+        """(Re)build the Local watcher from alerts.local settings"""
+        self.stop_local_watch()
+        if not self.settings_manager or not self.settings_manager.get(
+            "alerts.local.enabled", False
+        ):
+            return
+
+        region = self.settings_manager.get("alerts.local.region", [])
+        if not isinstance(region, (list, tuple)) or len(region) != 4 or min(region[2:]) <= 0:
+            self.logger.warning(f"Local watch enabled but region is invalid: {region}")
+            return
+
+        detector = LocalDetector(
+            tolerance=self.settings_manager.get(
+                "alerts.local.tolerance", LocalDetector.DEFAULT_TOLERANCE
+            ),
+            spike_threshold=self.settings_manager.get(
+                "alerts.local.spike_threshold", LocalDetector.DEFAULT_SPIKE_THRESHOLD
+            ),
+        )
+        self.local_watcher = LocalWatcher(
+            self.capture_system.capture_region_sync,
+            tuple(region),
+            detector=detector,
+            interval_ms=self.settings_manager.get(
+                "alerts.local.interval_ms", LocalWatcher.DEFAULT_INTERVAL_MS
+            ),
+        )
+        self.local_watcher.report_ready.connect(self._on_local_report)
+        for window_id in self.preview_frames:
+            self.local_watcher.watch(window_id)
+        self.local_watcher.start()
+
+    def stop_local_watch(self):
+        """Stop and drop the Local watcher, if any"""
+        if self.local_watcher is not None:
+            self.local_watcher.stop()
+            self.local_watcher = None
+
+    def _on_local_report(self, window_id: str, report: LocalReport):
+        """
+        Route Local hostile-count increases through the alert bus
+
+        Args:
+            window_id: Window whose Local list was analyzed
+            report: LocalReport from the watcher
+        """
+        if report.level is not None and window_id in self.preview_frames:
+            self.logger.info(
+                f"Local hostiles in {window_id}: {report.previous_count} -> {report.hostile_count}"
+            )
+            self.alert_bus.post(window_id, report.level)
+
+    def configure_alert_probe(self):
+        """(Re)build the sparse alert probe from alerts.probe settings"""
+        self.stop_alert_probe()
+        if not self.settings_manager or not self.settings_manager.get(
+            "alerts.probe.enabled", False
+        ):
+            return
+
+        probe = AlertProbe(
+            self.alert_detector,
+            interval_ms=self.settings_manager.get(
+                "alerts.probe.interval_ms", AlertProbe.DEFAULT_INTERVAL_MS
+            ),
+            strip_count=self.settings_manager.get("alerts.probe.strips", AlertProbe.STRIP_COUNT),
+        )
+        probe.alert_detected.connect(self._on_probe_alert)
+        for window_id in self.preview_frames:
+            probe.watch(window_id)
+        if probe.start():
+            self.alert_probe = probe
+
+    def stop_alert_probe(self):
+        """Stop and drop the alert probe, if any"""
+        if self.alert_probe is not None:
+            self.alert_probe.stop()
+            self.alert_probe = None
+
+    def _on_probe_alert(self, window_id: str, level: AlertLevel):
+        """
+        Route probe alerts through the alert bus
+
+        Args:
+            window_id: Probed window
+            level: AlertLevel from the probe
+        """
+        if window_id in self.preview_frames:
+            self.alert_bus.post(window_id, level)
+
+    def configure_alert_scheduler(self):
+        """
+        (Re)build the alert scheduler from alerts.sampling settings
+
+        Sampling is opt-in and paused in Low Power Mode; without a scheduler
+        alerts are analyzed from preview frames instead.
+        """
+        self.stop_alert_scheduler()
+        if not self.settings_manager:
+            return
+        if not self.settings_manager.get("alerts.enabled", True):
+            return
+        if not self.settings_manager.get("alerts.sampling.enabled", False):
+            return
+        if self.settings_manager.get("performance.low_power_mode", False):
+            return
+
+        self.alert_scheduler = AlertScheduler(
+            self.capture_system.capture_sample_sync,
+            rate_hz=self.settings_manager.get(
+                "alerts.sampling.rate_hz", AlertScheduler.DEFAULT_RATE_HZ
+            ),
+            budget_ms=self.settings_manager.get(
+                "alerts.sampling.budget_ms", AlertScheduler.DEFAULT_BUDGET_MS
+            ),
+            scale=self.settings_manager.get("alerts.sampling.scale", AlertScheduler.DEFAULT_SCALE),
+        )
+        self.alert_scheduler.sample_ready.connect(self._on_alert_sample)
+        for window_id in self.preview_frames:
+            self.alert_scheduler.watch(window_id)
+        self.alert_scheduler.start()
+
+    def stop_alert_scheduler(self):
+        """Stop and drop the alert scheduler, if any"""
+        if self.alert_scheduler is not None:
+            self.alert_scheduler.stop()
+            self.alert_scheduler = None
+
+    def _on_alert_sample(self, window_id: str, image: Image.Image):
+        """
+        Analyze a low-res alert sample (alerts go through the registered callback)
+
+        Args:
+            window_id: Sampled window
+            image: Low-resolution frame from the scheduler
+        """
+        if window_id not in self.preview_frames or self.alert_scheduler is None:
+            return
+        try:
+            self.alert_detector.analyze_frame(window_id, image, self.alert_scheduler.scale)
+        except Exception as e:
+            self.logger.error(f"Failed to analyze alert sample for {window_id}: {e}")
 
     def get_active_window_count(self) -> int:
         """Get count of active preview windows"""
@@ -1201,6 +2023,14 @@ class MainTab(QWidget):
 
         # v2.3: Layout controls
         self.grid_applier = GridApplier()
+
+        # Layout moves are committed off the GUI thread
+        self.layout_committer = LayoutCommitter(self)
+        self.layout_committer.layout_committed.connect(self._on_layout_committed)
+
+        # Auto-minimize toggles run across windows off the GUI thread
+        self.bulk_ops = BulkWindowOps(self)
+        self.bulk_ops.operation_finished.connect(self._on_bulk_operation_finished)
         self.cycling_groups: Dict[str, List[str]] = {}
         self._load_cycling_groups()
 
@@ -1250,19 +2080,38 @@ class MainTab(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.preview_scroll = scroll
 
         # Container for preview frames with flow/grid layout
         self.preview_container = QWidget()
         self.preview_layout = FlowLayout(margin=15, spacing=15)  # Grid-style flow layout
         self.preview_container.setLayout(self.preview_layout)
 
-        scroll.setWidget(self.preview_container)
+        # Canvas renderer: all thumbnails painted by one widget instead
+        self.thumbnail_wall: Optional[ThumbnailWall] = None
+        if self.window_manager.renderer == RENDERER_CANVAS:
+            self.thumbnail_wall = ThumbnailWall(self.settings_manager)
+            scroll.setWidget(self.thumbnail_wall)
+        else:
+            scroll.setWidget(self.preview_container)
         layout.addWidget(scroll)
 
+        # Only previews inside the viewport are captured; refresh on scroll-in
+        self.window_manager.viewport_provider = self._preview_viewport
+        for bar in (scroll.verticalScrollBar(), scroll.horizontalScrollBar()):
+            bar.valueChanged.connect(lambda _value: self.window_manager.on_viewport_changed())
+            bar.rangeChanged.connect(lambda *_range: self.window_manager.on_viewport_changed())
+
         # Status bar
         status_bar = self._create_status_bar()
         layout.addWidget(status_bar)
 
+    def _preview_viewport(self) -> QRect:
+        """Visible part of the preview area, in preview content coordinates"""
+        content = self.preview_scroll.widget()
+        viewport = self.preview_scroll.viewport()
+        return QRect(-content.x(), -content.y(), viewport.width(), viewport.height())
+
     def _create_toolbar(self) -> QWidget:
         """Create toolbar using ActionRegistry (v2.3)"""
         toolbar = QWidget()
@@ -1558,8 +2407,8 @@ class MainTab(QWidget):
         if not screen:
             screen = ScreenGeometry(0, 0, 1920, 1080, True)
 
-        # Apply arrangement
-        success = self.grid_applier.apply_arrangement(
+        # Collect the moves here, apply them on a worker thread
+        transaction = self.grid_applier.build_transaction(
             arrangement=arrangement,
             window_map=window_map,
             screen=screen,
@@ -1570,13 +2419,31 @@ class MainTab(QWidget):
             stacked_use_grid_size=self.stack_resize_checkbox.isChecked(),
         )
 
-        if success:
-            pattern = self.pattern_combo.currentText()
-            self.status_label.setText(f"Applied {pattern} layout to {len(window_map)} windows")
-            self.layout_applied.emit(pattern)
-            self.logger.info(f"Applied {pattern} layout to {len(window_map)} windows")
-        else:
+        if transaction is None:
             QMessageBox.warning(self, "Error", "Failed to apply layout. Check logs for details.")
+            return
+
+        pattern = self.pattern_combo.currentText()
+        self.status_label.setText(f"Applying {pattern} layout...")
+        self.layout_committer.run(pattern, transaction)
+
+    def _on_layout_committed(self, pattern: str, result: LayoutResult):
+        """
+        Show the outcome of a layout applied by the layout committer
+
+        Args:
+            pattern: Layout pattern name
+            result: Counts and timing of the commit
+        """
+        if result.failed:
+            self.logger.error(f"Failed to apply arrangement to {result.failed} windows")
+            QMessageBox.warning(self, "Error", "Failed to apply layout. Check logs for details.")
+            return
+
+        count = result.moved + result.unchanged
+        self.status_label.setText(f"Applied {pattern} layout to {count} windows")
+        self.layout_applied.emit(pattern)
+        self.logger.info(f"Applied {pattern} layout to {count} windows")
 
     def refresh_layout_groups(self):
         """Called when groups change in hotkeys tab"""
@@ -1614,12 +2481,7 @@ class MainTab(QWidget):
             # Add to window manager
             frame = self.window_manager.add_window(window_id, char_name)
             if frame:
-                # Connect signals
-                frame.window_activated.connect(self._on_window_activated)
-                frame.window_removed.connect(self._on_window_removed)
-
-                # Add to layout
-                self.preview_layout.addWidget(frame)
+                self.add_preview_frame(frame)
                 added_count += 1
 
                 # Emit character detected signal
@@ -1725,12 +2587,19 @@ class MainTab(QWidget):
         # Add to window manager
         frame = self.window_manager.add_window(window_id, char_name)
         if frame:
-            frame.window_activated.connect(self._on_window_activated)
-            frame.window_removed.connect(self._on_window_removed)
-            self.preview_layout.addWidget(frame)
+            self.add_preview_frame(frame)
             return True
         return False
 
+    def add_preview_frame(self, frame: Union[WindowPreviewWidget, ThumbnailTile]):
+        """Connect a new preview frame and show it (flow layout or thumbnail wall)"""
+        frame.window_activated.connect(self._on_window_activated)
+        frame.window_removed.connect(self._on_window_removed)
+        if self.thumbnail_wall is not None:
+            self.thumbnail_wall.add_tile(frame)
+        else:
+            self.preview_layout.addWidget(frame)
+
     def show_add_window_dialog(self):
         """Show dialog to add windows"""
         try:
@@ -1800,9 +2669,12 @@ class MainTab(QWidget):
                 last_window = self.settings_manager.get_last_activated_window()
                 if last_window and last_window != window_id:
                     # Minimize the previous EVE window
-                    subprocess.run(
-                        ["xdotool", "windowminimize", last_window], capture_output=True, timeout=1
-                    )
+                    if not WindowControl.get_instance().minimize(last_window):
+                        subprocess.run(
+                            ["xdotool", "windowminimize", last_window],
+                            capture_output=True,
+                            timeout=1,
+                        )
                     self.logger.info(f"Auto-minimized previous EVE window: {last_window}")
 
             # Track this as the last activated EVE window
@@ -1860,33 +2732,50 @@ class MainTab(QWidget):
             self._update_minimize_button_style()
 
             if new_value:
-                # Mode enabled - also minimize inactive windows now
-                result = subprocess.run(
-                    ["xdotool", "getwindowfocus"], capture_output=True, text=True, timeout=1
-                )
-                if result.returncode == 0:
-                    focused_id = result.stdout.strip()
-                    minimized_count = 0
-                    for window_id in self.window_manager.preview_frames.keys():
-                        if window_id != focused_id:
-                            if self.capture_system.minimize_window(window_id):
-                                minimized_count += 1
-                    self.logger.info(f"Auto-minimize enabled, minimized {minimized_count} windows")
-                    self.status_label.setText(f"Auto-minimize ON ({minimized_count} minimized)")
+                # Mode enabled - also minimize inactive windows now (in the background)
+                focused_id = self.window_manager.get_focused_window()
+                if focused_id is not None:
+                    inactive = [
+                        window_id
+                        for window_id in self.window_manager.preview_frames.keys()
+                        if window_id != focused_id
+                    ]
+                    self.bulk_ops.run(
+                        "auto_minimize", inactive, self.capture_system.minimize_window
+                    )
+                    self.status_label.setText("Auto-minimize ON (minimizing...)")
                 else:
                     self.status_label.setText("Auto-minimize ON")
             else:
-                # Mode disabled - restore all windows
-                restored_count = 0
-                for window_id in self.window_manager.preview_frames.keys():
-                    if self.capture_system.restore_window(window_id):
-                        restored_count += 1
-                self.logger.info(f"Auto-minimize disabled, restored {restored_count} windows")
-                self.status_label.setText(f"Auto-minimize OFF ({restored_count} restored)")
+                # Mode disabled - restore all windows (in the background)
+                self.bulk_ops.run(
+                    "auto_restore",
+                    list(self.window_manager.preview_frames.keys()),
+                    self.capture_system.restore_window,
+                )
+                self.status_label.setText("Auto-minimize OFF (restoring...)")
 
         except Exception as e:
             self.logger.error(f"Error toggling auto-minimize: {e}")
 
+    def _on_bulk_operation_finished(self, operation: str, results: dict):
+        """
+        Show the outcome of an auto-minimize bulk operation
+
+        Args:
+            operation: 'auto_minimize' or 'auto_restore'
+            results: window_id -> success
+        """
+        count = sum(1 for success in results.values() if success)
+        # Map states changed - expire the shared window snapshot
+        WindowRegistry.get_instance().invalidate()
+        if operation == "auto_minimize":
+            self.logger.info(f"Auto-minimize enabled, minimized {count} windows")
+            self.status_label.setText(f"Auto-minimize ON ({count} minimized)")
+        else:
+            self.logger.info(f"Auto-minimize disabled, restored {count} windows")
+            self.status_label.setText(f"Auto-minimize OFF ({count} restored)")
+
     def _update_minimize_button_style(self):
         """Update minimize button visual state"""
         if hasattr(self, "minimize_inactive_btn") and self.minimize_inactive_btn:
@@ -21,11 +21,20 @@ from argus_overview.core.eve_settings_sync import EVESettingsSync
 from argus_overview.core.hotkey_manager import HotkeyManager
 from argus_overview.core.layout_manager import LayoutManager
 from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+from argus_overview.core.window_events import (
+    ActiveWindowWatcher,
+    ClientListWatcher,
+    ScreenChangeWatcher,
+)
+from argus_overview.core.window_ops import BulkWindowOps
+from argus_overview.core.window_registry import WindowRegistry
 from argus_overview.ui.action_registry import ActionRegistry
 from argus_overview.ui.menu_builder import MenuBuilder
 from argus_overview.ui.settings_manager import SettingsManager
 from argus_overview.ui.themes import get_theme_manager
 from argus_overview.ui.tray import SystemTray
+from argus_overview.utils.screen import MonitorCache
+from argus_overview.utils.window_control import WindowControl
 
 
 class MainWindowV21(QMainWindow):
@@ -53,15 +62,31 @@ class MainWindowV21(QMainWindow):
         capture_workers = self.settings_manager.get("performance.capture_workers", 1)
         self.capture_system = WindowCaptureThreaded(max_workers=capture_workers)
 
+        # Client list, titles and map state from X events, on one connection:
+        # feeds event-driven discovery and the registry's minimized clients
+        self.client_watcher = ClientListWatcher(self)
+
         # v2.2: Auto-discovery
         self.auto_discovery = AutoDiscovery(
-            interval_seconds=self.settings_manager.get("general.auto_discovery_interval", 5)
+            interval_seconds=self.settings_manager.get("general.auto_discovery_interval", 5),
+            event_driven=self.settings_manager.get("general.auto_discovery_events", True),
+            watcher=self.client_watcher,
         )
 
         # v2.2: Window cycling state
         self.cycling_index = 0  # Current position in cycling group
         self.current_cycling_group = "Default"  # Active cycling group name
 
+        # Focus tracking from _NET_ACTIVE_WINDOW (previews, cycling index, last activated)
+        self.focus_tracker = ActiveWindowWatcher(self)
+
+        # Monitor layout cache invalidation from RandR events
+        self.screen_watcher = ScreenChangeWatcher(self)
+
+        # Minimize/restore all run off the GUI thread
+        self.bulk_ops = BulkWindowOps(self)
+        self.bulk_ops.operation_finished.connect(self._on_bulk_operation_finished)
+
         # v2.2: Theme manager
         self.theme_manager = get_theme_manager()
 
@@ -114,8 +139,34 @@ class MainWindowV21(QMainWindow):
             self.auto_discovery.character_gone.connect(self._on_character_gone)
             self.auto_discovery.start()
 
+        self._start_focus_tracking()
+        self._start_monitor_tracking()
+        self._start_minimized_tracking()
+
         self.logger.info("Main window v2.2 initialized successfully")
 
+    def _start_focus_tracking(self):
+        """Follow the active window through X events instead of querying xdotool"""
+        self.focus_tracker.active_changed.connect(self._on_active_window_changed)
+        self.focus_tracker.watch_lost.connect(self._on_focus_watch_lost)
+        if self.focus_tracker.start():
+            self.main_tab.window_manager.focus_tracked = True
+            self._on_active_window_changed(self.focus_tracker.active_window() or "")
+
+    def _start_monitor_tracking(self):
+        """Expire the cached monitor layout whenever screens change"""
+        app = QApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._on_screens_changed)
+            app.screenRemoved.connect(self._on_screens_changed)
+        self.screen_watcher.start()
+
+    def _start_minimized_tracking(self):
+        """Keep the registry's map state current from X events (discovery may have started it)"""
+        self.client_watcher.watch_lost.connect(self._on_client_watch_lost)
+        if self.main_tab.window_manager.skip_minimized:
+            self.client_watcher.start()
+
     def _create_system_tray(self):
         """Create system tray icon (v2.4 - uses ActionRegistry)"""
         self.system_tray = SystemTray(self)
@@ -340,7 +391,7 @@ class MainWindowV21(QMainWindow):
         self._cycle_window(direction=-1)
 
     def _activate_window(self, window_id: str):
-        """Activate a window by ID using xdotool, optionally minimizing previous EVE window"""
+        """Activate a window by ID (EWMH or xdotool), optionally minimizing the previous one"""
         import re
         import subprocess
 
@@ -363,20 +414,24 @@ class MainWindowV21(QMainWindow):
                     and re.match(r"^0x[0-9a-fA-F]+$", last_eve_window)
                 ):
                     # Minimize the previous EVE window
-                    subprocess.run(
-                        ["xdotool", "windowminimize", last_eve_window],
-                        capture_output=True,
-                        timeout=1,
-                    )
+                    if not WindowControl.get_instance().minimize(last_eve_window):
+                        subprocess.run(
+                            ["xdotool", "windowminimize", last_eve_window],
+                            capture_output=True,
+                            timeout=1,
+                        )
                     self.logger.info(f"Auto-minimized previous EVE window: {last_eve_window}")
 
             # Track this as the last activated EVE window
             self.settings_manager.set_last_activated_window(window_id)
 
-            # Activate the new window
-            subprocess.run(
-                ["xdotool", "windowactivate", "--sync", window_id], capture_output=True, timeout=2
-            )
+            # Activate the new window (EWMH message; xdotool without an X connection)
+            if not WindowControl.get_instance().activate(window_id):
+                subprocess.run(
+                    ["xdotool", "windowactivate", "--sync", window_id],
+                    capture_output=True,
+                    timeout=2,
+                )
         except Exception as e:
             self.logger.error(f"Failed to activate window {window_id}: {e}")
 
@@ -414,7 +469,7 @@ class MainWindowV21(QMainWindow):
             self.auto_discovery.set_interval(
                 self.settings_manager.get("general.auto_discovery_interval", 5)
             )
-            if not self.auto_discovery.scan_timer.isActive():
+            if not self.auto_discovery.running:
                 self.auto_discovery.start()
         else:
             self.auto_discovery.stop()
@@ -429,7 +484,7 @@ class MainWindowV21(QMainWindow):
         QApplication.quit()
 
     def _apply_to_all_windows(self, action: str):
-        """Apply action to all EVE windows
+        """Apply action to all EVE windows in the background (reported when finished)
 
         Args:
             action: 'minimize' or 'restore'
@@ -441,8 +496,21 @@ class MainWindowV21(QMainWindow):
         if not method:
             return
 
-        count = sum(1 for wid in self.main_tab.window_manager.preview_frames.keys() if method(wid))
-        action_past = "Minimized" if action == "minimize" else "Restored"
+        window_ids = list(self.main_tab.window_manager.preview_frames.keys())
+        self.bulk_ops.run(f"{action}_all", window_ids, method)
+
+    @Slot(str, dict)
+    def _on_bulk_operation_finished(self, operation: str, results: dict):
+        """Report a finished minimize/restore all
+
+        Args:
+            operation: 'minimize_all' or 'restore_all'
+            results: window_id -> success
+        """
+        count = sum(1 for success in results.values() if success)
+        # Map states changed - expire the shared window snapshot
+        WindowRegistry.get_instance().invalidate()
+        action_past = "Minimized" if operation == "minimize_all" else "Restored"
         self.logger.info(f"{action_past} {count} EVE windows")
         self.system_tray.show_notification(
             f"Windows {action_past}", f"{action_past} {count} windows"
@@ -479,9 +547,7 @@ class MainWindowV21(QMainWindow):
             if window_id not in self.main_tab.window_manager.preview_frames:
                 frame = self.main_tab.window_manager.add_window(window_id, char_name)
                 if frame:
-                    frame.window_activated.connect(self.main_tab._on_window_activated)
-                    frame.window_removed.connect(self.main_tab._on_window_removed)
-                    self.main_tab.preview_layout.addWidget(frame)
+                    self.main_tab.add_preview_frame(frame)
                     self.main_tab._update_status()
 
                     # Show notification
@@ -569,12 +635,32 @@ class MainWindowV21(QMainWindow):
             enabled=self.settings_manager.get("alerts.enabled", True),
             red_flash_threshold=self.settings_manager.get("alerts.red_flash.threshold", 0.7),
             change_threshold=self.settings_manager.get("alerts.screen_change.threshold", 0.3),
+            background_learning_rate=self.settings_manager.get(
+                "alerts.screen_change.learning_rate", 0.05
+            ),
             sound_enabled=self.settings_manager.get("alerts.red_flash.sound_alert", False),
             visual_border=self.settings_manager.get("alerts.red_flash.visual_border", True),
             alert_cooldown=self.settings_manager.get("alerts.red_flash.cooldown", 5),
         )
         self.alert_detector.set_config(alert_config)
 
+        # Template zones (icon matching) - only built when something is configured
+        from argus_overview.core.template_detector import TemplateMatcher
+
+        templates = self.settings_manager.get("alerts.templates", {})
+        zones = self.settings_manager.get("alerts.template_zones", [])
+        matcher = None
+        if isinstance(templates, dict) and isinstance(zones, list) and templates and zones:
+            matcher = TemplateMatcher.from_config(templates, zones)
+        self.alert_detector.set_template_matcher(matcher)
+
+        # Keep the alert bus cooldown in sync (main tab doesn't exist on first call)
+        if hasattr(self, "main_tab"):
+            self.main_tab.window_manager.alert_bus.set_cooldown(alert_config.alert_cooldown)
+            self.main_tab.window_manager.configure_local_watch()
+            self.main_tab.window_manager.configure_alert_probe()
+            self.main_tab.window_manager.configure_alert_scheduler()
+
         self.logger.info("Initial settings applied")
 
     def _create_main_tab(self):
@@ -670,7 +756,7 @@ class MainWindowV21(QMainWindow):
         # Route to appropriate component
         if key.startswith("performance"):
             if key == "performance.low_power_mode":
-                # Low power mode: FPS=5, alerts off
+                # Low power mode: FPS=5, alert sampling paused
                 self._apply_low_power_mode(value)
             elif key == "performance.capture_workers":
                 # This requires restart of capture system
@@ -679,6 +765,9 @@ class MainWindowV21(QMainWindow):
                 # Apply to main tab if it exists
                 if hasattr(self, "main_tab"):
                     self.main_tab.window_manager.set_refresh_rate(value)
+            elif key == "performance.result_budget_ms":
+                if hasattr(self, "main_tab"):
+                    self.main_tab.window_manager.set_result_budget(value)
             elif key == "performance.disable_previews":
                 # Toggle preview captures on/off (GPU/CPU savings)
                 if hasattr(self, "main_tab"):
@@ -696,20 +785,20 @@ class MainWindowV21(QMainWindow):
     def _apply_low_power_mode(self, enabled: bool):
         """
         Apply low power mode settings.
-        When enabled: FPS=5, alerts disabled.
+        When enabled: preview FPS=5 and the separate alert sampler is paused
+        (alerts are analyzed from preview frames).
         When disabled: restore previous settings.
 
         Args:
             enabled: True to enable low power mode
         """
         if enabled:
-            self.logger.info("Enabling Low Power Mode (FPS=5, alerts off)")
+            self.logger.info("Enabling Low Power Mode (FPS=5, alert sampling paused)")
 
             # Store previous values for restoration
             if not hasattr(self, "_low_power_previous"):
                 self._low_power_previous = {
                     "fps": self.settings_manager.get("performance.default_refresh_rate", 30),
-                    "alerts": self.settings_manager.get("alerts.enabled", True),
                 }
 
             # Set FPS to 5
@@ -720,13 +809,11 @@ class MainWindowV21(QMainWindow):
                     self.main_tab.refresh_rate_spin.blockSignals(True)
                     self.main_tab.refresh_rate_spin.setValue(5)
                     self.main_tab.refresh_rate_spin.blockSignals(False)
-
-            # Disable alerts
-            self.settings_manager.set("alerts.enabled", False)
-            self._apply_initial_settings()
+                # Sampler reads performance.low_power_mode and stays stopped
+                self.main_tab.window_manager.configure_alert_scheduler()
 
             # Update status bar
-            self.statusBar().showMessage("⚡ Low Power Mode active (FPS=5, alerts off)", 5000)
+            self.statusBar().showMessage("⚡ Low Power Mode active (FPS=5)", 5000)
 
         else:
             self.logger.info("Disabling Low Power Mode (restoring previous settings)")
@@ -743,12 +830,11 @@ class MainWindowV21(QMainWindow):
                         self.main_tab.refresh_rate_spin.setValue(prev["fps"])
                         self.main_tab.refresh_rate_spin.blockSignals(False)
 
-                # Restore alerts
-                self.settings_manager.set("alerts.enabled", prev["alerts"])
-                self._apply_initial_settings()
-
                 del self._low_power_previous
 
+            if hasattr(self, "main_tab"):
+                self.main_tab.window_manager.configure_alert_scheduler()
+
             self.statusBar().showMessage("Low Power Mode disabled", 3000)
 
     @Slot(str, str)
@@ -791,6 +877,44 @@ class MainWindowV21(QMainWindow):
         ):
             self.characters_tab.update_character_status(char_name, None)
 
+    @Slot(str)
+    def _on_active_window_changed(self, window_id: str):
+        """
+        Handle a focus change reported by the window manager
+
+        Args:
+            window_id: Active window ID, "" when nothing is active
+        """
+        key = self.main_tab.window_manager.set_focused_window(window_id)
+        if key is None:
+            return  # Not one of our previews
+
+        self.settings_manager.set_last_activated_window(key)
+
+        # Keep cycling relative to the client the user is actually in
+        char_name = self.main_tab.window_manager.preview_frames[key].character_name
+        members = self._get_cycling_group_members()
+        if char_name in members:
+            self.cycling_index = members.index(char_name)
+
+    @Slot()
+    def _on_focus_watch_lost(self):
+        """Focus watcher lost its X connection - fall back to querying on demand"""
+        self.logger.warning("Focus tracking lost, falling back to xdotool queries")
+        self.main_tab.window_manager.focus_tracked = False
+        self.main_tab.window_manager.set_focused_window(None)
+
+    @Slot()
+    def _on_client_watch_lost(self):
+        """Client watcher lost its X connection - clear map state, capture every preview"""
+        self.logger.warning("Window events lost, capturing all previews")
+        self.client_watcher.stop()
+
+    def _on_screens_changed(self, *_args):
+        """Screen added/removed (Qt) - re-read the monitor layout on next use"""
+        self.logger.debug("Screens changed, invalidating monitor layout")
+        MonitorCache.get_instance().invalidate()
+
     @Slot(object)
     def _on_team_selected(self, team):
         """
@@ -844,6 +968,23 @@ class MainWindowV21(QMainWindow):
         if hasattr(self, "auto_discovery"):
             self.auto_discovery.stop()
 
+        if hasattr(self, "focus_tracker"):
+            self.focus_tracker.stop()
+
+        if hasattr(self, "screen_watcher"):
+            self.screen_watcher.stop()
+
+        if hasattr(self, "client_watcher"):
+            self.client_watcher.stop()
+
+        if hasattr(self, "bulk_ops"):
+            self.bulk_ops.wait(timeout=1.0)
+
+        if hasattr(self, "main_tab"):
+            self.main_tab.window_manager.stop_local_watch()
+            self.main_tab.window_manager.stop_alert_probe()
+            self.main_tab.window_manager.stop_alert_scheduler()
+
         if hasattr(self, "capture_system"):
             self.capture_system.stop()
 
@@ -25,15 +25,18 @@ class SettingsManager:
             "show_notifications": True,
             "auto_save_interval": 5,  # minutes
             "auto_discovery": True,
-            "auto_discovery_interval": 5,  # seconds
+            "auto_discovery_interval": 5,  # seconds (polling fallback)
+            "auto_discovery_events": True,  # React to X client-list/title changes instead of polling
             "hot_reload": True,
         },
         "performance": {
-            "low_power_mode": False,  # FPS=5, alerts off - for running with EVE clients
+            "low_power_mode": False,  # FPS=5, no extra alert sampling - for running with EVE clients
             "auto_minimize_inactive": False,  # Auto-minimize previous window when cycling
+            "skip_minimized": True,  # Don't capture minimized clients (last frame + overlay)
             "disable_previews": False,  # Disable all window captures (saves GPU/CPU)
             "default_refresh_rate": 1,  # FPS - 1 is efficient, increase if needed
             "capture_workers": 1,  # Single worker to reduce overhead
+            "result_budget_ms": 4,  # GUI time per capture tick for applying finished frames
             "enable_caching": True,
             "cache_size_mb": 50,
             "capture_quality": "low",  # low, medium, high
@@ -47,6 +50,7 @@ class SettingsManager:
             "show_activity_indicator": True,
             "default_width": 280,
             "default_height": 200,
+            "renderer": "widgets",  # widgets (one per client) or canvas (single painted wall)
         },
         "alerts": {
             "enabled": True,
@@ -56,7 +60,32 @@ class SettingsManager:
                 "sound_alert": False,
                 "cooldown": 5,  # seconds
             },
-            "screen_change": {"threshold": 0.3, "visual_border": True, "sound_alert": False},
+            "screen_change": {
+                "threshold": 0.3,
+                "visual_border": True,
+                "sound_alert": False,
+                "learning_rate": 0.05,  # Background model adaptation per frame
+            },
+            "templates": {},  # name -> icon image path
+            "template_zones": [],  # [{name, region: [x, y, w, h] fractions, templates, threshold, level}]
+            "local": {
+                "enabled": False,
+                "region": [],  # Local member list [x, y, w, h] in window pixels
+                "interval_ms": 250,  # Region-only capture, faster than previews
+                "tolerance": 48,  # RGB distance from standing tag colors
+                "spike_threshold": 2,  # New hostiles at once that raise HIGH
+            },
+            "probe": {
+                "enabled": True,  # Red-flash probe via X strips, runs with previews off
+                "interval_ms": 100,  # 10 Hz, independent of preview FPS
+                "strips": 6,  # 1-pixel full-width rows sampled per window
+            },
+            "sampling": {
+                "enabled": False,  # Opt-in: sample alerts on their own schedule, not preview frames
+                "rate_hz": 5,  # Per-window alert sampling rate
+                "budget_ms": 50,  # How long a tick waits for its captures; slow ones finish later
+                "scale": 0.25,  # Low-res captures for analysis
+            },
         },
         "hotkeys": {
             "activate_window_1": "<ctrl>+<alt>+1",
@@ -226,8 +226,8 @@ class PerformancePanel(QWidget):
         self.low_power_check.stateChanged.connect(self._on_low_power_changed)
         self.low_power_check.setToolTip(
             "LOW POWER MODE\n"
-            "• Sets FPS to 5\n"
-            "• Disables alert detection\n"
+            "• Sets preview FPS to 5\n"
+            "• Pauses separate alert sampling (alerts use preview frames)\n"
             "• Reduces CPU/GPU load significantly\n\n"
             "Use when running multiple EVE clients."
         )
@@ -272,6 +272,21 @@ class PerformancePanel(QWidget):
         )
         form.addRow("Capture workers:", self.workers_spin)
 
+        # GUI time spent applying captured frames per tick
+        self.result_budget_spin = QSpinBox()
+        self.result_budget_spin.setRange(1, 50)
+        self.result_budget_spin.setValue(
+            self.settings_manager.get("performance.result_budget_ms", 4)
+        )
+        self.result_budget_spin.setSuffix(" ms")
+        self.result_budget_spin.setToolTip(
+            "Time per capture tick for drawing new frames; the rest wait for the next tick."
+        )
+        self.result_budget_spin.valueChanged.connect(
+            lambda v: self.setting_changed.emit("performance.result_budget_ms", v)
+        )
+        form.addRow("Frame budget per tick:", self.result_budget_spin)
+
         # Caching
         self.caching_check = QCheckBox()
         self.caching_check.setChecked(self.settings_manager.get("performance.enable_caching", True))
@@ -302,6 +317,21 @@ class PerformancePanel(QWidget):
         )
         form.addRow("Capture quality:", self.quality_combo)
 
+        # Thumbnail renderer
+        self.renderer_combo = QComboBox()
+        self.renderer_combo.addItems(["widgets", "canvas"])
+        self.renderer_combo.setCurrentText(
+            self.settings_manager.get("thumbnails.renderer", "widgets")
+        )
+        self.renderer_combo.setToolTip(
+            "canvas paints all thumbnails in one widget (faster with many clients).\n"
+            "Takes effect after restart."
+        )
+        self.renderer_combo.currentTextChanged.connect(
+            lambda v: self.setting_changed.emit("thumbnails.renderer", v)
+        )
+        form.addRow("Thumbnail renderer:", self.renderer_combo)
+
         group.setLayout(form)
         layout.addWidget(group)
         layout.addStretch()
@@ -410,6 +440,37 @@ class AlertsPanel(QWidget):
         screen_change_group.setLayout(screen_change_layout)
         layout.addWidget(screen_change_group)
 
+        # Alert sampling (independent of the preview refresh rate)
+        sampling_group = QGroupBox("Alert Sampling")
+        sampling_layout = QFormLayout()
+
+        self.sampling_enabled = QCheckBox()
+        self.sampling_enabled.setChecked(
+            self.settings_manager.get("alerts.sampling.enabled", False)
+        )
+        self.sampling_enabled.setToolTip(
+            "Sample alerts with low-res captures at their own rate,\n"
+            "so previews can run at 1 FPS or be disabled"
+        )
+        self.sampling_enabled.stateChanged.connect(
+            lambda: self.setting_changed.emit(
+                "alerts.sampling.enabled", self.sampling_enabled.isChecked()
+            )
+        )
+        sampling_layout.addRow("Independent sampling:", self.sampling_enabled)
+
+        self.sampling_rate = QSpinBox()
+        self.sampling_rate.setRange(1, 20)
+        self.sampling_rate.setValue(int(self.settings_manager.get("alerts.sampling.rate_hz", 5)))
+        self.sampling_rate.setSuffix(" Hz")
+        self.sampling_rate.valueChanged.connect(
+            lambda v: self.setting_changed.emit("alerts.sampling.rate_hz", v)
+        )
+        sampling_layout.addRow("Rate:", self.sampling_rate)
+
+        sampling_group.setLayout(sampling_layout)
+        layout.addWidget(sampling_group)
+
         layout.addStretch()
         self.setLayout(layout)
 
@@ -0,0 +1,699 @@
+"""
+Thumbnail Wall - Single-canvas renderer for window previews
+Paints every thumbnail, border, label and activity dot into one widget instead
+of one WindowPreviewWidget (labels, opacity effect, timers) per client, so
+20-40 clients cost one paint pass over the tiles that actually changed
+"""
+
+import logging
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+from PIL import Image
+from PySide6.QtCore import QEvent, QMimeData, QObject, QPoint, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QBrush, QColor, QDrag, QFont, QImage, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QInputDialog, QMessageBox, QSizePolicy, QToolTip, QWidget
+
+from argus_overview.core.alert_detector import AlertLevel
+from argus_overview.ui.animation_clock import RECENT_ACTIVITY_S, AnimationClock
+from argus_overview.ui.menu_builder import ContextMenuBuilder
+from argus_overview.utils.window_control import WindowControl
+
+# Renderer names for the thumbnails.renderer setting
+RENDERER_WIDGETS = "widgets"
+RENDERER_CANVAS = "canvas"
+
+
+def paint_status_overlay(painter: QPainter, rect: QRect, text: str):
+    """Dim a preview's last frame and label it with its status (shared by both renderers)"""
+    painter.save()
+    painter.fillRect(rect, QColor(0, 0, 0, 150))
+    painter.setPen(QPen(QColor(220, 220, 220)))
+    font = QFont(painter.font())
+    font.setBold(True)
+    painter.setFont(font)
+    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+    painter.restore()
+
+
+class ThumbnailTile(QObject):
+    """
+    One client on a ThumbnailWall - state only, painted by the wall.
+
+    Exposes the WindowPreviewWidget API used by WindowManager/MainTab
+    (update_frame, set_alert, set_focused, signals, setVisible, ...), so the
+    two renderers are interchangeable.
+    """
+
+    window_activated = Signal(str)  # window_id
+    window_removed = Signal(str)  # window_id
+    label_changed = Signal(str, str)  # window_id, new_label
+
+    def __init__(
+        self,
+        window_id: str,
+        character_name: str,
+        capture_system,
+        settings_manager=None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.window_id = window_id
+        self.character_name = character_name
+        self.capture_system = capture_system
+        self.settings_manager = settings_manager
+
+        # State (mirrors WindowPreviewWidget)
+        self.current_pixmap: Optional[QPixmap] = None
+        self.display_pixmap: Optional[QPixmap] = None  # current_pixmap fitted to the tile
+        self.alert_level: Optional[AlertLevel] = None
+        self.alert_regions: List[Tuple[float, float, float, float]] = []
+        self.alert_flash_counter = 0
+        self.zoom_factor = 0.3
+        self.custom_label: Optional[str] = None
+        self.session_start: datetime = datetime.now()
+        self.last_activity: datetime = datetime.now()
+        self.is_focused: bool = False
+        self.is_minimized: bool = False  # Not captured; last frame shown with an overlay
+        self.is_unresponsive: bool = False  # Quarantined by the capture breaker, same overlay
+        self._positions_locked: bool = False
+        self._visible = True
+
+        self.wall: Optional[ThumbnailWall] = None
+        self.animation_clock = AnimationClock.get_instance()
+
+        if self.settings_manager:
+            self._positions_locked = self.settings_manager.get("thumbnails.lock_positions", False)
+            labels = self.settings_manager.get("character_labels", {})
+            self.custom_label = labels.get(self.character_name)
+
+    def display_name(self) -> str:
+        """Get the display name (custom label or character name)"""
+        if self.custom_label:
+            return f"{self.custom_label} ({self.character_name})"
+        return self.character_name
+
+    def tooltip_text(self) -> str:
+        """Tooltip shown when hovering the tile"""
+        tooltip = f"{self.character_name}"
+        if self.custom_label:
+            tooltip = f"{self.custom_label}\n{self.character_name}"
+        tooltip += f"\nWindow ID: {self.window_id}"
+        tooltip += "\nClick to activate | Right-click for menu"
+        return tooltip
+
+    def preview_size(self) -> QSize:
+        """Size available for the preview image"""
+        if self.wall is None:
+            return QSize(0, 0)
+        return self.wall.image_rect(QRect(QPoint(0, 0), self.wall.tile_size)).size()
+
+    def update(self):
+        """Schedule a repaint of this tile only"""
+        if self.wall is not None:
+            self.wall.update_tile(self)
+
+    def geometry(self) -> QRect:
+        """Tile rect in wall coordinates (empty when not shown)"""
+        if self.wall is None:
+            return QRect()
+        return self.wall.tile_rect(self) or QRect()
+
+    def isVisible(self) -> bool:
+        """Whether the tile is shown (and should be captured)"""
+        return self._visible and self.wall is not None and self.wall.isVisible()
+
+    def setVisible(self, visible: bool):
+        """Show or hide the tile (hidden tiles don't take a slot)"""
+        if visible == self._visible:
+            return
+        self._visible = visible
+        if self.wall is not None:
+            self.wall.relayout()
+
+    def deleteLater(self):
+        """Detach from the wall and the animation clock, then schedule deletion"""
+        if self.wall is not None:
+            self.wall.remove_tile(self)
+        self.animation_clock.forget(self)
+        super().deleteLater()
+
+    def update_frame(self, image: Union[Image.Image, QImage, None]):
+        """
+        Update preview with new captured frame
+
+        Args:
+            image: PIL Image, or a display-ready QImage from a capture worker
+        """
+        from argus_overview.ui.main_tab import pil_to_qimage
+
+        if self.is_minimized:
+            return  # Keep the last good frame; late captures of a minimized client are blank
+
+        try:
+            qimage = image if isinstance(image, QImage) else pil_to_qimage(image)
+            if qimage is None:
+                return
+
+            self.current_pixmap = QPixmap.fromImage(qimage)
+
+            target = self.preview_size()
+            fitted = qimage.size().scaled(target, Qt.AspectRatioMode.KeepAspectRatio)
+            if fitted == qimage.size() or target.isEmpty():
+                self.display_pixmap = self.current_pixmap
+            else:
+                self.display_pixmap = self.current_pixmap.scaled(
+                    target,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.FastTransformation,
+                )
+            self.update()
+
+        except Exception as e:
+            self.logger.error(f"Failed to update frame for {self.window_id}: {e}")
+
+    def set_alert(
+        self, level: AlertLevel, regions: Optional[List[Tuple[float, float, float, float]]] = None
+    ):
+        """
+        Set alert and start border flash (driven by the shared animation clock)
+
+        Args:
+            level: AlertLevel enum
+            regions: Optional changed areas to highlight, as (x, y, w, h) fractions
+        """
+        self.alert_level = level
+        self.alert_regions = list(regions) if regions else []
+        self.alert_flash_counter = 30  # 3 seconds at 10 Hz
+        self.animation_clock.start_flash(self)
+        self.update()
+
+        self.logger.debug(f"Alert set for {self.window_id}: {level}")
+
+    def flash_tick(self) -> bool:
+        """
+        Advance the alert flash by one clock tick (the clock repaints)
+
+        Returns:
+            True while the flash is still running
+        """
+        self.alert_flash_counter -= 1
+        if self.alert_flash_counter <= 0:
+            self.alert_flash_counter = 0
+            self.alert_level = None
+            self.alert_regions = []
+            return False
+        return True
+
+    def session_tick(self):
+        """Session clock tick - the label is painted, so just repaint"""
+        self.update()
+
+    def set_custom_label(self, label: Optional[str]):
+        """
+        Set a custom label for this thumbnail
+
+        Args:
+            label: Custom label text or None to clear
+        """
+        self.custom_label = label
+        self.label_changed.emit(self.window_id, label or "")
+        self.update()
+
+        if self.settings_manager:
+            labels = self.settings_manager.get("character_labels", {})
+            if label:
+                labels[self.character_name] = label
+            elif self.character_name in labels:
+                del labels[self.character_name]
+            self.settings_manager.set("character_labels", labels)
+
+    def set_focused(self, focused: bool):
+        """Set whether this window has focus (for activity indicator)"""
+        self.is_focused = focused
+        if focused:
+            self.last_activity = datetime.now()
+        self.update()
+        self._schedule_idle_repaint()
+
+    def set_minimized(self, minimized: bool):
+        """Set whether the client is minimized (shows the minimized overlay)"""
+        if minimized == self.is_minimized:
+            return
+        self.is_minimized = minimized
+        self.update()
+
+    def set_unresponsive(self, unresponsive: bool):
+        """Set whether the client stopped responding to captures (shows an overlay)"""
+        if unresponsive == self.is_unresponsive:
+            return
+        self.is_unresponsive = unresponsive
+        self.update()
+
+    def status_text(self) -> Optional[str]:
+        """Overlay text for a preview that isn't being captured, or None"""
+        if self.is_minimized:
+            return "Minimized"
+        if self.is_unresponsive:
+            return "Not responding"
+        return None
+
+    def mark_activity(self):
+        """Mark that activity occurred on this window"""
+        self.last_activity = datetime.now()
+        self.update()
+        self._schedule_idle_repaint()
+
+    def _schedule_idle_repaint(self):
+        """Have the clock repaint when the 'recent' indicator turns idle"""
+        if self.is_focused:
+            return
+        remaining = RECENT_ACTIVITY_S - (datetime.now() - self.last_activity).total_seconds()
+        if remaining > 0:
+            self.animation_clock.schedule_repaint(self, remaining)
+
+    def get_activity_state(self) -> str:
+        """
+        Get activity state for indicator
+
+        Returns:
+            'focused', 'recent', or 'idle'
+        """
+        if self.is_focused:
+            return "focused"
+
+        elapsed = (datetime.now() - self.last_activity).total_seconds()
+        if elapsed < RECENT_ACTIVITY_S:
+            return "recent"
+        return "idle"
+
+    def session_text(self) -> str:
+        """Elapsed session time, e.g. '1h 5m'"""
+        elapsed = (datetime.now() - self.session_start).total_seconds()
+        hours = int(elapsed // 3600)
+        minutes = int((elapsed % 3600) // 60)
+        if hours > 0:
+            return f"{hours}h {minutes}m"
+        return f"{minutes}m"
+
+    def show_context_menu(self, global_pos: QPoint, parent: QWidget):
+        """Show the window context menu (same actions as WindowPreviewWidget)"""
+        handlers = {
+            "focus_window": lambda: self.window_activated.emit(self.window_id),
+            "minimize_window": self._minimize_window,
+            "close_window": lambda: self._close_window(parent),
+            "set_label": lambda: self._show_label_dialog(parent),
+            "remove_from_preview": lambda: self.window_removed.emit(self.window_id),
+        }
+
+        menu = ContextMenuBuilder().build_window_context_menu(
+            handlers=handlers,
+            zoom_handler=self._set_zoom,
+            current_zoom=self.zoom_factor,
+            parent=parent,
+        )
+        menu.exec(global_pos)
+
+    def _show_label_dialog(self, parent: QWidget):
+        """Show dialog to set custom label"""
+        current = self.custom_label or ""
+        text, ok = QInputDialog.getText(
+            parent, "Set Label", f"Enter label for {self.character_name}:", text=current
+        )
+        if ok:
+            self.set_custom_label(text if text.strip() else None)
+
+    def _close_window(self, parent: QWidget):
+        """Close the EVE window with confirmation"""
+        reply = QMessageBox.question(
+            parent,
+            "Close Window",
+            f"Close the EVE window for {self.character_name}?\n\nThis will close the game client.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            try:
+                if not WindowControl.get_instance().close(self.window_id):
+                    subprocess.run(
+                        ["wmctrl", "-i", "-c", self.window_id], capture_output=True, timeout=2
+                    )
+                self.logger.info(f"Closed window: {self.window_id}")
+                self.window_removed.emit(self.window_id)
+            except Exception as e:
+                self.logger.error(f"Failed to close window: {e}")
+
+    def _minimize_window(self):
+        """Minimize the window"""
+        try:
+            if self.capture_system.minimize_window(self.window_id):
+                self.logger.info(f"Minimized window: {self.window_id}")
+            else:
+                self.logger.warning(f"Failed to minimize window: {self.window_id}")
+        except Exception as e:
+            self.logger.error(f"Error minimizing window: {e}")
+
+    def _set_zoom(self, zoom: float):
+        """Set zoom factor"""
+        self.zoom_factor = zoom
+        self.logger.debug(f"Zoom set to {int(zoom * 100)}% for {self.window_id}")
+
+
+class ThumbnailWall(QWidget):
+    """
+    Custom-painted grid of ThumbnailTiles.
+
+    Features:
+    - Flow-style grid (same margin/spacing as the widget renderer)
+    - Dirty-rect repaints: a tile change only invalidates that tile's rect
+    - Per-tile hit-testing for click-to-activate, drag and context menu
+    - Flash, session and activity repaints from the shared AnimationClock
+    - Hover dimming via painter opacity (no QGraphicsOpacityEffect)
+    """
+
+    MARGIN = 15
+    SPACING = 15
+    BORDER = 2
+    LABEL_HEIGHT = 18
+    TIMER_HEIGHT = 14
+    DRAG_DISTANCE = 10
+
+    def __init__(self, settings_manager=None, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.settings_manager = settings_manager
+
+        self.tiles: List[ThumbnailTile] = []
+        self._tile_rects: Dict[str, QRect] = {}  # window_id -> rect (visible tiles only)
+        self._content_height = 0
+        self._hovered: Optional[ThumbnailTile] = None
+        self._press_tile: Optional[ThumbnailTile] = None
+        self._drag_start_pos: Optional[QPoint] = None
+
+        # Settings
+        width, height = 280, 200
+        self._opacity_on_hover = 0.3
+        self._show_activity_indicator = True
+        self._show_session_timer = False
+        if settings_manager:
+            width = settings_manager.get("thumbnails.default_width", width)
+            height = settings_manager.get("thumbnails.default_height", height)
+            self._opacity_on_hover = settings_manager.get("thumbnails.opacity_on_hover", 0.3)
+            self._show_activity_indicator = settings_manager.get(
+                "thumbnails.show_activity_indicator", True
+            )
+            self._show_session_timer = settings_manager.get("thumbnails.show_session_timer", False)
+        self.tile_size = QSize(width, height)
+
+        # Counters (for diagnostics and benchmarks)
+        self.tiles_painted = 0
+
+        self.setMouseTracking(True)
+        policy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+
+    # -- tiles -------------------------------------------------------------
+
+    def add_tile(self, tile: ThumbnailTile):
+        """Place a tile at the end of the wall"""
+        if tile in self.tiles:
+            return
+        tile.wall = self
+        self.tiles.append(tile)
+        if self._show_session_timer:
+            tile.animation_clock.add_session(tile)
+        self.relayout()
+
+    def remove_tile(self, tile: ThumbnailTile):
+        """Take a tile off the wall"""
+        if tile not in self.tiles:
+            return
+        self.tiles.remove(tile)
+        tile.wall = None
+        for attr in ("_hovered", "_press_tile"):
+            if getattr(self, attr) is tile:
+                setattr(self, attr, None)
+        self.relayout()
+
+    def tile_rect(self, tile: ThumbnailTile) -> Optional[QRect]:
+        """Rect of a tile in wall coordinates, or None if not shown"""
+        return self._tile_rects.get(tile.window_id)
+
+    def tile_at(self, pos: QPoint) -> Optional[ThumbnailTile]:
+        """Hit-test a point in wall coordinates"""
+        for tile in self.tiles:
+            rect = self._tile_rects.get(tile.window_id)
+            if rect is not None and rect.contains(pos):
+                return tile
+        return None
+
+    def update_tile(self, tile: ThumbnailTile):
+        """Invalidate just this tile's rect"""
+        rect = self._tile_rects.get(tile.window_id)
+        if rect is not None:
+            self.update(rect)
+
+    # -- layout ------------------------------------------------------------
+
+    def _columns(self, width: int) -> int:
+        """Tiles per row at the given wall width"""
+        usable = width - 2 * self.MARGIN + self.SPACING
+        return max(1, usable // (self.tile_size.width() + self.SPACING))
+
+    def heightForWidth(self, width: int) -> int:
+        """Height needed to show every visible tile at this width"""
+        count = sum(1 for tile in self.tiles if tile._visible)
+        if count == 0:
+            return 2 * self.MARGIN
+        rows = -(-count // self._columns(width))
+        return 2 * self.MARGIN + rows * self.tile_size.height() + (rows - 1) * self.SPACING
+
+    def sizeHint(self) -> QSize:
+        """Preferred size: four columns"""
+        width = 2 * self.MARGIN + 4 * self.tile_size.width() + 3 * self.SPACING
+        return QSize(width, self.heightForWidth(width))
+
+    def relayout(self):
+        """Recompute tile rects (rows centered like FlowLayout) and repaint"""
+        self._tile_rects = {}
+        visible = [tile for tile in self.tiles if tile._visible]
+        columns = self._columns(self.width())
+        step_x = self.tile_size.width() + self.SPACING
+        step_y = self.tile_size.height() + self.SPACING
+
+        for start in range(0, len(visible), columns):
+            row = visible[start : start + columns]
+            row_width = len(row) * step_x - self.SPACING
+            x = max(self.MARGIN, (self.width() - row_width) // 2)
+            y = self.MARGIN + (start // columns) * step_y
+            for i, tile in enumerate(row):
+                self._tile_rects[tile.window_id] = QRect(QPoint(x + i * step_x, y), self.tile_size)
+
+        height = self.heightForWidth(self.width())
+        if height != self._content_height:
+            self._content_height = height
+            self.updateGeometry()
+        self.update()
+
+    def resizeEvent(self, event):
+        """Reflow tiles when the wall width changes"""
+        super().resizeEvent(event)
+        self.relayout()
+
+    # -- painting ----------------------------------------------------------
+
+    def image_rect(self, rect: QRect) -> QRect:
+        """Area of a tile rect reserved for the preview image"""
+        footer = self.LABEL_HEIGHT + (self.TIMER_HEIGHT if self._show_session_timer else 0)
+        inner = rect.adjusted(self.BORDER, self.BORDER, -self.BORDER, -self.BORDER)
+        return inner.adjusted(0, 0, 0, -footer)
+
+    def paintEvent(self, event):
+        """Paint only the tiles intersecting the dirty region"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        dirty = event.rect()
+
+        for tile in self.tiles:
+            rect = self._tile_rects.get(tile.window_id)
+            if rect is None or not rect.intersects(dirty):
+                continue
+            painter.save()
+            painter.setClipRect(rect)
+            if tile is self._hovered:
+                painter.setOpacity(self._opacity_on_hover)
+            self._paint_tile(painter, tile, rect)
+            painter.restore()
+            self.tiles_painted += 1
+
+        painter.end()
+
+    def _paint_tile(self, painter: QPainter, tile: ThumbnailTile, rect: QRect):
+        """Paint one tile: image (dimmed with a status), label, timer, alert, activity dot, lock"""
+        image_rect = self.image_rect(rect)
+
+        # Preview image (centered, aspect preserved) or placeholder
+        status = tile.status_text()
+        shown = image_rect
+        if tile.display_pixmap is not None and not tile.display_pixmap.isNull():
+            size = tile.display_pixmap.size().scaled(
+                image_rect.size(), Qt.AspectRatioMode.KeepAspectRatio
+            )
+            shown = QRect(
+                image_rect.x() + (image_rect.width() - size.width()) // 2,
+                image_rect.y() + (image_rect.height() - size.height()) // 2,
+                size.width(),
+                size.height(),
+            )
+            painter.drawPixmap(shown, tile.display_pixmap)
+            if status:
+                paint_status_overlay(painter, shown, status)
+        else:
+            painter.setPen(QPen(self.palette().text().color()))
+            painter.drawText(image_rect, Qt.AlignmentFlag.AlignCenter, status or "Loading...")
+
+        # Label (and session timer)
+        font = QFont(painter.font())
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QPen(self.palette().text().color()))
+        label_rect = QRect(
+            image_rect.x(), image_rect.bottom() + 1, image_rect.width(), self.LABEL_HEIGHT
+        )
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, tile.display_name())
+        if self._show_session_timer:
+            font.setBold(False)
+            font.setPixelSize(9)
+            painter.setFont(font)
+            painter.setPen(QPen(QColor(136, 136, 136)))
+            timer_rect = label_rect.translated(0, self.LABEL_HEIGHT)
+            timer_rect.setHeight(self.TIMER_HEIGHT)
+            painter.drawText(timer_rect, Qt.AlignmentFlag.AlignCenter, tile.session_text())
+
+        # Alert border and changed regions
+        if tile.alert_level and tile.alert_flash_counter > 0:
+            if tile.alert_level == AlertLevel.HIGH:
+                color = QColor(255, 0, 0, 200)
+            elif tile.alert_level == AlertLevel.MEDIUM:
+                color = QColor(255, 255, 0, 200)
+            else:
+                color = QColor(0, 255, 0, 200)
+
+            pen = QPen(color)
+            pen.setWidth(4)
+            painter.setPen(pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRect(rect.adjusted(2, 2, -2, -2))
+
+            if tile.alert_regions:
+                pen.setWidth(2)
+                painter.setPen(pen)
+                for x, y, w, h in tile.alert_regions:
+                    painter.drawRect(
+                        shown.x() + int(x * shown.width()),
+                        shown.y() + int(y * shown.height()),
+                        int(w * shown.width()),
+                        int(h * shown.height()),
+                    )
+
+        # Activity indicator
+        if self._show_activity_indicator:
+            activity = tile.get_activity_state()
+            if activity == "focused":
+                indicator_color = QColor(0, 255, 0, 220)
+            elif activity == "recent":
+                indicator_color = QColor(255, 200, 0, 220)
+            else:
+                indicator_color = QColor(128, 128, 128, 180)
+
+            painter.setBrush(QBrush(indicator_color))
+            painter.setPen(QPen(Qt.PenStyle.NoPen))
+            painter.drawEllipse(rect.right() - 13, rect.y() + 6, 8, 8)
+
+        # Lock icon
+        if tile._positions_locked:
+            painter.setPen(QPen(QColor(200, 200, 200, 180)))
+            painter.drawText(rect.x() + 6, rect.y() + 14, "🔒")
+
+    # -- input -------------------------------------------------------------
+
+    def _set_hovered(self, tile: Optional[ThumbnailTile]):
+        """Move hover dimming to another tile"""
+        if tile is self._hovered:
+            return
+        previous, self._hovered = self._hovered, tile
+        for changed in (previous, tile):
+            if changed is not None:
+                self.update_tile(changed)
+
+    def mousePressEvent(self, event):
+        """Remember the pressed tile - click or drag is decided on move/release"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._press_tile = self.tile_at(event.position().toPoint())
+            self._drag_start_pos = event.position().toPoint() if self._press_tile else None
+
+    def mouseMoveEvent(self, event):
+        """Track hover; start a character drag once moved far enough"""
+        pos = event.position().toPoint()
+        self._set_hovered(self.tile_at(pos))
+
+        if self._press_tile is None or self._drag_start_pos is None:
+            return
+        if (pos - self._drag_start_pos).manhattanLength() < self.DRAG_DISTANCE:
+            return
+
+        tile = self._press_tile
+        self._press_tile = None
+        self._drag_start_pos = None
+
+        drag = QDrag(self)
+        mime_data = QMimeData()
+        mime_data.setText(tile.character_name)
+        mime_data.setData("application/x-eve-character", tile.character_name.encode())
+        drag.setMimeData(mime_data)
+
+        rect = self.tile_rect(tile)
+        if rect is not None:
+            pixmap = self.grab(rect).scaled(80, 50, Qt.AspectRatioMode.KeepAspectRatio)
+            drag.setPixmap(pixmap)
+            drag.setHotSpot(pixmap.rect().center())
+
+        drag.exec(Qt.DropAction.MoveAction)
+
+    def mouseReleaseEvent(self, event):
+        """Activate the pressed tile if the press didn't become a drag"""
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+        tile = self._press_tile
+        self._press_tile = None
+        self._drag_start_pos = None
+        if tile is not None and tile is self.tile_at(event.position().toPoint()):
+            tile.window_activated.emit(tile.window_id)
+            self.logger.info(f"Activating window: {tile.window_id}")
+
+    def leaveEvent(self, event):
+        """Clear hover dimming"""
+        self._set_hovered(None)
+        super().leaveEvent(event)
+
+    def contextMenuEvent(self, event):
+        """Context menu for the tile under the cursor"""
+        tile = self.tile_at(event.pos())
+        if tile is not None:
+            tile.show_context_menu(event.globalPos(), self)
+
+    def event(self, event):
+        """Per-tile tooltips"""
+        if event.type() == QEvent.Type.ToolTip:
+            tile = self.tile_at(event.pos())
+            if tile is not None:
+                QToolTip.showText(event.globalPos(), tile.tooltip_text(), self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
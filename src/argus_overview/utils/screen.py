@@ -1,10 +1,18 @@
-"""Screen geometry utilities - shared across UI components"""
+"""Screen geometry utilities - shared across UI components
+
+The monitor layout is read once (RandR over python-xlib, `xrandr --query`
+without it) and served from MonitorCache until the screen configuration
+changes; ScreenChangeWatcher and Qt's screenAdded/screenRemoved invalidate it.
+"""
 
 import logging
 import re
 import subprocess
+import threading
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+from argus_overview.utils.x11 import XLIB_AVAILABLE, XError, open_display, randr
 
 logger = logging.getLogger(__name__)
 
@@ -20,21 +28,115 @@ class ScreenGeometry:
     is_primary: bool = False
 
 
-def get_screen_geometry(monitor: int = 0) -> ScreenGeometry:
-    """Get screen geometry using xrandr.
-
-    Args:
-        monitor: Monitor index (0-based)
-
-    Returns:
-        ScreenGeometry for requested monitor, or default 1920x1080 on failure
+class MonitorCache:
     """
-    try:
+    Caches the monitor layout until the screen configuration changes.
+
+    Features:
+    - One query fills the cache: RandR outputs/CRTCs over python-xlib, or
+      `xrandr --query` when python-xlib or the display is missing
+    - Lookups after that are served from memory
+    - invalidate() on RandR screen-change events or Qt screen add/remove;
+      the next lookup queries again
+    - Failed or empty queries aren't cached, so the next lookup retries
+
+    Usage:
+        monitors = MonitorCache.get_instance().monitors()
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._monitors: Optional[List[ScreenGeometry]] = None
+        self._lock = threading.Lock()
+
+        # Counters (for diagnostics and benchmarks)
+        self.queries = 0
+        self.invalidations = 0
+
+    @classmethod
+    def get_instance(cls) -> "MonitorCache":
+        """Get singleton instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)"""
+        cls._instance = None
+
+    def monitors(self) -> List[ScreenGeometry]:
+        """
+        Get every connected monitor, querying only if the cache is empty
+
+        Returns:
+            List of ScreenGeometry in output order (empty if the query failed)
+
+        Raises:
+            Exception from the xrandr fallback (subprocess errors, timeouts)
+        """
+        with self._lock:
+            if self._monitors is None:
+                monitors = self._query()
+                if not monitors:
+                    return []
+                self._monitors = monitors
+            return list(self._monitors)
+
+    def invalidate(self):
+        """Drop the cached layout so the next lookup queries again (screen change)"""
+        with self._lock:
+            if self._monitors is not None:
+                self.invalidations += 1
+            self._monitors = None
+
+    def _query(self) -> List[ScreenGeometry]:
+        """Read the monitor layout, RandR first"""
+        self.queries += 1
+        monitors = self._query_randr()
+        if monitors is None:
+            monitors = self._query_xrandr()
+        logger.debug(f"Monitor layout: {monitors}")
+        return monitors
+
+    def _query_randr(self) -> Optional[List[ScreenGeometry]]:
+        """Monitors from RandR outputs with an active CRTC; None if RandR can't be used"""
+        if not XLIB_AVAILABLE:
+            return None
+        display = open_display()
+        if display is None:
+            return None
+        try:
+            if not display.has_extension("RANDR"):
+                return None
+            root = display.screen().root
+            resources = root.xrandr_get_screen_resources_current()
+            primary = root.xrandr_get_output_primary().output
+
+            monitors: List[ScreenGeometry] = []
+            for output in resources.outputs:
+                info = display.xrandr_get_output_info(output, resources.config_timestamp)
+                if info.connection != randr.Connected or not info.crtc:
+                    continue  # Disconnected or connected but switched off
+                crtc = display.xrandr_get_crtc_info(info.crtc, resources.config_timestamp)
+                monitors.append(
+                    ScreenGeometry(crtc.x, crtc.y, crtc.width, crtc.height, output == primary)
+                )
+            return monitors
+        except (XError, OSError) as e:
+            logger.debug(f"RandR query failed, falling back to xrandr: {e}")
+            return None
+        finally:
+            display.close()
+
+    def _query_xrandr(self) -> List[ScreenGeometry]:
+        """Monitors parsed from `xrandr --query`"""
         result = subprocess.run(["xrandr", "--query"], capture_output=True, text=True, timeout=5)
 
         if result.returncode != 0:
             logger.error("xrandr failed")
-            return ScreenGeometry(0, 0, 1920, 1080, True)
+            return []
 
         monitors: List[ScreenGeometry] = []
         for line in result.stdout.split("\n"):
@@ -44,13 +146,27 @@ def get_screen_geometry(monitor: int = 0) -> ScreenGeometry:
                     w, h, x, y = map(int, match.groups())
                     is_primary = "primary" in line
                     monitors.append(ScreenGeometry(x, y, w, h, is_primary))
+        return monitors
+
+
+def get_screen_geometry(monitor: int = 0) -> ScreenGeometry:
+    """Get screen geometry from the monitor cache.
+
+    Args:
+        monitor: Monitor index (0-based)
+
+    Returns:
+        ScreenGeometry for requested monitor, or default 1920x1080 on failure
+    """
+    try:
+        monitors = MonitorCache.get_instance().monitors()
 
         if monitor < len(monitors):
             return monitors[monitor]
         elif monitors:
             return monitors[0]
 
-        logger.warning("Could not parse xrandr output, using default geometry")
+        logger.warning("Could not read monitor layout, using default geometry")
         return ScreenGeometry(0, 0, 1920, 1080, True)
 
     except Exception as e:
@@ -59,26 +175,13 @@ def get_screen_geometry(monitor: int = 0) -> ScreenGeometry:
 
 
 def get_all_monitors() -> List[ScreenGeometry]:
-    """Get geometry for all connected monitors.
+    """Get geometry for all connected monitors (from the monitor cache).
 
     Returns:
         List of ScreenGeometry for all monitors, or single default on failure
     """
     try:
-        result = subprocess.run(["xrandr", "--query"], capture_output=True, text=True, timeout=5)
-
-        if result.returncode != 0:
-            return [ScreenGeometry(0, 0, 1920, 1080, True)]
-
-        monitors: List[ScreenGeometry] = []
-        for line in result.stdout.split("\n"):
-            if " connected" in line:
-                match = re.search(r"(\d+)x(\d+)\+(\d+)\+(\d+)", line)
-                if match:
-                    w, h, x, y = map(int, match.groups())
-                    is_primary = "primary" in line
-                    monitors.append(ScreenGeometry(x, y, w, h, is_primary))
-
+        monitors = MonitorCache.get_instance().monitors()
         return monitors if monitors else [ScreenGeometry(0, 0, 1920, 1080, True)]
 
     except Exception as e:
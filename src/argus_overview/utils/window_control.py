@@ -0,0 +1,436 @@
+"""Window control over a persistent X connection.
+
+Activating, minimizing, moving and closing windows used to spawn xdotool or
+wmctrl for every call (sometimes twice, with a --sync retry and a sleep).
+WindowControl sends the same requests as EWMH client messages to the window
+manager over one python-xlib connection instead, and broadcasts keystrokes as
+synthetic key events to every target window in one batch. Every method
+returns False (or 0) when it couldn't send (no python-xlib or display, X
+error), so callers keep their subprocess path as the fallback.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from argus_overview.utils.x11 import XK, XLIB_AVAILABLE, X, XError, open_display, xevent
+
+# EWMH source indication: requests come from a pager, so WMs don't apply
+# focus-stealing prevention to them
+SOURCE_PAGER = 2
+
+# X.CurrentTime, as the request timestamp
+CURRENT_TIME = 0
+
+# ICCCM WM_CHANGE_STATE argument
+ICONIC_STATE = 3
+
+# _NET_MOVERESIZE_WINDOW flags: bits 8-11 say which of x, y, width, height are set
+MOVERESIZE_X = 1 << 8
+MOVERESIZE_Y = 1 << 9
+MOVERESIZE_WIDTH = 1 << 10
+MOVERESIZE_HEIGHT = 1 << 11
+
+# xdotool modifier names -> X modifier mask names
+KEY_MODIFIERS = {
+    "shift": "ShiftMask",
+    "ctrl": "ControlMask",
+    "control": "ControlMask",
+    "alt": "Mod1Mask",
+    "meta": "Mod1Mask",
+    "super": "Mod4Mask",
+    "win": "Mod4Mask",
+}
+
+
+class WindowControl:
+    """
+    EWMH window control (activate, minimize, move/resize, close).
+
+    Features:
+    - One X connection, opened on first use and reused (thread-safe)
+    - No subprocess, no --sync round trip, no sleeps
+    - Key broadcasts build every client's events and flush them in one batch
+    - Returns False instead of raising so callers can fall back to xdotool/wmctrl
+
+    Usage:
+        control = WindowControl.get_instance()
+        if not control.activate(window_id):
+            subprocess.run(["xdotool", "windowactivate", window_id], ...)
+    """
+
+    ATOMS = (
+        "_NET_ACTIVE_WINDOW",
+        "_NET_MOVERESIZE_WINDOW",
+        "_NET_CLOSE_WINDOW",
+        "WM_CHANGE_STATE",
+        "_NET_FRAME_EXTENTS",
+    )
+
+    _instance = None
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._display: Optional[Any] = None
+        self._root: Optional[Any] = None
+        self._atoms: Dict[str, int] = {}
+        self._keys: Dict[str, Optional[Tuple[int, int]]] = {}  # key -> (keycode, state)
+        self._connect_tried = False
+        self._batch = threading.local()  # Per-thread batch() depth: only its owner defers flushes
+        self._lock = threading.Lock()  # Hotkeys call in from their own thread
+
+        # Counters (for diagnostics and benchmarks)
+        self.messages_sent = 0
+        self.error_count = 0
+        self.broadcasts = 0
+        self.last_broadcast_skew_ms = 0.0  # First to last client's key events
+
+    @classmethod
+    def get_instance(cls) -> "WindowControl":
+        """Get singleton instance"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)"""
+        if cls._instance is not None:
+            cls._instance.close_connection()
+        cls._instance = None
+
+    @property
+    def available(self) -> bool:
+        """Whether client messages can be sent (connects on first check)"""
+        with self._lock:
+            return self._connect()
+
+    def activate(self, window_id: str) -> bool:
+        """
+        Activate (raise, focus and de-iconify) a window
+
+        Args:
+            window_id: X11 window ID
+
+        Returns:
+            True if the request was sent
+        """
+        return self._send(window_id, "_NET_ACTIVE_WINDOW", [SOURCE_PAGER, CURRENT_TIME])
+
+    def restore(self, window_id: str) -> bool:
+        """Restore a minimized window (activation de-iconifies it)"""
+        return self.activate(window_id)
+
+    def minimize(self, window_id: str) -> bool:
+        """
+        Minimize (iconify) a window
+
+        Args:
+            window_id: X11 window ID
+
+        Returns:
+            True if the request was sent
+        """
+        return self._send(window_id, "WM_CHANGE_STATE", [ICONIC_STATE])
+
+    def move_resize(
+        self,
+        window_id: str,
+        x: int,
+        y: int,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> bool:
+        """
+        Move a window, and resize it when width and height are given
+
+        Args:
+            window_id: X11 window ID
+            x: Target X position
+            y: Target Y position
+            width: Target width (None keeps the current width)
+            height: Target height (None keeps the current height)
+
+        Returns:
+            True if the request was sent
+        """
+        flags = MOVERESIZE_X | MOVERESIZE_Y | (SOURCE_PAGER << 12)  # Gravity 0: window's own
+        if width is not None:
+            flags |= MOVERESIZE_WIDTH
+        if height is not None:
+            flags |= MOVERESIZE_HEIGHT
+        return self._send(
+            window_id,
+            "_NET_MOVERESIZE_WINDOW",
+            [flags, int(x), int(y), int(width or 0), int(height or 0)],
+        )
+
+    def close(self, window_id: str) -> bool:
+        """
+        Ask the window manager to close a window (like clicking its close button)
+
+        Args:
+            window_id: X11 window ID
+
+        Returns:
+            True if the request was sent
+        """
+        return self._send(window_id, "_NET_CLOSE_WINDOW", [CURRENT_TIME, SOURCE_PAGER])
+
+    def send_key(self, window_ids: List[str], key: str) -> int:
+        """
+        Send a keystroke to several windows in one X batch (like `xdotool key --window`)
+
+        Press and release events for every window are queued first and written
+        with a single flush, so all clients get the key within one round trip.
+        The time between queuing the first and the last client is kept in
+        last_broadcast_skew_ms.
+
+        Args:
+            window_ids: X11 window IDs
+            key: Key in xdotool syntax (e.g. "F1", "Return", "ctrl+c")
+
+        Returns:
+            Number of windows the key was sent to (0 if it couldn't be sent over X)
+        """
+        xids = []
+        for window_id in window_ids:
+            try:
+                xids.append(int(window_id, 16))
+            except (TypeError, ValueError):
+                continue
+        if not xids:
+            return 0
+
+        with self._lock:
+            if not self._connect():
+                return 0
+            keycode, state = self._lookup_key(key) or (0, 0)
+            if not keycode:
+                self.logger.debug(f"No keycode for '{key}', broadcasting with xdotool")
+                return 0
+
+            try:
+                start = time.perf_counter()
+                last = start
+                for xid in xids:
+                    window = self._display.create_resource_object("window", xid)
+                    for event_class, mask in (
+                        (xevent.KeyPress, X.KeyPressMask),
+                        (xevent.KeyRelease, X.KeyReleaseMask),
+                    ):
+                        event = event_class(
+                            time=CURRENT_TIME,
+                            root=self._root.id,
+                            window=xid,
+                            same_screen=1,
+                            child=X.NONE,
+                            root_x=0,
+                            root_y=0,
+                            event_x=0,
+                            event_y=0,
+                            state=state,
+                            detail=keycode,
+                        )
+                        window.send_event(event, event_mask=mask, propagate=True)
+                    last = time.perf_counter()
+                self._display.flush()
+            except XError as e:
+                self.error_count += 1
+                self.logger.debug(f"Key broadcast of '{key}' failed: {e}")
+                return 0
+            except Exception as e:
+                self._connection_lost(e)
+                return 0
+
+            self.broadcasts += 1
+            self.last_broadcast_skew_ms = (last - start) * 1000
+        return len(xids)
+
+    def get_geometries(self, window_ids: List[str]) -> Dict[str, Tuple[int, int, int, int]]:
+        """
+        Read window geometries in the form move_resize() takes them
+
+        Args:
+            window_ids: X11 window IDs
+
+        Returns:
+            window_id -> (x, y, width, height): frame position (client origin
+            minus _NET_FRAME_EXTENTS) and client size. Windows that couldn't be
+            read are left out; empty without an X connection.
+        """
+        geometries: Dict[str, Tuple[int, int, int, int]] = {}
+        with self._lock:
+            if not self._connect():
+                return geometries
+            for window_id in window_ids:
+                try:
+                    window = self._display.create_resource_object("window", int(window_id, 16))
+                    size = window.get_geometry()
+                    origin = self._root.translate_coords(window, 0, 0)
+                    extents = window.get_full_property(
+                        self._atoms["_NET_FRAME_EXTENTS"], X.AnyPropertyType
+                    )
+                except (TypeError, ValueError):
+                    continue
+                except XError as e:
+                    self.logger.debug(f"Geometry lookup failed for {window_id}: {e}")
+                    continue
+                except Exception as e:
+                    self._connection_lost(e)
+                    break
+                left, top = 0, 0
+                if extents is not None and len(extents.value) == 4:
+                    left, _right, top, _bottom = (int(value) for value in extents.value)
+                geometries[window_id] = (origin.x - left, origin.y - top, size.width, size.height)
+        return geometries
+
+    @contextmanager
+    def batch(self):
+        """
+        Send every request made inside the block with one flush when it ends
+
+        Batching is per thread: requests from other threads (e.g. a hotkey
+        activating a window during a bulk operation) still flush immediately.
+
+        Usage:
+            with control.batch():
+                for window_id in window_ids:
+                    control.minimize(window_id)
+        """
+        self._batch.depth = self._batch_depth() + 1
+        try:
+            yield self
+        finally:
+            self._batch.depth -= 1
+            with self._lock:
+                if self._batch.depth == 0 and self._display is not None:
+                    try:
+                        self._display.flush()
+                    except Exception as e:
+                        self._connection_lost(e)
+
+    def _batch_depth(self) -> int:
+        """Nesting depth of batch() blocks open in the calling thread"""
+        return getattr(self._batch, "depth", 0)
+
+    def close_connection(self):
+        """Close the X connection; the next request reconnects"""
+        with self._lock:
+            self._close_display()
+            self._connect_tried = False
+
+    def _send(self, window_id: str, message: str, data: List[int]) -> bool:
+        """Send a client message about a window to the root (i.e. the window manager)"""
+        try:
+            xid = int(window_id, 16)
+        except (TypeError, ValueError):
+            return False
+
+        with self._lock:
+            if not self._connect():
+                return False
+            try:
+                window = self._display.create_resource_object("window", xid)
+                client_message = xevent.ClientMessage(
+                    window=window,
+                    client_type=self._atoms[message],
+                    data=(32, (data + [0] * 5)[:5]),
+                )
+                self._root.send_event(
+                    client_message,
+                    event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask,
+                )
+                if not self._batch_depth():
+                    self._display.flush()
+            except XError as e:
+                self.error_count += 1
+                self.logger.debug(f"{message} for {window_id} failed: {e}")
+                return False
+            except Exception as e:
+                self._connection_lost(e)
+                return False
+
+        self.messages_sent += 1
+        return True
+
+    def _lookup_key(self, key: str) -> Optional[Tuple[int, int]]:
+        """
+        Resolve an xdotool-style key to a keycode and modifier state (cached)
+
+        Args:
+            key: e.g. "F1", "Return", "shift+F1"
+
+        Returns:
+            (keycode, state), or None if a part isn't a known key or modifier
+        """
+        if key in self._keys:
+            return self._keys[key]
+
+        *modifiers, name = key.split("+")
+        resolved = None
+        state = 0
+        for modifier in modifiers:
+            mask = KEY_MODIFIERS.get(modifier.strip().lower())
+            if mask is None:
+                break
+            state |= getattr(X, mask)
+        else:
+            name = name.strip()
+            keysym = XK.string_to_keysym(name) or XK.string_to_keysym(name.capitalize())
+            keycode = self._display.keysym_to_keycode(keysym) if keysym else 0
+            if keycode:
+                # Keysyms on the shifted level (e.g. "A", "exclam") need Shift
+                if self._display.keycode_to_keysym(keycode, 0) != keysym:
+                    state |= X.ShiftMask
+                resolved = (keycode, state)
+
+        self._keys[key] = resolved
+        return resolved
+
+    def _connection_lost(self, error: Exception):
+        """Drop a broken connection; the next request reconnects (caller holds the lock)"""
+        self.error_count += 1
+        self.logger.warning(f"Window control lost the X connection: {error}")
+        self._close_display()
+        self._connect_tried = False
+
+    def _connect(self) -> bool:
+        """Open the X connection once (caller holds the lock)"""
+        if self._display is not None:
+            return True
+        if self._connect_tried or not XLIB_AVAILABLE:
+            return False
+        self._connect_tried = True
+
+        self._display = open_display()
+        if self._display is None:
+            self.logger.info("No X display, window control uses xdotool/wmctrl")
+            return False
+        try:
+            self._display.set_error_handler(self._on_async_error)
+            self._root = self._display.screen().root
+            for name in self.ATOMS:
+                self._atoms[name] = self._display.intern_atom(name)
+        except (XError, OSError) as e:
+            self.logger.warning(f"Window control unavailable: {e}")
+            self._close_display()
+            return False
+        return True
+
+    def _on_async_error(self, error, request):
+        """Errors reported after the fact (e.g. BadWindow for a client that just closed)"""
+        self.error_count += 1
+        self.logger.debug(f"X error: {error}")
+
+    def _close_display(self):
+        """Close the X connection if open"""
+        if self._display is not None:
+            try:
+                self._display.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing window control display: {e}")
+            self._display = None
+            self._keys.clear()  # Keyboard mapping may differ after reconnecting
@@ -7,6 +7,7 @@ import time
 from typing import Optional
 
 from .constants import TIMEOUT_MEDIUM
+from .window_control import WindowControl
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,10 @@ def move_window(
         logger.warning(f"Invalid window ID format: {window_id}")
         return False
 
+    # One EWMH message over the shared X connection; xdotool only as fallback
+    if WindowControl.get_instance().move_resize(window_id, x, y, w, h):
+        return True
+
     try:
         # Try with --sync first, fallback for Wine/Proton windows
         try:
@@ -100,6 +105,9 @@ def activate_window(window_id: str, timeout: float = TIMEOUT_MEDIUM) -> bool:
         logger.warning(f"Invalid window ID format: {window_id}")
         return False
 
+    if WindowControl.get_instance().activate(window_id):
+        return True
+
     try:
         try:
             subprocess.run(
@@ -0,0 +1,60 @@
+"""Native X11 helpers built on python-xlib.
+
+Each user of a Display should own its connection: python-xlib connections
+are not thread-safe, so background threads open their own via open_display().
+"""
+
+import logging
+import os
+from typing import Any, Optional
+
+try:
+    from Xlib import XK, X, display
+    from Xlib.error import DisplayError, XError
+    from Xlib.ext import randr
+    from Xlib.protocol import event as xevent
+
+    XLIB_AVAILABLE = True
+except ImportError:
+    X = None
+    XK = None
+    display = None
+    randr = None
+    xevent = None
+    DisplayError = XError = Exception
+    XLIB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Plane mask for get_image (all planes)
+ALL_PLANES = 0xFFFFFFFF
+
+
+def open_display(name: Optional[str] = None) -> Optional[Any]:
+    """Open a new X display connection.
+
+    Args:
+        name: Display name (defaults to $DISPLAY)
+
+    Returns:
+        Xlib Display, or None if python-xlib is missing or the display can't be opened
+    """
+    if not XLIB_AVAILABLE:
+        return None
+    if name is None and not os.environ.get("DISPLAY"):
+        return None  # e.g. Wayland-only or headless - don't let Xlib probe the platform
+    try:
+        return display.Display(name)
+    except (DisplayError, OSError, ValueError) as e:
+        logger.debug(f"Could not open X display: {e}")
+        return None
+
+
+def window_id_to_int(window_id: str) -> int:
+    """Convert an X11 window ID string ("0x03800003") to an int."""
+    return int(window_id, 16)
+
+
+def int_to_window_id(xid: int) -> str:
+    """Convert an X11 window ID int to the "0x%08x" form used across the app."""
+    return f"0x{xid:08x}"
@@ -0,0 +1,15 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+from argus_overview.utils.screen import MonitorCache
+
+
+@pytest.fixture(autouse=True)
+def reset_monitor_cache():
+    """Each test sees its own (mocked) monitor layout instead of a cached one"""
+    MonitorCache.reset_instance()
+    yield
+    MonitorCache.reset_instance()
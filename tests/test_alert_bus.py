@@ -0,0 +1,179 @@
+"""
+Unit tests for the AlertEventBus module.
+
+Tests cover:
+- Initialization and configuration
+- Per-window, per-level cooldown
+- Burst coalescing (highest level wins)
+- Batched delivery via alerts_ready
+- Clearing state
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from argus_overview.core.alert_bus import AlertEventBus
+from argus_overview.core.alert_detector import AlertLevel
+
+
+@pytest.fixture
+def bus():
+    """Create a bus with a 5 second cooldown"""
+    return AlertEventBus(cooldown_seconds=5)
+
+
+class TestAlertEventBusInit:
+    """Tests for AlertEventBus initialization"""
+
+    def test_defaults(self):
+        """Bus starts empty with default flush interval"""
+        bus = AlertEventBus()
+
+        assert bus.cooldown == 5.0
+        assert bus.flush_interval_ms == AlertEventBus.DEFAULT_FLUSH_INTERVAL_MS
+        assert bus.has_pending() is False
+        assert bus.get_stats() == {"posted": 0, "suppressed": 0, "delivered": 0, "flushes": 0}
+
+    def test_set_cooldown(self, bus):
+        """Cooldown can be changed and is clamped to >= 0"""
+        bus.set_cooldown(10)
+        assert bus.cooldown == 10.0
+
+        bus.set_cooldown(-1)
+        assert bus.cooldown == 0.0
+
+
+class TestCooldown:
+    """Tests for cooldown enforcement"""
+
+    def test_first_alert_accepted(self, bus):
+        """First alert for a window is accepted"""
+        assert bus.post("0x1", AlertLevel.HIGH, now=100.0) is True
+        assert bus.has_pending() is True
+
+    def test_same_level_suppressed_within_cooldown(self, bus):
+        """Same level within cooldown is suppressed"""
+        bus.post("0x1", AlertLevel.MEDIUM, now=100.0)
+
+        assert bus.post("0x1", AlertLevel.MEDIUM, now=102.0) is False
+        assert bus.suppressed_count == 1
+
+    def test_same_level_accepted_after_cooldown(self, bus):
+        """Same level after cooldown expires is accepted"""
+        bus.post("0x1", AlertLevel.MEDIUM, now=100.0)
+
+        assert bus.post("0x1", AlertLevel.MEDIUM, now=105.5) is True
+
+    def test_escalation_not_suppressed(self, bus):
+        """A higher level fires even while a lower one cools down"""
+        bus.post("0x1", AlertLevel.MEDIUM, now=100.0)
+
+        assert bus.post("0x1", AlertLevel.HIGH, now=101.0) is True
+
+    def test_downgrade_suppressed(self, bus):
+        """A lower level is suppressed while a higher one cools down"""
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+
+        assert bus.post("0x1", AlertLevel.MEDIUM, now=101.0) is False
+
+    def test_cooldown_is_per_window(self, bus):
+        """Cooldown on one window doesn't affect another"""
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+
+        assert bus.post("0x2", AlertLevel.HIGH, now=100.5) is True
+
+    def test_zero_cooldown_accepts_everything(self):
+        """Zero cooldown disables suppression"""
+        bus = AlertEventBus(cooldown_seconds=0)
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+
+        assert bus.post("0x1", AlertLevel.HIGH, now=100.0) is True
+
+    def test_none_level_ignored(self, bus):
+        """Posting None is a no-op"""
+        assert bus.post("0x1", None) is False
+        assert bus.posted_count == 0
+
+
+class TestCoalescing:
+    """Tests for burst coalescing and batched delivery"""
+
+    def test_flush_emits_single_batch(self, bus):
+        """All pending windows are delivered in one emission"""
+        handler = MagicMock()
+        bus.alerts_ready.connect(handler)
+
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+        bus.post("0x2", AlertLevel.MEDIUM, now=100.0)
+        bus.post("0x3", AlertLevel.LOW, now=100.0)
+        bus.flush()
+
+        handler.assert_called_once_with(
+            {"0x1": AlertLevel.HIGH, "0x2": AlertLevel.MEDIUM, "0x3": AlertLevel.LOW}
+        )
+        assert bus.has_pending() is False
+        assert bus.delivered_count == 3
+        assert bus.flush_count == 1
+
+    def test_highest_level_wins(self, bus):
+        """Coalesced burst keeps the highest level per window"""
+        handler = MagicMock()
+        bus.alerts_ready.connect(handler)
+
+        bus.post("0x1", AlertLevel.MEDIUM, now=100.0)
+        bus.post("0x1", AlertLevel.HIGH, now=100.01)
+        bus.flush()
+
+        handler.assert_called_once_with({"0x1": AlertLevel.HIGH})
+
+    def test_flush_empty_does_not_emit(self, bus):
+        """Flushing with nothing pending emits nothing"""
+        handler = MagicMock()
+        bus.alerts_ready.connect(handler)
+
+        bus.flush()
+
+        handler.assert_not_called()
+        assert bus.flush_count == 0
+
+    def test_post_arms_flush_timer(self, bus):
+        """First accepted alert of a burst arms the flush timer"""
+        bus._flush_timer = MagicMock()
+        bus._flush_timer.isActive.return_value = False
+
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+
+        bus._flush_timer.start.assert_called_once_with(bus.flush_interval_ms)
+
+    def test_post_does_not_rearm_active_timer(self, bus):
+        """Further alerts in a burst don't push the flush back"""
+        bus._flush_timer = MagicMock()
+        bus._flush_timer.isActive.return_value = True
+
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+
+        bus._flush_timer.start.assert_not_called()
+
+
+class TestClear:
+    """Tests for clearing bus state"""
+
+    def test_clear_window(self, bus):
+        """Clearing a window drops its pending alert and cooldown"""
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+        bus.post("0x2", AlertLevel.HIGH, now=100.0)
+
+        bus.clear("0x1")
+
+        assert bus.post("0x1", AlertLevel.HIGH, now=101.0) is True
+        assert bus.post("0x2", AlertLevel.HIGH, now=101.0) is False
+
+    def test_clear_all(self, bus):
+        """Clearing everything resets pending and cooldowns"""
+        bus.post("0x1", AlertLevel.HIGH, now=100.0)
+
+        bus.clear()
+
+        assert bus.has_pending() is False
+        assert bus.post("0x1", AlertLevel.HIGH, now=101.0) is True
@@ -14,6 +14,7 @@ Tests cover:
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -21,6 +22,7 @@ from argus_overview.core.alert_detector import (
     AlertConfig,
     AlertDetector,
     AlertLevel,
+    red_fraction,
 )
 
 
@@ -85,7 +87,7 @@ class TestAlertDetectorInit:
         detector = AlertDetector()
 
         assert isinstance(detector.config, AlertConfig)
-        assert detector.previous_frames == {}
+        assert detector.background_models == {}
         assert detector.last_alert_times == {}
         assert detector.alert_callbacks == {}
 
@@ -130,12 +132,12 @@ class TestCallbackRegistration:
         """Can unregister a callback"""
         callback = MagicMock()
         detector.register_callback("win1", callback)
-        detector.previous_frames["win1"] = MagicMock()
+        detector.background_models["win1"] = MagicMock()
 
         detector.unregister_callback("win1")
 
         assert "win1" not in detector.alert_callbacks
-        assert "win1" not in detector.previous_frames
+        assert "win1" not in detector.background_models
 
     def test_unregister_nonexistent(self, detector):
         """Unregistering nonexistent callback doesn't error"""
@@ -178,7 +180,7 @@ class TestAnalyzeFrame:
     def test_stores_frame_for_comparison(self, detector, normal_image):
         """Stores frame for next comparison"""
         detector.analyze_frame("win1", normal_image)
-        assert "win1" in detector.previous_frames
+        assert "win1" in detector.background_models
 
     def test_red_flash_triggers_high_alert(self, detector, red_image):
         """Red flash triggers HIGH alert"""
@@ -203,6 +205,20 @@ class TestAnalyzeFrame:
 
         callback.assert_called_once_with(AlertLevel.HIGH)
 
+    def test_alert_records_last_alert_time(self, detector, red_image):
+        """Detected alerts record a timestamp in last_alert_times"""
+        detector.config.red_flash_threshold = 0.5
+
+        detector.analyze_frame("win1", red_image)
+
+        assert "win1" in detector.last_alert_times
+
+    def test_no_alert_leaves_last_alert_time_unset(self, detector, normal_image):
+        """Frames without alerts don't touch last_alert_times"""
+        detector.analyze_frame("win1", normal_image)
+
+        assert "win1" not in detector.last_alert_times
+
     def test_callback_error_handled(self, detector, red_image):
         """Callback errors are handled gracefully"""
         callback = MagicMock(side_effect=Exception("Test error"))
@@ -270,56 +286,43 @@ class TestRedFlashDetection:
         assert not result
 
 
-class TestScreenChangeDetection:
-    """Tests for screen change detection"""
+class TestAnalyzeProbe:
+    """Tests for red_fraction and probe (strip) analysis"""
 
     @pytest.fixture
     def detector(self):
         """Create a fresh detector"""
         return AlertDetector()
 
-    def test_identical_images_no_change(self, detector):
-        """Identical images show no change"""
-        img1 = Image.new("RGB", (100, 100), color=(100, 100, 100))
-        img2 = Image.new("RGB", (100, 100), color=(100, 100, 100))
+    def test_red_fraction(self):
+        """Fraction of strongly red pixels"""
+        pixels = np.zeros((2, 10, 3), dtype=np.uint8)
+        pixels[0] = (255, 10, 10)
 
-        result = detector._detect_screen_change(img1, img2)
-        assert not result
+        assert red_fraction(pixels) == 0.5
 
-    def test_completely_different_detected(self, detector):
-        """Completely different images detected as change"""
-        img1 = Image.new("RGB", (100, 100), color=(0, 0, 0))
-        img2 = Image.new("RGB", (100, 100), color=(255, 255, 255))
+    def test_red_fraction_empty(self):
+        """Empty input is not red"""
+        assert red_fraction(np.zeros((0, 0, 3), dtype=np.uint8)) == 0.0
 
-        result = detector._detect_screen_change(img1, img2)
-        assert result
+    def test_red_strips_high(self, detector):
+        """Mostly red strips raise HIGH"""
+        pixels = np.full((6, 100, 3), (240, 20, 20), dtype=np.uint8)
 
-    def test_partial_change_threshold(self, detector):
-        """Partial change respects threshold"""
-        # Create mostly similar images with 20% different
-        img1 = Image.new("RGB", (100, 100), color=(100, 100, 100))
-        img2 = img1.copy()
-        pixels = img2.load()
-        for x in range(20):
-            for y in range(100):
-                pixels[x, y] = (200, 200, 200)
+        assert detector.analyze_probe(pixels) == AlertLevel.HIGH
 
-        # High threshold - should not detect
-        detector.config.change_threshold = 0.5
-        assert not detector._detect_screen_change(img1, img2)
+    def test_normal_strips_none(self, detector):
+        """Normal strips raise nothing"""
+        pixels = np.full((6, 100, 3), (50, 100, 150), dtype=np.uint8)
 
-        # Low threshold - should detect
-        detector.config.change_threshold = 0.1
-        assert detector._detect_screen_change(img1, img2)
+        assert detector.analyze_probe(pixels) is None
 
-    def test_handles_different_sizes(self, detector):
-        """Handles images of different sizes"""
-        img1 = Image.new("RGB", (200, 200), color=(100, 100, 100))
-        img2 = Image.new("RGB", (50, 50), color=(100, 100, 100))
+    def test_disabled_returns_none(self, detector):
+        """Disabled detector ignores probes"""
+        detector.config.enabled = False
+        pixels = np.full((6, 100, 3), (240, 20, 20), dtype=np.uint8)
 
-        # Should not raise
-        result = detector._detect_screen_change(img1, img2)
-        assert not result
+        assert detector.analyze_probe(pixels) is None
 
 
 class TestHistoryManagement:
@@ -329,27 +332,27 @@ class TestHistoryManagement:
     def detector(self):
         """Create detector with some history"""
         d = AlertDetector()
-        d.previous_frames["win1"] = MagicMock()
-        d.previous_frames["win2"] = MagicMock()
+        d.background_models["win1"] = MagicMock()
+        d.background_models["win2"] = MagicMock()
         return d
 
     def test_clear_specific_window(self, detector):
         """Can clear history for specific window"""
         detector.clear_history("win1")
 
-        assert "win1" not in detector.previous_frames
-        assert "win2" in detector.previous_frames
+        assert "win1" not in detector.background_models
+        assert "win2" in detector.background_models
 
     def test_clear_nonexistent_window(self, detector):
         """Clearing nonexistent window doesn't error"""
         detector.clear_history("nonexistent")  # Should not raise
-        assert len(detector.previous_frames) == 2
+        assert len(detector.background_models) == 2
 
     def test_clear_all_history(self, detector):
         """Can clear all history"""
         detector.clear_history()
 
-        assert len(detector.previous_frames) == 0
+        assert len(detector.background_models) == 0
 
 
 class TestMediumAlertOnChange:
@@ -384,6 +387,105 @@ class TestMediumAlertOnChange:
 
         assert result is None
 
+    def test_animation_stops_alerting(self, detector):
+        """Content that flickers every frame stops raising MEDIUM"""
+        dark = Image.new("RGB", (100, 100), color=(60, 60, 60))
+        light = Image.new("RGB", (100, 100), color=(140, 140, 140))
+
+        results = [detector.analyze_frame("win1", light if i % 2 else dark) for i in range(40)]
+
+        assert AlertLevel.MEDIUM in results[:5]
+        assert results[-20:] == [None] * 20
+
+    def test_change_regions_localized(self, detector):
+        """A MEDIUM alert records where the change happened"""
+        detector.analyze_frame("win1", Image.new("RGB", (1600, 900), color=(50, 50, 50)))
+        frame = Image.new("RGB", (1600, 900), color=(50, 50, 50))
+        frame.paste((220, 220, 220), (0, 0, 1600, 400))  # Top 4 of 9 cell rows change
+
+        assert detector.analyze_frame("win1", frame) == AlertLevel.MEDIUM
+        assert detector.get_change_regions("win1") == [(0.0, 0.0, 1.0, 4 / 9)]
+
+    def test_change_regions_cleared_without_change(self, detector):
+        """Regions are dropped once a frame has no significant change"""
+        detector.change_regions["win1"] = [(0.0, 0.0, 1.0, 1.0)]
+        img = Image.new("RGB", (100, 100), color=(50, 50, 50))
+        detector.analyze_frame("win1", img)
+        detector.analyze_frame("win1", img)
+
+        assert detector.get_change_regions("win1") == []
+        assert detector.get_change_regions("unknown") == []
+
+    def test_model_uses_config_learning_rate(self, detector):
+        """Background model picks up the configured learning rate"""
+        detector.config.background_learning_rate = 0.2
+        detector.analyze_frame("win1", Image.new("RGB", (100, 100), color=(50, 50, 50)))
+
+        model = detector.background_models["win1"]
+        assert model.learning_rate == 0.2
+        assert model.shape == (AlertDetector.RED_FLASH_SIZE[1], AlertDetector.RED_FLASH_SIZE[0])
+
+
+class TestTemplateMatcherIntegration:
+    """Tests for template zone matches feeding analyze_frame"""
+
+    @pytest.fixture
+    def detector(self):
+        """Create a fresh detector"""
+        return AlertDetector()
+
+    @staticmethod
+    def _matcher(*levels):
+        matcher = MagicMock()
+        matcher.has_zones.return_value = True
+        matcher.analyze.return_value = [
+            MagicMock(level=level, template="icon", zone="hud", score=0.9) for level in levels
+        ]
+        return matcher
+
+    def test_no_matcher_by_default(self, detector):
+        """Detector has no template matcher until one is set"""
+        assert detector.template_matcher is None
+
+    def test_match_raises_alert(self, detector):
+        """A template match alone raises its zone level"""
+        detector.set_template_matcher(self._matcher(AlertLevel.LOW))
+        img = Image.new("RGB", (100, 100), color=(50, 50, 50))
+
+        assert detector.analyze_frame("win1", img) == AlertLevel.LOW
+
+    def test_match_escalates_but_never_downgrades(self, detector):
+        """Highest level wins between screen change and template matches"""
+        detector.analyze_frame("win1", Image.new("RGB", (100, 100), color=(50, 50, 50)))
+        detector.set_template_matcher(self._matcher(AlertLevel.LOW))
+
+        result = detector.analyze_frame("win1", Image.new("RGB", (100, 100), color=(200, 200, 200)))
+        assert result == AlertLevel.MEDIUM
+
+        detector.set_template_matcher(self._matcher(AlertLevel.LOW, AlertLevel.HIGH))
+        result = detector.analyze_frame("win1", Image.new("RGB", (100, 100), color=(50, 50, 50)))
+        assert result == AlertLevel.HIGH
+
+    def test_matcher_without_zones_skipped(self, detector):
+        """Matcher with nothing configured is not run"""
+        matcher = self._matcher(AlertLevel.HIGH)
+        matcher.has_zones.return_value = False
+        detector.set_template_matcher(matcher)
+
+        detector.analyze_frame("win1", Image.new("RGB", (100, 100), color=(50, 50, 50)))
+
+        matcher.analyze.assert_not_called()
+
+    def test_matcher_error_handled(self, detector):
+        """Matcher exceptions don't break frame analysis"""
+        matcher = self._matcher()
+        matcher.analyze.side_effect = RuntimeError("boom")
+        detector.set_template_matcher(matcher)
+
+        result = detector.analyze_frame("win1", Image.new("RGB", (100, 100), color=(50, 50, 50)))
+
+        assert result is None
+
 
 class TestExceptionHandling:
     """Tests for exception handling in detection methods"""
@@ -420,41 +522,3 @@ class TestExceptionHandling:
 
         # Should return False on error
         assert result is False
-
-    def test_screen_change_handles_resize_error(self, detector):
-        """_detect_screen_change handles resize errors"""
-        from unittest.mock import MagicMock
-
-        # Create mock images where resize fails
-        mock_current = MagicMock()
-        mock_current.resize.side_effect = Exception("Resize failed")
-
-        mock_previous = MagicMock()
-
-        result = detector._detect_screen_change(mock_current, mock_previous)
-
-        # Should return False on error
-        assert result is False
-
-    def test_screen_change_handles_numpy_error(self, detector):
-        """_detect_screen_change handles numpy errors"""
-        from unittest.mock import patch
-
-        img1 = Image.new("RGB", (100, 100), color=(50, 50, 50))
-        img2 = Image.new("RGB", (100, 100), color=(200, 200, 200))
-
-        # Mock numpy.array to raise on second call (during comparison)
-        call_count = [0]
-        original_array = __import__("numpy").array
-
-        def mock_array(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] > 1:
-                raise Exception("numpy failed")
-            return original_array(*args, **kwargs)
-
-        with patch("argus_overview.core.alert_detector.np.array", side_effect=mock_array):
-            result = detector._detect_screen_change(img1, img2)
-
-        # Should return False on error
-        assert result is False
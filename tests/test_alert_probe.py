@@ -0,0 +1,170 @@
+"""
+Unit tests for the AlertProbe module.
+
+Tests cover:
+- Window bookkeeping
+- Strip row placement
+- Strip sampling over a mocked X display (BGRX decode, geometry cache, errors)
+- Polling and alert emission
+- Start/stop without python-xlib or a display
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from argus_overview.core.alert_detector import AlertDetector, AlertLevel
+from argus_overview.core.alert_probe import AlertProbe
+from argus_overview.utils.x11 import XError
+
+
+def make_display(width=100, height=70, bgrx=(20, 20, 240, 0)):
+    """Mocked Display whose windows return solid BGRX rows"""
+    window = MagicMock()
+    window.get_geometry.return_value = MagicMock(width=width, height=height)
+    window.get_image.return_value = MagicMock(data=bytes(bgrx) * width)
+    display = MagicMock()
+    display.create_resource_object.return_value = window
+    return display, window
+
+
+@pytest.fixture
+def probe():
+    """Probe with a mocked display attached"""
+    probe = AlertProbe(AlertDetector(), interval_ms=100, strip_count=6)
+    probe._display, probe.window = make_display()
+    return probe
+
+
+class TestBookkeeping:
+    """Tests for watch/unwatch and construction"""
+
+    def test_init(self):
+        """Probe starts stopped with no windows"""
+        probe = AlertProbe(AlertDetector())
+
+        assert probe.running is False
+        assert probe.watched_windows() == []
+        assert probe.interval_ms == AlertProbe.DEFAULT_INTERVAL_MS
+
+    def test_interval_and_strips_clamped(self):
+        """Interval and strip count have lower bounds"""
+        probe = AlertProbe(AlertDetector(), interval_ms=1, strip_count=0)
+
+        assert probe.interval_ms == 20
+        assert probe.strip_count == 1
+
+    def test_watch_unwatch(self, probe):
+        """Windows are added once and removed with their geometry"""
+        probe.watch("0x1")
+        probe.watch("0x1")
+        probe._geometry["0x1"] = (100, 70, 0.0)
+
+        assert probe.watched_windows() == ["0x1"]
+
+        probe.unwatch("0x1")
+        assert probe.watched_windows() == []
+        assert "0x1" not in probe._geometry
+
+    def test_strip_rows_evenly_spaced(self, probe):
+        """Strips avoid the window edges"""
+        assert probe.strip_rows(70) == [10, 20, 30, 40, 50, 60]
+
+
+class TestSampleWindow:
+    """Tests for strip sampling"""
+
+    def test_decodes_bgrx_to_rgb(self, probe):
+        """32-bit BGRX rows become RGB strips"""
+        pixels = probe.sample_window("0x00000001")
+
+        assert pixels.shape == (6, 100, 3)
+        assert tuple(pixels[0, 0]) == (240, 20, 20)
+        probe._display.create_resource_object.assert_called_once_with("window", 1)
+        assert probe.window.get_image.call_count == 6
+
+    def test_geometry_cached(self, probe):
+        """Geometry is fetched once within the refresh window"""
+        probe.sample_window("0x1")
+        probe.sample_window("0x1")
+
+        probe.window.get_geometry.assert_called_once()
+
+    def test_x_error_returns_none(self, probe):
+        """Unreadable (e.g. unmapped) windows are skipped and geometry dropped"""
+        probe.window.get_image.side_effect = XError(MagicMock(), b"\x00" * 32)
+
+        assert probe.sample_window("0x1") is None
+        assert probe.error_count == 1
+        assert "0x1" not in probe._geometry
+
+    def test_short_reply_returns_none(self, probe):
+        """Non-32bpp replies are rejected"""
+        probe.window.get_image.return_value = MagicMock(data=b"\x00" * 10)
+
+        assert probe.sample_window("0x1") is None
+
+    def test_no_display_returns_none(self):
+        """Sampling without a connection returns None"""
+        assert AlertProbe(AlertDetector()).sample_window("0x1") is None
+
+
+class TestPolling:
+    """Tests for poll_once"""
+
+    def test_red_window_emits_high(self, probe):
+        """A red flash on the strips emits HIGH"""
+        alerts = MagicMock()
+        probe.alert_detected.connect(alerts)
+        probe.watch("0x1")
+
+        probe.poll_once()
+
+        alerts.assert_called_once_with("0x1", AlertLevel.HIGH)
+        assert probe.probe_count == 1
+
+    def test_normal_window_emits_nothing(self, probe):
+        """Non-red strips emit nothing"""
+        probe._display, probe.window = make_display(bgrx=(150, 100, 50, 0))
+        alerts = MagicMock()
+        probe.alert_detected.connect(alerts)
+        probe.watch("0x1")
+
+        probe.poll_once()
+
+        alerts.assert_not_called()
+
+
+class TestStartStop:
+    """Tests for start/stop"""
+
+    def test_start_without_xlib(self):
+        """Without python-xlib the probe stays stopped"""
+        probe = AlertProbe(AlertDetector())
+        with patch("argus_overview.core.alert_probe.XLIB_AVAILABLE", False):
+            assert probe.start() is False
+        assert probe.running is False
+
+    def test_start_without_display(self):
+        """If the display can't be opened the probe stays stopped"""
+        probe = AlertProbe(AlertDetector())
+        with patch("argus_overview.core.alert_probe.XLIB_AVAILABLE", True), patch(
+            "argus_overview.core.alert_probe.open_display", return_value=None
+        ):
+            assert probe.start() is False
+        assert probe.running is False
+
+    def test_start_stop(self):
+        """Probe thread starts and stops, closing its display"""
+        probe = AlertProbe(AlertDetector())
+        display = MagicMock()
+        with patch("argus_overview.core.alert_probe.XLIB_AVAILABLE", True), patch(
+            "argus_overview.core.alert_probe.open_display", return_value=display
+        ):
+            assert probe.start() is True
+        assert probe.running is True
+
+        probe.stop()
+        assert probe.running is False
+        assert probe._thread is None
+        display.close.assert_called_once()
@@ -0,0 +1,177 @@
+"""
+Unit tests for the AlertScheduler module.
+
+Tests cover:
+- Rate/budget/scale clamping
+- Window bookkeeping
+- Concurrent per-window ticks (slow and hung clients skip only their own window)
+- Sample emission and capture errors
+- Achieved per-window rate
+- Start/stop
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+from PySide6.QtCore import Qt
+
+from argus_overview.core.alert_scheduler import AlertScheduler
+
+# Samples are emitted from capture threads; tests receive them in place
+# instead of through an event loop
+DIRECT = Qt.ConnectionType.DirectConnection
+
+
+@pytest.fixture
+def image():
+    """Small sample frame"""
+    return Image.new("RGB", (40, 22))
+
+
+@pytest.fixture
+def scheduler(image):
+    """Scheduler with an instant mocked capture"""
+    return AlertScheduler(MagicMock(return_value=image), rate_hz=5, budget_ms=50)
+
+
+class TestInit:
+    """Tests for construction"""
+
+    def test_defaults(self, scheduler):
+        """Scheduler starts stopped with no windows"""
+        assert scheduler.running is False
+        assert scheduler.watched_windows() == []
+        assert scheduler.interval_s == pytest.approx(0.2)
+
+    def test_values_clamped(self):
+        """Rate, budget and scale are clamped to sane ranges"""
+        scheduler = AlertScheduler(MagicMock(), rate_hz=1000, budget_ms=0, scale=5)
+
+        assert scheduler.rate_hz == AlertScheduler.MAX_RATE_HZ
+        assert scheduler.budget_ms == 1.0
+        assert scheduler.scale == 1.0
+
+    def test_watch_unwatch(self, scheduler):
+        """Windows are added once and removed"""
+        scheduler.watch("0x1")
+        scheduler.watch("0x1")
+        assert scheduler.watched_windows() == ["0x1"]
+
+        scheduler.unwatch("0x1")
+        assert scheduler.watched_windows() == []
+
+
+class TestTick:
+    """Tests for concurrent per-window ticks"""
+
+    def test_samples_all_windows_within_budget(self, scheduler, image):
+        """Fast captures finish within the tick; every window emits a sample"""
+        samples = MagicMock()
+        scheduler.sample_ready.connect(samples, DIRECT)
+        scheduler.watch("0x1")
+        scheduler.watch("0x2")
+
+        assert scheduler.tick() == 2
+
+        scheduler.capture_sample.assert_any_call("0x1", scheduler.scale)
+        samples.assert_any_call("0x2", image)
+        assert scheduler.samples_taken == 2
+        assert scheduler.samples_deferred == 0
+
+    def test_captures_run_concurrently(self, image):
+        """Every window is sampled each tick; slow captures overlap instead of queueing"""
+
+        def slow_capture(window_id, scale):
+            time.sleep(0.05)
+            return image
+
+        scheduler = AlertScheduler(slow_capture, budget_ms=200)
+        for window_id in ("0x1", "0x2", "0x3"):
+            scheduler.watch(window_id)
+
+        start = time.perf_counter()
+        assert scheduler.tick() == 3
+        elapsed = time.perf_counter() - start
+
+        assert scheduler.samples_taken == 3
+        assert elapsed < 0.12  # Not 3 x 50ms in a row
+
+    def test_hung_window_skips_only_itself(self, image):
+        """A capture still running keeps its window out of the next ticks, no others"""
+        release = threading.Event()
+
+        def capture(window_id, scale):
+            if window_id == "0x1":
+                release.wait(2.0)
+            return image
+
+        scheduler = AlertScheduler(capture, budget_ms=20)
+        sampled = []
+        scheduler.sample_ready.connect(lambda window_id, _img: sampled.append(window_id), DIRECT)
+        scheduler.watch("0x1")
+        scheduler.watch("0x2")
+
+        assert scheduler.tick() == 2
+        assert scheduler.tick() == 1
+        assert scheduler.tick() == 1
+        release.set()
+        scheduler._pool.shutdown(wait=True)
+
+        assert sampled.count("0x2") == 3
+        assert sampled.count("0x1") == 1
+        assert scheduler.samples_deferred == 2
+
+    def test_failed_capture_emits_nothing(self, scheduler):
+        """None captures and exceptions are skipped"""
+        samples = MagicMock()
+        scheduler.sample_ready.connect(samples, DIRECT)
+        scheduler.capture_sample.side_effect = [None, RuntimeError("boom")]
+        scheduler.watch("0x1")
+        scheduler.watch("0x2")
+
+        scheduler.tick()
+
+        samples.assert_not_called()
+        assert scheduler.samples_taken == 0
+
+    def test_tick_without_windows(self, scheduler):
+        """Ticking with nothing watched is a no-op"""
+        assert scheduler.tick() == 0
+
+    def test_achieved_rates(self, scheduler):
+        """Delivered samples per second are reported per window"""
+        scheduler.watch("0x1")
+        scheduler.watch("0x2")
+        scheduler._counting_since = time.monotonic() - 1.0
+        scheduler.capture_sample.side_effect = lambda window_id, scale: (
+            None if window_id == "0x2" else MagicMock()
+        )
+
+        scheduler.tick()
+        scheduler.tick()
+
+        rates = scheduler.achieved_rates()
+        assert rates["0x1"] == pytest.approx(2.0, rel=0.1)
+        assert rates["0x2"] == 0.0
+        assert scheduler.achieved_rate_hz() == pytest.approx(1.0, rel=0.1)
+
+
+class TestStartStop:
+    """Tests for the scheduler thread"""
+
+    def test_start_stop(self, scheduler):
+        """Thread starts, samples, and stops"""
+        scheduler.watch("0x1")
+        scheduler.rate_hz = AlertScheduler.MAX_RATE_HZ
+
+        scheduler.start()
+        assert scheduler.running is True
+        time.sleep(0.15)
+        scheduler.stop()
+
+        assert scheduler.running is False
+        assert scheduler._thread is None
+        assert scheduler.samples_taken > 0
@@ -0,0 +1,195 @@
+"""
+Unit tests for the AnimationClock module.
+
+Tests cover:
+- Singleton access
+- Flash ticks and the idle stop
+- Session ticks
+- One-shot repaints (activity indicator)
+- Deleted items and forget()
+"""
+
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from argus_overview.ui.animation_clock import AnimationClock  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication for tests that need real Qt timers."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def clock(qapp):
+    """Fresh clock (not the shared singleton)"""
+    clock = AnimationClock()
+    yield clock
+    clock._timer.stop()
+
+
+def flashing_item(ticks):
+    """Item that keeps flashing for the given number of ticks"""
+    item = MagicMock()
+    item.flash_tick.side_effect = [True] * (ticks - 1) + [False]
+    return item
+
+
+class TestSingleton:
+    """Tests for get_instance/reset_instance"""
+
+    def test_get_instance_shared(self, qapp):
+        """get_instance returns one clock until reset"""
+        AnimationClock.reset_instance()
+        clock = AnimationClock.get_instance()
+
+        assert AnimationClock.get_instance() is clock
+        AnimationClock.reset_instance()
+        assert AnimationClock.get_instance() is not clock
+        AnimationClock.reset_instance()
+
+
+class TestFlash:
+    """Tests for flash ticks"""
+
+    def test_idle_clock_has_no_timer(self, clock):
+        """Nothing registered - no wakeups"""
+        assert clock.active is False
+
+    def test_flash_ticks_at_flash_rate(self, clock):
+        """A flashing item arms the 10 Hz tick"""
+        clock.start_flash(flashing_item(3))
+
+        assert clock.active
+        assert clock._timer.interval() == AnimationClock.FLASH_INTERVAL_MS
+
+    def test_all_flashing_items_advance_together(self, clock):
+        """One tick advances and repaints every flashing item"""
+        first, second = flashing_item(3), flashing_item(3)
+        clock.start_flash(first)
+        clock.start_flash(second)
+        clock.start_flash(first)  # Re-registering is a no-op
+
+        clock._tick()
+
+        first.flash_tick.assert_called_once()
+        second.flash_tick.assert_called_once()
+        first.update.assert_called_once()
+        second.update.assert_called_once()
+
+    def test_stops_when_flashes_end(self, clock):
+        """The timer stops once the last flash is done"""
+        item = flashing_item(2)
+        clock.start_flash(item)
+
+        clock._tick()
+        assert clock.is_flashing(item)
+        clock._tick()
+
+        assert not clock.is_flashing(item)
+        assert item.update.call_count == 2  # Final repaint clears the border
+        assert clock.active is False
+
+    def test_runs_on_event_loop(self, clock, qapp):
+        """Ticks fire from the Qt event loop"""
+        item = flashing_item(2)
+        clock.start_flash(item)
+
+        deadline = time.monotonic() + 2.0
+        while clock.is_flashing(item) and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+
+        assert item.flash_tick.call_count == 2
+        assert clock.ticks == 2
+
+
+class TestSessionAndRepaint:
+    """Tests for session ticks and one-shot repaints"""
+
+    def test_session_tick_when_due(self, clock):
+        """Session items tick once per SESSION_INTERVAL_S"""
+        item = MagicMock()
+        clock.add_session(item)
+
+        clock._tick()
+        item.session_tick.assert_not_called()
+
+        clock._next_session = time.monotonic() - 1
+        clock._tick()
+        item.session_tick.assert_called_once()
+        assert clock.active  # Next minute armed
+
+    def test_session_only_sleeps_long(self, clock):
+        """Without flashes the clock wakes for the next session tick only"""
+        clock.add_session(MagicMock())
+
+        assert clock._timer.remainingTime() > 1000
+
+    def test_scheduled_repaint_fires_once(self, clock):
+        """schedule_repaint updates the item once when due"""
+        item = MagicMock()
+        clock.schedule_repaint(item, 0)
+
+        clock._tick()
+        clock._tick()
+
+        item.update.assert_called_once()
+        assert clock.active is False
+
+    def test_earliest_repaint_kept(self, clock):
+        """A later request doesn't postpone an earlier one"""
+        item = MagicMock()
+        clock.schedule_repaint(item, 1)
+        clock.schedule_repaint(item, 5)
+
+        assert clock._repaint_due[item] - time.monotonic() < 1.5
+
+    def test_repaint_not_doubled_while_flashing(self, clock):
+        """A flashing item due for a repaint is updated once per tick"""
+        item = flashing_item(3)
+        clock.start_flash(item)
+        clock.schedule_repaint(item, 0)
+
+        clock._tick()
+
+        item.update.assert_called_once()
+
+
+class TestForget:
+    """Tests for dropping items"""
+
+    def test_forget_removes_everything(self, clock):
+        """forget() drops all registrations and idles the clock"""
+        item = flashing_item(5)
+        clock.start_flash(item)
+        clock.add_session(item)
+        clock.schedule_repaint(item, 1)
+
+        clock.forget(item)
+
+        assert not clock.is_flashing(item)
+        assert item not in clock._session
+        assert item not in clock._repaint_due
+        assert clock.active is False
+
+    def test_deleted_item_dropped(self, clock):
+        """Items whose Qt object is gone are forgotten on the next tick"""
+        item = MagicMock()
+        item.flash_tick.side_effect = RuntimeError("Internal C++ object already deleted")
+        clock.start_flash(item)
+
+        clock._tick()
+
+        assert not clock.is_flashing(item)
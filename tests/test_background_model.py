@@ -0,0 +1,185 @@
+"""
+Unit tests for the BackgroundModel module.
+
+Tests cover:
+- Preallocated float32 storage
+- Seeding from the first frame
+- Foreground fraction against the model
+- Animated content vs. slow drift
+- Reset
+- Change-region bounding boxes
+"""
+
+import numpy as np
+import pytest
+
+from argus_overview.core.background_model import BackgroundModel, find_change_regions
+
+SHAPE = (90, 160)
+
+
+def flat(value):
+    """Create a uniform grayscale frame"""
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+@pytest.fixture
+def model():
+    """Create a model with default parameters"""
+    return BackgroundModel(SHAPE)
+
+
+class TestInit:
+    """Tests for BackgroundModel initialization"""
+
+    def test_arrays_preallocated_float32(self, model):
+        """Model state is float32 and shaped like the frame"""
+        assert model.mean.dtype == np.float32
+        assert model.variance.dtype == np.float32
+        assert model.mean.shape == SHAPE
+        assert model.foreground.shape == SHAPE
+        assert model.initialized is False
+
+    def test_learning_rate_clamped(self):
+        """Learning rate is clamped into (0, 1]"""
+        assert BackgroundModel(SHAPE, learning_rate=5).learning_rate == 1.0
+        assert BackgroundModel(SHAPE, learning_rate=0).learning_rate == 0.001
+
+
+class TestUpdate:
+    """Tests for update()"""
+
+    def test_first_frame_seeds_model(self, model):
+        """First frame seeds the mean and reports no change"""
+        assert model.update(flat(80)) == 0.0
+        assert model.initialized is True
+        assert np.all(model.mean == 80)
+
+    def test_update_is_in_place(self, model):
+        """update() never reallocates the model arrays"""
+        mean, variance = model.mean, model.variance
+
+        model.update(flat(80))
+        model.update(flat(200))
+
+        assert model.mean is mean
+        assert model.variance is variance
+
+    def test_static_scene_no_change(self, model):
+        """Identical frames never report change"""
+        for _ in range(10):
+            assert model.update(flat(80)) == 0.0
+
+    def test_large_change_detected(self, model):
+        """A full-frame jump is all foreground"""
+        model.update(flat(50))
+
+        assert model.update(flat(200)) == 1.0
+        assert model.foreground.all()
+
+    def test_partial_change_fraction(self, model):
+        """Fraction reflects the changed area"""
+        model.update(flat(50))
+        frame = flat(50)
+        frame[:45, :] = 200
+
+        assert model.update(frame) == pytest.approx(0.5)
+
+    def test_small_change_below_floor(self, model):
+        """Changes under the MIN_STD floor are not foreground"""
+        model.update(flat(100))
+
+        assert model.update(flat(120)) == 0.0
+
+    def test_animation_settles(self, model):
+        """Content flickering every frame widens its own threshold"""
+        results = [model.update(flat(60 if i % 2 else 140)) for i in range(40)]
+
+        assert max(results[:5]) > 0
+        assert max(results[-20:]) == 0.0
+
+    def test_slow_drift_detected(self, model):
+        """Steps too small for a last-frame diff still accumulate"""
+        results = [model.update(flat(20 + 3 * i)) for i in range(40)]
+
+        assert max(results) == 1.0
+
+    def test_persistent_change_absorbed(self, model):
+        """A new steady scene becomes background"""
+        model.update(flat(50))
+        results = [model.update(flat(200)) for _ in range(100)]
+
+        assert results[0] == 1.0
+        assert results[-1] == 0.0
+
+    def test_reset(self, model):
+        """Reset makes the next frame re-seed the model"""
+        model.update(flat(50))
+        model.update(flat(200))
+
+        model.reset()
+
+        assert model.initialized is False
+        assert model.update(flat(10)) == 0.0
+        assert np.all(model.mean == 10)
+
+
+class TestFindChangeRegions:
+    """Tests for find_change_regions()"""
+
+    def test_empty_mask(self):
+        """No change, no regions"""
+        assert find_change_regions(np.zeros(SHAPE, dtype=bool)) == []
+
+    def test_single_region(self):
+        """One changed block area yields one box in frame fractions"""
+        mask = np.zeros(SHAPE, dtype=bool)
+        mask[10:30, 20:50] = True
+
+        assert find_change_regions(mask) == [(2 / 16, 1 / 9, 3 / 16, 2 / 9)]
+
+    def test_separate_regions_largest_first(self):
+        """Disjoint areas are separate boxes, largest first"""
+        mask = np.zeros(SHAPE, dtype=bool)
+        mask[60:90, 150:160] = True  # 3 cells
+        mask[0:20, 0:40] = True  # 8 cells
+
+        regions = find_change_regions(mask)
+
+        assert regions == [(0.0, 0.0, 4 / 16, 2 / 9), (15 / 16, 6 / 9, 1 / 16, 3 / 9)]
+
+    def test_u_shape_is_one_region(self):
+        """Runs joined only through a lower row merge into one component"""
+        mask = np.zeros(SHAPE, dtype=bool)
+        mask[0:30, 0:50] = True
+        mask[0:30, 100:150] = True
+        mask[30:60, 0:150] = True
+
+        assert find_change_regions(mask) == [(0.0, 0.0, 15 / 16, 6 / 9)]
+
+    def test_diagonal_cells_not_connected(self):
+        """Components are 4-connected"""
+        mask = np.zeros(SHAPE, dtype=bool)
+        mask[0:10, 0:10] = True
+        mask[10:20, 10:20] = True
+
+        assert len(find_change_regions(mask)) == 2
+
+    def test_min_fill(self):
+        """Sparse blocks below min_fill are ignored"""
+        mask = np.zeros(SHAPE, dtype=bool)
+        mask[0:10:2, 0:10:2] = True  # 25 of 100 pixels
+
+        assert len(find_change_regions(mask, min_fill=0.25)) == 1
+        assert find_change_regions(mask, min_fill=0.5) == []
+
+    def test_mask_smaller_than_cell(self):
+        """Masks smaller than one cell produce nothing"""
+        assert find_change_regions(np.ones((5, 5), dtype=bool)) == []
+
+    def test_remainder_trimmed(self):
+        """Partial cells at the edges are ignored"""
+        mask = np.zeros((95, 165), dtype=bool)
+        mask[90:, :] = True
+
+        assert find_change_regions(mask) == []
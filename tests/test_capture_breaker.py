@@ -0,0 +1,127 @@
+"""
+Unit tests for the Capture Breaker module.
+
+Tests cover:
+- Healthy windows pass without bookkeeping
+- Exponential backoff (doubling, capped) and the single trial slot
+- Quarantine after consecutive timeouts only
+- Liveness probe scheduling and recovery
+"""
+
+from argus_overview.core.capture_breaker import CaptureBreaker
+
+
+class TestBackoff:
+    """Tests for allow/record_failure/record_success"""
+
+    def test_healthy_window_allowed(self):
+        """A window that never failed is always allowed"""
+        breaker = CaptureBreaker()
+
+        assert breaker.allow("0x1", now=0.0)
+        assert breaker.allow("0x1", now=0.0)
+        assert breaker.skipped == 0
+
+    def test_backoff_doubles_and_caps(self):
+        """Each consecutive timeout doubles the wait, up to BACKOFF_MAX_S"""
+        breaker = CaptureBreaker()
+        waits = []
+        now = 0.0
+        for _ in range(8):
+            breaker.record_failure("0x1", timed_out=True, now=now)
+            waits.append(breaker._health["0x1"].retry_at - now)
+            now += waits[-1]
+
+        assert waits[:5] == [0.5, 1.0, 2.0, 4.0, 8.0]
+        assert max(waits) == breaker.BACKOFF_MAX_S
+
+    def test_refused_until_retry_then_one_trial(self):
+        """Backing off refuses captures; afterwards one trial runs at a time"""
+        breaker = CaptureBreaker()
+        breaker.record_failure("0x1", timed_out=True, now=0.0)
+
+        assert not breaker.allow("0x1", now=0.4)
+        assert breaker.allow("0x1", now=0.5)
+        assert not breaker.allow("0x1", now=0.6)  # Trial still running
+        assert breaker.skipped == 2
+
+    def test_fast_failure_not_backed_off(self):
+        """A failure that didn't time out is retried on the next cycle"""
+        breaker = CaptureBreaker()
+        breaker.record_failure("0x1", timed_out=True, now=0.0)
+        breaker.record_failure("0x1", timed_out=False, now=0.5)
+
+        assert breaker.allow("0x1", now=0.5)
+        breaker.record_failure("0x1", timed_out=False, now=0.6)
+        assert breaker.allow("0x1", now=0.6)
+        assert breaker.skipped == 0
+
+    def test_success_clears_state(self):
+        """A working capture resets the window to healthy"""
+        breaker = CaptureBreaker()
+        breaker.record_failure("0x1", timed_out=True, now=0.0)
+        assert breaker.allow("0x1", now=1.0)
+
+        assert breaker.record_success("0x1") is True
+        assert breaker.record_success("0x1") is False
+        assert breaker.allow("0x1", now=1.0)
+
+
+class TestQuarantine:
+    """Tests for quarantine and liveness probes"""
+
+    def _quarantine(self, breaker, window_id="0x1"):
+        for i in range(breaker.QUARANTINE_AFTER):
+            quarantined = breaker.record_failure(window_id, timed_out=True, now=float(i))
+        return quarantined
+
+    def test_quarantined_after_consecutive_timeouts(self):
+        """QUARANTINE_AFTER timeouts in a row quarantine the window"""
+        breaker = CaptureBreaker()
+
+        assert self._quarantine(breaker) is True
+        assert breaker.is_quarantined("0x1")
+        assert breaker.quarantined() == {"0x1"}
+        assert not breaker.allow("0x1", now=1000.0)
+        assert breaker.quarantines == 1
+
+    def test_fast_failure_resets_timeout_count(self):
+        """Only consecutive timeouts count - a quick failure isn't a hang"""
+        breaker = CaptureBreaker()
+        breaker.record_failure("0x1", timed_out=True, now=0.0)
+        breaker.record_failure("0x1", timed_out=True, now=1.0)
+        breaker.record_failure("0x1", timed_out=False, now=2.0)
+
+        assert breaker.record_failure("0x1", timed_out=True, now=3.0) is False
+        assert not breaker.is_quarantined("0x1")
+
+    def test_probes_due_every_interval(self):
+        """Each quarantined window is handed out once per PROBE_INTERVAL_S"""
+        breaker = CaptureBreaker()
+        self._quarantine(breaker)
+        start = breaker._health["0x1"].probed_at
+
+        assert breaker.due_probes(now=start + 1.0) == []
+        assert breaker.due_probes(now=start + breaker.PROBE_INTERVAL_S) == ["0x1"]
+        assert breaker.due_probes(now=start + breaker.PROBE_INTERVAL_S + 1.0) == []
+
+    def test_probe_recovery(self):
+        """A responding probe releases the window; a silent one keeps it"""
+        breaker = CaptureBreaker()
+        self._quarantine(breaker)
+
+        assert breaker.record_probe("0x1", responding=False) is False
+        assert breaker.is_quarantined("0x1")
+        assert breaker.record_probe("0x1", responding=True) is True
+        assert not breaker.is_quarantined("0x1")
+        assert breaker.allow("0x1")
+        assert (breaker.probes, breaker.recoveries) == (2, 1)
+
+    def test_forget(self):
+        """Forgetting a window drops its quarantine"""
+        breaker = CaptureBreaker()
+        self._quarantine(breaker)
+
+        breaker.forget("0x1")
+
+        assert breaker.quarantined() == set()
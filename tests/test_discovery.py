@@ -9,6 +9,7 @@ Tests cover:
 - Scan cycle behavior
 - Known/active character tracking
 - Serialization
+- Event-driven mode and polling fallback
 """
 
 from datetime import datetime
@@ -19,17 +20,17 @@ import pytest
 from argus_overview.core.discovery import (
     AutoDiscovery,
     DiscoveredCharacter,
-    _clear_wmctrl_cache,
     scan_eve_windows,
 )
+from argus_overview.core.window_registry import WindowRegistry
 
 
 @pytest.fixture(autouse=True)
-def clear_wmctrl_cache():
-    """Clear wmctrl cache before each test"""
-    _clear_wmctrl_cache()
+def reset_registry():
+    """Start each test with an empty shared window snapshot"""
+    WindowRegistry.reset_instance()
     yield
-    _clear_wmctrl_cache()
+    WindowRegistry.reset_instance()
 
 
 class TestDiscoveredCharacter:
@@ -364,9 +365,13 @@ class TestScanEveWindowsFunction:
 
     def test_returns_list(self):
         """Returns list of tuples"""
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
-                returncode=0, stdout="0x123  0 host EVE - Pilot1\n0x456  0 host EVE - Pilot2\n"
+                returncode=0,
+                stdout=(
+                    "0x123  0 1 0 0 800 600 host EVE - Pilot1\n"
+                    "0x456  0 1 0 0 800 600 host EVE - Pilot2\n"
+                ),
             )
 
             result = scan_eve_windows()
@@ -377,7 +382,7 @@ class TestScanEveWindowsFunction:
 
     def test_handles_empty_output(self):
         """Handles empty wmctrl output"""
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0, stdout="")
 
             result = scan_eve_windows()
@@ -385,7 +390,7 @@ class TestScanEveWindowsFunction:
 
     def test_handles_subprocess_error(self):
         """Handles subprocess failure"""
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.side_effect = Exception("wmctrl failed")
 
             result = scan_eve_windows()
@@ -393,10 +398,14 @@ class TestScanEveWindowsFunction:
 
     def test_filters_non_eve_windows(self):
         """Only returns EVE windows"""
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=0,
-                stdout="0x1  0 host Firefox\n0x2  0 host EVE - Test\n0x3  0 host Terminal\n",
+                stdout=(
+                    "0x1  0 1 0 0 800 600 host Firefox\n"
+                    "0x2  0 1 0 0 800 600 host EVE - Test\n"
+                    "0x3  0 1 0 0 800 600 host Terminal\n"
+                ),
             )
 
             result = scan_eve_windows()
@@ -502,9 +511,13 @@ class TestGetEVEWindows:
         """Returns EVE windows from wmctrl"""
         discovery = AutoDiscovery()
 
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
-                returncode=0, stdout="0x123  0 host EVE - Pilot1\n0x456  0 host Firefox\n"
+                returncode=0,
+                stdout=(
+                    "0x123  0 1 0 0 800 600 host EVE - Pilot1\n"
+                    "0x456  0 1 0 0 800 600 host Firefox\n"
+                ),
             )
 
             result = discovery._get_eve_windows()
@@ -518,7 +531,7 @@ class TestGetEVEWindows:
 
         discovery = AutoDiscovery()
 
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.TimeoutExpired("wmctrl", 2)
 
             result = discovery._get_eve_windows()
@@ -529,7 +542,7 @@ class TestGetEVEWindows:
         """Handles wmctrl failure"""
         discovery = AutoDiscovery()
 
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=1, stdout="")
 
             result = discovery._get_eve_windows()
@@ -540,7 +553,7 @@ class TestGetEVEWindows:
         """Handles general exceptions"""
         discovery = AutoDiscovery()
 
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             mock_run.side_effect = Exception("wmctrl not found")
 
             result = discovery._get_eve_windows()
@@ -551,10 +564,14 @@ class TestGetEVEWindows:
         """Skips empty lines in wmctrl output"""
         discovery = AutoDiscovery()
 
-        with patch("argus_overview.core.discovery.subprocess.run") as mock_run:
+        with patch("argus_overview.core.window_registry.subprocess.run") as mock_run:
             # Output with empty lines interspersed
             mock_run.return_value = MagicMock(
-                returncode=0, stdout="0x123  0 host EVE - Pilot1\n\n0x456  0 host EVE - Pilot2\n\n"
+                returncode=0,
+                stdout=(
+                    "0x123  0 1 0 0 800 600 host EVE - Pilot1\n\n"
+                    "0x456  0 1 0 0 800 600 host EVE - Pilot2\n\n"
+                ),
             )
 
             result = discovery._get_eve_windows()
@@ -580,3 +597,90 @@ class TestForceScan:
 
             assert count == 2
             assert len(discovery.active_window_ids) == 2
+
+
+class TestEventDriven:
+    """Tests for discovery driven by X window events"""
+
+    def test_start_uses_watcher_without_polling(self):
+        """With window events available, nothing is polled"""
+        discovery = AutoDiscovery(event_driven=True)
+        found = MagicMock()
+        discovery.new_character_found.connect(found)
+
+        with patch("argus_overview.core.discovery.ClientListWatcher") as watcher_cls:
+            watcher = watcher_cls.return_value
+            watcher.start.return_value = True
+            watcher.windows.return_value = [("0x1", "EVE - Pilot1"), ("0x2", "Firefox")]
+            with patch.object(discovery, "_get_eve_windows") as get_windows:
+                discovery.start()
+
+        get_windows.assert_not_called()
+        assert not discovery.scan_timer.isActive()
+        assert discovery.running is True
+        found.assert_called_once_with("Pilot1", "0x1", "EVE - Pilot1")
+
+        discovery.stop()
+        watcher.stop.assert_called_once()
+        assert discovery.running is False
+
+    def test_shared_watcher_left_running(self):
+        """A watcher passed in by the owner is used, and only disconnected on stop"""
+        watcher = MagicMock()
+        watcher.start.return_value = True
+        watcher.windows.return_value = []
+        discovery = AutoDiscovery(event_driven=True, watcher=watcher)
+
+        with patch("argus_overview.core.discovery.ClientListWatcher") as watcher_cls:
+            discovery.start()
+        discovery.stop()
+
+        watcher_cls.assert_not_called()
+        watcher.windows_changed.connect.assert_called_once_with(discovery._on_windows_changed)
+        watcher.windows_changed.disconnect.assert_called_once_with(discovery._on_windows_changed)
+        watcher.watch_lost.disconnect.assert_called_once_with(discovery._on_watch_lost)
+        watcher.stop.assert_not_called()
+        assert discovery.running is False
+
+    def test_falls_back_to_polling(self):
+        """Without window events, start polls as before"""
+        discovery = AutoDiscovery(event_driven=True)
+
+        with patch("argus_overview.core.discovery.ClientListWatcher") as watcher_cls:
+            watcher_cls.return_value.start.return_value = False
+            with patch.object(discovery, "_scan_cycle") as scan:
+                with patch.object(discovery.scan_timer, "start") as timer_start:
+                    discovery.start()
+
+        scan.assert_called_once()
+        timer_start.assert_called_once_with(discovery.interval)
+        assert discovery._watcher is None
+
+    def test_windows_changed_emits_new_and_gone(self):
+        """Event updates go through the same new/gone diff as scans"""
+        discovery = AutoDiscovery(event_driven=True)
+        found = MagicMock()
+        gone = MagicMock()
+        discovery.new_character_found.connect(found)
+        discovery.character_gone.connect(gone)
+
+        discovery._on_windows_changed([("0x1", "EVE"), ("0x2", "EVE - Pilot2")])
+        discovery._on_windows_changed([("0x1", "EVE - Pilot1")])
+
+        assert [c.args[0] for c in found.call_args_list] == ["Pilot2", "Pilot1"]
+        gone.assert_called_once_with("Pilot2", "0x2")
+
+    def test_watch_lost_starts_polling(self):
+        """Losing the X connection switches to polling"""
+        discovery = AutoDiscovery(event_driven=True)
+        watcher = MagicMock()
+        discovery._watcher = watcher
+
+        with patch.object(discovery, "_scan_cycle") as scan:
+            with patch.object(discovery.scan_timer, "start") as timer_start:
+                discovery._on_watch_lost()
+
+        watcher.stop.assert_called_once()
+        scan.assert_called_once()
+        timer_start.assert_called_once_with(discovery.interval)
+        assert discovery._watcher is None
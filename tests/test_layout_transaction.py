@@ -0,0 +1,215 @@
+"""
+Unit tests for the Layout Transaction module.
+
+Tests cover:
+- Diffing against current geometry (unchanged windows skipped)
+- Issuing the remaining moves in one batch
+- One settle wait (target reached, stopped short, timeout)
+- Registry geometry and no settle wait without an X connection
+- Per-phase timing
+- LayoutCommitter committing on a worker thread and reporting the result
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtCore import Qt
+
+from argus_overview.core.layout_transaction import (
+    LayoutCommitter,
+    LayoutResult,
+    LayoutTransaction,
+    WindowTarget,
+)
+from argus_overview.core.window_registry import WindowRegistry
+from argus_overview.utils.window_control import WindowControl
+
+
+@pytest.fixture
+def control():
+    """Window control with an X connection; geometries come from control.geometry"""
+    control = MagicMock()
+    control.available = True
+    control.geometry = {}
+    control.get_geometries.side_effect = lambda ids: {
+        window_id: control.geometry[window_id] for window_id in ids if window_id in control.geometry
+    }
+    with patch.object(WindowControl, "get_instance", return_value=control):
+        yield control
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    WindowRegistry.reset_instance()
+    yield
+    WindowRegistry.reset_instance()
+
+
+class TestWindowTarget:
+    """Tests for WindowTarget.matches"""
+
+    def test_matches(self):
+        """Position always counts; size only when given"""
+        assert WindowTarget(10, 20, 800, 600).matches((10, 20, 800, 600))
+        assert not WindowTarget(10, 20, 800, 600).matches((10, 20, 800, 601))
+        assert WindowTarget(10, 20).matches((10, 20, 1, 1))
+        assert not WindowTarget(10, 20).matches((11, 20, 1, 1))
+
+
+class TestCommit:
+    """Tests for LayoutTransaction.commit"""
+
+    def test_only_changed_windows_moved(self, control):
+        """Windows already in place aren't touched; the rest go out in one batch"""
+        control.geometry = {"0x1": (10, 10, 800, 600), "0x2": (0, 0, 640, 480)}
+
+        def move_resize(window_id, x, y, w, h):
+            control.geometry[window_id] = (x, y, w, h)  # WM applies it at once
+            return True
+
+        mover = MagicMock(side_effect=move_resize)
+        transaction = LayoutTransaction(mover)
+        transaction.add("0x1", 10, 10, 800, 600)
+        transaction.add("0x2", 820, 10, 800, 600)
+
+        result = transaction.commit()
+
+        mover.assert_called_once_with("0x2", 820, 10, 800, 600)
+        control.batch.assert_called_once()
+        assert (result.moved, result.unchanged, result.failed) == (1, 1, 0)
+        assert result.settled is True
+        assert result.total_ms == result.read_ms + result.issue_ms + result.settle_ms
+        assert "1 moved, 1 unchanged" in result.summary()
+
+    def test_position_only_uses_move_only(self, control):
+        """Targets without a size go through move_only"""
+        move_only = MagicMock(return_value=True)
+        transaction = LayoutTransaction(MagicMock(), move_only)
+        transaction.SETTLE_TIMEOUT_S = 0
+        transaction.add("0x1", 10, 10)
+
+        transaction.commit()
+
+        move_only.assert_called_once_with("0x1", 10, 10)
+
+    def test_settles_when_window_stops_short(self, control):
+        """A window held back by size hints counts as settled once it stops changing"""
+        control.geometry = {"0x1": (0, 0, 640, 480)}
+
+        def move_resize(window_id, x, y, w, h):
+            control.geometry[window_id] = (x, y, 1024, 768)  # Minimum size wins
+            return True
+
+        transaction = LayoutTransaction(move_resize)
+        transaction.add("0x1", 10, 10, 800, 600)
+
+        result = transaction.commit()
+
+        assert result.settled is True
+        assert result.settle_ms < transaction.SETTLE_TIMEOUT_S * 1000
+
+    def test_settle_timeout(self, control):
+        """A window that never moves is reported unsettled after the timeout"""
+        control.geometry = {"0x1": (0, 0, 640, 480)}
+        transaction = LayoutTransaction(MagicMock(return_value=True))
+        transaction.SETTLE_TIMEOUT_S = 0.05
+        transaction.add("0x1", 10, 10, 800, 600)
+
+        result = transaction.commit()
+
+        assert result.settled is False
+        assert "not all windows settled" in result.summary()
+
+    def test_failures_counted(self, control):
+        """Movers returning False or raising count as failed"""
+        transaction = LayoutTransaction(MagicMock(side_effect=[False, OSError("xdotool")]))
+        transaction.add("0x1", 0, 0, 10, 10)
+        transaction.add("0x2", 0, 0, 10, 10)
+
+        result = transaction.commit()
+
+        assert (result.moved, result.failed) == (0, 2)
+
+    def test_empty(self, control):
+        """Nothing queued - nothing read or moved"""
+        result = LayoutTransaction(MagicMock()).commit()
+
+        assert result.moved == 0
+        control.get_geometries.assert_not_called()
+
+
+class TestWithoutX:
+    """Tests for the wmctrl/xdotool fallback"""
+
+    def test_registry_geometry_and_no_settle_wait(self):
+        """Geometry comes from one wmctrl query; xdotool calls wait for themselves"""
+        wmctrl = MagicMock(
+            returncode=0,
+            stdout=(
+                "0x03800003  0 4101 10   10   800  600  host EVE - Pilot One\n"
+                "0x03a00003  0 4202 0    0    800  600  host EVE - Pilot Two\n"
+            ),
+        )
+        mover = MagicMock(return_value=True)
+        with patch("argus_overview.utils.window_control.open_display", return_value=None), patch(
+            "argus_overview.core.window_registry.subprocess.run", return_value=wmctrl
+        ) as run:
+            WindowControl.reset_instance()
+            transaction = LayoutTransaction(mover)
+            transaction.add("0x03800003", 10, 10, 800, 600)
+            transaction.add("0x03a00003", 820, 10, 800, 600)
+            result = transaction.commit()
+            WindowControl.reset_instance()
+
+        run.assert_called_once()
+        mover.assert_called_once_with("0x03a00003", 820, 10, 800, 600)
+        assert (result.moved, result.unchanged) == (1, 1)
+        assert result.settle_ms == 0
+
+
+class TestLayoutCommitter:
+    """Tests for committing off the calling thread"""
+
+    def test_commits_on_worker_thread(self, control):
+        """The moves run on another thread and the result comes back by signal"""
+        mover_threads = []
+        mover = MagicMock(
+            side_effect=lambda *_args: mover_threads.append(threading.get_ident()) or True
+        )
+        control.geometry = {"0x1": (0, 0, 800, 600)}
+        transaction = LayoutTransaction(mover)
+        transaction.add("0x1", 10, 10, 800, 600)
+        reported = []
+
+        committer = LayoutCommitter()
+        # No event loop in tests - deliver on the worker thread
+        committer.layout_committed.connect(
+            lambda name, result: reported.append((name, result)),
+            Qt.ConnectionType.DirectConnection,
+        )
+        committer.run("2x2 Grid", transaction)
+
+        assert committer.wait()
+        assert mover_threads and threading.get_ident() not in mover_threads
+        assert len(reported) == 1
+        name, result = reported[0]
+        assert (name, result.moved) == ("2x2 Grid", 1)
+        assert committer.last_result is result
+
+    def test_commit_error_reported_as_failure(self):
+        """An exception in commit reports every queued window as failed"""
+        transaction = LayoutTransaction(MagicMock())
+        transaction.add("0x1", 0, 0)
+        transaction.add("0x2", 0, 0)
+        reported = []
+
+        committer = LayoutCommitter()
+        committer.layout_committed.connect(
+            lambda _name, result: reported.append(result), Qt.ConnectionType.DirectConnection
+        )
+        with patch.object(transaction, "commit", side_effect=RuntimeError("X gone")):
+            committer.run("Stacked", transaction)
+            assert committer.wait()
+
+        assert reported == [LayoutResult(failed=2)]
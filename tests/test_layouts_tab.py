@@ -5,6 +5,15 @@ Tests ScreenGeometry, DraggableTile, ArrangementGrid, GridApplier, LayoutsTab
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def layout_committer():
+    """LayoutsTab tests patch QWidget.__init__, so the committer can't be parented to the tab"""
+    with patch("argus_overview.ui.layouts_tab.LayoutCommitter") as committer_cls:
+        yield committer_cls
+
 
 # Test ScreenGeometry dataclass
 class TestScreenGeometry:
@@ -294,7 +303,7 @@ class TestGridApplier:
         """Test apply_arrangement with stacked mode"""
         from argus_overview.ui.layouts_tab import GridApplier, ScreenGeometry
 
-        mock_subprocess.return_value = MagicMock()
+        mock_subprocess.return_value = MagicMock(returncode=0)
 
         mock_layout_manager = MagicMock()
         applier = GridApplier(mock_layout_manager)
@@ -321,7 +330,7 @@ class TestGridApplier:
         """Test apply_arrangement with grid mode"""
         from argus_overview.ui.layouts_tab import GridApplier, ScreenGeometry
 
-        mock_subprocess.return_value = MagicMock()
+        mock_subprocess.return_value = MagicMock(returncode=0)
 
         mock_layout_manager = MagicMock()
         applier = GridApplier(mock_layout_manager)
@@ -367,7 +376,7 @@ class TestLayoutsTab:
     """Tests for LayoutsTab widget"""
 
     @patch("argus_overview.ui.layouts_tab.QWidget.__init__")
-    def test_init(self, mock_widget):
+    def test_init(self, mock_widget, layout_committer):
         """Test LayoutsTab initialization"""
         mock_widget.return_value = None
 
@@ -386,6 +395,8 @@ class TestLayoutsTab:
 
                 assert tab.layout_manager is mock_layout_manager
                 assert tab.main_tab is mock_main_tab
+                layout_committer.assert_called_once_with(tab)
+                assert tab.layout_committer is layout_committer.return_value
 
     @patch("argus_overview.ui.layouts_tab.QWidget.__init__")
     def test_load_groups(self, mock_widget):
@@ -1164,14 +1175,33 @@ class TestLayoutsTabApplyToActiveWindows:
 
                 tab.grid_applier = MagicMock()
                 tab.grid_applier.get_screen_geometry.return_value = ScreenGeometry(0, 0, 1920, 1080)
-                tab.grid_applier.apply_arrangement.return_value = True
+                tab.layout_committer = MagicMock()
+
+                tab._apply_to_active_windows()
 
+                tab.layout_committer.run.assert_called_once_with(
+                    "2x2 Grid", tab.grid_applier.build_transaction.return_value
+                )
+                mock_msgbox.information.assert_not_called()
+
+    @patch("argus_overview.ui.layouts_tab.QWidget.__init__")
+    @patch("argus_overview.ui.layouts_tab.QMessageBox")
+    def test_layout_committed_success(self, mock_msgbox, mock_widget):
+        """Test a committed layout reports success and emits layout_applied"""
+        mock_widget.return_value = None
+
+        from argus_overview.core.layout_transaction import LayoutResult
+        from argus_overview.ui.layouts_tab import LayoutsTab
+
+        with patch.object(LayoutsTab, "_setup_ui"):
+            with patch.object(LayoutsTab, "_load_groups"):
+                tab = LayoutsTab(MagicMock(), MagicMock())
                 tab.layout_applied = MagicMock()
 
-                tab._apply_to_active_windows()
+                tab._on_layout_committed("2x2 Grid", LayoutResult(moved=2, unchanged=1))
 
-                mock_msgbox.information.assert_called()
-                tab.layout_applied.emit.assert_called()
+                assert "3 windows" in mock_msgbox.information.call_args[0][2]
+                tab.layout_applied.emit.assert_called_with("2x2 Grid")
 
     @patch("argus_overview.ui.layouts_tab.QWidget.__init__")
     @patch("argus_overview.ui.layouts_tab.QMessageBox")
@@ -1211,11 +1241,32 @@ class TestLayoutsTabApplyToActiveWindows:
 
                 tab.grid_applier = MagicMock()
                 tab.grid_applier.get_screen_geometry.return_value = ScreenGeometry(0, 0, 1920, 1080)
-                tab.grid_applier.apply_arrangement.return_value = False
+                tab.grid_applier.build_transaction.return_value = None
+                tab.layout_committer = MagicMock()
 
                 tab._apply_to_active_windows()
 
                 mock_msgbox.warning.assert_called()
+                tab.layout_committer.run.assert_not_called()
+
+    @patch("argus_overview.ui.layouts_tab.QWidget.__init__")
+    @patch("argus_overview.ui.layouts_tab.QMessageBox")
+    def test_layout_committed_with_failures(self, mock_msgbox, mock_widget):
+        """Test a commit with failed moves shows a warning"""
+        mock_widget.return_value = None
+
+        from argus_overview.core.layout_transaction import LayoutResult
+        from argus_overview.ui.layouts_tab import LayoutsTab
+
+        with patch.object(LayoutsTab, "_setup_ui"):
+            with patch.object(LayoutsTab, "_load_groups"):
+                tab = LayoutsTab(MagicMock(), MagicMock())
+                tab.layout_applied = MagicMock()
+
+                tab._on_layout_committed("2x2 Grid", LayoutResult(failed=1))
+
+                mock_msgbox.warning.assert_called_once()
+                tab.layout_applied.emit.assert_not_called()
 
 
 # Test edge cases for more coverage
@@ -1312,6 +1363,8 @@ class TestGridApplierApplyArrangementEdgeCases:
         """Test apply_arrangement skips chars not in window_map"""
         from argus_overview.ui.layouts_tab import GridApplier, ScreenGeometry
 
+        mock_subprocess.return_value = MagicMock(returncode=0)
+
         mock_layout_manager = MagicMock()
         applier = GridApplier(mock_layout_manager)
 
@@ -1347,11 +1400,11 @@ class TestGridApplierMoveWindowTimeout:
         # First call times out, second succeeds
         mock_subprocess.side_effect = [
             subprocess.TimeoutExpired("xdotool", 2),  # windowmove --sync times out
-            MagicMock(),  # windowmove without --sync
-            MagicMock(),  # windowsize --sync
+            MagicMock(returncode=0),  # windowmove without --sync
+            MagicMock(returncode=0),  # windowsize --sync
         ]
 
-        applier._move_window("0x123", 100, 200, 800, 600)
+        assert applier._move_window("0x123", 100, 200, 800, 600) is True
 
         # Should have called 3 times - timeout on first, then retry, then size
         assert mock_subprocess.call_count == 3
@@ -1370,16 +1423,35 @@ class TestGridApplierMoveWindowTimeout:
 
         # Move succeeds, size times out then succeeds
         mock_subprocess.side_effect = [
-            MagicMock(),  # windowmove --sync succeeds
+            MagicMock(returncode=0),  # windowmove --sync succeeds
             subprocess.TimeoutExpired("xdotool", 2),  # windowsize --sync times out
-            MagicMock(),  # windowsize without --sync
+            MagicMock(returncode=0),  # windowsize without --sync
         ]
 
-        applier._move_window("0x123", 100, 200, 800, 600)
+        assert applier._move_window("0x123", 100, 200, 800, 600) is True
 
         assert mock_subprocess.call_count == 3
         mock_sleep.assert_called_once_with(0.1)
 
+    @patch("argus_overview.ui.layouts_tab.subprocess.run")
+    def test_move_window_xdotool_failure(self, mock_subprocess):
+        """A non-zero xdotool exit is a failed move and counts in the layout result"""
+        from argus_overview.ui.layouts_tab import GridApplier, ScreenGeometry
+
+        mock_subprocess.return_value = MagicMock(returncode=1)
+        applier = GridApplier(MagicMock())
+
+        result = applier.apply_arrangement(
+            arrangement={"Pilot1": (0, 0)},
+            window_map={"Pilot1": "0x123"},
+            screen=ScreenGeometry(0, 0, 1920, 1080),
+            grid_rows=1,
+            grid_cols=1,
+        )
+
+        assert result is False
+        assert applier.last_result.failed == 1
+
 
 # =============================================================================
 # LayoutsTab UI Setup Tests
@@ -0,0 +1,265 @@
+"""
+Unit tests for the Hostile-in-Local detector module.
+
+Tests cover:
+- Color LUT construction
+- Per-row hostile pixel counts
+- Counting tagged entries and spike levels
+- LocalWatcher window bookkeeping and polling
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from argus_overview.core.alert_detector import AlertLevel
+from argus_overview.core.local_detector import (
+    DEFAULT_HOSTILE_COLORS,
+    LUT_SIZE,
+    LocalDetector,
+    LocalWatcher,
+    build_color_lut,
+)
+
+BACKGROUND = (20, 20, 25)
+RED = (191, 0, 0)
+ORANGE = (255, 89, 0)
+BLUE = (0, 100, 200)
+
+
+def make_local(tags):
+    """Create a Local list image with 10x10 tags at the given (y, color)"""
+    img = Image.new("RGB", (200, 400), BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    for y, color in tags:
+        draw.rectangle([5, y, 14, y + 9], fill=color)
+    return img
+
+
+@pytest.fixture
+def detector():
+    """Create a detector with default colors"""
+    return LocalDetector()
+
+
+class TestColorLut:
+    """Tests for build_color_lut"""
+
+    def test_lut_size(self):
+        """LUT covers 5-bit quantized RGB (32k entries)"""
+        lut = build_color_lut(DEFAULT_HOSTILE_COLORS, 48)
+
+        assert lut.shape == (LUT_SIZE,)
+        assert LUT_SIZE == 32768
+        assert lut.dtype == np.uint8
+
+    def test_reference_color_is_hostile(self):
+        """The bin holding a reference color is marked hostile"""
+        lut = build_color_lut([RED], 20)
+        r, g, b = RED
+
+        assert lut[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)] == 1
+
+    def test_distant_color_not_hostile(self):
+        """Colors far from the references are not marked"""
+        lut = build_color_lut([RED], 20)
+        r, g, b = BLUE
+
+        assert lut[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)] == 0
+
+    def test_no_colors_empty_lut(self):
+        """An empty color list produces an all-zero LUT"""
+        assert build_color_lut([], 48).sum() == 0
+
+
+class TestRowCounts:
+    """Tests for per-row counting"""
+
+    def test_row_counts_per_row(self, detector):
+        """Each row of a tag has 10 hostile pixels"""
+        counts = detector.row_counts(make_local([(50, RED)]))
+
+        assert counts.shape == (400,)
+        assert counts[50:60].tolist() == [10] * 10
+        assert counts[:50].sum() == 0
+        assert counts[60:].sum() == 0
+
+    def test_non_rgb_converted(self, detector):
+        """RGBA captures are handled"""
+        counts = detector.row_counts(make_local([(50, ORANGE)]).convert("RGBA"))
+
+        assert counts[55] == 10
+
+    def test_count_hostiles_runs(self, detector):
+        """Each contiguous run of hostile rows is one entry"""
+        img = make_local([(0, RED), (40, ORANGE), (80, BLUE), (120, RED)])
+
+        assert detector.count_hostiles(detector.row_counts(img)) == 3
+
+    def test_count_hostiles_min_row_pixels(self):
+        """Rows with fewer hostile pixels than min_row_pixels are ignored"""
+        detector = LocalDetector(min_row_pixels=11)
+
+        assert detector.count_hostiles(detector.row_counts(make_local([(50, RED)]))) == 0
+
+
+class TestAnalyze:
+    """Tests for analyze() and alert levels"""
+
+    def test_first_capture_is_baseline(self, detector):
+        """Hostiles already in Local on the first capture don't alert"""
+        report = detector.analyze("0x1", make_local([(0, RED), (40, RED), (80, ORANGE)]))
+
+        assert report.hostile_count == 3
+        assert report.previous_count == 3
+        assert report.level is None
+
+    def test_first_hostile_is_medium(self, detector):
+        """A single new hostile raises MEDIUM"""
+        detector.analyze("0x1", make_local([]))
+
+        report = detector.analyze("0x1", make_local([(50, RED)]))
+
+        assert report.hostile_count == 1
+        assert report.previous_count == 0
+        assert report.delta == 1
+        assert report.level == AlertLevel.MEDIUM
+
+    def test_spike_is_high(self, detector):
+        """Several new hostiles at once raise HIGH"""
+        detector.analyze("0x1", make_local([]))
+
+        report = detector.analyze("0x1", make_local([(0, RED), (40, RED), (80, ORANGE)]))
+
+        assert report.level == AlertLevel.HIGH
+
+    def test_unchanged_count_no_alert(self, detector):
+        """Same hostiles on the next capture raise nothing"""
+        img = make_local([(50, RED)])
+        detector.analyze("0x1", img)
+
+        report = detector.analyze("0x1", img)
+
+        assert report.delta == 0
+        assert report.level is None
+
+    def test_decrease_no_alert(self, detector):
+        """Hostiles leaving Local raise nothing"""
+        detector.analyze("0x1", make_local([(0, RED), (40, RED)]))
+
+        report = detector.analyze("0x1", make_local([]))
+
+        assert report.delta == -2
+        assert report.level is None
+
+    def test_counts_tracked_per_window(self, detector):
+        """Previous counts are per window"""
+        detector.analyze("0x1", make_local([]))
+        detector.analyze("0x2", make_local([(0, RED), (40, RED)]))
+
+        report = detector.analyze("0x1", make_local([(50, RED)]))
+
+        assert report.previous_count == 0
+        assert report.level == AlertLevel.MEDIUM
+
+    def test_clear_history(self, detector):
+        """Clearing history resets previous counts"""
+        detector.analyze("0x1", make_local([(50, RED)]))
+        detector.analyze("0x2", make_local([(50, RED)]))
+
+        detector.clear_history("0x1")
+        assert "0x1" not in detector.previous_counts
+        assert "0x2" in detector.previous_counts
+
+        detector.clear_history()
+        assert detector.previous_counts == {}
+
+
+class TestLocalWatcher:
+    """Tests for LocalWatcher"""
+
+    @pytest.fixture
+    def watcher(self):
+        """Watcher with a mocked region capture"""
+        capture = MagicMock(return_value=make_local([(50, RED)]))
+        return LocalWatcher(capture, (10, 20, 200, 400), interval_ms=100)
+
+    def test_init(self, watcher):
+        """Watcher starts stopped with no windows"""
+        assert watcher.running is False
+        assert watcher.watched_windows() == []
+        assert watcher.region == (10, 20, 200, 400)
+
+    def test_interval_clamped(self):
+        """Intervals below 50ms are clamped"""
+        watcher = LocalWatcher(MagicMock(), (0, 0, 1, 1), interval_ms=1)
+
+        assert watcher.interval_ms == 50
+
+    def test_watch_unwatch(self, watcher):
+        """Windows are added once and removed with their history"""
+        watcher.watch("0x1")
+        watcher.watch("0x1")
+        watcher.detector.previous_counts["0x1"] = 3
+
+        assert watcher.watched_windows() == ["0x1"]
+
+        watcher.unwatch("0x1")
+        assert watcher.watched_windows() == []
+        assert "0x1" not in watcher.detector.previous_counts
+
+    def test_poll_once_emits_report(self, watcher):
+        """Polling captures the region and emits reports (the first one is the baseline)"""
+        reports = MagicMock()
+        changes = MagicMock()
+        watcher.report_ready.connect(reports)
+        watcher.hostile_count_changed.connect(changes)
+        watcher.watch("0x1")
+
+        watcher.poll_once()
+
+        watcher.capture_region.assert_called_once_with("0x1", (10, 20, 200, 400))
+        window_id, report = reports.call_args[0]
+        assert window_id == "0x1"
+        assert report.level is None
+        changes.assert_called_once_with("0x1", 1)
+
+    def test_poll_once_unchanged_skips_count_signal(self, watcher):
+        """hostile_count_changed only fires on a change"""
+        changes = MagicMock()
+        watcher.hostile_count_changed.connect(changes)
+        watcher.watch("0x1")
+
+        watcher.poll_once()
+        watcher.poll_once()
+
+        changes.assert_called_once()
+
+    def test_poll_once_skips_failed_capture(self, watcher):
+        """A failed capture emits nothing"""
+        reports = MagicMock()
+        watcher.report_ready.connect(reports)
+        watcher.capture_region.return_value = None
+        watcher.watch("0x1")
+
+        watcher.poll_once()
+
+        reports.assert_not_called()
+
+    def test_poll_once_handles_errors(self, watcher):
+        """Capture errors are logged, not raised"""
+        watcher.capture_region.side_effect = RuntimeError("boom")
+        watcher.watch("0x1")
+
+        watcher.poll_once()
+
+    def test_start_stop(self, watcher):
+        """Watcher thread starts and stops"""
+        watcher.start()
+        assert watcher.running is True
+
+        watcher.stop()
+        assert watcher.running is False
+        assert watcher._thread is None
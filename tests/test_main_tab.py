@@ -5,7 +5,9 @@ Tests FlowLayout, DraggableTile, ArrangementGrid, GridApplier, WindowPreviewWidg
 
 from unittest.mock import MagicMock, patch
 
-from PySide6.QtCore import QRect, Qt
+from PySide6.QtCore import QRect, QSize, Qt
+
+from argus_overview.core.window_ops import BulkWindowOps
 
 # =============================================================================
 # pil_to_qimage Function Tests
@@ -78,6 +80,33 @@ class TestPilToQimage:
         assert result.width() == 10
         assert result.height() == 10
 
+    def test_pil_to_qimage_rgb_native_format(self):
+        """RGB images come back as owned, opaque Format_RGB32"""
+        from PIL import Image
+        from PySide6.QtGui import QImage
+
+        from argus_overview.ui.main_tab import pil_to_qimage
+
+        img = Image.new("RGB", (10, 10), color=(255, 0, 10))
+        result = pil_to_qimage(img)
+        del img
+
+        assert result.format() == QImage.Format.Format_RGB32
+        assert result.pixel(3, 3) == 0xFFFF000A
+
+    def test_pil_to_qimage_rgba_premultiplied(self):
+        """RGBA images are packed premultiplied in one pass"""
+        from PIL import Image
+        from PySide6.QtGui import QImage
+
+        from argus_overview.ui.main_tab import pil_to_qimage
+
+        img = Image.new("RGBA", (4, 4), color=(255, 0, 0, 128))
+        result = pil_to_qimage(img)
+
+        assert result.format() == QImage.Format.Format_ARGB32_Premultiplied
+        assert result.pixelColor(0, 0).alpha() == 128
+
 
 # =============================================================================
 # FlowLayout Tests
@@ -93,6 +122,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -107,6 +137,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
 
             mock_item = MagicMock()
@@ -120,6 +151,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = [MagicMock(), MagicMock()]
 
             assert layout.count() == 2
@@ -130,6 +162,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             mock_item = MagicMock()
             layout._item_list = [mock_item]
 
@@ -141,6 +174,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
 
             assert layout.itemAt(0) is None
@@ -152,6 +186,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             mock_item = MagicMock()
             layout._item_list = [mock_item]
 
@@ -166,6 +201,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
 
             assert layout.takeAt(0) is None
@@ -176,6 +212,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
 
             assert layout.expandingDirections() == Qt.Orientation(0)
 
@@ -185,6 +222,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
 
             assert layout.hasHeightForWidth() is True
 
@@ -194,6 +232,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -208,6 +247,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -224,6 +264,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -241,6 +282,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
 
@@ -256,6 +298,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._margin = 10
 
             mock_item = MagicMock()
@@ -272,6 +315,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -288,6 +332,7 @@ class TestFlowLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._margin = 10
             layout._spacing = 10
 
@@ -572,16 +617,22 @@ class TestWindowPreviewWidget:
 
     def test_set_focused_false(self):
         """Test set_focused to False"""
+        from datetime import datetime
+
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.is_focused = True
+            widget.last_activity = datetime.now()
             widget.update = MagicMock()
+            widget.animation_clock = MagicMock()
 
             widget.set_focused(False)
 
             assert widget.is_focused is False
+            # Just unfocused - "recent" for a few seconds, then the clock repaints it idle
+            widget.animation_clock.schedule_repaint.assert_called_once()
 
     def test_mark_activity(self):
         """Test mark_activity method"""
@@ -592,13 +643,19 @@ class TestWindowPreviewWidget:
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.last_activity = datetime.now() - timedelta(minutes=5)
+            widget.is_focused = False
             widget.update = MagicMock()
+            widget.animation_clock = MagicMock()
 
             old_time = widget.last_activity
             widget.mark_activity()
 
             assert widget.last_activity > old_time
             widget.update.assert_called_once()
+            # The clock repaints the indicator once it turns idle
+            item, delay = widget.animation_clock.schedule_repaint.call_args[0]
+            assert item is widget
+            assert 4.5 < delay <= 5
 
     def test_get_activity_state_focused(self):
         """Test get_activity_state when focused"""
@@ -655,18 +712,17 @@ class TestWindowPreviewWidget:
             widget.window_id = "12345"
             widget.alert_level = None
             widget.alert_flash_counter = 0
-            widget.flash_timer = MagicMock()
-            widget.flash_timer.isActive.return_value = False
+            widget.animation_clock = MagicMock()
             widget.logger = MagicMock()
 
             widget.set_alert(AlertLevel.HIGH)
 
             assert widget.alert_level == AlertLevel.HIGH
             assert widget.alert_flash_counter == 30
-            widget.flash_timer.start.assert_called_once_with(100)
+            widget.animation_clock.start_flash.assert_called_once_with(widget)
 
     def test_set_alert_timer_already_active(self):
-        """Test set_alert when timer already running"""
+        """Test set_alert while already flashing restarts the countdown"""
         from argus_overview.core.alert_detector import AlertLevel
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
@@ -675,48 +731,82 @@ class TestWindowPreviewWidget:
             widget.window_id = "12345"
             widget.alert_level = AlertLevel.LOW
             widget.alert_flash_counter = 10
-            widget.flash_timer = MagicMock()
-            widget.flash_timer.isActive.return_value = True
+            widget.animation_clock = MagicMock()
             widget.logger = MagicMock()
 
             widget.set_alert(AlertLevel.HIGH)
 
             assert widget.alert_level == AlertLevel.HIGH
             assert widget.alert_flash_counter == 30
-            widget.flash_timer.start.assert_not_called()
+            widget.animation_clock.start_flash.assert_called_once_with(widget)  # Idempotent
 
     def test_flash_tick_decrement(self):
-        """Test _flash_tick decrements counter"""
+        """Test flash_tick decrements counter"""
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.alert_flash_counter = 10
             widget.alert_level = MagicMock()
-            widget.flash_timer = MagicMock()
             widget.update = MagicMock()
 
-            widget._flash_tick()
+            assert widget.flash_tick() is True
 
             assert widget.alert_flash_counter == 9
-            widget.update.assert_called_once()
+            widget.update.assert_not_called()  # The clock batches repaints
 
     def test_flash_tick_stops_at_zero(self):
-        """Test _flash_tick stops timer at zero"""
+        """Test flash_tick ends the flash at zero"""
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.alert_flash_counter = 1
             widget.alert_level = MagicMock()
-            widget.flash_timer = MagicMock()
             widget.update = MagicMock()
 
-            widget._flash_tick()
+            assert widget.flash_tick() is False
 
             assert widget.alert_flash_counter == 0
             assert widget.alert_level is None
-            widget.flash_timer.stop.assert_called_once()
+            assert widget.alert_regions == []
+
+    def test_set_alert_with_regions(self):
+        """Test set_alert stores change regions for highlighting"""
+        from argus_overview.core.alert_detector import AlertLevel
+        from argus_overview.ui.main_tab import WindowPreviewWidget
+
+        with patch.object(WindowPreviewWidget, "__init__", return_value=None):
+            widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
+            widget.window_id = "12345"
+            widget.animation_clock = MagicMock()
+            widget.logger = MagicMock()
+
+            widget.set_alert(AlertLevel.MEDIUM, [(0.1, 0.2, 0.3, 0.4)])
+            assert widget.alert_regions == [(0.1, 0.2, 0.3, 0.4)]
+
+            widget.set_alert(AlertLevel.HIGH)
+            assert widget.alert_regions == []
+
+    def test_displayed_image_rect_centers_pixmap(self):
+        """Test the highlight rect follows the centered, scaled pixmap"""
+        from PySide6.QtCore import QRect, QSize
+
+        from argus_overview.ui.main_tab import WindowPreviewWidget
+
+        with patch.object(WindowPreviewWidget, "__init__", return_value=None):
+            widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
+            widget.image_label = MagicMock()
+            widget.image_label.geometry.return_value = QRect(0, 20, 200, 100)
+            pixmap = MagicMock()
+            pixmap.isNull.return_value = False
+            pixmap.size.return_value = QSize(160, 90)
+            widget.image_label.pixmap.return_value = pixmap
+
+            assert widget._displayed_image_rect() == QRect(20, 25, 160, 90)
+
+            widget.image_label.pixmap.return_value = None
+            assert widget._displayed_image_rect() == QRect(0, 20, 200, 100)
 
     def test_update_session_timer_disabled(self):
         """Test _update_session_timer when disabled"""
@@ -1051,6 +1141,14 @@ class TestWindowManager:
 
         with patch.object(WindowManager, "__init__", return_value=None):
             manager = WindowManager.__new__(WindowManager)
+            manager.local_watcher = None
+            manager.alert_probe = None
+            manager.alert_scheduler = None
+            manager.renderer = "widgets"
+            manager._frame_pool = []
+            manager.focused_window_id = None
+            manager.frames_created = 0
+            manager.frames_reused = 0
             manager.preview_frames = {}
             manager.logger = MagicMock()
             manager.capture_system = MagicMock()
@@ -1086,10 +1184,15 @@ class TestWindowManager:
 
         with patch.object(WindowManager, "__init__", return_value=None):
             manager = WindowManager.__new__(WindowManager)
+            manager.local_watcher = None
+            manager.alert_probe = None
+            manager.alert_scheduler = None
             mock_frame = MagicMock()
             manager.preview_frames = {"12345": mock_frame}
             manager.logger = MagicMock()
             manager.alert_detector = MagicMock()
+            manager.alert_bus = MagicMock()
+            manager.capture_system = MagicMock()
 
             manager.remove_window("12345")
 
@@ -1424,6 +1527,7 @@ class TestWindowPreviewWidgetAdditional:
             widget.window_id = "12345"
             widget.logger = MagicMock()
             widget.image_label = MagicMock()
+            widget.is_minimized = False
 
             img = Image.new("RGB", (100, 100), (255, 0, 0))
 
@@ -1445,6 +1549,7 @@ class TestWindowPreviewWidgetAdditional:
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.window_id = "12345"
             widget.logger = MagicMock()
+            widget.is_minimized = False
 
             img = Image.new("RGB", (100, 100), (255, 0, 0))
 
@@ -1821,6 +1926,7 @@ class TestWindowManagerCaptureCycle:
             manager = WindowManager.__new__(WindowManager)
             manager.logger = MagicMock()
             manager.capture_system = MagicMock()
+            manager.alert_scheduler = None
             manager.capture_system.capture_window_async.return_value = "req-1"
             manager.pending_requests = {}
             manager._pending_lock = threading.Lock()
@@ -1844,6 +1950,7 @@ class TestWindowManagerCaptureCycle:
             manager = WindowManager.__new__(WindowManager)
             manager.logger = MagicMock()
             manager.capture_system = MagicMock()
+            manager.alert_scheduler = None
             manager.pending_requests = {}
             manager._process_capture_results = MagicMock()
 
@@ -1863,6 +1970,7 @@ class TestWindowManagerCaptureCycle:
             manager = WindowManager.__new__(WindowManager)
             manager.logger = MagicMock()
             manager.capture_system = MagicMock()
+            manager.alert_scheduler = None
             manager.capture_system.capture_window_async.side_effect = Exception("Capture failed")
             manager.pending_requests = {}
             manager._process_capture_results = MagicMock()
@@ -1898,6 +2006,8 @@ class TestWindowManagerProcessResults:
 
             mock_image = Image.new("RGB", (100, 100))
             manager.capture_system = MagicMock()
+            manager.result_budget_ms = 4.0
+            manager.reset_drain_stats()
             manager.capture_system.get_result.side_effect = [("req-1", "0x123", mock_image), None]
             manager.alert_detector = MagicMock()
             manager.alert_detector.analyze_frame.return_value = None
@@ -1916,6 +2026,8 @@ class TestWindowManagerProcessResults:
             manager.pending_requests = {}
             manager.preview_frames = {}
             manager.capture_system = MagicMock()
+            manager.result_budget_ms = 4.0
+            manager.reset_drain_stats()
             manager.capture_system.get_result.return_value = None
 
             manager._process_capture_results()  # Should not raise
@@ -1937,6 +2049,8 @@ class TestWindowManagerProcessResults:
 
             mock_image = Image.new("RGB", (100, 100))
             manager.capture_system = MagicMock()
+            manager.result_budget_ms = 4.0
+            manager.reset_drain_stats()
             manager.capture_system.get_result.side_effect = [("req-1", "0x123", mock_image), None]
             manager.alert_detector = MagicMock()
             manager.alert_detector.analyze_frame.return_value = AlertLevel.HIGH
@@ -2935,6 +3049,7 @@ class TestFlowLayoutDoLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -2956,6 +3071,7 @@ class TestFlowLayoutDoLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -2980,6 +3096,7 @@ class TestFlowLayoutDoLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -3004,6 +3121,7 @@ class TestFlowLayoutDoLayout:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._spacing = 10
 
             # Call with empty row_items - should return early
@@ -3456,16 +3574,17 @@ class TestGridApplierTimeout:
 
         with patch.object(GridApplier, "__init__", return_value=None):
             applier = GridApplier.__new__(GridApplier)
+            applier.logger = MagicMock()
 
             with patch("subprocess.run") as mock_run:
                 # First call raises timeout, second succeeds
                 mock_run.side_effect = [
                     subprocess.TimeoutExpired("xdotool", 2),
-                    MagicMock(),  # Fallback windowmove
-                    MagicMock(),  # windowsize with sync
+                    MagicMock(returncode=0),  # Fallback windowmove
+                    MagicMock(returncode=0),  # windowsize with sync
                 ]
 
-                applier._move_window("12345", 100, 100, 800, 600)
+                assert applier._move_window("12345", 100, 100, 800, 600) is True
 
                 # Should have made 3 calls: timeout + fallback + size
                 assert mock_run.call_count >= 2
@@ -3478,16 +3597,17 @@ class TestGridApplierTimeout:
 
         with patch.object(GridApplier, "__init__", return_value=None):
             applier = GridApplier.__new__(GridApplier)
+            applier.logger = MagicMock()
 
             with patch("subprocess.run") as mock_run:
                 # Move succeeds, size times out, fallback succeeds
                 mock_run.side_effect = [
-                    MagicMock(),  # windowmove with sync
+                    MagicMock(returncode=0),  # windowmove with sync
                     subprocess.TimeoutExpired("xdotool", 2),
-                    MagicMock(),  # Fallback windowsize
+                    MagicMock(returncode=0),  # Fallback windowsize
                 ]
 
-                applier._move_window("12345", 100, 100, 800, 600)
+                assert applier._move_window("12345", 100, 100, 800, 600) is True
 
                 assert mock_run.call_count >= 2
 
@@ -3499,17 +3619,32 @@ class TestGridApplierTimeout:
 
         with patch.object(GridApplier, "__init__", return_value=None):
             applier = GridApplier.__new__(GridApplier)
+            applier.logger = MagicMock()
 
             with patch("subprocess.run") as mock_run:
                 mock_run.side_effect = [
                     subprocess.TimeoutExpired("xdotool", 2),
-                    MagicMock(),
+                    MagicMock(returncode=0),
                 ]
 
-                applier._move_window_position_only("12345", 100, 100)
+                assert applier._move_window_position_only("12345", 100, 100) is True
 
                 assert mock_run.call_count == 2
 
+    def test_move_window_xdotool_failure(self):
+        """A non-zero xdotool exit is a failed move, and the resize is not attempted"""
+        from argus_overview.ui.main_tab import GridApplier
+
+        with patch.object(GridApplier, "__init__", return_value=None):
+            applier = GridApplier.__new__(GridApplier)
+            applier.logger = MagicMock()
+
+            with patch("subprocess.run", return_value=MagicMock(returncode=1)) as mock_run:
+                assert applier._move_window("0x123", 100, 100, 800, 600) is False
+                assert applier._move_window_position_only("0x123", 100, 100) is False
+
+            assert mock_run.call_count == 2
+
 
 # =============================================================================
 # GridApplier Screen Geometry Tests
@@ -3830,8 +3965,7 @@ class TestWindowPreviewWidgetMethods:
             widget.window_id = "12345"
             widget.alert_level = None
             widget.alert_flash_counter = 0
-            widget.flash_timer = MagicMock()
-            widget.flash_timer.isActive.return_value = False
+            widget.animation_clock = MagicMock()
 
             # Create mock AlertLevel
             mock_level = MagicMock()
@@ -3839,7 +3973,7 @@ class TestWindowPreviewWidgetMethods:
 
             assert widget.alert_level == mock_level
             assert widget.alert_flash_counter == 30
-            widget.flash_timer.start.assert_called_with(100)
+            widget.animation_clock.start_flash.assert_called_once_with(widget)
 
     def test_set_alert_timer_already_active(self):
         """Test set_alert doesn't restart active timer"""
@@ -3851,47 +3985,43 @@ class TestWindowPreviewWidgetMethods:
             widget.window_id = "12345"
             widget.alert_level = None
             widget.alert_flash_counter = 0
-            widget.flash_timer = MagicMock()
-            widget.flash_timer.isActive.return_value = True
+            widget.animation_clock = MagicMock()
 
             mock_level = MagicMock()
             widget.set_alert(mock_level)
 
             # Timer should not be started again
-            widget.flash_timer.start.assert_not_called()
+            widget.animation_clock.start_flash.assert_called_once_with(widget)  # Idempotent
 
     def test_flash_tick_decrements_counter(self):
-        """Test _flash_tick decrements counter"""
+        """Test flash_tick decrements counter"""
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.alert_flash_counter = 10
             widget.alert_level = MagicMock()
-            widget.flash_timer = MagicMock()
             widget.update = MagicMock()
 
-            widget._flash_tick()
+            assert widget.flash_tick() is True
 
             assert widget.alert_flash_counter == 9
-            widget.update.assert_called_once()
+            widget.update.assert_not_called()  # The clock batches repaints
 
     def test_flash_tick_stops_at_zero(self):
-        """Test _flash_tick stops timer at zero"""
+        """Test flash_tick ends the flash at zero"""
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.alert_flash_counter = 1
             widget.alert_level = MagicMock()
-            widget.flash_timer = MagicMock()
             widget.update = MagicMock()
 
-            widget._flash_tick()
+            assert widget.flash_tick() is False
 
             assert widget.alert_flash_counter == 0
             assert widget.alert_level is None
-            widget.flash_timer.stop.assert_called_once()
 
     def test_update_session_timer_not_shown(self):
         """Test _update_session_timer returns early if not shown"""
@@ -4342,15 +4472,18 @@ class TestMainTabMinimize:
             tab.capture_system = MagicMock()
             tab.capture_system.minimize_window.return_value = True
             tab._update_minimize_button_style = MagicMock()
+            tab.bulk_ops = BulkWindowOps()
 
             mock_result = MagicMock()
             mock_result.returncode = 0
             mock_result.stdout = "12345"
             with patch("subprocess.run", return_value=mock_result):
                 tab.minimize_inactive_windows()
+                assert tab.bulk_ops.wait()
 
             assert tab._windows_minimized is True
             tab.settings_manager.set.assert_called()
+            assert tab.capture_system.minimize_window.call_count == 2
 
     def test_minimize_inactive_windows_restore(self):
         """Test minimize_inactive_windows toggles to disabled"""
@@ -4367,10 +4500,14 @@ class TestMainTabMinimize:
             tab.settings_manager = MagicMock()
             tab.settings_manager.get.return_value = True  # Current state is on
             tab._update_minimize_button_style = MagicMock()
+            tab.capture_system = MagicMock()
+            tab.bulk_ops = BulkWindowOps()
 
             tab.minimize_inactive_windows()
+            assert tab.bulk_ops.wait()
 
             assert tab._windows_minimized is False
+            assert tab.capture_system.restore_window.call_count == 2
 
 
 # =============================================================================
@@ -4430,6 +4567,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 10
             layout._spacing = 10
@@ -4444,6 +4582,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
 
             mock_item = MagicMock()
@@ -4457,6 +4596,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = [MagicMock(), MagicMock(), MagicMock()]
 
             assert layout.count() == 3
@@ -4467,6 +4607,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             item1 = MagicMock()
             item2 = MagicMock()
             layout._item_list = [item1, item2]
@@ -4480,6 +4621,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = [MagicMock()]
 
             assert layout.itemAt(-1) is None
@@ -4491,6 +4633,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             item1 = MagicMock()
             item2 = MagicMock()
             layout._item_list = [item1, item2]
@@ -4506,6 +4649,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = [MagicMock()]
 
             assert layout.takeAt(-1) is None
@@ -4517,6 +4661,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
 
             result = layout.expandingDirections()
 
@@ -4529,6 +4674,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
 
             assert layout.hasHeightForWidth() is True
 
@@ -4894,15 +5040,14 @@ class TestWindowPreviewWidgetMethods2:
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.logger = MagicMock()
             widget.window_id = "12345"
-            widget.flash_timer = MagicMock()
-            widget.flash_timer.isActive.return_value = False
+            widget.animation_clock = MagicMock()
 
             mock_level = MagicMock()
             widget.set_alert(mock_level)
 
             assert widget.alert_level == mock_level
             assert widget.alert_flash_counter == 30
-            widget.flash_timer.start.assert_called_with(100)
+            widget.animation_clock.start_flash.assert_called_once_with(widget)
 
     def test_set_alert_timer_already_active(self):
         """Test set_alert when timer already active"""
@@ -4912,14 +5057,13 @@ class TestWindowPreviewWidgetMethods2:
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.logger = MagicMock()
             widget.window_id = "12345"
-            widget.flash_timer = MagicMock()
-            widget.flash_timer.isActive.return_value = True
+            widget.animation_clock = MagicMock()
 
             mock_level = MagicMock()
             widget.set_alert(mock_level)
 
             # Should not start timer again
-            widget.flash_timer.start.assert_not_called()
+            widget.animation_clock.start_flash.assert_called_once_with(widget)  # Idempotent
 
 
 # =============================================================================
@@ -4955,6 +5099,7 @@ class TestMainTabOneClickImport:
             tab.window_manager.preview_frames = {}
             tab.window_manager.add_window.return_value = MagicMock()
             tab.preview_layout = MagicMock()
+            tab.thumbnail_wall = None
             tab.status_label = MagicMock()
             tab.character_detected = MagicMock()
             tab._update_status = MagicMock()
@@ -5133,7 +5278,7 @@ class TestMainTabApplyLayout:
             tab.monitor_spin.value.return_value = 0
             tab.grid_applier = MagicMock()
             tab.grid_applier.get_screen_geometry.return_value = MagicMock()
-            tab.grid_applier.apply_arrangement.return_value = True
+            tab.layout_committer = MagicMock()
             tab.grid_rows_spin = MagicMock()
             tab.grid_rows_spin.value.return_value = 2
             tab.grid_cols_spin = MagicMock()
@@ -5152,8 +5297,26 @@ class TestMainTabApplyLayout:
 
             tab._apply_layout_to_windows()
 
-            tab.grid_applier.apply_arrangement.assert_called_once()
-            tab.status_label.setText.assert_called()
+            tab.layout_committer.run.assert_called_once_with(
+                "2x2 Grid", tab.grid_applier.build_transaction.return_value
+            )
+            tab.status_label.setText.assert_called_with("Applying 2x2 Grid layout...")
+            tab.layout_applied.emit.assert_not_called()
+
+    def test_layout_committed_success(self):
+        """A committed layout updates the status and emits layout_applied"""
+        from argus_overview.core.layout_transaction import LayoutResult
+        from argus_overview.ui.main_tab import MainTab
+
+        with patch.object(MainTab, "__init__", return_value=None):
+            tab = MainTab.__new__(MainTab)
+            tab.status_label = MagicMock()
+            tab.layout_applied = MagicMock()
+            tab.logger = MagicMock()
+
+            tab._on_layout_committed("2x2 Grid", LayoutResult(moved=3, unchanged=1))
+
+            tab.status_label.setText.assert_called_with("Applied 2x2 Grid layout to 4 windows")
             tab.layout_applied.emit.assert_called_with("2x2 Grid")
 
 
@@ -5163,38 +5326,35 @@ class TestMainTabApplyLayout:
 
 
 class TestWindowPreviewWidgetFlashTick:
-    """Tests for WindowPreviewWidget _flash_tick"""
+    """Tests for WindowPreviewWidget flash_tick"""
 
     def test_flash_tick_decrement(self):
-        """Test _flash_tick decrements counter"""
+        """Test flash_tick decrements counter"""
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.alert_flash_counter = 10
-            widget.flash_timer = MagicMock()
             widget.update = MagicMock()
 
-            widget._flash_tick()
+            assert widget.flash_tick() is True
 
             assert widget.alert_flash_counter == 9
-            widget.update.assert_called_once()
+            widget.update.assert_not_called()  # The clock batches repaints
 
     def test_flash_tick_stops_at_zero(self):
-        """Test _flash_tick stops timer at zero"""
+        """Test flash_tick ends the flash at zero"""
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.alert_flash_counter = 1
-            widget.flash_timer = MagicMock()
             widget.update = MagicMock()
 
-            widget._flash_tick()
+            assert widget.flash_tick() is False
 
             assert widget.alert_flash_counter == 0
             assert widget.alert_level is None
-            widget.flash_timer.stop.assert_called_once()
 
 
 class TestWindowPreviewWidgetSessionTimer:
@@ -5311,14 +5471,21 @@ class TestWindowPreviewWidgetFocus:
 
     def test_set_focused_false(self):
         """Test set_focused with False"""
+        from datetime import datetime
+
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.update = MagicMock()
+            widget.last_activity = datetime(2020, 1, 1)
+            widget.animation_clock = MagicMock()
 
             widget.set_focused(False)
 
+            # Long idle already - nothing left for the clock to repaint
+            widget.animation_clock.schedule_repaint.assert_not_called()
+
             assert widget.is_focused is False
             widget.update.assert_called_once()
 
@@ -5331,6 +5498,8 @@ class TestWindowPreviewWidgetFocus:
         with patch.object(WindowPreviewWidget, "__init__", return_value=None):
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.update = MagicMock()
+            widget.is_focused = False
+            widget.animation_clock = MagicMock()
             old_time = datetime(2020, 1, 1)
             widget.last_activity = old_time
 
@@ -5588,6 +5757,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             # Call real init manually
             layout._item_list = []
             layout._margin = 10
@@ -5603,6 +5773,7 @@ class TestFlowLayoutInit:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
             layout._margin = 20
             layout._spacing = 15
@@ -5620,6 +5791,7 @@ class TestFlowLayoutCount:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
 
             assert layout.count() == 0
@@ -5630,6 +5802,7 @@ class TestFlowLayoutCount:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = [MagicMock(), MagicMock(), MagicMock()]
 
             assert layout.count() == 3
@@ -5644,6 +5817,7 @@ class TestFlowLayoutItemAt:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             item1 = MagicMock()
             item2 = MagicMock()
             layout._item_list = [item1, item2]
@@ -5657,6 +5831,7 @@ class TestFlowLayoutItemAt:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = [MagicMock()]
 
             assert layout.itemAt(-1) is None
@@ -5672,6 +5847,7 @@ class TestFlowLayoutTakeAt:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             item1 = MagicMock()
             item2 = MagicMock()
             layout._item_list = [item1, item2]
@@ -5688,6 +5864,7 @@ class TestFlowLayoutTakeAt:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = [MagicMock()]
 
             assert layout.takeAt(-1) is None
@@ -5704,6 +5881,7 @@ class TestFlowLayoutAddItem:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._item_list = []
 
             item = MagicMock()
@@ -5722,6 +5900,7 @@ class TestFlowLayoutCenterRow:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._margin = 10
             layout._spacing = 10
 
@@ -5739,6 +5918,7 @@ class TestFlowLayoutCenterRow:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._margin = 10
             layout._spacing = 10
 
@@ -5952,6 +6132,9 @@ class TestWindowManagerAlertCallback:
 
         with patch.object(WindowManager, "__init__", return_value=None):
             wm = WindowManager.__new__(WindowManager)
+            wm.local_watcher = None
+            wm.alert_probe = None
+            wm.alert_scheduler = None
             wm.logger = MagicMock()
             wm.preview_frames = {}
 
@@ -5980,8 +6163,10 @@ class TestWindowManagerCaptureCycleException:
             wm._pending_lock = threading.Lock()
             wm.pending_requests = {}
             wm.capture_system = MagicMock()
+            wm.alert_scheduler = None
             wm.capture_system.capture_window_async.side_effect = Exception("Capture failed")
             wm._process_capture_results = MagicMock()
+            wm.skip_minimized = False
 
             mock_frame = MagicMock()
             mock_frame.isVisible.return_value = True
@@ -6035,6 +6220,7 @@ class TestWindowPreviewWidgetUpdateFrame:
             widget.current_pixmap = None
             widget.zoom_factor = 0.3
             widget.last_activity = datetime.now()
+            widget.is_minimized = False
 
             # Mock PIL Image
             mock_image = MagicMock()
@@ -6042,7 +6228,7 @@ class TestWindowPreviewWidgetUpdateFrame:
             mock_image.tobytes.return_value = b"\x00" * 100 * 75 * 4
             mock_image.mode = "RGBA"
 
-            with patch("argus_overview.ui.main_tab.QImage"):
+            with patch("argus_overview.ui.main_tab.pil_to_qimage"):
                 with patch("argus_overview.ui.main_tab.QPixmap.fromImage") as mock_pixmap:
                     mock_pixmap.return_value = MagicMock()
                     widget.update_frame(mock_image)
@@ -6057,6 +6243,7 @@ class TestWindowPreviewWidgetUpdateFrame:
             widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
             widget.image_label = MagicMock()
             widget.current_pixmap = MagicMock()
+            widget.is_minimized = False
 
             mock_image = MagicMock()
 
@@ -6088,6 +6275,14 @@ class TestWindowManagerAddWindow:
 
         with patch.object(WindowManager, "__init__", return_value=None):
             manager = WindowManager.__new__(WindowManager)
+            manager.local_watcher = None
+            manager.alert_probe = None
+            manager.alert_scheduler = None
+            manager.renderer = "widgets"
+            manager._frame_pool = []
+            manager.focused_window_id = None
+            manager.frames_created = 0
+            manager.frames_reused = 0
             manager.preview_frames = {}
             manager.capture_system = MagicMock()
             manager.alert_detector = MagicMock()
@@ -6111,15 +6306,22 @@ class TestWindowManagerRemoveWindow:
 
         with patch.object(WindowManager, "__init__", return_value=None):
             manager = WindowManager.__new__(WindowManager)
+            manager.local_watcher = None
+            manager.alert_probe = None
+            manager.alert_scheduler = None
             mock_frame = MagicMock()
             manager.preview_frames = {"0x12345": mock_frame}
             manager.alert_detector = MagicMock()
+            manager.alert_bus = MagicMock()
             manager.logger = MagicMock()
+            manager.capture_system = MagicMock()
 
             manager.remove_window("0x12345")
 
             assert "0x12345" not in manager.preview_frames
             mock_frame.deleteLater.assert_called_once()
+            manager.alert_bus.clear.assert_called_once_with("0x12345")
+            manager.capture_system.breaker.forget.assert_called_once_with("0x12345")
 
     def test_remove_window_not_found(self):
         """Test remove_window with unknown window"""
@@ -6153,9 +6355,11 @@ class TestWindowManagerCaptureCycle:
             manager.pending_requests = {}
             manager._pending_lock = threading.Lock()
             manager.capture_system = MagicMock()
+            manager.alert_scheduler = None
             manager.capture_system.capture_window_async.return_value = "req1"
             manager.logger = MagicMock()
             manager._process_capture_results = MagicMock()
+            manager.skip_minimized = False
 
             manager._capture_cycle()
 
@@ -6179,6 +6383,8 @@ class TestWindowManagerProcessResults:
             manager.pending_requests = {"req1": "0x12345"}
             manager._pending_lock = threading.Lock()
             manager.capture_system = MagicMock()
+            manager.result_budget_ms = 4.0
+            manager.reset_drain_stats()
             manager.alert_detector = MagicMock()
             manager.logger = MagicMock()
 
@@ -6581,6 +6787,7 @@ class TestWindowPreviewWidgetRealInit:
 
     def test_real_init(self, qapp):
         """Test WindowPreviewWidget real initialization"""
+        from argus_overview.ui.animation_clock import AnimationClock
         from argus_overview.ui.main_tab import WindowPreviewWidget
 
         mock_capture = MagicMock()
@@ -6602,7 +6809,7 @@ class TestWindowPreviewWidgetRealInit:
         assert widget.image_label is not None
         assert widget.info_label is not None
         assert widget.timer_label is not None
-        assert widget.flash_timer is not None
+        assert widget.animation_clock is AnimationClock.get_instance()
         assert widget.opacity_effect is not None
 
     def test_real_init_with_settings_manager(self, qapp):
@@ -7506,10 +7713,12 @@ class TestMinimizeInactiveWindows:
             tab.status_label = MagicMock()
             tab._windows_minimized = False
             tab._update_minimize_button_style = MagicMock()
+            tab.bulk_ops = BulkWindowOps()
 
             with patch("argus_overview.ui.main_tab.subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(returncode=0, stdout="win1\n")
                 tab.minimize_inactive_windows()
+                assert tab.bulk_ops.wait()
                 tab.settings_manager.set.assert_called_with(
                     "performance.auto_minimize_inactive", True
                 )
@@ -7531,10 +7740,13 @@ class TestMinimizeInactiveWindows:
             tab.status_label = MagicMock()
             tab._windows_minimized = True
             tab._update_minimize_button_style = MagicMock()
+            tab.bulk_ops = BulkWindowOps()
 
             tab.minimize_inactive_windows()
             tab.settings_manager.set.assert_called_with("performance.auto_minimize_inactive", False)
             assert tab._windows_minimized is False
+            tab.status_label.setText.assert_called_with("Auto-minimize OFF (restoring...)")
+            assert tab.bulk_ops.wait()
             assert tab.capture_system.restore_window.call_count == 2
 
     def test_minimize_inactive_windows_exception(self):
@@ -7551,6 +7763,25 @@ class TestMinimizeInactiveWindows:
             tab.minimize_inactive_windows()
             tab.logger.error.assert_called()
 
+    def test_bulk_operation_finished_reports_counts(self):
+        """Finished auto-minimize/restore operations update the status with counts"""
+        from argus_overview.ui.main_tab import MainTab
+
+        with patch.object(MainTab, "__init__", return_value=None):
+            tab = MainTab.__new__(MainTab)
+            tab.logger = MagicMock()
+            tab.status_label = MagicMock()
+
+            with patch("argus_overview.ui.main_tab.WindowRegistry") as registry:
+                tab._on_bulk_operation_finished("auto_minimize", {"win1": True, "win2": False})
+                tab.status_label.setText.assert_called_with("Auto-minimize ON (1 minimized)")
+
+                tab._on_bulk_operation_finished("auto_restore", {"win1": True, "win2": True})
+                tab.status_label.setText.assert_called_with("Auto-minimize OFF (2 restored)")
+
+            # Map states changed; the next capture cycle re-reads them
+            assert registry.get_instance.return_value.invalidate.call_count == 2
+
 
 # =============================================================================
 # Update Minimize Button Style Tests
@@ -7736,6 +7967,7 @@ class TestAddWindowToPreview:
             mock_frame = MagicMock()
             tab.window_manager.add_window.return_value = mock_frame
             tab.preview_layout = MagicMock()
+            tab.thumbnail_wall = None
 
             result = tab._add_window_to_preview("0x123", "EVE - TestChar")
 
@@ -7756,6 +7988,7 @@ class TestAddWindowToPreview:
             mock_frame = MagicMock()
             tab.window_manager.add_window.return_value = mock_frame
             tab.preview_layout = MagicMock()
+            tab.thumbnail_wall = None
 
             tab._add_window_to_preview("0x123", "EVE - My Character")
 
@@ -7774,6 +8007,7 @@ class TestAddWindowToPreview:
             mock_frame = MagicMock()
             tab.window_manager.add_window.return_value = mock_frame
             tab.preview_layout = MagicMock()
+            tab.thumbnail_wall = None
 
             tab._add_window_to_preview("0x123", "EVE Online - Another Char")
 
@@ -7792,6 +8026,7 @@ class TestAddWindowToPreview:
             mock_frame = MagicMock()
             tab.window_manager.add_window.return_value = mock_frame
             tab.preview_layout = MagicMock()
+            tab.thumbnail_wall = None
 
             tab._add_window_to_preview("0x123", "EVE -")
 
@@ -7827,6 +8062,7 @@ class TestAddWindowToPreview:
             mock_frame = MagicMock()
             tab.window_manager.add_window.return_value = mock_frame
             tab.preview_layout = MagicMock()
+            tab.thumbnail_wall = None
 
             tab._add_window_to_preview("0x123", "EVE - SomeTitle")
 
@@ -8036,7 +8272,7 @@ class TestMainTabApplyLayoutScreenFallback:
             tab.monitor_spin.value.return_value = 0
             tab.grid_applier = MagicMock()
             tab.grid_applier.get_screen_geometry.return_value = None  # Trigger fallback
-            tab.grid_applier.apply_arrangement.return_value = True
+            tab.layout_committer = MagicMock()
             tab.grid_rows_spin = MagicMock(value=MagicMock(return_value=2))
             tab.grid_cols_spin = MagicMock(value=MagicMock(return_value=2))
             tab.spacing_spin = MagicMock(value=MagicMock(return_value=10))
@@ -8051,8 +8287,8 @@ class TestMainTabApplyLayoutScreenFallback:
 
             tab._apply_layout_to_windows()
 
-            # Verify apply_arrangement was called with fallback screen
-            call_args = tab.grid_applier.apply_arrangement.call_args
+            # Verify the transaction was built for the fallback screen
+            call_args = tab.grid_applier.build_transaction.call_args
             screen = call_args.kwargs.get("screen") or call_args[1].get("screen")
             assert screen.width == 1920
             assert screen.height == 1080
@@ -8062,7 +8298,7 @@ class TestMainTabApplyLayoutFailure:
     """Tests for MainTab _apply_layout failure warning"""
 
     def test_apply_layout_shows_warning_on_failure(self):
-        """Test _apply_layout shows warning when apply_arrangement fails"""
+        """Test _apply_layout shows warning when the layout can't be computed"""
         from argus_overview.ui.main_tab import MainTab
 
         with patch.object(MainTab, "__init__", return_value=None):
@@ -8076,7 +8312,8 @@ class TestMainTabApplyLayoutFailure:
             tab.monitor_spin.value.return_value = 0
             tab.grid_applier = MagicMock()
             tab.grid_applier.get_screen_geometry.return_value = MagicMock()
-            tab.grid_applier.apply_arrangement.return_value = False  # Trigger failure
+            tab.grid_applier.build_transaction.return_value = None  # Trigger failure
+            tab.layout_committer = MagicMock()
             tab.grid_rows_spin = MagicMock(value=MagicMock(return_value=2))
             tab.grid_cols_spin = MagicMock(value=MagicMock(return_value=2))
             tab.spacing_spin = MagicMock(value=MagicMock(return_value=10))
@@ -8092,6 +8329,23 @@ class TestMainTabApplyLayoutFailure:
                 args = mock_msgbox.warning.call_args[0]
                 assert "Error" in args[1]
                 assert "Failed to apply layout" in args[2]
+                tab.layout_committer.run.assert_not_called()
+
+    def test_layout_committed_with_failures_shows_warning(self):
+        """Test a commit with failed moves shows the warning"""
+        from argus_overview.core.layout_transaction import LayoutResult
+        from argus_overview.ui.main_tab import MainTab
+
+        with patch.object(MainTab, "__init__", return_value=None):
+            tab = MainTab.__new__(MainTab)
+            tab.logger = MagicMock()
+            tab.layout_applied = MagicMock()
+
+            with patch("argus_overview.ui.main_tab.QMessageBox") as mock_msgbox:
+                tab._on_layout_committed("Grid", LayoutResult(moved=1, failed=1))
+
+                mock_msgbox.warning.assert_called_once()
+                tab.layout_applied.emit.assert_not_called()
 
 
 class TestOneClickImportNoWindows:
@@ -8187,14 +8441,13 @@ class TestMinimizeInactiveXdotoolFails:
             tab.status_label = MagicMock()
             tab._update_minimize_button_style = MagicMock()
 
-            # Mock subprocess.run to fail
-            mock_result = MagicMock()
-            mock_result.returncode = 1  # Non-zero = failure
-            with patch("subprocess.run", return_value=mock_result):
-                tab.minimize_inactive_windows()
+            # Focus unknown (no watcher and xdotool failed)
+            tab.window_manager.get_focused_window.return_value = None
+            tab.minimize_inactive_windows()
 
-                # Should set status to "Auto-minimize ON" without count
-                tab.status_label.setText.assert_called_with("Auto-minimize ON")
+            # Should set status to "Auto-minimize ON" without count
+            tab.status_label.setText.assert_called_with("Auto-minimize ON")
+            tab.capture_system.minimize_window.assert_not_called()
 
 
 class TestKeyPressEventNonNumber:
@@ -8234,6 +8487,7 @@ class TestOneClickImportAllFail:
             tab.window_manager.preview_frames = {}  # Empty - no duplicates
             tab.window_manager.add_window.return_value = None  # Frame creation fails
             tab.preview_layout = MagicMock()
+            tab.thumbnail_wall = None
             tab.character_detected = MagicMock()
             tab.status_label = MagicMock()
             tab._update_status = MagicMock()
@@ -8251,8 +8505,8 @@ class TestOneClickImportAllFail:
 class TestProcessCaptureResultsAlert:
     """Tests for _process_capture_results alert detection"""
 
-    def test_process_capture_results_sets_alert(self):
-        """Test _process_capture_results sets alert level on frame"""
+    def test_process_capture_results_routes_alert_through_bus(self):
+        """Test _process_capture_results leaves alert delivery to the callback/bus"""
         import threading
 
         from argus_overview.core.alert_detector import AlertLevel
@@ -8264,6 +8518,9 @@ class TestProcessCaptureResultsAlert:
             wm._pending_lock = threading.Lock()
             wm.pending_requests = {"req1": "0x123"}
             wm.capture_system = MagicMock()
+            wm.result_budget_ms = 4.0
+            wm.reset_drain_stats()
+            wm.alert_scheduler = None
 
             # Mock capture result as tuple (request_id, window_id, image)
             mock_image = MagicMock()
@@ -8280,8 +8537,9 @@ class TestProcessCaptureResultsAlert:
 
             wm._process_capture_results()
 
-            # Should set alert on frame
-            mock_frame.set_alert.assert_called_with(AlertLevel.HIGH)
+            # Frame is analyzed, but the alert is applied later by the bus flush
+            wm.alert_detector.analyze_frame.assert_called_once_with("0x123", mock_image)
+            mock_frame.set_alert.assert_not_called()
 
     def test_process_capture_results_handles_exception(self):
         """Test _process_capture_results handles exception during processing"""
@@ -8295,6 +8553,8 @@ class TestProcessCaptureResultsAlert:
             wm._pending_lock = threading.Lock()
             wm.pending_requests = {"req1": "0x123"}
             wm.capture_system = MagicMock()
+            wm.result_budget_ms = 4.0
+            wm.reset_drain_stats()
 
             # Mock capture result as tuple
             mock_image = MagicMock()
@@ -8325,6 +8585,7 @@ class TestFlowLayoutRowWrap:
 
         with patch.object(FlowLayout, "__init__", return_value=None):
             layout = FlowLayout.__new__(FlowLayout)
+            layout._reset_caches()
             layout._margin = 10
             layout._spacing = 5
             layout._center_row = MagicMock()
@@ -8413,10 +8674,19 @@ class TestWindowManagerAddWindowAlertCallback:
 
         with patch.object(WindowManager, "__init__", return_value=None):
             wm = WindowManager.__new__(WindowManager)
+            wm.local_watcher = None
+            wm.alert_probe = None
+            wm.alert_scheduler = None
+            wm.renderer = "widgets"
+            wm._frame_pool = []
+            wm.focused_window_id = None
+            wm.frames_created = 0
+            wm.frames_reused = 0
             wm.logger = MagicMock()
             wm.preview_frames = {}
             wm.capture_system = MagicMock()
             wm.alert_detector = MagicMock()
+            wm.alert_bus = MagicMock()
             wm.settings_manager = MagicMock()
 
             # Mock WindowPreviewWidget creation
@@ -8432,9 +8702,9 @@ class TestWindowManagerAddWindowAlertCallback:
                 # Get the callback and test it
                 callback = call_args[0][1]
 
-                # Call the callback and verify it sets alert on frame
+                # Call the callback and verify it posts to the alert bus
                 callback(AlertLevel.HIGH)
-                mock_frame.set_alert.assert_called_with(AlertLevel.HIGH)
+                wm.alert_bus.post.assert_called_once_with("0x123", AlertLevel.HIGH)
 
     def test_alert_callback_ignores_removed_window(self):
         """Test alert callback does nothing if window was removed"""
@@ -8443,10 +8713,19 @@ class TestWindowManagerAddWindowAlertCallback:
 
         with patch.object(WindowManager, "__init__", return_value=None):
             wm = WindowManager.__new__(WindowManager)
+            wm.local_watcher = None
+            wm.alert_probe = None
+            wm.alert_scheduler = None
+            wm.renderer = "widgets"
+            wm._frame_pool = []
+            wm.focused_window_id = None
+            wm.frames_created = 0
+            wm.frames_reused = 0
             wm.logger = MagicMock()
             wm.preview_frames = {}
             wm.capture_system = MagicMock()
             wm.alert_detector = MagicMock()
+            wm.alert_bus = MagicMock()
             wm.settings_manager = MagicMock()
 
             mock_frame = MagicMock()
@@ -8464,3 +8743,1122 @@ class TestWindowManagerAddWindowAlertCallback:
                 # set_alert was called once during add_window test, but not after clear
                 # Actually, set_alert is only called by the callback, so:
                 mock_frame.set_alert.assert_not_called()
+                wm.alert_bus.post.assert_not_called()
+
+
+class TestWindowManagerAlertsReady:
+    """Tests for WindowManager._on_alerts_ready (alert bus batch delivery)"""
+
+    def test_applies_batch_to_frames(self):
+        """Each window in the batch gets its alert level"""
+        from argus_overview.core.alert_detector import AlertLevel
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+            frame1 = MagicMock()
+            frame2 = MagicMock()
+            wm.preview_frames = {"0x1": frame1, "0x2": frame2}
+            wm.alert_detector = MagicMock()
+            regions = {"0x1": [], "0x2": [(0.0, 0.5, 0.25, 0.5)]}
+            wm.alert_detector.get_change_regions.side_effect = regions.get
+
+            wm._on_alerts_ready({"0x1": AlertLevel.HIGH, "0x2": AlertLevel.MEDIUM})
+
+            frame1.set_alert.assert_called_once_with(AlertLevel.HIGH, [])
+            frame2.set_alert.assert_called_once_with(AlertLevel.MEDIUM, [(0.0, 0.5, 0.25, 0.5)])
+
+    def test_skips_removed_windows(self):
+        """Alerts for windows no longer in preview are ignored"""
+        from argus_overview.core.alert_detector import AlertLevel
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+            wm.preview_frames = {}
+
+            wm._on_alerts_ready({"0x1": AlertLevel.HIGH})  # Should not raise
+
+
+class TestWindowManagerLocalWatch:
+    """Tests for WindowManager Hostile-in-Local watcher wiring"""
+
+    def _make_wm(self, settings):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.settings_manager = MagicMock()
+        wm.settings_manager.get.side_effect = lambda key, default=None: settings.get(key, default)
+        wm.capture_system = MagicMock()
+        wm.preview_frames = {"0x1": MagicMock()}
+        wm.alert_bus = MagicMock()
+        wm.local_watcher = None
+        wm.alert_probe = None
+        wm.alert_scheduler = None
+        wm.renderer = "widgets"
+        wm._frame_pool = []
+        wm.focused_window_id = None
+        wm.frames_created = 0
+        wm.frames_reused = 0
+        return wm
+
+    def test_disabled_by_default(self):
+        """No watcher when alerts.local.enabled is off"""
+        wm = self._make_wm({})
+
+        wm.configure_local_watch()
+
+        assert wm.local_watcher is None
+
+    def test_invalid_region_skipped(self):
+        """Enabled with an empty region logs a warning and builds nothing"""
+        wm = self._make_wm({"alerts.local.enabled": True, "alerts.local.region": []})
+
+        wm.configure_local_watch()
+
+        assert wm.local_watcher is None
+        wm.logger.warning.assert_called_once()
+
+    def test_builds_and_starts_watcher(self):
+        """Enabled with a region builds a watcher over existing windows"""
+        wm = self._make_wm(
+            {
+                "alerts.local.enabled": True,
+                "alerts.local.region": [10, 20, 200, 400],
+                "alerts.local.interval_ms": 100,
+            }
+        )
+
+        with patch("argus_overview.ui.main_tab.LocalWatcher") as mock_watcher_cls:
+            wm.configure_local_watch()
+
+        watcher = mock_watcher_cls.return_value
+        args, kwargs = mock_watcher_cls.call_args
+        assert args[0] is wm.capture_system.capture_region_sync
+        assert args[1] == (10, 20, 200, 400)
+        assert kwargs["interval_ms"] == 100
+        watcher.report_ready.connect.assert_called_once_with(wm._on_local_report)
+        watcher.watch.assert_called_once_with("0x1")
+        watcher.start.assert_called_once()
+        assert wm.local_watcher is watcher
+
+    def test_reconfigure_stops_previous_watcher(self):
+        """Reconfiguring stops the running watcher first"""
+        wm = self._make_wm({})
+        old = MagicMock()
+        wm.local_watcher = old
+
+        wm.configure_local_watch()
+
+        old.stop.assert_called_once()
+        assert wm.local_watcher is None
+
+    def test_local_report_posts_to_bus(self):
+        """Reports with a level are posted to the alert bus"""
+        from argus_overview.core.alert_detector import AlertLevel
+
+        wm = self._make_wm({})
+        report = MagicMock(level=AlertLevel.HIGH, previous_count=0, hostile_count=3)
+
+        wm._on_local_report("0x1", report)
+
+        wm.alert_bus.post.assert_called_once_with("0x1", AlertLevel.HIGH)
+
+    def test_local_report_without_level_ignored(self):
+        """Reports without a level, or for removed windows, post nothing"""
+        from argus_overview.core.alert_detector import AlertLevel
+
+        wm = self._make_wm({})
+
+        wm._on_local_report("0x1", MagicMock(level=None))
+        wm._on_local_report("0x9", MagicMock(level=AlertLevel.HIGH))
+
+        wm.alert_bus.post.assert_not_called()
+
+    def test_add_and_remove_window_update_watch(self):
+        """Adding/removing previews watches/unwatches their Local list"""
+        wm = self._make_wm({})
+        wm.preview_frames = {}
+        wm.alert_detector = MagicMock()
+        wm.local_watcher = MagicMock()
+
+        with patch("argus_overview.ui.main_tab.WindowPreviewWidget"):
+            wm.add_window("0x5", "Pilot")
+        wm.local_watcher.watch.assert_called_once_with("0x5")
+
+        wm.remove_window("0x5")
+        wm.local_watcher.unwatch.assert_called_once_with("0x5")
+
+
+class TestWindowManagerAlertProbe:
+    """Tests for WindowManager sparse alert probe wiring"""
+
+    def _make_wm(self, settings):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.settings_manager = MagicMock()
+        wm.settings_manager.get.side_effect = lambda key, default=None: settings.get(key, default)
+        wm.alert_detector = MagicMock()
+        wm.capture_system = MagicMock()
+        wm.preview_frames = {"0x1": MagicMock()}
+        wm.alert_bus = MagicMock()
+        wm.local_watcher = None
+        wm.alert_probe = None
+        wm.alert_scheduler = None
+        wm.renderer = "widgets"
+        wm._frame_pool = []
+        wm.focused_window_id = None
+        wm.frames_created = 0
+        wm.frames_reused = 0
+        return wm
+
+    def test_disabled_builds_nothing(self):
+        """No probe when alerts.probe.enabled is off"""
+        wm = self._make_wm({"alerts.probe.enabled": False})
+
+        wm.configure_alert_probe()
+
+        assert wm.alert_probe is None
+
+    def test_builds_and_starts_probe(self):
+        """Enabled probe watches existing windows and starts"""
+        wm = self._make_wm({"alerts.probe.enabled": True, "alerts.probe.interval_ms": 200})
+
+        with patch("argus_overview.ui.main_tab.AlertProbe") as mock_probe_cls:
+            mock_probe_cls.return_value.start.return_value = True
+            wm.configure_alert_probe()
+
+        probe = mock_probe_cls.return_value
+        assert mock_probe_cls.call_args[1]["interval_ms"] == 200
+        probe.alert_detected.connect.assert_called_once_with(wm._on_probe_alert)
+        probe.watch.assert_called_once_with("0x1")
+        assert wm.alert_probe is probe
+
+    def test_failed_start_drops_probe(self):
+        """A probe that can't start (no X) is not kept"""
+        wm = self._make_wm({"alerts.probe.enabled": True})
+
+        with patch("argus_overview.ui.main_tab.AlertProbe") as mock_probe_cls:
+            mock_probe_cls.return_value.start.return_value = False
+            wm.configure_alert_probe()
+
+        assert wm.alert_probe is None
+
+    def test_reconfigure_stops_previous_probe(self):
+        """Reconfiguring stops the running probe first"""
+        wm = self._make_wm({"alerts.probe.enabled": False})
+        old = MagicMock()
+        wm.alert_probe = old
+
+        wm.configure_alert_probe()
+
+        old.stop.assert_called_once()
+        assert wm.alert_probe is None
+
+    def test_probe_alert_posts_to_bus(self):
+        """Probe alerts for previewed windows go to the alert bus"""
+        from argus_overview.core.alert_detector import AlertLevel
+
+        wm = self._make_wm({})
+
+        wm._on_probe_alert("0x1", AlertLevel.HIGH)
+        wm._on_probe_alert("0x9", AlertLevel.HIGH)
+
+        wm.alert_bus.post.assert_called_once_with("0x1", AlertLevel.HIGH)
+
+    def test_add_and_remove_window_update_probe(self):
+        """Adding/removing previews watches/unwatches the probe"""
+        wm = self._make_wm({})
+        wm.preview_frames = {}
+        wm.alert_probe = MagicMock()
+
+        with patch("argus_overview.ui.main_tab.WindowPreviewWidget"):
+            wm.add_window("0x5", "Pilot")
+        wm.alert_probe.watch.assert_called_once_with("0x5")
+
+        wm.remove_window("0x5")
+        wm.alert_probe.unwatch.assert_called_once_with("0x5")
+
+
+class TestWindowManagerAlertScheduler:
+    """Tests for WindowManager alert scheduler wiring"""
+
+    def _make_wm(self, settings):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.settings_manager = MagicMock()
+        wm.settings_manager.get.side_effect = lambda key, default=None: settings.get(key, default)
+        wm.alert_detector = MagicMock()
+        wm.capture_system = MagicMock()
+        wm.preview_frames = {"0x1": MagicMock()}
+        wm.alert_bus = MagicMock()
+        wm.local_watcher = None
+        wm.alert_probe = None
+        wm.alert_scheduler = None
+        wm.renderer = "widgets"
+        wm._frame_pool = []
+        wm.focused_window_id = None
+        wm.frames_created = 0
+        wm.frames_reused = 0
+        wm.result_budget_ms = 4.0
+        wm.reset_drain_stats()
+        return wm
+
+    def test_builds_and_starts_scheduler(self):
+        """Scheduler samples existing windows with the low-res capture"""
+        wm = self._make_wm(
+            {
+                "alerts.sampling.enabled": True,
+                "alerts.sampling.rate_hz": 2,
+                "alerts.sampling.budget_ms": 30,
+            }
+        )
+
+        with patch("argus_overview.ui.main_tab.AlertScheduler") as mock_scheduler_cls:
+            wm.configure_alert_scheduler()
+
+        scheduler = mock_scheduler_cls.return_value
+        args, kwargs = mock_scheduler_cls.call_args
+        assert args[0] is wm.capture_system.capture_sample_sync
+        assert kwargs["rate_hz"] == 2
+        assert kwargs["budget_ms"] == 30
+        scheduler.sample_ready.connect.assert_called_once_with(wm._on_alert_sample)
+        scheduler.watch.assert_called_once_with("0x1")
+        scheduler.start.assert_called_once()
+        assert wm.alert_scheduler is scheduler
+
+    @pytest.mark.parametrize("key", ["alerts.enabled", "alerts.sampling.enabled"])
+    def test_disabled_builds_nothing(self, key):
+        """No scheduler when alerts or independent sampling are off"""
+        wm = self._make_wm({key: False})
+        old = MagicMock()
+        wm.alert_scheduler = old
+
+        wm.configure_alert_scheduler()
+
+        old.stop.assert_called_once()
+        assert wm.alert_scheduler is None
+
+    def test_sampling_is_opt_in(self):
+        """Independent sampling stays off unless alerts.sampling.enabled is set"""
+        wm = self._make_wm({})
+
+        with patch("argus_overview.ui.main_tab.AlertScheduler") as mock_scheduler_cls:
+            wm.configure_alert_scheduler()
+
+        mock_scheduler_cls.assert_not_called()
+        assert wm.alert_scheduler is None
+
+    def test_low_power_mode_pauses_sampling(self):
+        """Low Power Mode keeps the sampler stopped even when sampling is enabled"""
+        wm = self._make_wm({"alerts.sampling.enabled": True, "performance.low_power_mode": True})
+
+        with patch("argus_overview.ui.main_tab.AlertScheduler") as mock_scheduler_cls:
+            wm.configure_alert_scheduler()
+
+        mock_scheduler_cls.assert_not_called()
+        assert wm.alert_scheduler is None
+
+    def test_alert_sample_analyzed(self):
+        """Samples for previewed windows are analyzed at the sample scale; others dropped"""
+        wm = self._make_wm({})
+        wm.alert_scheduler = MagicMock(scale=0.25)
+        image = MagicMock()
+
+        wm._on_alert_sample("0x1", image)
+        wm._on_alert_sample("0x9", image)
+
+        wm.alert_detector.analyze_frame.assert_called_once_with("0x1", image, 0.25)
+
+    def test_template_zone_matched_through_sampling(self):
+        """A template zone defined at full resolution fires from a 25% alert sample"""
+        import numpy as np
+        from PIL import Image as PILImage
+
+        from argus_overview.core.alert_detector import AlertDetector, AlertLevel
+        from argus_overview.core.alert_scheduler import AlertScheduler
+        from argus_overview.core.template_detector import TemplateMatcher, TemplateZone
+
+        icon = np.zeros((32, 32, 3), dtype=np.uint8)
+        icon[5:27, 5:27] = (220, 40, 40)
+        icon[11:21, 11:21] = (255, 255, 255)
+        rng = np.random.default_rng(42)
+        window = PILImage.fromarray(rng.integers(0, 60, (1080, 1920, 3), dtype=np.uint8))
+        window.paste(PILImage.fromarray(icon), (1000, 600))
+
+        matcher = TemplateMatcher()
+        matcher.add_template("scram", PILImage.fromarray(icon))
+        matcher.add_zone(TemplateZone(name="hud", region=(0.5, 0.5, 0.3, 0.3), templates=["scram"]))
+        detector = AlertDetector()
+        detector.set_template_matcher(matcher)
+        detector.analyze_frame("0x1", window.resize((480, 270)), 0.25)  # Learn the background
+        callback = MagicMock()
+        detector.register_callback("0x1", callback)
+
+        def capture_sample(_window_id, scale):
+            # What capture_sample_sync returns: the window box-averaged to `scale`
+            size = (round(window.width * scale), round(window.height * scale))
+            return window.resize(size, PILImage.Resampling.BOX)
+
+        wm = self._make_wm({})
+        wm.alert_detector = detector
+        wm.alert_scheduler = AlertScheduler(capture_sample, scale=0.25)
+        # No event loop here - receive the sample in place
+        wm.alert_scheduler.sample_ready.connect(
+            wm._on_alert_sample, Qt.ConnectionType.DirectConnection
+        )
+        wm.alert_scheduler.watch("0x1")
+
+        wm.alert_scheduler.tick()
+
+        callback.assert_called_once_with(AlertLevel.HIGH)
+
+    def test_preview_frames_not_analyzed_while_scheduled(self):
+        """Preview results skip analysis when the scheduler owns alert sampling"""
+        wm = self._make_wm({})
+        wm.alert_scheduler = MagicMock()
+        wm._pending_lock = MagicMock()
+        wm.pending_requests = {"req": "0x1"}
+        wm.capture_system.get_result.side_effect = [("req", "0x1", MagicMock()), None]
+
+        wm._process_capture_results()
+
+        wm.preview_frames["0x1"].update_frame.assert_called_once()
+        wm.alert_detector.analyze_frame.assert_not_called()
+
+    def test_add_and_remove_window_update_scheduler(self):
+        """Adding/removing previews watches/unwatches the scheduler"""
+        wm = self._make_wm({})
+        wm.preview_frames = {}
+        wm.alert_scheduler = MagicMock()
+
+        with patch("argus_overview.ui.main_tab.WindowPreviewWidget"):
+            wm.add_window("0x5", "Pilot")
+        wm.alert_scheduler.watch.assert_called_once_with("0x5")
+
+        wm.remove_window("0x5")
+        wm.alert_scheduler.unwatch.assert_called_once_with("0x5")
+
+
+class TestWorkerQImageFrames:
+    """Tests for display-only previews fed by worker-produced QImages"""
+
+    def _make_wm(self):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.alert_detector = MagicMock()
+        wm.capture_system = MagicMock()
+        wm.capture_system.capture_window_async.return_value = "req"
+        wm.pending_requests = {}
+        wm._pending_lock = MagicMock()
+        wm._process_capture_results = MagicMock()
+        wm.alert_scheduler = MagicMock()
+        wm.viewport_provider = None
+        wm.skip_minimized = False
+        wm.result_budget_ms = 4.0
+        wm.reset_drain_stats()
+        frame = MagicMock()
+        frame.isVisible.return_value = True
+        frame.preview_size.return_value = QSize(320, 180)
+        wm.preview_frames = {"0x1": frame}
+        return wm
+
+    def test_capture_cycle_requests_fitted_qimage(self):
+        """With the alert scheduler running, captures are fitted to the label"""
+        wm = self._make_wm()
+
+        wm._capture_cycle()
+
+        wm.capture_system.capture_window_async.assert_called_once_with(
+            "0x1", target_size=(320, 180)
+        )
+
+    def test_capture_cycle_pil_without_scheduler(self):
+        """Without the scheduler, previews capture PIL frames for analysis"""
+        wm = self._make_wm()
+        wm.alert_scheduler = None
+        wm.preview_frames["0x1"].zoom_factor = 0.3
+
+        wm._capture_cycle()
+
+        wm.capture_system.capture_window_async.assert_called_once_with("0x1", scale=0.3)
+
+    def test_qimage_results_not_analyzed(self):
+        """QImage results only update the preview"""
+        from PySide6.QtGui import QImage
+
+        from argus_overview.ui.main_tab import WindowManager
+
+        wm = self._make_wm()
+        wm.alert_scheduler = None
+        qimage = QImage(4, 4, QImage.Format.Format_RGB32)
+        wm.capture_system.get_result.side_effect = [("req", "0x1", qimage), None]
+
+        WindowManager._process_capture_results(wm)
+
+        wm.preview_frames["0x1"].update_frame.assert_called_once_with(qimage)
+        wm.alert_detector.analyze_frame.assert_not_called()
+
+    def test_update_frame_fitted_qimage_skips_scaling(self):
+        """A QImage already fitted to the label is uploaded without rescaling"""
+        from PySide6.QtGui import QImage
+
+        from argus_overview.ui.main_tab import WindowPreviewWidget
+
+        with patch.object(WindowPreviewWidget, "__init__", return_value=None):
+            widget = WindowPreviewWidget.__new__(WindowPreviewWidget)
+        widget.logger = MagicMock()
+        widget.image_label = MagicMock()
+        widget.image_label.size.return_value = QSize(320, 200)
+        widget.is_minimized = False
+        qimage = QImage(320, 180, QImage.Format.Format_RGB32)
+
+        with patch("argus_overview.ui.main_tab.pil_to_qimage") as mock_convert:
+            widget.update_frame(qimage)
+
+        mock_convert.assert_not_called()
+        pixmap = widget.image_label.setPixmap.call_args[0][0]
+        assert pixmap is widget.current_pixmap
+        assert pixmap.width() == 320
+
+
+class TestCanvasRenderer:
+    """Tests for the thumbnails.renderer = canvas wiring"""
+
+    def test_add_window_creates_tile(self):
+        """With the canvas renderer, add_window returns a ThumbnailTile"""
+        from argus_overview.ui.main_tab import WindowManager
+        from argus_overview.ui.thumbnail_wall import ThumbnailTile
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.local_watcher = None
+        wm.alert_probe = None
+        wm.alert_scheduler = None
+        wm.renderer = "canvas"
+        wm.frames_created = 0
+        wm.focused_window_id = None
+        wm.logger = MagicMock()
+        wm.preview_frames = {}
+        wm.capture_system = MagicMock()
+        wm.alert_detector = MagicMock()
+        wm.settings_manager = None
+
+        frame = wm.add_window("0x1", "Pilot")
+
+        assert isinstance(frame, ThumbnailTile)
+        assert wm.preview_frames["0x1"] is frame
+
+    def test_add_preview_frame_routes_to_wall(self):
+        """Frames go onto the wall instead of the flow layout"""
+        from argus_overview.ui.main_tab import MainTab
+
+        with patch.object(MainTab, "__init__", return_value=None):
+            tab = MainTab.__new__(MainTab)
+        tab.preview_layout = MagicMock()
+        tab.thumbnail_wall = MagicMock()
+        frame = MagicMock()
+
+        tab.add_preview_frame(frame)
+
+        tab.thumbnail_wall.add_tile.assert_called_once_with(frame)
+        tab.preview_layout.addWidget.assert_not_called()
+        frame.window_activated.connect.assert_called_once_with(tab._on_window_activated)
+
+
+class TestViewportCapture:
+    """Tests for skipping previews scrolled out of the viewport"""
+
+    def _make_wm(self, scheduler=True):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.capture_system = MagicMock()
+        wm.capture_system.capture_window_async.side_effect = lambda wid, **kw: f"req-{wid}"
+        wm.pending_requests = {}
+        wm._pending_lock = MagicMock()
+        wm._process_capture_results = MagicMock()
+        wm.alert_scheduler = MagicMock() if scheduler else None
+        wm._offscreen = set()
+        wm.captures_skipped_offscreen = 0
+        wm.skip_minimized = False
+        wm.viewport_provider = MagicMock(return_value=QRect(0, 0, 600, 400))
+        wm.preview_frames = {
+            "0x1": self._frame(QRect(15, 15, 280, 200)),
+            "0x2": self._frame(QRect(15, 900, 280, 200)),
+        }
+        return wm
+
+    def _frame(self, geometry):
+        frame = MagicMock()
+        frame.isVisible.return_value = True
+        frame.geometry.return_value = geometry
+        frame.preview_size.return_value = QSize(276, 178)
+        frame.zoom_factor = 0.3
+        return frame
+
+    def _requested(self, wm):
+        return [c[0][0] for c in wm.capture_system.capture_window_async.call_args_list]
+
+    def test_offscreen_previews_skipped(self):
+        """Only previews intersecting the viewport are captured"""
+        wm = self._make_wm()
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x1"]
+        assert wm._offscreen == {"0x2"}
+        assert wm.captures_skipped_offscreen == 1
+        wm.viewport_provider.assert_called_once()  # Once per cycle
+
+    def test_without_scheduler_everything_captured(self):
+        """Preview frames feed alert analysis then, so none are skipped"""
+        wm = self._make_wm(scheduler=False)
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x1", "0x2"]
+        wm.viewport_provider.assert_not_called()
+
+    def test_viewport_error_captures_all(self):
+        """An unavailable viewport falls back to capturing every preview"""
+        wm = self._make_wm()
+        wm.viewport_provider.side_effect = RuntimeError("deleted")
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x1", "0x2"]
+
+    def test_scroll_in_requests_immediate_capture(self):
+        """Previews scrolled into view are captured right away, once"""
+        wm = self._make_wm()
+        wm._capture_cycle()
+        wm.capture_system.capture_window_async.reset_mock()
+
+        wm.viewport_provider.return_value = QRect(0, 800, 600, 400)
+        wm.on_viewport_changed()
+        wm.on_viewport_changed()
+
+        wm.capture_system.capture_window_async.assert_called_once_with(
+            "0x2", target_size=(276, 178)
+        )
+        assert wm.pending_requests["req-0x2"] == "0x2"
+        assert wm._offscreen == set()
+
+    def test_scroll_drops_removed_previews(self):
+        """Removed previews are forgotten instead of captured"""
+        wm = self._make_wm()
+        wm._offscreen = {"0x9"}
+
+        wm.on_viewport_changed()
+
+        wm.capture_system.capture_window_async.assert_not_called()
+        assert wm._offscreen == set()
+
+    def test_preview_viewport_in_content_coordinates(self):
+        """The viewport rect is offset by the scroll position"""
+        from argus_overview.ui.main_tab import MainTab
+
+        with patch.object(MainTab, "__init__", return_value=None):
+            tab = MainTab.__new__(MainTab)
+        tab.preview_scroll = MagicMock()
+        tab.preview_scroll.widget.return_value.x.return_value = 0
+        tab.preview_scroll.widget.return_value.y.return_value = -350
+        tab.preview_scroll.viewport.return_value.width.return_value = 800
+        tab.preview_scroll.viewport.return_value.height.return_value = 500
+
+        assert tab._preview_viewport() == QRect(0, 350, 800, 500)
+
+
+class TestCaptureResultBudget:
+    """Tests for the time-budgeted capture result drain"""
+
+    def _make_wm(self, results, budget_ms=4.0):
+        import threading
+
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.alert_detector = MagicMock()
+        wm.alert_scheduler = MagicMock()
+        wm._pending_lock = threading.Lock()
+        wm.pending_requests = {}
+        wm.preview_frames = {"0x1": MagicMock()}
+        queue = [("req", "0x1", MagicMock()) for _ in range(results)]
+        wm.capture_system = MagicMock()
+        wm.capture_system.get_result.side_effect = lambda timeout: queue.pop(0) if queue else None
+        wm.capture_system.pending_results.side_effect = lambda: len(queue)
+        wm.result_budget_ms = budget_ms
+        wm.reset_drain_stats()
+        return wm
+
+    def test_drains_past_old_cap(self):
+        """Cheap results are all applied in one tick, not 10 at a time"""
+        wm = self._make_wm(30)
+
+        with patch("argus_overview.ui.main_tab.time.perf_counter", return_value=0.0):
+            wm._process_capture_results()
+
+        assert wm.preview_frames["0x1"].update_frame.call_count == 30
+        stats = wm.get_drain_stats()
+        assert stats["results_processed"] == 30
+        assert stats["budget_exhausted"] == 0
+        assert stats["results_deferred"] == 0
+
+    def test_budget_defers_rest(self):
+        """Once the budget is spent the remaining results wait for the next tick"""
+        import time
+
+        wm = self._make_wm(5, budget_ms=1.0)
+        wm.preview_frames["0x1"].update_frame.side_effect = lambda image: time.sleep(0.002)
+
+        wm._process_capture_results()
+
+        assert wm.preview_frames["0x1"].update_frame.call_count == 1
+        assert wm.drain_budget_exhausted == 1
+        assert wm.results_deferred == 4
+        assert wm.last_drain_ms >= 2.0
+
+        wm._process_capture_results()
+        assert wm.preview_frames["0x1"].update_frame.call_count == 2
+        assert wm.drain_cycles == 2
+
+    def test_set_result_budget_clamped(self):
+        """Budget stays within 1-50ms"""
+        wm = self._make_wm(0)
+
+        wm.set_result_budget(0)
+        assert wm.result_budget_ms == 1.0
+        wm.set_result_budget(500)
+        assert wm.result_budget_ms == 50.0
+
+
+class TestMinimizedCapture:
+    """Tests for skipping minimized and unresponsive clients in the capture cycle"""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        from argus_overview.core.window_registry import WindowRegistry
+
+        WindowRegistry.reset_instance()
+        yield
+        WindowRegistry.reset_instance()
+
+    @staticmethod
+    def _set_minimized(window_ids):
+        """Mark clients unmapped in the registry, as the client watcher would"""
+        from argus_overview.core.window_registry import WindowRegistry
+
+        WindowRegistry.get_instance().set_client_states(dict.fromkeys(window_ids, (False, False)))
+
+    def _make_wm(self):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.capture_system = MagicMock()
+        wm.capture_system.capture_window_async.side_effect = lambda wid, **kw: f"req-{wid}"
+        wm.capture_system.unresponsive_windows.return_value = set()
+        wm.pending_requests = {}
+        wm._pending_lock = MagicMock()
+        wm._process_capture_results = MagicMock()
+        wm.alert_scheduler = None
+        wm.skip_minimized = True
+        wm.captures_skipped_minimized = 0
+        wm.captures_skipped_unresponsive = 0
+        wm.focused_window_id = None
+        wm.preview_frames = {}
+        self._set_minimized(["0x1", "0x2"])
+        for window_id in ("0x1", "0x2", "0x3"):
+            frame = MagicMock()
+            frame.isVisible.return_value = True
+            frame.is_minimized = False
+            frame.is_unresponsive = False
+            frame.zoom_factor = 0.3
+            wm.preview_frames[window_id] = frame
+        return wm
+
+    def _requested(self, wm):
+        return [c[0][0] for c in wm.capture_system.capture_window_async.call_args_list]
+
+    def test_minimized_clients_skipped(self):
+        """Minimized clients aren't captured and get the overlay"""
+        wm = self._make_wm()
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x3"]
+        assert wm.captures_skipped_minimized == 2
+        wm.preview_frames["0x1"].set_minimized.assert_called_once_with(True)
+        wm.preview_frames["0x3"].set_minimized.assert_not_called()
+
+    def test_restored_client_captured_again(self):
+        """Once the watcher reports it restored, the client is captured and the overlay goes"""
+        wm = self._make_wm()
+        wm.preview_frames["0x1"].is_minimized = True
+        self._set_minimized(["0x2"])
+
+        wm._capture_cycle()
+
+        assert "0x1" in self._requested(wm)
+        wm.preview_frames["0x1"].set_minimized.assert_called_once_with(False)
+
+    def test_focused_client_never_skipped(self):
+        """The focused window was just restored even if no event arrived yet"""
+        wm = self._make_wm()
+        wm.focused_window_id = "0x2"
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x2", "0x3"]
+
+    def test_disabled(self):
+        """performance.skip_minimized off - everything is captured"""
+        wm = self._make_wm()
+        wm.skip_minimized = False
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x1", "0x2", "0x3"]
+
+    def test_registry_ids_matched_numerically(self):
+        """Registry IDs ("0x%08x") match previews keyed in another spelling; others are ignored"""
+        wm = self._make_wm()
+        self._set_minimized(["0x00000003", "0x05000001"])
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x1", "0x2"]
+        assert wm.captures_skipped_minimized == 1
+
+    def test_widget_overlay_keeps_last_frame(self, qapp):
+        """A minimized preview shows its last frame dimmed and ignores new frames"""
+        from PIL import Image as PILImage
+
+        from argus_overview.ui.main_tab import WindowPreviewWidget
+
+        widget = WindowPreviewWidget("0x1", "Pilot1", MagicMock())
+        widget.update_frame(PILImage.new("RGB", (64, 36), (255, 255, 255)))
+        last = widget.current_pixmap
+
+        widget.set_minimized(True)
+        dimmed = widget.image_label.pixmap().toImage().pixelColor(0, 0)
+        widget.update_frame(PILImage.new("RGB", (64, 36)))
+
+        assert dimmed.red() < 255
+        assert widget.current_pixmap is last
+
+        widget.set_minimized(False)
+        assert widget.is_minimized is False
+        widget.deleteLater()
+
+    def test_widget_without_frame(self, qapp):
+        """Minimized before the first frame - text placeholder"""
+        from argus_overview.ui.main_tab import WindowPreviewWidget
+
+        widget = WindowPreviewWidget("0x1", "Pilot1", MagicMock())
+
+        widget.set_minimized(True)
+        assert widget.image_label.text() == "Minimized"
+        widget.set_minimized(False)
+        assert widget.image_label.text() == "Loading..."
+        widget.deleteLater()
+
+    def test_unresponsive_clients_skipped(self):
+        """Clients quarantined by the capture breaker aren't requested and get the overlay"""
+        wm = self._make_wm()
+        self._set_minimized(["0x2"])
+        wm.capture_system.unresponsive_windows.return_value = {"0x1"}
+        wm.preview_frames["0x3"].is_unresponsive = True
+
+        wm._capture_cycle()
+
+        assert self._requested(wm) == ["0x3"]
+        assert wm.captures_skipped_unresponsive == 1
+        wm.preview_frames["0x1"].set_unresponsive.assert_called_once_with(True)
+        wm.preview_frames["0x3"].set_unresponsive.assert_called_once_with(False)
+
+    def test_widget_not_responding_status(self, qapp):
+        """Minimized wins over not responding; clearing both restores the placeholder"""
+        from argus_overview.ui.main_tab import WindowPreviewWidget
+
+        widget = WindowPreviewWidget("0x1", "Pilot1", MagicMock())
+
+        widget.set_unresponsive(True)
+        assert widget.image_label.text() == "Not responding"
+        widget.set_minimized(True)
+        assert widget.image_label.text() == "Minimized"
+        widget.set_minimized(False)
+        widget.set_unresponsive(False)
+        assert widget.image_label.text() == "Loading..."
+        widget.deleteLater()
+
+
+class TestPreviewFramePool:
+    """Tests for recycling preview widgets across add/remove"""
+
+    def _make_wm(self):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.logger = MagicMock()
+        wm.capture_system = MagicMock()
+        wm.alert_detector = MagicMock()
+        wm.alert_bus = MagicMock()
+        wm.settings_manager = None
+        wm.local_watcher = None
+        wm.alert_probe = None
+        wm.alert_scheduler = None
+        wm.renderer = "widgets"
+        wm.preview_frames = {}
+        wm._frame_pool = []
+        wm.focused_window_id = None
+        wm.frames_created = 0
+        wm.frames_reused = 0
+        return wm
+
+    def test_removed_widget_is_rebound(self, qapp):
+        """add_window after remove_window reuses the widget with fresh state"""
+        from PIL import Image as PILImage
+
+        from argus_overview.core.alert_detector import AlertLevel
+
+        wm = self._make_wm()
+        frame = wm.add_window("0x1", "Pilot1")
+        frame.set_alert(AlertLevel.HIGH)
+        frame.zoom_factor = 0.5
+        frame.update_frame(PILImage.new("RGB", (64, 36)))
+
+        wm.remove_window("0x1")
+        reused = wm.add_window("0x2", "Pilot2")
+
+        assert reused is frame
+        assert reused.window_id == "0x2"
+        assert reused.info_label.text() == "Pilot2"
+        assert reused.image_label.text() == "Loading..."
+        assert reused.current_pixmap is None
+        assert reused.alert_level is None
+        assert reused.zoom_factor == 0.3
+        assert not reused.animation_clock.is_flashing(reused)
+        assert (wm.frames_created, wm.frames_reused) == (1, 1)
+
+    def test_release_detaches_widget(self, qapp):
+        """Pooled widgets leave the layout and drop old signal receivers"""
+        from PySide6.QtWidgets import QWidget
+
+        from argus_overview.ui.main_tab import FlowLayout
+
+        wm = self._make_wm()
+        container = QWidget()
+        layout = FlowLayout()
+        container.setLayout(layout)
+        frame = wm.add_window("0x1", "Pilot1")
+        layout.addWidget(frame)
+        activated = MagicMock()
+        frame.window_activated.connect(activated)
+
+        wm.remove_window("0x1")
+
+        assert layout.count() == 0
+        assert frame.isHidden()
+        frame.window_activated.emit("0x1")
+        activated.assert_not_called()
+
+    def test_pool_is_bounded(self, qapp):
+        """Widgets beyond MAX_POOLED_FRAMES are deleted"""
+        wm = self._make_wm()
+        wm.MAX_POOLED_FRAMES = 1
+        wm.add_window("0x1", "Pilot1")
+        extra = wm.add_window("0x2", "Pilot2")
+
+        wm.remove_window("0x1")
+        with patch.object(extra, "deleteLater") as delete_later:
+            wm.remove_window("0x2")
+
+        delete_later.assert_called_once()
+        assert len(wm._frame_pool) == 1
+
+    def test_canvas_tiles_not_pooled(self, qapp):
+        """The canvas renderer builds tiles directly"""
+        from argus_overview.ui.thumbnail_wall import ThumbnailTile
+
+        wm = self._make_wm()
+        wm.renderer = "canvas"
+
+        tile = wm.add_window("0x1", "Pilot1")
+        wm.remove_window("0x1")
+
+        assert isinstance(tile, ThumbnailTile)
+        assert wm._frame_pool == []
+
+
+class TestFlowLayoutCaching:
+    """Tests for FlowLayout hint caching and incremental re-flow"""
+
+    def _make_layout(self, sizes):
+        from PySide6.QtWidgets import QLabel, QWidget
+
+        from argus_overview.ui.main_tab import FlowLayout
+
+        container = QWidget()
+        layout = FlowLayout(container, margin=10, spacing=10)
+        labels = []
+        for width, height in sizes:
+            label = QLabel()
+            label.setFixedSize(width, height)
+            layout.addWidget(label)
+            labels.append(label)
+        return container, layout, labels
+
+    def _full_layout(self, layout, rect):
+        """Geometry of a from-scratch layout, for comparison"""
+        layout._reset_caches()
+        layout.setGeometry(rect)
+        return [layout.itemAt(i).geometry() for i in range(layout.count())]
+
+    def test_height_for_width_memoized(self, qapp):
+        """Repeated width queries reuse the result until invalidated"""
+        _container, layout, _labels = self._make_layout([(100, 50)] * 5)
+
+        with patch.object(layout, "_do_layout", wraps=layout._do_layout) as do_layout:
+            first = layout.heightForWidth(250)
+            assert layout.heightForWidth(250) == first
+            assert do_layout.call_count == 1
+
+            layout.invalidate()
+            assert layout.heightForWidth(250) == first
+            assert do_layout.call_count == 2
+
+    def test_unchanged_layout_places_nothing(self, qapp):
+        """Re-applying the same rect is a no-op"""
+        _container, layout, _labels = self._make_layout([(100, 50)] * 6)
+        rect = QRect(0, 0, 250, 400)
+        layout.setGeometry(rect)
+        layout.items_placed = 0
+
+        layout.setGeometry(rect)
+
+        assert layout.items_placed == 0
+
+    def test_append_reflows_last_row_only(self, qapp):
+        """Adding an item re-places only the last row (and the new item)"""
+        from PySide6.QtCore import QPoint
+        from PySide6.QtWidgets import QLabel
+
+        _container, layout, _labels = self._make_layout([(100, 50)] * 6)
+        rect = QRect(0, 0, 250, 400)
+        layout.setGeometry(rect)
+        layout.items_placed = 0
+
+        label = QLabel()
+        label.setFixedSize(100, 50)
+        layout.addWidget(label)
+        layout.setGeometry(rect)
+
+        assert layout.items_placed == 3  # Last row of two, then the new row of one
+        assert label.geometry().topLeft() == QPoint(75, 190)
+
+    def test_shrunk_row_start_moves_up(self, qapp):
+        """An item that starts a row and shrinks re-joins the previous row"""
+        _container, layout, labels = self._make_layout([(100, 50), (200, 50), (100, 50)])
+        rect = QRect(0, 0, 250, 400)
+        layout.setGeometry(rect)
+
+        labels[1].setFixedSize(100, 50)
+        layout.setGeometry(rect)
+        incremental = [label.geometry() for label in labels]
+
+        assert incremental[1].y() == incremental[0].y()
+        assert incremental == self._full_layout(layout, rect)
+
+    def test_tail_removal_recenters_last_row(self, qapp):
+        """Removing the last item re-centers the remaining row"""
+        _container, layout, labels = self._make_layout([(100, 50)] * 4)
+        rect = QRect(0, 0, 250, 400)
+        layout.setGeometry(rect)
+
+        layout.removeWidget(labels[3])
+        layout.setGeometry(rect)
+
+        assert labels[2].geometry().x() == 75
+        assert layout.heightForWidth(250) == layout._laid_out_height
+
+
+class TestFocusTracking:
+    """Tests for WindowManager focus state pushed from the active-window watcher"""
+
+    @pytest.fixture
+    def wm(self):
+        from argus_overview.ui.main_tab import WindowManager
+
+        with patch.object(WindowManager, "__init__", return_value=None):
+            wm = WindowManager.__new__(WindowManager)
+        wm.preview_frames = {"0x03800003": MagicMock(), "0x03a00003": MagicMock()}
+        wm.focused_window_id = None
+        wm.focus_tracked = True
+        return wm
+
+    def test_focus_moves_between_previews(self, wm):
+        """Only the previews losing and gaining focus are touched"""
+        first, second = wm.preview_frames.values()
+
+        assert wm.set_focused_window("0x3800003") == "0x03800003"  # Unpadded spelling
+        first.set_focused.assert_called_once_with(True)
+
+        assert wm.set_focused_window("0x03a00003") == "0x03a00003"
+        first.set_focused.assert_called_with(False)
+        second.set_focused.assert_called_once_with(True)
+
+        wm.set_focused_window("0x03a00003")
+        assert second.set_focused.call_count == 1
+
+    def test_focus_leaves_previews(self, wm):
+        """Focusing another app clears the preview's focus"""
+        first = wm.preview_frames["0x03800003"]
+        wm.set_focused_window("0x03800003")
+
+        assert wm.set_focused_window("0x05000001") is None
+
+        first.set_focused.assert_called_with(False)
+        assert wm.get_focused_window() == "0x05000001"
+
+    def test_added_window_starts_focused(self, wm):
+        """A preview added for the active window shows focus immediately"""
+        frame = MagicMock()
+        wm.set_focused_window("0x04000001")
+        wm.logger = MagicMock()
+        wm.local_watcher = wm.alert_probe = wm.alert_scheduler = None
+        wm.alert_detector = MagicMock()
+        wm._acquire_frame = MagicMock(return_value=frame)
+
+        wm.add_window("0x04000001", "Pilot")
+
+        frame.set_focused.assert_called_once_with(True)
+
+    def test_untracked_falls_back_to_xdotool(self, wm):
+        """Without the watcher, one xdotool query is matched to a preview key"""
+        wm.focus_tracked = False
+
+        with patch(
+            "argus_overview.ui.main_tab.get_focused_window", return_value="0x3a00003"
+        ) as query:
+            assert wm.get_focused_window() == "0x03a00003"
+
+        query.assert_called_once()
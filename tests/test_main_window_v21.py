@@ -5,6 +5,8 @@ Tests MainWindowV21 - the main application window
 
 from unittest.mock import MagicMock, patch
 
+from argus_overview.core.window_ops import BulkWindowOps
+
 
 # Test MainWindowV21 initialization
 class TestMainWindowV21Init:
@@ -50,6 +52,9 @@ def create_mock_window():
     )
     window._minimize_all_windows = lambda: MainWindowV21._minimize_all_windows(window)
     window._restore_all_windows = lambda: MainWindowV21._restore_all_windows(window)
+    window._on_bulk_operation_finished = lambda op, results: (
+        MainWindowV21._on_bulk_operation_finished(window, op, results)
+    )
     window._activate_character = lambda char: MainWindowV21._activate_character(window, char)
     window._on_profile_selected = lambda name: MainWindowV21._on_profile_selected(window, name)
     window._show_settings = lambda: MainWindowV21._show_settings(window)
@@ -71,6 +76,13 @@ def create_mock_window():
     window._apply_low_power_mode = lambda enabled: MainWindowV21._apply_low_power_mode(
         window, enabled
     )
+    window._on_active_window_changed = lambda wid: MainWindowV21._on_active_window_changed(
+        window, wid
+    )
+    window._on_focus_watch_lost = lambda: MainWindowV21._on_focus_watch_lost(window)
+    window._start_minimized_tracking = lambda: MainWindowV21._start_minimized_tracking(window)
+    window._on_client_watch_lost = lambda: MainWindowV21._on_client_watch_lost(window)
+    window._on_screens_changed = lambda *args: MainWindowV21._on_screens_changed(window, *args)
 
     return window
 
@@ -310,11 +322,16 @@ class TestMinimizeRestoreWindows:
         window.capture_system.minimize_window.return_value = True
 
         window.system_tray = MagicMock()
+        window.bulk_ops = BulkWindowOps()
 
         window._minimize_all_windows()
+        assert window.bulk_ops.wait()
 
         assert window.capture_system.minimize_window.call_count == 2
-        window.system_tray.show_notification.assert_called()
+        window._on_bulk_operation_finished("minimize_all", {"0x111": True, "0x222": True})
+        window.system_tray.show_notification.assert_called_with(
+            "Windows Minimized", "Minimized 2 windows"
+        )
 
     def test_restore_all_windows(self):
         """Test restoring all EVE windows"""
@@ -328,11 +345,41 @@ class TestMinimizeRestoreWindows:
         window.capture_system.restore_window.return_value = True
 
         window.system_tray = MagicMock()
+        window.bulk_ops = BulkWindowOps()
 
         window._restore_all_windows()
+        assert window.bulk_ops.wait()
 
         assert window.capture_system.restore_window.call_count == 2
-        window.system_tray.show_notification.assert_called()
+        window._on_bulk_operation_finished("restore_all", {"0x111": True, "0x222": False})
+        window.system_tray.show_notification.assert_called_with(
+            "Windows Restored", "Restored 1 windows"
+        )
+
+    def test_finished_operation_expires_registry(self):
+        """Minimize/restore all changes map states, so the window snapshot is expired"""
+        window = create_mock_window()
+        window.system_tray = MagicMock()
+
+        with patch("argus_overview.ui.main_window_v21.WindowRegistry") as mock_registry:
+            window._on_bulk_operation_finished("minimize_all", {"0x111": True})
+
+        mock_registry.get_instance.return_value.invalidate.assert_called_once()
+
+    def test_apply_runs_off_gui_thread(self):
+        """The operation is handed to the bulk runner instead of looping inline"""
+        window = create_mock_window()
+        window.main_tab = MagicMock()
+        window.main_tab.window_manager.preview_frames = {"0x111": MagicMock()}
+        window.capture_system = MagicMock()
+        window.bulk_ops = MagicMock()
+
+        window._minimize_all_windows()
+
+        window.bulk_ops.run.assert_called_once_with(
+            "minimize_all", ["0x111"], window.capture_system.minimize_window
+        )
+        window.capture_system.minimize_window.assert_not_called()
 
 
 # Test activate character
@@ -426,8 +473,7 @@ class TestReloadConfig:
         window.theme_manager = MagicMock()
 
         window.auto_discovery = MagicMock()
-        window.auto_discovery.scan_timer = MagicMock()
-        window.auto_discovery.scan_timer.isActive.return_value = False
+        window.auto_discovery.running = False
 
         window.system_tray = MagicMock()
 
@@ -787,8 +833,7 @@ class TestReloadConfigEdgeCases:
 
         window.theme_manager = MagicMock()
         window.auto_discovery = MagicMock()
-        window.auto_discovery.scan_timer = MagicMock()
-        window.auto_discovery.scan_timer.isActive.return_value = True  # Already running
+        window.auto_discovery.running = True  # Already running
 
         window.system_tray = MagicMock()
         window._apply_initial_settings = MagicMock()
@@ -1668,8 +1713,9 @@ class TestApplyLowPowerMode:
         window.main_tab.window_manager.set_refresh_rate.assert_called_with(5)
         # Should update spinner
         window.main_tab.refresh_rate_spin.setValue.assert_called_with(5)
-        # Should disable alerts
-        window.settings_manager.set.assert_called()
+        # Alert settings are left alone; the sampler is re-evaluated (and paused)
+        window.settings_manager.set.assert_not_called()
+        window.main_tab.window_manager.configure_alert_scheduler.assert_called_once()
         # Should show status message
         window.statusBar().showMessage.assert_called()
 
@@ -1683,7 +1729,7 @@ class TestApplyLowPowerMode:
         window.statusBar = MagicMock(return_value=MagicMock())
 
         # Simulate that low power mode was previously enabled
-        window._low_power_previous = {"fps": 30, "alerts": True}
+        window._low_power_previous = {"fps": 30}
 
         window._apply_low_power_mode(False)
 
@@ -1691,8 +1737,8 @@ class TestApplyLowPowerMode:
         window.main_tab.window_manager.set_refresh_rate.assert_called_with(30)
         # Should update spinner
         window.main_tab.refresh_rate_spin.setValue.assert_called_with(30)
-        # Should restore alerts
-        window.settings_manager.set.assert_called()
+        # Alert sampler resumes if it is enabled
+        window.main_tab.window_manager.configure_alert_scheduler.assert_called_once()
         # Should show status message
         window.statusBar().showMessage.assert_called()
 
@@ -1714,7 +1760,7 @@ class TestApplyLowPowerMode:
         # Should have stored previous values
         assert hasattr(window, "_low_power_previous")
         assert window._low_power_previous["fps"] == 45
-        assert window._low_power_previous["alerts"] is True
+        assert "alerts" not in window._low_power_previous
 
     def test_disable_low_power_mode_without_previous(self):
         """Test disabling when no previous settings stored"""
@@ -2025,3 +2071,100 @@ class TestApplyToAllWindowsInvalidAction:
         # Should not try to call any methods since action was invalid
         window.capture_system.minimize_window.assert_not_called()
         window.capture_system.restore_window.assert_not_called()
+
+
+class TestActiveWindowChanged:
+    """Tests for focus changes pushed by the _NET_ACTIVE_WINDOW watcher"""
+
+    def _window(self):
+        window = create_mock_window()
+        window.cycling_index = 0
+        window.current_cycling_group = "Default"
+        window.settings_manager = MagicMock()
+        window.settings_manager.get.return_value = {"Default": ["Char1", "Char2", "Char3"]}
+        frame = MagicMock()
+        frame.character_name = "Char3"
+        window.main_tab = MagicMock()
+        window.main_tab.window_manager.preview_frames = {"0x03800003": frame}
+        return window
+
+    def test_preview_focus_updates_state(self):
+        """Focusing a client updates last-activated and the cycling index"""
+        window = self._window()
+        window.main_tab.window_manager.set_focused_window.return_value = "0x03800003"
+
+        window._on_active_window_changed("0x03800003")
+
+        window.main_tab.window_manager.set_focused_window.assert_called_once_with("0x03800003")
+        window.settings_manager.set_last_activated_window.assert_called_once_with("0x03800003")
+        assert window.cycling_index == 2
+
+    def test_other_window_focus(self):
+        """Focusing a window without a preview leaves cycling state alone"""
+        window = self._window()
+        window.main_tab.window_manager.set_focused_window.return_value = None
+
+        window._on_active_window_changed("0x05000001")
+
+        window.settings_manager.set_last_activated_window.assert_not_called()
+        assert window.cycling_index == 0
+
+    def test_watch_lost(self):
+        """Losing the watcher falls back to on-demand queries"""
+        window = self._window()
+
+        window._on_focus_watch_lost()
+
+        assert window.main_tab.window_manager.focus_tracked is False
+        window.main_tab.window_manager.set_focused_window.assert_called_once_with(None)
+
+
+class TestMinimizedTracking:
+    """Tests for the shared client watcher feeding the registry's map state"""
+
+    def test_started_when_skipping_minimized(self):
+        """The watcher runs for minimized tracking if previews skip minimized clients"""
+        window = create_mock_window()
+        window.main_tab = MagicMock()
+        window.main_tab.window_manager.skip_minimized = True
+        window.client_watcher = MagicMock()
+
+        window._start_minimized_tracking()
+
+        window.client_watcher.watch_lost.connect.assert_called_once_with(
+            window._on_client_watch_lost
+        )
+        window.client_watcher.start.assert_called_once()
+
+    def test_not_started_when_capturing_minimized(self):
+        """With skip_minimized off only event-driven discovery starts the watcher"""
+        window = create_mock_window()
+        window.main_tab = MagicMock()
+        window.main_tab.window_manager.skip_minimized = False
+        window.client_watcher = MagicMock()
+
+        window._start_minimized_tracking()
+
+        window.client_watcher.start.assert_not_called()
+
+    def test_watch_lost(self):
+        """Losing the connection stops the watcher, which clears the registry's map state"""
+        window = create_mock_window()
+        window.client_watcher = MagicMock()
+
+        window._on_client_watch_lost()
+
+        window.client_watcher.stop.assert_called_once()
+
+
+class TestScreensChanged:
+    """Tests for Qt screen add/remove handling"""
+
+    def test_invalidates_monitor_cache(self):
+        """A screen added or removed expires the cached monitor layout"""
+        window = create_mock_window()
+
+        with patch("argus_overview.ui.main_window_v21.MonitorCache") as mock_cache:
+            window._on_screens_changed(MagicMock())
+
+        mock_cache.get_instance.return_value.invalidate.assert_called_once()
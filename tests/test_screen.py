@@ -1,11 +1,19 @@
 """
 Unit tests for screen geometry utilities
-Tests get_screen_geometry and get_all_monitors functions
+Tests get_screen_geometry and get_all_monitors functions and the monitor cache
 """
 
 from unittest.mock import MagicMock, patch
 
-from argus_overview.utils.screen import ScreenGeometry, get_all_monitors, get_screen_geometry
+import pytest
+
+from argus_overview.utils.screen import (
+    MonitorCache,
+    ScreenGeometry,
+    get_all_monitors,
+    get_screen_geometry,
+)
+from argus_overview.utils.x11 import XLIB_AVAILABLE, XError
 
 
 class TestScreenGeometry:
@@ -261,3 +269,90 @@ class TestGetAllMonitors:
         assert len(monitors) == 2
         assert monitors[0].y == 0
         assert monitors[1].y == 1080
+
+
+class TestMonitorCache:
+    """Tests for MonitorCache"""
+
+    XRANDR = MagicMock(
+        returncode=0,
+        stdout="eDP-1 connected primary 1920x1080+0+0\nHDMI-1 connected 2560x1440+1920+0\n",
+    )
+
+    @patch("argus_overview.utils.screen.subprocess.run", return_value=XRANDR)
+    def test_lookups_served_from_cache(self, mock_run):
+        """One xrandr query serves every later lookup"""
+        assert get_screen_geometry(1).width == 2560
+        assert get_screen_geometry(0).is_primary is True
+        assert len(get_all_monitors()) == 2
+
+        mock_run.assert_called_once()
+        assert MonitorCache.get_instance().queries == 1
+
+    @patch("argus_overview.utils.screen.subprocess.run", return_value=XRANDR)
+    def test_invalidate_requeries(self, mock_run):
+        """After a screen change the next lookup queries again"""
+        cache = MonitorCache.get_instance()
+        cache.monitors()
+        cache.invalidate()
+        cache.invalidate()  # Already empty - not counted again
+
+        cache.monitors()
+
+        assert mock_run.call_count == 2
+        assert cache.invalidations == 1
+
+    @patch("argus_overview.utils.screen.subprocess.run")
+    def test_failure_not_cached(self, mock_run):
+        """A failed query is retried on the next lookup"""
+        mock_run.side_effect = [MagicMock(returncode=1, stdout=""), self.XRANDR]
+
+        assert get_screen_geometry(1).width == 1920  # Default
+        assert get_screen_geometry(1).width == 2560
+
+    @pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+    @patch("argus_overview.utils.screen.subprocess.run")
+    def test_randr_query(self, mock_run):
+        """With a display, monitors come from RandR outputs with an active CRTC"""
+        display = MagicMock()
+        root = display.screen.return_value.root
+        root.xrandr_get_screen_resources_current.return_value = MagicMock(
+            outputs=[1, 2, 3], config_timestamp=42
+        )
+        root.xrandr_get_output_primary.return_value = MagicMock(output=3)
+        outputs = {
+            1: MagicMock(connection=0, crtc=10),
+            2: MagicMock(connection=1, crtc=0),  # Disconnected
+            3: MagicMock(connection=0, crtc=11),
+        }
+        crtcs = {
+            10: MagicMock(x=0, y=0, width=1920, height=1080),
+            11: MagicMock(x=1920, y=0, width=2560, height=1440),
+        }
+        display.xrandr_get_output_info.side_effect = lambda output, _ts: outputs[output]
+        display.xrandr_get_crtc_info.side_effect = lambda crtc, _ts: crtcs[crtc]
+
+        with patch("argus_overview.utils.screen.open_display", return_value=display):
+            monitors = MonitorCache.get_instance().monitors()
+
+        assert monitors == [
+            ScreenGeometry(0, 0, 1920, 1080, False),
+            ScreenGeometry(1920, 0, 2560, 1440, True),
+        ]
+        mock_run.assert_not_called()
+        display.close.assert_called_once()
+
+    @pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+    @patch("argus_overview.utils.screen.subprocess.run", return_value=XRANDR)
+    def test_randr_error_falls_back_to_xrandr(self, mock_run):
+        """An X error during the RandR query falls back to xrandr"""
+        display = MagicMock()
+        display.screen.return_value.root.xrandr_get_screen_resources_current.side_effect = XError(
+            MagicMock(), b"\x00" * 32
+        )
+
+        with patch("argus_overview.utils.screen.open_display", return_value=display):
+            monitors = MonitorCache.get_instance().monitors()
+
+        assert len(monitors) == 2
+        mock_run.assert_called_once()
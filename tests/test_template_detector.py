@@ -0,0 +1,224 @@
+"""
+Unit tests for the TemplateMatcher module.
+
+Tests cover:
+- Template preparation (scales, rejection of tiny/flat templates)
+- Zone matching with normalized cross-correlation
+- Multi-scale matching
+- Downscaled frames (alert samples)
+- Building from settings
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from argus_overview.core.alert_detector import AlertLevel
+from argus_overview.core.template_detector import TemplateMatcher, TemplateZone
+
+
+def make_icon(size=24):
+    """Create a high-contrast test icon"""
+    icon = np.zeros((size, size, 3), dtype=np.uint8)
+    icon[size // 6 : size - size // 6, size // 6 : size - size // 6] = (220, 40, 40)
+    icon[size // 3 : size - size // 3, size // 3 : size - size // 3] = (255, 255, 255)
+    return Image.fromarray(icon)
+
+
+def make_frame(icon=None, position=(0, 0), size=(640, 360)):
+    """Create a noisy frame, optionally with an icon pasted in"""
+    rng = np.random.default_rng(42)
+    frame = Image.fromarray(rng.integers(0, 60, (size[1], size[0], 3), dtype=np.uint8))
+    if icon is not None:
+        frame.paste(icon, position)
+    return frame
+
+
+@pytest.fixture
+def matcher():
+    """Matcher with one 24x24 icon"""
+    m = TemplateMatcher()
+    m.add_template("icon", make_icon())
+    return m
+
+
+class TestTemplatePreparation:
+    """Tests for add_template/load_template"""
+
+    def test_add_template_prepares_each_ui_scale(self):
+        """One prepared template per UI scale"""
+        m = TemplateMatcher(ui_scales=(1.0, 1.5))
+
+        assert m.add_template("icon", make_icon()) is True
+        shapes = [p.zero_mean.shape for p in m.templates["icon"]]
+        assert shapes == [(12, 12), (18, 18)]
+
+    def test_prepared_template_is_zero_mean(self, matcher):
+        """Prepared template has zero mean and matching norm"""
+        prepared = matcher.templates["icon"][0]
+
+        assert abs(float(prepared.zero_mean.mean())) < 1e-3
+        assert prepared.norm == pytest.approx(float(np.linalg.norm(prepared.zero_mean)), rel=1e-4)
+
+    def test_tiny_template_rejected(self):
+        """Templates below MIN_TEMPLATE_SIZE after downsampling are rejected"""
+        m = TemplateMatcher()
+
+        assert m.add_template("tiny", make_icon(6)) is False
+        assert "tiny" not in m.templates
+
+    def test_flat_template_rejected(self):
+        """Uniform templates can't be correlated"""
+        m = TemplateMatcher()
+
+        assert m.add_template("flat", Image.new("RGB", (24, 24), (100, 100, 100))) is False
+
+    def test_load_template_from_disk(self, tmp_path):
+        """Templates load from image files"""
+        path = tmp_path / "icon.png"
+        make_icon().save(path)
+        m = TemplateMatcher()
+
+        assert m.load_template("icon", path) is True
+        assert "icon" in m.templates
+
+    def test_load_missing_template(self, tmp_path):
+        """Missing file returns False"""
+        m = TemplateMatcher()
+
+        assert m.load_template("icon", tmp_path / "missing.png") is False
+
+
+class TestZoneMatching:
+    """Tests for match_zone/analyze"""
+
+    def test_finds_icon_at_exact_position(self, matcher):
+        """Planted icon is found with a near-perfect score"""
+        frame = make_frame(make_icon(), (400, 200))
+        zone = TemplateZone(name="hud", region=(0.5, 0.5, 0.3, 0.3), templates=["icon"])
+
+        match = matcher.match_zone(frame, zone)
+
+        assert match is not None
+        assert match.score > 0.99
+        assert (match.x, match.y) == (400, 200)
+        assert match.zone == "hud"
+        assert match.template == "icon"
+        assert match.level == AlertLevel.HIGH
+
+    def test_no_match_outside_zone(self, matcher):
+        """Icon outside the zone isn't matched"""
+        frame = make_frame(make_icon(), (400, 200))
+        zone = TemplateZone(name="hud", region=(0.0, 0.0, 0.3, 0.3), templates=["icon"])
+
+        assert matcher.match_zone(frame, zone) is None
+
+    def test_threshold_respected(self, matcher):
+        """A score above 1.0 is impossible, so threshold 1.01 never matches"""
+        frame = make_frame(make_icon(), (400, 200))
+        zone = TemplateZone(
+            name="hud", region=(0.5, 0.5, 0.3, 0.3), templates=["icon"], threshold=1.01
+        )
+
+        assert matcher.match_zone(frame, zone) is None
+
+    def test_unknown_template_ignored(self, matcher):
+        """Zones referencing unknown templates produce no match"""
+        frame = make_frame(make_icon(), (400, 200))
+        zone = TemplateZone(name="hud", region=(0.5, 0.5, 0.3, 0.3), templates=["other"])
+
+        assert matcher.match_zone(frame, zone) is None
+
+    def test_zone_smaller_than_template(self, matcher):
+        """Zones too small for the template produce no match"""
+        zone = TemplateZone(name="hud", region=(0.5, 0.5, 0.01, 0.01), templates=["icon"])
+
+        assert matcher.match_zone(make_frame(), zone) is None
+
+    def test_empty_zone(self, matcher):
+        """Zones clamped to nothing produce no match"""
+        zone = TemplateZone(name="hud", region=(1.5, 1.5, 0.1, 0.1), templates=["icon"])
+
+        assert matcher.match_zone(make_frame(), zone) is None
+
+    def test_larger_ui_scale_matched(self):
+        """Icon drawn at 150% UI scale matches the 1.5 prepared template"""
+        m = TemplateMatcher(ui_scales=(1.0, 1.5))
+        m.add_template("icon", make_icon())
+        frame = make_frame(make_icon(36), (300, 100))
+        zone = TemplateZone(name="hud", region=(0.4, 0.2, 0.3, 0.3), templates=["icon"])
+
+        match = m.match_zone(frame, zone)
+
+        assert match is not None
+        assert match.score > 0.95
+        assert (match.x, match.y) == (300, 100)
+
+    def test_downscaled_frame_matched_at_its_scale(self, matcher):
+        """An alert sample at 25% still matches; the position is in window pixels"""
+        frame = make_frame(make_icon(32), (1000, 600), size=(1920, 1080))
+        sample = frame.resize((480, 270), Image.Resampling.BOX)
+        matcher.add_template("big", make_icon(32))
+        zone = TemplateZone(name="hud", region=(0.5, 0.5, 0.3, 0.3), templates=["big"])
+
+        assert matcher.match_zone(sample, zone) is None  # Full-resolution templates
+        match = matcher.match_zone(sample, zone, frame_scale=0.25)
+
+        assert match is not None
+        assert match.score > 0.99
+        assert (match.x, match.y) == (1000, 600)
+        assert 0.25 in matcher._rescaled
+
+    def test_spectrum_cached_per_crop_shape(self, matcher):
+        """Template spectrum is computed once per crop shape"""
+        frame = make_frame(make_icon(), (400, 200))
+        zone = TemplateZone(name="hud", region=(0.5, 0.5, 0.3, 0.3), templates=["icon"])
+
+        matcher.match_zone(frame, zone)
+        matcher.match_zone(frame, zone)
+
+        assert len(matcher.templates["icon"][0].spectra) == 1
+
+    def test_analyze_returns_matches_for_all_zones(self, matcher):
+        """analyze() returns one match per matching zone"""
+        frame = make_frame(make_icon(), (400, 200))
+        matcher.add_zone(TemplateZone(name="hit", region=(0.5, 0.5, 0.3, 0.3), templates=["icon"]))
+        matcher.add_zone(TemplateZone(name="miss", region=(0.0, 0.0, 0.3, 0.3), templates=["icon"]))
+
+        matches = matcher.analyze(frame)
+
+        assert [m.zone for m in matches] == ["hit"]
+
+
+class TestFromConfig:
+    """Tests for building a matcher from settings"""
+
+    def test_from_config(self, tmp_path):
+        """Templates and zones are loaded from settings dicts"""
+        path = tmp_path / "scram.png"
+        make_icon().save(path)
+
+        m = TemplateMatcher.from_config(
+            {"scram": str(path)},
+            [
+                {
+                    "name": "hud",
+                    "region": [0.4, 0.6, 0.2, 0.2],
+                    "templates": ["scram"],
+                    "level": "medium",
+                }
+            ],
+        )
+
+        assert m.has_zones() is True
+        assert m.zones[0].level == AlertLevel.MEDIUM
+        assert m.zones[0].region == (0.4, 0.6, 0.2, 0.2)
+
+    def test_invalid_zone_skipped(self):
+        """Invalid zone entries are logged and skipped"""
+        m = TemplateMatcher.from_config(
+            {}, [{"region": [0, 0, 1, 1]}, {"name": "x", "region": [0, 0, 1, 1], "level": "bogus"}]
+        )
+
+        assert m.zones == []
+        assert m.has_zones() is False
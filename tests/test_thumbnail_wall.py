@@ -0,0 +1,380 @@
+"""
+Unit tests for the Thumbnail Wall module.
+
+Tests cover:
+- ThumbnailTile state (labels, frames, alerts, activity, visibility, status overlay)
+- Wall layout and hit-testing
+- Dirty-tile repaints
+- Flashing via the shared animation clock
+- Click, drag and context menu routing
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+from PySide6.QtCore import QEvent, QPoint, QSize, Qt
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from argus_overview.core.alert_detector import AlertLevel  # noqa: E402
+from argus_overview.ui.animation_clock import AnimationClock  # noqa: E402
+from argus_overview.ui.thumbnail_wall import ThumbnailTile, ThumbnailWall  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication for tests that need real Qt widgets."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def wall(qapp):
+    """1000px wide wall (3 columns of 280x200 tiles)"""
+    wall = ThumbnailWall()
+    wall.resize(1000, 700)
+    return wall
+
+
+def make_tiles(wall, count):
+    tiles = [ThumbnailTile(f"0x{i}", f"Pilot{i}", MagicMock()) for i in range(count)]
+    for tile in tiles:
+        wall.add_tile(tile)
+    return tiles
+
+
+def mouse_event(pos, button=Qt.MouseButton.LeftButton):
+    event = MagicMock()
+    event.button.return_value = button
+    event.position.return_value.toPoint.return_value = pos
+    return event
+
+
+class TestThumbnailTile:
+    """Tests for tile state"""
+
+    def test_display_name_and_tooltip(self, qapp):
+        """Custom labels prefix the character name"""
+        settings = MagicMock()
+        settings.get.side_effect = lambda key, default=None: (
+            {"Pilot": "Scout"} if key == "character_labels" else default
+        )
+        tile = ThumbnailTile("0x1", "Pilot", MagicMock(), settings_manager=settings)
+
+        assert tile.display_name() == "Scout (Pilot)"
+        assert "Window ID: 0x1" in tile.tooltip_text()
+
+    def test_detached_tile(self, qapp):
+        """A tile not on a wall isn't visible and has no preview area"""
+        tile = ThumbnailTile("0x1", "Pilot", MagicMock())
+
+        assert tile.isVisible() is False
+        assert tile.preview_size().isEmpty()
+        tile.update()  # No wall - no-op
+
+    def test_update_frame_fits_tile(self, wall):
+        """Frames are scaled once to the tile's image area"""
+        (tile,) = make_tiles(wall, 1)
+
+        tile.update_frame(Image.new("RGB", (1920, 1080)))
+
+        target = tile.preview_size()
+        assert tile.current_pixmap.size() == QSize(1920, 1080)
+        assert tile.display_pixmap.width() <= target.width()
+        assert tile.display_pixmap.height() <= target.height()
+
+    def test_update_frame_repaints_only_tile(self, wall):
+        """A new frame invalidates just that tile"""
+        tile, _other = make_tiles(wall, 2)
+
+        with patch.object(wall, "update") as update:
+            tile.update_frame(Image.new("RGB", (100, 60)))
+
+        update.assert_called_once_with(wall.tile_rect(tile))
+
+    def test_update_frame_none(self, wall):
+        """Failed captures leave the previous frame"""
+        (tile,) = make_tiles(wall, 1)
+
+        tile.update_frame(None)
+
+        assert tile.current_pixmap is None
+
+    def test_set_custom_label_saves(self, qapp):
+        """Labels are stored in character_labels"""
+        settings = MagicMock()
+        settings.get.return_value = {}
+        tile = ThumbnailTile("0x1", "Pilot", MagicMock(), settings_manager=settings)
+        changed = MagicMock()
+        tile.label_changed.connect(changed)
+
+        tile.set_custom_label("Scout")
+
+        changed.assert_called_once_with("0x1", "Scout")
+        settings.set.assert_called_with("character_labels", {"Pilot": "Scout"})
+
+    def test_activity_state(self, qapp):
+        """Focused beats recent"""
+        tile = ThumbnailTile("0x1", "Pilot", MagicMock())
+
+        assert tile.get_activity_state() == "recent"
+        tile.set_focused(True)
+        assert tile.get_activity_state() == "focused"
+
+    def test_minimized_keeps_last_frame(self, wall):
+        """While minimized, late (blank) captures don't replace the last frame"""
+        (tile,) = make_tiles(wall, 1)
+        tile.update_frame(Image.new("RGB", (320, 180)))
+        last = tile.current_pixmap
+
+        with patch.object(wall, "update") as update:
+            tile.set_minimized(True)
+            tile.set_minimized(True)
+        tile.update_frame(Image.new("RGB", (320, 180)))
+
+        update.assert_called_once_with(wall.tile_rect(tile))
+        assert tile.current_pixmap is last
+
+    def test_status_text(self, wall):
+        """Minimized takes precedence over not responding"""
+        (tile,) = make_tiles(wall, 1)
+        assert tile.status_text() is None
+
+        tile.set_unresponsive(True)
+        assert tile.status_text() == "Not responding"
+        tile.set_minimized(True)
+        assert tile.status_text() == "Minimized"
+
+
+class TestLayout:
+    """Tests for tile placement and hit-testing"""
+
+    def test_rows_centered(self, wall):
+        """Tiles fill rows of three, each row centered"""
+        tiles = make_tiles(wall, 4)
+
+        first = wall.tile_rect(tiles[0])
+        assert first.size() == wall.tile_size
+        assert wall.tile_rect(tiles[1]).x() == first.x() + 280 + ThumbnailWall.SPACING
+        last = wall.tile_rect(tiles[3])
+        assert last.y() == first.y() + 200 + ThumbnailWall.SPACING
+        assert last.center().x() == pytest.approx(500, abs=1)
+
+    def test_height_for_width(self, wall):
+        """Height grows with rows"""
+        make_tiles(wall, 4)
+
+        assert wall.heightForWidth(1000) == 2 * 15 + 2 * 200 + 15
+        assert wall.heightForWidth(2000) == 2 * 15 + 200
+
+    def test_tile_at(self, wall):
+        """Points hit the tile under them; gaps hit nothing"""
+        tiles = make_tiles(wall, 2)
+
+        assert wall.tile_at(wall.tile_rect(tiles[1]).center()) is tiles[1]
+        assert wall.tile_at(QPoint(1, 1)) is None
+
+    def test_geometry_matches_slot(self, wall):
+        """geometry() reports the tile rect (for viewport checks)"""
+        tiles = make_tiles(wall, 2)
+
+        assert tiles[1].geometry() == wall.tile_rect(tiles[1])
+        tiles[1].setVisible(False)
+        assert tiles[1].geometry().isEmpty()
+
+    def test_hidden_tiles_release_their_slot(self, wall):
+        """Hidden tiles aren't laid out, painted or hit"""
+        tiles = make_tiles(wall, 2)
+
+        tiles[0].setVisible(False)
+
+        assert wall.tile_rect(tiles[0]) is None
+        assert tiles[0].isVisible() is False
+        assert wall.tile_at(QPoint(370, 100)) is tiles[1]  # Alone and centered now
+        assert wall.tile_rect(tiles[1]).x() == (1000 - 280) // 2
+
+    def test_delete_later_removes_tile(self, wall):
+        """Deleting a tile takes it off the wall"""
+        tiles = make_tiles(wall, 2)
+
+        tiles[0].deleteLater()
+
+        assert wall.tiles == [tiles[1]]
+        assert tiles[0].wall is None
+
+    def test_add_tile_once(self, wall):
+        """Adding the same tile twice is ignored"""
+        (tile,) = make_tiles(wall, 1)
+
+        wall.add_tile(tile)
+
+        assert wall.tiles == [tile]
+
+
+class TestPainting:
+    """Tests for dirty-tile painting"""
+
+    def test_repaint_paints_only_dirty_tile(self, wall, qapp):
+        """Repainting one tile's rect doesn't touch the others"""
+        tiles = make_tiles(wall, 6)
+        wall.show()
+        qapp.processEvents()
+        wall.tiles_painted = 0
+
+        wall.repaint(wall.tile_rect(tiles[4]))
+
+        assert wall.tiles_painted == 1
+        wall.hide()
+
+    def test_full_repaint_paints_every_tile(self, wall, qapp):
+        """A full repaint visits every visible tile"""
+        tiles = make_tiles(wall, 3)
+        tiles[0].set_alert(AlertLevel.HIGH, [(0.1, 0.1, 0.2, 0.2)])
+        tiles[1].update_frame(Image.new("RGB", (320, 180)))
+        wall.show()
+        qapp.processEvents()
+        wall.tiles_painted = 0
+
+        wall.repaint()
+
+        assert wall.tiles_painted == 3
+        wall.hide()
+
+    def test_minimized_overlay_dims_frame(self, wall, qapp):
+        """A minimized tile's last frame is painted dimmed"""
+        (tile,) = make_tiles(wall, 1)
+        tile.update_frame(Image.new("RGB", (320, 180), (255, 255, 255)))
+        point = wall.image_rect(wall.tile_rect(tile)).center() + QPoint(0, 30)
+
+        before = wall.grab().toImage().pixelColor(point)
+        tile.set_minimized(True)
+        after = wall.grab().toImage().pixelColor(point)
+
+        assert before.red() == 255
+        assert after.red() < 255
+
+
+class TestFlash:
+    """Tests for flashing through the shared animation clock"""
+
+    @pytest.fixture(autouse=True)
+    def clock(self, qapp):
+        AnimationClock.reset_instance()
+        yield AnimationClock.get_instance()
+        AnimationClock.reset_instance()
+
+    def test_alert_registers_with_clock(self, wall, clock):
+        """Every flashing tile is advanced by the one clock"""
+        tiles = make_tiles(wall, 2)
+
+        tiles[0].set_alert(AlertLevel.HIGH)
+        tiles[1].set_alert(AlertLevel.MEDIUM)
+
+        assert clock.active
+        clock._tick()
+        assert tiles[0].alert_flash_counter == 29
+        assert tiles[1].alert_flash_counter == 29
+
+    def test_flash_ends(self, wall, clock):
+        """Alerts clear and the clock goes idle after the last tick"""
+        (tile,) = make_tiles(wall, 1)
+        tile.set_alert(AlertLevel.HIGH, [(0.0, 0.0, 0.5, 0.5)])
+        tile.alert_flash_counter = 1
+
+        with patch.object(wall, "update") as update:
+            clock._tick()
+
+        assert tile.alert_level is None
+        assert tile.alert_regions == []
+        update.assert_called_once_with(wall.tile_rect(tile))
+        assert not clock.active
+
+    def test_delete_later_forgets_tile(self, wall, clock):
+        """Deleted tiles stop ticking"""
+        (tile,) = make_tiles(wall, 1)
+        tile.set_alert(AlertLevel.HIGH)
+
+        tile.deleteLater()
+
+        assert not clock.is_flashing(tile)
+
+
+class TestInput:
+    """Tests for click, drag and context menu routing"""
+
+    def test_click_activates_tile(self, wall):
+        """Press and release on a tile emits window_activated"""
+        tiles = make_tiles(wall, 2)
+        activated = MagicMock()
+        tiles[1].window_activated.connect(activated)
+        pos = wall.tile_rect(tiles[1]).center()
+
+        wall.mousePressEvent(mouse_event(pos))
+        wall.mouseReleaseEvent(mouse_event(pos))
+
+        activated.assert_called_once_with("0x1")
+
+    def test_release_elsewhere_does_nothing(self, wall):
+        """Releasing over another tile is not a click"""
+        tiles = make_tiles(wall, 2)
+        activated = MagicMock()
+        tiles[0].window_activated.connect(activated)
+
+        wall.mousePressEvent(mouse_event(wall.tile_rect(tiles[0]).center()))
+        wall.mouseReleaseEvent(mouse_event(wall.tile_rect(tiles[1]).center()))
+
+        activated.assert_not_called()
+
+    def test_drag_carries_character(self, wall):
+        """Moving past the drag distance starts a character drag"""
+        (tile,) = make_tiles(wall, 1)
+        start = wall.tile_rect(tile).center()
+
+        wall.mousePressEvent(mouse_event(start))
+        with patch("argus_overview.ui.thumbnail_wall.QDrag") as drag_cls, patch.object(
+            wall, "grab"
+        ):
+            wall.mouseMoveEvent(mouse_event(start + QPoint(20, 0)))
+
+        mime = drag_cls.return_value.setMimeData.call_args[0][0]
+        assert bytes(mime.data("application/x-eve-character")) == b"Pilot0"
+        drag_cls.return_value.exec.assert_called_once()
+        assert wall._press_tile is None
+
+    def test_hover_moves_between_tiles(self, wall):
+        """Hover follows the pointer and clears on leave"""
+        tiles = make_tiles(wall, 2)
+
+        wall.mouseMoveEvent(mouse_event(wall.tile_rect(tiles[1]).center()))
+        assert wall._hovered is tiles[1]
+
+        wall.leaveEvent(QEvent(QEvent.Type.Leave))
+        assert wall._hovered is None
+
+    def test_context_menu_for_tile(self, wall):
+        """Right-click opens the menu of the tile under the cursor"""
+        tiles = make_tiles(wall, 2)
+        event = MagicMock()
+        event.pos.return_value = wall.tile_rect(tiles[1]).center()
+
+        with patch.object(ThumbnailTile, "show_context_menu") as show:
+            wall.contextMenuEvent(event)
+
+        show.assert_called_once_with(event.globalPos.return_value, wall)
+
+    def test_context_menu_off_tile(self, wall):
+        """Right-click on empty space shows nothing"""
+        make_tiles(wall, 1)
+        event = MagicMock()
+        event.pos.return_value = QPoint(1, 1)
+
+        with patch.object(ThumbnailTile, "show_context_menu") as show:
+            wall.contextMenuEvent(event)
+
+        show.assert_not_called()
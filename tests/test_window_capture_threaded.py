@@ -238,6 +238,18 @@ class TestGetResult:
         assert result[1] == "0x12345"
         assert result[2] is mock_image
 
+    def test_pending_results_counts_queue(self):
+        """Test pending_results reports queued results"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        capture = WindowCaptureThreaded()
+        assert capture.pending_results() == 0
+
+        capture.result_queue.put(("req_1", "0x1", None))
+        capture.result_queue.put(("req_2", "0x2", None))
+
+        assert capture.pending_results() == 2
+
     def test_get_result_timeout_parameter(self):
         """Test get_result respects timeout parameter"""
         from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
@@ -372,9 +384,276 @@ class TestCaptureWindowSync:
         assert "png:-" in cmd
 
 
+class TestCaptureRegionSync:
+    """Tests for capture_region_sync method"""
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    @patch("argus_overview.core.window_capture_threaded.Image")
+    def test_capture_region_uses_crop_geometry(self, mock_image_module, mock_subprocess):
+        """Region capture passes an ImageMagick crop geometry"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"fake png data"
+        mock_subprocess.return_value = mock_result
+        mock_img = MagicMock()
+        mock_image_module.open.return_value = mock_img
+
+        capture = WindowCaptureThreaded()
+        result = capture.capture_region_sync("0xABCD", (10, 20, 200, 400))
+
+        assert result is mock_img
+        cmd = mock_subprocess.call_args[0][0]
+        assert cmd[0] == "import"
+        assert "0xABCD" in cmd
+        assert cmd[cmd.index("-crop") + 1] == "200x400+10+20"
+        assert "+repage" in cmd
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_capture_region_invalid_inputs(self, mock_subprocess):
+        """Invalid window IDs and empty regions don't spawn a capture"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        capture = WindowCaptureThreaded()
+
+        assert capture.capture_region_sync("bogus", (0, 0, 10, 10)) is None
+        assert capture.capture_region_sync("0x1", (0, 0, 0, 10)) is None
+        mock_subprocess.assert_not_called()
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_capture_region_failure(self, mock_subprocess):
+        """Failed region capture returns None"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_subprocess.side_effect = Exception("Unknown error")
+
+        capture = WindowCaptureThreaded()
+
+        assert capture.capture_region_sync("0x1", (0, 0, 10, 10)) is None
+
+
+class TestCaptureWindowQImageSync:
+    """Tests for worker-side QImage production"""
+
+    @staticmethod
+    def _png(size=(200, 100), color=(255, 0, 10)):
+        import io
+
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new("RGB", size, color).save(buffer, "PNG")
+        return buffer.getvalue()
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_decodes_to_native_fitted_qimage(self, mock_subprocess):
+        """PNG is decoded by Qt to RGB32 and fitted to the target box"""
+        from PySide6.QtGui import QImage
+
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout=self._png())
+
+        result = WindowCaptureThreaded()._capture_window_qimage_sync("0x1", (100, 100))
+
+        assert isinstance(result, QImage)
+        assert result.format() == QImage.Format.Format_RGB32
+        assert (result.width(), result.height()) == (100, 50)
+        assert result.pixel(50, 25) == 0xFFFF000A
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_invalid_png_returns_none(self, mock_subprocess):
+        """Undecodable output returns None"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_subprocess.return_value = MagicMock(returncode=0, stdout=b"not a png")
+
+        assert WindowCaptureThreaded()._capture_window_qimage_sync("0x1", (100, 100)) is None
+
+    def test_worker_routes_target_size_to_qimage(self):
+        """Tasks with a target size produce QImages"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        capture = WindowCaptureThreaded(max_workers=1)
+        capture._stop_event.clear()
+        sentinel = MagicMock()
+        capture.capture_window_async("0x12345", target_size=(64, 36))
+        capture.capture_queue.put(None)
+
+        with patch.object(
+            capture, "_capture_window_qimage_sync", return_value=sentinel
+        ) as q, patch.object(capture, "_capture_window_sync") as pil:
+            capture._worker()
+
+        q.assert_called_once_with("0x12345", (64, 36))
+        pil.assert_not_called()
+        assert capture.result_queue.get_nowait()[2] is sentinel
+
+
+class TestCaptureSampleSync:
+    """Tests for capture_sample_sync method"""
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    @patch("argus_overview.core.window_capture_threaded.Image")
+    def test_capture_sample_downsamples_in_imagemagick(self, mock_image_module, mock_subprocess):
+        """Sample capture asks ImageMagick for a box-averaged grab"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"fake png data"
+        mock_subprocess.return_value = mock_result
+        mock_img = MagicMock()
+        mock_image_module.open.return_value = mock_img
+
+        capture = WindowCaptureThreaded()
+        result = capture.capture_sample_sync("0xABCD", 0.25)
+
+        assert result is mock_img
+        cmd = mock_subprocess.call_args[0][0]
+        assert cmd[cmd.index("-scale") + 1] == "25%"
+        mock_img.resize.assert_not_called()
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_capture_sample_invalid_window(self, mock_subprocess):
+        """Invalid window IDs don't spawn a capture"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        assert WindowCaptureThreaded().capture_sample_sync("bogus") is None
+        mock_subprocess.assert_not_called()
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_capture_sample_failure(self, mock_subprocess):
+        """Failed sample capture returns None"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_subprocess.side_effect = Exception("Unknown error")
+
+        assert WindowCaptureThreaded().capture_sample_sync("0x1") is None
+
+
+class TestCaptureBreaker:
+    """Tests for hung-window quarantine in the capture path"""
+
+    @staticmethod
+    def _run(hung):
+        """subprocess.run stand-in: windows in `hung` time out, the rest capture"""
+        import subprocess as subprocess_module
+
+        def run(cmd, **kwargs):
+            if cmd[2] in hung:
+                raise subprocess_module.TimeoutExpired(cmd, kwargs["timeout"])
+            return MagicMock(returncode=0, stdout=b"png")
+
+        return run
+
+    @patch("argus_overview.core.window_capture_threaded.Image")
+    def test_hung_window_quarantined_others_captured(self, mock_image):
+        """After repeated timeouts a hung window isn't grabbed; others still are"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        capture = WindowCaptureThreaded(max_workers=1)
+        capture.breaker.BACKOFF_BASE_S = 0.0  # Retry at once
+        with patch(
+            "argus_overview.core.window_capture_threaded.subprocess.run",
+            side_effect=self._run({"0xbad"}),
+        ) as run, patch.object(capture, "_ensure_prober") as ensure_prober:
+            for _ in range(capture.breaker.QUARANTINE_AFTER):
+                assert capture._capture_window_sync("0xbad", 1.0) is None
+            grabs = run.call_count
+
+            assert capture._capture_window_sync("0xbad", 1.0) is None
+            assert capture.capture_sample_sync("0xbad") is None
+            assert capture._capture_window_sync("0xgood", 1.0) is not None
+
+        assert run.call_count == grabs + 1  # Only 0xgood
+        assert capture.unresponsive_windows() == {"0xbad"}
+        ensure_prober.assert_called_once()
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_backoff_skips_capture(self, mock_subprocess):
+        """A timed-out window isn't grabbed again until its backoff expires"""
+        import subprocess as subprocess_module
+
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_subprocess.side_effect = subprocess_module.TimeoutExpired("import", 1.0)
+        capture = WindowCaptureThreaded()
+
+        capture._capture_window_sync("0x1", 1.0)
+        capture._capture_window_sync("0x1", 1.0)
+
+        mock_subprocess.assert_called_once()
+        assert capture.breaker.skipped == 1
+
+    @patch("argus_overview.core.window_capture_threaded.subprocess.run")
+    def test_fast_failure_retried(self, mock_subprocess):
+        """A capture that failed without timing out is tried again right away"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        mock_subprocess.return_value = MagicMock(returncode=1, stdout=b"")
+        capture = WindowCaptureThreaded()
+
+        capture._capture_window_sync("0x1", 1.0)
+        capture._capture_window_sync("0x1", 1.0)
+
+        assert mock_subprocess.call_count == 2
+        assert capture.breaker.skipped == 0
+
+    def test_probe_window(self):
+        """The probe grabs one pixel; only a timeout means not responding"""
+        import subprocess as subprocess_module
+
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        capture = WindowCaptureThreaded()
+        with patch("argus_overview.core.window_capture_threaded.subprocess.run") as run:
+            assert capture._probe_window("0x1") is True
+            assert "1x1+0+0" in run.call_args[0][0]
+            assert run.call_args[1]["timeout"] == capture.PROBE_TIMEOUT_S
+
+            run.side_effect = subprocess_module.TimeoutExpired("import", 0.5)
+            assert capture._probe_window("0x1") is False
+
+    def test_prober_releases_recovered_window(self):
+        """The prober runs while something is quarantined and exits after recovery"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        capture = WindowCaptureThreaded()
+        capture.PROBE_TICK_S = 0.01
+        capture.breaker.PROBE_INTERVAL_S = 0.0
+        capture._stop_event.clear()
+        for _ in range(capture.breaker.QUARANTINE_AFTER):
+            capture.breaker.record_failure("0x1", timed_out=True)
+
+        with patch.object(capture, "_probe_window", return_value=True) as probe:
+            capture._ensure_prober()
+            capture._ensure_prober()  # Already running - no second thread
+            prober = capture._prober
+            prober.join(timeout=2.0)
+
+        probe.assert_called_with("0x1")
+        assert not prober.is_alive()
+        assert capture._prober is None
+        assert capture.unresponsive_windows() == set()
+        capture._stop_event.set()
+
+
 class TestGetWindowList:
     """Tests for get_window_list method"""
 
+    def setup_method(self):
+        """Each test queries a fresh shared window snapshot"""
+        from argus_overview.core.window_registry import WindowRegistry
+
+        WindowRegistry.reset_instance()
+
+    def teardown_method(self):
+        from argus_overview.core.window_registry import WindowRegistry
+
+        WindowRegistry.reset_instance()
+
     @patch("argus_overview.core.window_capture_threaded.subprocess.run")
     def test_get_window_list_success(self, mock_subprocess):
         """Test successful window list retrieval"""
@@ -382,9 +661,9 @@ class TestGetWindowList:
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """0x12345 0 hostname Window Title 1
-0x67890 0 hostname Window Title 2
-0xABCDE 0 hostname EVE Online - Character Name"""
+        mock_result.stdout = """0x12345 0 101 0 0 800 600 hostname Window Title 1
+0x67890 0 102 0 0 800 600 hostname Window Title 2
+0xABCDE 0 103 0 0 1920 1080 hostname EVE Online - Character Name"""
         mock_subprocess.return_value = mock_result
 
         capture = WindowCaptureThreaded()
@@ -439,7 +718,7 @@ class TestGetWindowList:
 
     @patch("argus_overview.core.window_capture_threaded.subprocess.run")
     def test_get_window_list_uses_wmctrl(self, mock_subprocess):
-        """Test that window list uses wmctrl command"""
+        """Test that window list uses the registry's wmctrl query"""
         from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
 
         mock_result = MagicMock()
@@ -452,7 +731,7 @@ class TestGetWindowList:
 
         call_args = mock_subprocess.call_args
         cmd = call_args[0][0]
-        assert cmd == ["wmctrl", "-l"]
+        assert cmd == ["wmctrl", "-lpG"]
 
     @patch("argus_overview.core.window_capture_threaded.subprocess.run")
     def test_get_window_list_handles_short_lines(self, mock_subprocess):
@@ -461,9 +740,9 @@ class TestGetWindowList:
 
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = """0x12345 0 hostname Full Window Title
+        mock_result.stdout = """0x12345 0 101 0 0 800 600 hostname Full Window Title
 0x67890 short
-0xABCDE 0 hostname Another Window"""
+0xABCDE 0 102 0 0 800 600 hostname Another Window"""
         mock_subprocess.return_value = mock_result
 
         capture = WindowCaptureThreaded()
@@ -691,7 +970,7 @@ class TestWorkerThread:
         capture._stop_event.clear()  # Set running state
 
         # Queue a task then None to stop
-        capture.capture_queue.put(("0x12345", 1.0, "request_123"))
+        capture.capture_queue.put(("0x12345", 1.0, "request_123", None))
         capture.capture_queue.put(None)
 
         # Run worker
@@ -735,7 +1014,7 @@ class TestWorkerThread:
         # Mock _capture_window_sync to raise an exception
         with patch.object(capture, "_capture_window_sync", side_effect=Exception("Test error")):
             # Queue a task then None to stop
-            capture.capture_queue.put(("0x12345", 1.0, "request_123"))
+            capture.capture_queue.put(("0x12345", 1.0, "request_123", None))
             capture.capture_queue.put(None)
 
             # Run worker
@@ -0,0 +1,303 @@
+"""
+Unit tests for the Window Control module.
+
+Tests cover:
+- EWMH client messages (activate, minimize, move/resize, close)
+- No python-xlib or display: every request reports False for the fallback
+- Key broadcasts in one X batch (keycode/modifier lookup, skew)
+- X errors and a dropped connection
+- Callers skipping xdotool/wmctrl when a message was sent
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from argus_overview.utils.window_control import (
+    MOVERESIZE_HEIGHT,
+    MOVERESIZE_WIDTH,
+    MOVERESIZE_X,
+    MOVERESIZE_Y,
+    SOURCE_PAGER,
+    WindowControl,
+)
+from argus_overview.utils.x11 import XLIB_AVAILABLE, X, XError
+
+ATOMS = {
+    "_NET_ACTIVE_WINDOW": 1,
+    "_NET_MOVERESIZE_WINDOW": 2,
+    "_NET_CLOSE_WINDOW": 3,
+    "WM_CHANGE_STATE": 4,
+    "_NET_FRAME_EXTENTS": 5,
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_control():
+    WindowControl.reset_instance()
+    yield
+    WindowControl.reset_instance()
+
+
+@pytest.fixture
+def display():
+    display = MagicMock()
+    display.intern_atom.side_effect = ATOMS.__getitem__
+    display.create_resource_object.side_effect = lambda _kind, xid: MagicMock(id=xid)
+    with patch("argus_overview.utils.window_control.open_display", return_value=display):
+        yield display
+
+
+def sent(display):
+    """(window id, message type, 5 data longs) of the last client message"""
+    message = display.screen.return_value.root.send_event.call_args[0][0]
+    return message.window.id, message.client_type, list(message.data[1])
+
+
+@pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+class TestClientMessages:
+    """Tests for the EWMH requests"""
+
+    def test_activate(self, display):
+        """_NET_ACTIVE_WINDOW from a pager, sent to the root with the WM masks"""
+        control = WindowControl.get_instance()
+
+        assert control.activate("0x03800003") is True
+
+        assert sent(display) == (0x03800003, 1, [SOURCE_PAGER, 0, 0, 0, 0])
+        mask = display.screen.return_value.root.send_event.call_args[1]["event_mask"]
+        assert mask == X.SubstructureRedirectMask | X.SubstructureNotifyMask
+        display.flush.assert_called()
+        assert control.messages_sent == 1
+
+    def test_minimize_and_restore(self, display):
+        """Minimize asks for IconicState; restore re-activates"""
+        control = WindowControl.get_instance()
+
+        control.minimize("0x1")
+        assert sent(display) == (0x1, 4, [3, 0, 0, 0, 0])
+
+        control.restore("0x1")
+        assert sent(display)[1] == 1
+
+    def test_move_resize(self, display):
+        """Flags say which of x, y, width, height are set"""
+        control = WindowControl.get_instance()
+
+        control.move_resize("0x1", 10, 20, 800, 600)
+        flags = MOVERESIZE_X | MOVERESIZE_Y | MOVERESIZE_WIDTH | MOVERESIZE_HEIGHT
+        assert sent(display) == (0x1, 2, [flags | SOURCE_PAGER << 12, 10, 20, 800, 600])
+
+        control.move_resize("0x1", 30, 40)
+        assert sent(display)[2] == [MOVERESIZE_X | MOVERESIZE_Y | SOURCE_PAGER << 12, 30, 40, 0, 0]
+
+    def test_close(self, display):
+        """_NET_CLOSE_WINDOW like the close button"""
+        WindowControl.get_instance().close("0x1")
+
+        assert sent(display) == (0x1, 3, [0, SOURCE_PAGER, 0, 0, 0])
+
+    def test_connection_reused(self, display):
+        """One connection serves every request"""
+        control = WindowControl.get_instance()
+
+        control.activate("0x1")
+        control.minimize("0x2")
+
+        display.intern_atom.assert_any_call("_NET_ACTIVE_WINDOW")
+        assert display.intern_atom.call_count == len(ATOMS)
+
+    def test_batch_flushes_once(self, display):
+        """Requests inside batch() are written with one flush at the end"""
+        control = WindowControl.get_instance()
+
+        with control.batch():
+            control.minimize("0x1")
+            control.minimize("0x2")
+            display.flush.assert_not_called()
+
+        display.flush.assert_called_once()
+        assert control.messages_sent == 2
+
+    def test_batch_is_per_thread(self, display):
+        """Another thread's request flushes at once while a batch is open"""
+        control = WindowControl.get_instance()
+
+        with control.batch():
+            control.minimize("0x1")
+            thread = threading.Thread(target=control.activate, args=("0x2",))
+            thread.start()
+            thread.join()
+            display.flush.assert_called_once()
+
+        assert display.flush.call_count == 2
+
+    def test_get_geometries(self, display):
+        """Frame origin (client origin minus frame extents) and client size"""
+        root = display.screen.return_value.root
+        root.translate_coords.return_value = MagicMock(x=104, y=128)
+        window = MagicMock()
+        window.get_geometry.return_value = MagicMock(width=1280, height=720)
+        window.get_full_property.return_value = MagicMock(value=[4, 4, 28, 4])
+        display.create_resource_object.side_effect = lambda _kind, xid: window
+
+        geometries = WindowControl.get_instance().get_geometries(["0x1", "not-a-window"])
+
+        assert geometries == {"0x1": (100, 100, 1280, 720)}
+        window.get_full_property.assert_called_with(5, X.AnyPropertyType)
+
+    def test_invalid_window_id(self, display):
+        """Malformed IDs aren't sent"""
+        assert WindowControl.get_instance().activate("not-a-window") is False
+        display.screen.return_value.root.send_event.assert_not_called()
+
+
+@pytest.fixture
+def keyboard(display):
+    """Keymap where F1 is keycode 67, "a"/"A" share keycode 38"""
+    keycodes = {0xFFBE: 67, ord("a"): 38, ord("A"): 38}
+    display.keysym_to_keycode.side_effect = lambda keysym: keycodes.get(keysym, 0)
+    display.keycode_to_keysym.side_effect = lambda keycode, index: {67: 0xFFBE, 38: ord("a")}[
+        keycode
+    ]
+    windows = {}
+
+    def window(_kind, xid):
+        return windows.setdefault(xid, MagicMock(id=xid))
+
+    display.create_resource_object.side_effect = window
+    return windows
+
+
+@pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+class TestKeyBroadcast:
+    """Tests for send_key"""
+
+    def test_one_flush_for_all_windows(self, display, keyboard):
+        """Press and release go to every window, then one flush"""
+        control = WindowControl.get_instance()
+
+        assert control.send_key(["0x1", "0x2", "0x3"], "F1") == 3
+
+        for xid in (1, 2, 3):
+            events = [call[0][0] for call in keyboard[xid].send_event.call_args_list]
+            assert [event.type for event in events] == [X.KeyPress, X.KeyRelease]
+            assert all(event.detail == 67 and event.state == 0 for event in events)
+            assert keyboard[xid].send_event.call_args[1]["propagate"] is True
+        display.flush.assert_called_once()
+        assert control.broadcasts == 1
+        assert control.last_broadcast_skew_ms >= 0
+
+    def test_modifiers_and_shifted_keys(self, display, keyboard):
+        """ctrl+ sets ControlMask; an upper-case letter adds Shift"""
+        control = WindowControl.get_instance()
+
+        control.send_key(["0x1"], "ctrl+a")
+        assert keyboard[1].send_event.call_args[0][0].state == X.ControlMask
+
+        control.send_key(["0x1"], "A")
+        assert keyboard[1].send_event.call_args[0][0].state == X.ShiftMask
+
+    def test_unknown_key_falls_back(self, display, keyboard):
+        """Unknown keys and modifiers send nothing (xdotool handles them)"""
+        control = WindowControl.get_instance()
+
+        assert control.send_key(["0x1"], "NoSuchKey") == 0
+        assert control.send_key(["0x1"], "hyper+F1") == 0
+        assert keyboard == {}
+
+    def test_invalid_ids_skipped(self, display, keyboard):
+        """Malformed IDs are left out of the batch"""
+        assert WindowControl.get_instance().send_key(["0x1", "window", None], "F1") == 1
+        assert list(keyboard) == [1]
+
+    def test_no_display(self):
+        """No display - nothing sent"""
+        with patch("argus_overview.utils.window_control.open_display", return_value=None):
+            assert WindowControl.get_instance().send_key(["0x1"], "F1") == 0
+
+
+@pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+class TestFallback:
+    """Tests for reporting failure so callers fall back"""
+
+    def test_no_display(self):
+        """No display - every request returns False, connecting is tried once"""
+        with patch(
+            "argus_overview.utils.window_control.open_display", return_value=None
+        ) as open_display:
+            control = WindowControl.get_instance()
+            assert control.available is False
+            assert control.activate("0x1") is False
+            assert control.move_resize("0x1", 0, 0, 10, 10) is False
+
+        open_display.assert_called_once()
+
+    def test_x_error(self, display):
+        """An X error fails the request but keeps the connection"""
+        root = display.screen.return_value.root
+        root.send_event.side_effect = XError(MagicMock(), b"\x00" * 32)
+        control = WindowControl.get_instance()
+
+        assert control.close("0x1") is False
+        assert control.error_count == 1
+        display.close.assert_not_called()
+
+    def test_lost_connection_reconnects(self, display):
+        """A broken connection is closed and reopened on the next request"""
+        root = display.screen.return_value.root
+        root.send_event.side_effect = [ConnectionResetError("X server gone"), None]
+        control = WindowControl.get_instance()
+
+        assert control.activate("0x1") is False
+        display.close.assert_called_once()
+
+        assert control.activate("0x1") is True
+
+
+@pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+class TestCallers:
+    """Tests for callers preferring client messages over subprocesses"""
+
+    def test_move_window_skips_xdotool(self, display):
+        """window_utils.move_window sends one message and spawns nothing"""
+        from argus_overview.utils.window_utils import move_window
+
+        with patch("argus_overview.utils.window_utils.subprocess.run") as run:
+            assert move_window("0x1", 0, 0, 800, 600) is True
+
+        run.assert_not_called()
+        assert sent(display)[1] == 2
+
+    def test_capture_system_activate(self, display):
+        """WindowCaptureThreaded.activate_window skips wmctrl"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        with patch("argus_overview.core.window_capture_threaded.subprocess.run") as run:
+            assert WindowCaptureThreaded().activate_window("0x1") is True
+
+        run.assert_not_called()
+
+    def test_broadcast_key_in_one_batch(self, display, keyboard):
+        """WindowCaptureThreaded.broadcast_key spawns no xdotool with X available"""
+        from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+
+        capture = WindowCaptureThreaded()
+        with patch("argus_overview.core.window_capture_threaded.subprocess.run") as run:
+            assert capture.broadcast_key(["0x1", "0x2"], "F1") == 2
+
+        run.assert_not_called()
+        display.flush.assert_called_once()
+        assert capture.last_broadcast_skew_ms == WindowControl.get_instance().last_broadcast_skew_ms
+
+    def test_falls_back_without_display(self):
+        """No display - xdotool as before"""
+        from argus_overview.utils.window_utils import activate_window
+
+        with patch("argus_overview.utils.window_control.open_display", return_value=None), patch(
+            "argus_overview.utils.window_utils.subprocess.run"
+        ) as run:
+            assert activate_window("0x1") is True
+
+        assert run.call_args[0][0] == ["xdotool", "windowactivate", "--sync", "0x1"]
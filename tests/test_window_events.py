@@ -0,0 +1,473 @@
+"""
+Unit tests for the Window Events module.
+
+Tests cover:
+- Client list reads and title lookups over a mocked X display
+- PropertyNotify handling (client list, _NET_WM_NAME / WM_NAME, unrelated events)
+- Vanished windows
+- Start/stop without python-xlib, a display or an EWMH window manager
+- Missing event hooks rejected on construction
+- The event thread sleeping until woken
+- Active window tracking from _NET_ACTIVE_WINDOW
+- Registry map state from Map/UnmapNotify and _NET_WM_STATE_HIDDEN
+- Monitor cache invalidation from RandR screen changes
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from argus_overview.core.window_events import (
+    ActiveWindowWatcher,
+    ClientListWatcher,
+    ScreenChangeWatcher,
+)
+from argus_overview.core.window_registry import WindowRegistry
+from argus_overview.utils.screen import MonitorCache, ScreenGeometry
+from argus_overview.utils.x11 import XLIB_AVAILABLE, X, XError, randr
+
+pytestmark = pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+
+ATOMS = {
+    "_NET_CLIENT_LIST": 1,
+    "_NET_WM_NAME": 2,
+    "WM_NAME": 3,
+    "UTF8_STRING": 4,
+    "_NET_ACTIVE_WINDOW": 5,
+    "_NET_WM_STATE": 6,
+    "_NET_WM_STATE_HIDDEN": 7,
+}
+ROOT_ID = 0x100
+
+
+class FakeX:
+    """Mocked Display with a mutable client list, titles and event queue"""
+
+    def __init__(self, clients, titles):
+        self.clients = list(clients)
+        self.titles = dict(titles)
+        self.queue = []
+        self.vanished = set()
+        self.unmapped = set()
+        self.hidden = set()
+
+        self.display = MagicMock()
+        self.display.intern_atom.side_effect = ATOMS.__getitem__
+        self.display.pending_events.side_effect = lambda: len(self.queue)
+        self.display.next_event.side_effect = lambda: self.queue.pop(0)
+        self.display.create_resource_object.side_effect = self._window
+        self.root = self.display.screen.return_value.root
+        self.root.id = ROOT_ID
+        self.root.get_full_property.side_effect = lambda atom, _type: MagicMock(
+            value=list(self.clients)
+        )
+
+    def _window(self, _kind, xid):
+        window = MagicMock()
+        window.id = xid
+
+        def get_property(atom, _type):
+            if xid in self.vanished:
+                raise XError(MagicMock(), b"\x00" * 32)  # BadWindow
+            if atom == ATOMS["_NET_WM_NAME"] and xid in self.titles:
+                return MagicMock(value=self.titles[xid].encode())
+            if atom == ATOMS["_NET_WM_STATE"]:
+                return MagicMock(
+                    value=[ATOMS["_NET_WM_STATE_HIDDEN"]] if xid in self.hidden else []
+                )
+            return None
+
+        window.get_full_property.side_effect = get_property
+        window.get_attributes.return_value.map_state = (
+            X.IsUnmapped if xid in self.unmapped else X.IsViewable
+        )
+        return window
+
+    def property_notify(self, xid, atom):
+        self.queue.append(
+            MagicMock(type=X.PropertyNotify, window=self._window("window", xid), atom=atom)
+        )
+
+    def map_notify(self, xid, mapped):
+        event_type = X.MapNotify if mapped else X.UnmapNotify
+        self.queue.append(MagicMock(type=event_type, window=MagicMock(id=xid)))
+
+
+def attach(watcher, fake):
+    """Wire a watcher to a fake display without starting its thread"""
+    watcher._display = fake.display
+    watcher._root = fake.root
+    watcher._atoms = dict(ATOMS)
+    watcher.refresh_client_list()
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """QApplication for queued cross-thread signals"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    WindowRegistry.reset_instance()
+    yield
+    WindowRegistry.reset_instance()
+
+
+@pytest.fixture
+def fake():
+    return FakeX([0x1, 0x2], {0x1: "EVE - Pilot One", 0x2: "Firefox"})
+
+
+@pytest.fixture
+def watcher(fake):
+    watcher = ClientListWatcher()
+    attach(watcher, fake)
+    return watcher
+
+
+class TestClientList:
+    """Tests for client list and title reads"""
+
+    def test_initial_windows(self, watcher):
+        """Clients are listed in client-list order with their titles"""
+        assert watcher.windows() == [("0x00000001", "EVE - Pilot One"), ("0x00000002", "Firefox")]
+
+    def test_wm_name_fallback(self, fake):
+        """WM_NAME is used when _NET_WM_NAME is missing"""
+        watcher = ClientListWatcher()
+        attach(watcher, fake)
+        window = MagicMock()
+        window.get_full_property.side_effect = lambda atom, _type: (
+            MagicMock(value="EVE - Legacy") if atom == ATOMS["WM_NAME"] else None
+        )
+
+        assert watcher._read_title(window) == "EVE - Legacy"
+
+    def test_vanished_window_skipped(self, fake):
+        """A client closed between the list read and the title lookup is skipped"""
+        fake.vanished.add(0x2)
+        watcher = ClientListWatcher()
+
+        attach(watcher, fake)
+
+        assert watcher.windows() == [("0x00000001", "EVE - Pilot One")]
+        assert watcher.error_count == 1
+
+
+class TestEvents:
+    """Tests for PropertyNotify handling"""
+
+    def test_new_client_emitted(self, watcher, fake):
+        """A client-list change emits the new list once"""
+        changed = MagicMock()
+        watcher.windows_changed.connect(changed)
+        fake.clients.append(0x3)
+        fake.titles[0x3] = "EVE - Pilot Three"
+        fake.property_notify(ROOT_ID, ATOMS["_NET_CLIENT_LIST"])
+        fake.property_notify(ROOT_ID, ATOMS["_NET_CLIENT_LIST"])
+
+        assert watcher.process_pending() is True
+
+        changed.assert_called_once()
+        assert ("0x00000003", "EVE - Pilot Three") in changed.call_args[0][0]
+        assert watcher.events_handled == 2
+
+    def test_closed_client_emitted(self, watcher, fake):
+        """Removed clients drop out of the list"""
+        fake.clients.remove(0x1)
+        fake.property_notify(ROOT_ID, ATOMS["_NET_CLIENT_LIST"])
+
+        assert watcher.process_pending() is True
+        assert watcher.windows() == [("0x00000002", "Firefox")]
+
+    def test_title_change(self, watcher, fake):
+        """A renamed client (character selected) is re-read"""
+        fake.titles[0x2] = "EVE - Pilot Two"
+        fake.property_notify(0x2, ATOMS["_NET_WM_NAME"])
+
+        assert watcher.process_pending() is True
+        assert ("0x00000002", "EVE - Pilot Two") in watcher.windows()
+
+    def test_unchanged_and_unrelated_events(self, watcher, fake):
+        """Same title, other atoms, untracked windows and other event types change nothing"""
+        changed = MagicMock()
+        watcher.windows_changed.connect(changed)
+        fake.property_notify(0x1, ATOMS["_NET_WM_NAME"])
+        fake.property_notify(0x1, 99)
+        fake.property_notify(0x9, ATOMS["WM_NAME"])
+        fake.queue.append(MagicMock(type=X.ConfigureNotify))
+
+        assert watcher.process_pending() is False
+        changed.assert_not_called()
+
+
+class TestStartStop:
+    """Tests for starting and stopping the watcher"""
+
+    def test_missing_hook_fails_on_construction(self):
+        """A watcher without every event hook can't be built"""
+        from argus_overview.core.window_events import _RootPropertyWatcher
+
+        class Incomplete(_RootPropertyWatcher):
+            def _setup(self):
+                return True
+
+            def _handle_event(self, event):
+                return False
+
+        with pytest.raises(TypeError, match="_emit_changed"):
+            Incomplete()
+
+    def test_start_without_xlib(self):
+        """No python-xlib - not started"""
+        with patch("argus_overview.core.window_events.XLIB_AVAILABLE", False):
+            assert ClientListWatcher().start() is False
+
+    def test_start_without_display(self):
+        """No display - not started"""
+        with patch("argus_overview.core.window_events.open_display", return_value=None):
+            assert ClientListWatcher().start() is False
+
+    def test_start_without_ewmh(self, fake):
+        """No _NET_CLIENT_LIST on the root - not started"""
+        fake.root.get_full_property.side_effect = None
+        fake.root.get_full_property.return_value = None
+
+        with patch("argus_overview.core.window_events.open_display", return_value=fake.display):
+            watcher = ClientListWatcher()
+            assert watcher.start() is False
+
+        fake.display.close.assert_called_once()
+
+    def test_thread_sleeps_until_stopped(self, fake):
+        """Idle watcher doesn't wake up; stop() wakes and joins it"""
+        read_fd, write_fd = os.pipe()
+        fake.display.fileno.return_value = read_fd
+
+        with patch("argus_overview.core.window_events.open_display", return_value=fake.display):
+            watcher = ClientListWatcher()
+            assert watcher.start() is True
+
+        fake.root.change_attributes.assert_called_once_with(event_mask=X.PropertyChangeMask)
+        assert len(watcher.windows()) == 2
+        time.sleep(0.05)
+        assert watcher.wakeups == 0
+
+        watcher.stop()
+
+        assert watcher.running is False
+        assert watcher._thread is None
+        fake.display.close.assert_called_once()
+        os.close(read_fd)
+        os.close(write_fd)
+
+    def test_lost_connection_emits(self, fake, qapp):
+        """An X connection failure stops the thread and asks for a fallback"""
+        read_fd, write_fd = os.pipe()
+        fake.display.fileno.return_value = read_fd
+        lost = MagicMock()
+
+        with patch("argus_overview.core.window_events.open_display", return_value=fake.display):
+            watcher = ClientListWatcher()
+            watcher.watch_lost.connect(lost)
+            watcher.start()
+        fake.display.pending_events.side_effect = ConnectionError("X server gone")
+        os.write(write_fd, b"\0")  # Wake the select on the "X socket"
+
+        watcher._thread.join(timeout=1.0)
+        qapp.processEvents()
+
+        assert watcher.running is False
+        lost.assert_called_once()
+        watcher.stop()
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+class TestActiveWindow:
+    """Tests for _NET_ACTIVE_WINDOW tracking"""
+
+    @pytest.fixture
+    def active(self, fake):
+        fake.active = [0x1]
+        fake.root.get_full_property.side_effect = lambda atom, _type: (
+            MagicMock(value=list(fake.active)) if atom == ATOMS["_NET_ACTIVE_WINDOW"] else None
+        )
+        watcher = ActiveWindowWatcher()
+        watcher._display = fake.display
+        watcher._root = fake.root
+        watcher._atoms = dict(ATOMS)
+        assert watcher._setup() is True
+        return watcher
+
+    def test_initial_active_window(self, active):
+        """The active window is read when tracking starts"""
+        assert active.active_window() == "0x00000001"
+
+    def test_focus_change_emitted(self, active, fake):
+        """A focus change emits the new window once"""
+        changed = MagicMock()
+        active.active_changed.connect(changed)
+        fake.active = [0x2]
+        fake.property_notify(ROOT_ID, ATOMS["_NET_ACTIVE_WINDOW"])
+
+        assert active.process_pending() is True
+
+        changed.assert_called_once_with("0x00000002")
+
+    def test_nothing_active(self, active, fake):
+        """Window 0 (desktop focused) reports no active window"""
+        changed = MagicMock()
+        active.active_changed.connect(changed)
+        fake.active = [0]
+        fake.property_notify(ROOT_ID, ATOMS["_NET_ACTIVE_WINDOW"])
+
+        active.process_pending()
+
+        assert active.active_window() is None
+        changed.assert_called_once_with("")
+
+    def test_unrelated_events_ignored(self, active, fake):
+        """Same window, other root atoms and client properties change nothing"""
+        fake.property_notify(ROOT_ID, ATOMS["_NET_ACTIVE_WINDOW"])
+        fake.property_notify(ROOT_ID, ATOMS["_NET_CLIENT_LIST"])
+        fake.property_notify(0x2, ATOMS["_NET_ACTIVE_WINDOW"])
+
+        assert active.process_pending() is False
+        assert active.events_handled == 3
+
+    def test_start_without_active_window_support(self, fake):
+        """No _NET_ACTIVE_WINDOW on the root - not started"""
+        fake.root.get_full_property.side_effect = None
+        fake.root.get_full_property.return_value = None
+
+        with patch("argus_overview.core.window_events.open_display", return_value=fake.display):
+            assert ActiveWindowWatcher().start() is False
+
+        fake.display.close.assert_called_once()
+
+
+class TestMapState:
+    """Tests for the client watcher keeping the registry's map state current"""
+
+    @pytest.fixture
+    def tracked(self, fake):
+        fake.unmapped.add(0x2)
+        watcher = ClientListWatcher()
+        attach(watcher, fake)
+        return watcher
+
+    def test_initial_state(self, tracked, fake):
+        """Every client is subscribed to and read once when the list is read"""
+        assert WindowRegistry.get_instance().minimized() == {"0x00000002"}
+        assert fake.display.create_resource_object.call_count == 2
+
+    def test_map_events(self, tracked, fake):
+        """Map/UnmapNotify update the registry without emitting a client-list change"""
+        changed = MagicMock()
+        tracked.windows_changed.connect(changed)
+        fake.map_notify(0x1, mapped=False)
+        fake.map_notify(0x2, mapped=True)
+
+        assert tracked.process_pending() is False
+
+        changed.assert_not_called()
+        assert WindowRegistry.get_instance().minimized() == {"0x00000001"}
+
+    def test_hidden_state(self, tracked, fake):
+        """_NET_WM_STATE_HIDDEN on a mapped client counts as minimized"""
+        fake.hidden.add(0x1)
+        fake.property_notify(0x1, ATOMS["_NET_WM_STATE"])
+
+        tracked.process_pending()
+
+        assert WindowRegistry.get_instance().minimized() == {"0x00000001", "0x00000002"}
+
+    def test_new_and_closed_clients(self, tracked, fake):
+        """Only clients new to the list are read; closed ones are dropped"""
+        fake.clients = [0x1, 0x3]
+        fake.hidden.add(0x3)
+        fake.display.create_resource_object.reset_mock()
+        fake.property_notify(ROOT_ID, ATOMS["_NET_CLIENT_LIST"])
+
+        assert tracked.process_pending() is True
+
+        assert WindowRegistry.get_instance().minimized() == {"0x00000003"}
+        fake.display.create_resource_object.assert_called_once_with("window", 0x3)
+
+    def test_untracked_windows_ignored(self, tracked, fake):
+        """Map events for windows outside the client list change nothing"""
+        fake.map_notify(0x9, mapped=False)
+
+        tracked.process_pending()
+
+        assert WindowRegistry.get_instance().client_states() == {
+            "0x00000001": (True, False),
+            "0x00000002": (False, False),
+        }
+
+    def test_stop_clears_registry(self, tracked):
+        """A stopped watcher can't follow map state, so nothing stays minimized"""
+        tracked.stop()
+
+        assert WindowRegistry.get_instance().minimized() == set()
+
+
+class TestScreenChange:
+    """Tests for RandR screen-change tracking"""
+
+    RANDR_EVENT_BASE = 89
+
+    @pytest.fixture
+    def screens(self, fake):
+        fake.display.query_extension.return_value = MagicMock(first_event=self.RANDR_EVENT_BASE)
+        watcher = ScreenChangeWatcher()
+        watcher._display = fake.display
+        watcher._root = fake.root
+        assert watcher._setup() is True
+        return watcher
+
+    def test_selects_randr_events(self, screens, fake):
+        """Screen, CRTC and output changes are selected on the root"""
+        mask = fake.root.xrandr_select_input.call_args[0][0]
+
+        assert mask & randr.RRScreenChangeNotifyMask
+        assert mask & randr.RRCrtcChangeNotifyMask
+        assert mask & randr.RROutputChangeNotifyMask
+
+    def test_screen_change_invalidates_cache(self, screens, fake):
+        """A RandR event expires the monitor cache and emits once per batch"""
+        cache = MonitorCache.get_instance()
+        cache._monitors = [ScreenGeometry(0, 0, 1920, 1080, True)]
+        changed = MagicMock()
+        screens.screens_changed.connect(changed)
+        fake.queue.append(MagicMock(type=self.RANDR_EVENT_BASE + randr.RRScreenChangeNotify))
+        fake.queue.append(MagicMock(type=self.RANDR_EVENT_BASE + randr.RRNotify))
+
+        assert screens.process_pending() is True
+
+        assert cache._monitors is None
+        changed.assert_called_once_with()
+
+    def test_property_events_ignored(self, screens, fake):
+        """PropertyNotify on the root isn't a screen change"""
+        fake.property_notify(ROOT_ID, ATOMS["_NET_ACTIVE_WINDOW"])
+
+        assert screens.process_pending() is False
+
+    def test_start_without_randr(self, fake):
+        """No RandR on the server - not started, root events not selected"""
+        fake.display.query_extension.return_value = None
+
+        with patch("argus_overview.core.window_events.open_display", return_value=fake.display):
+            assert ScreenChangeWatcher().start() is False
+
+        fake.root.change_attributes.assert_not_called()
+        fake.display.close.assert_called_once()
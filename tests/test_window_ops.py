@@ -0,0 +1,125 @@
+"""
+Unit tests for the Bulk Window Operations module.
+
+Tests cover:
+- Per-window results, errors counted as failures
+- Bounded thread pool when there's no X connection
+- One X flush for the whole set when there is
+- Running off the caller's thread and reporting through operation_finished
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from argus_overview.core.window_ops import BulkWindowOps
+from argus_overview.utils.window_control import WindowControl
+from argus_overview.utils.x11 import XLIB_AVAILABLE
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create QApplication so queued signals from the worker get delivered."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture(autouse=True)
+def no_display():
+    """Default to the pool path; tests wire a display when they need one"""
+    WindowControl.reset_instance()
+    with patch("argus_overview.utils.window_control.open_display", return_value=None):
+        yield
+    WindowControl.reset_instance()
+
+
+class TestExecute:
+    """Tests for execute()"""
+
+    def test_results_per_window(self):
+        """Results keep window order; exceptions count as failures"""
+
+        def operation(window_id):
+            if window_id == "0x3":
+                raise RuntimeError("xdotool missing")
+            return window_id != "0x2"
+
+        results = BulkWindowOps().execute(["0x1", "0x2", "0x3"], operation)
+
+        assert results == {"0x1": True, "0x2": False, "0x3": False}
+
+    def test_empty(self):
+        """No windows - nothing to do"""
+        operation = MagicMock()
+
+        assert BulkWindowOps().execute([], operation) == {}
+        operation.assert_not_called()
+
+    def test_pool_overlaps_slow_calls(self):
+        """Without X, blocking calls run concurrently on a bounded pool"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow(window_id):
+            with lock:
+                active.append(window_id)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(window_id)
+            return True
+
+        window_ids = [f"0x{i}" for i in range(12)]
+        start = time.perf_counter()
+        results = BulkWindowOps().execute(window_ids, slow)
+
+        assert all(results.values())
+        assert max(peak) == BulkWindowOps.MAX_WORKERS
+        assert time.perf_counter() - start < 12 * 0.02
+
+    @pytest.mark.skipif(not XLIB_AVAILABLE, reason="python-xlib not installed")
+    def test_one_flush_with_window_control(self):
+        """With an X connection every EWMH request goes out in one flush"""
+        display = MagicMock()
+        WindowControl.reset_instance()
+        with patch("argus_overview.utils.window_control.open_display", return_value=display):
+            control = WindowControl.get_instance()
+            results = BulkWindowOps().execute(["0x1", "0x2", "0x3"], control.minimize)
+
+        assert results == {"0x1": True, "0x2": True, "0x3": True}
+        assert display.screen.return_value.root.send_event.call_count == 3
+        display.flush.assert_called_once()
+
+
+class TestRun:
+    """Tests for run() and operation_finished"""
+
+    def test_runs_in_background_and_reports(self, qapp):
+        """run() returns immediately; results arrive through the signal"""
+        ops = BulkWindowOps()
+        finished = MagicMock()
+        ops.operation_finished.connect(finished)
+        release = threading.Event()
+        callers = set()
+
+        def operation(window_id):
+            callers.add(threading.current_thread())
+            release.wait(1.0)
+            return True
+
+        ops.run("minimize_all", ["0x1", "0x2"], operation)
+        finished.assert_not_called()
+
+        release.set()
+        assert ops.wait()
+        qapp.processEvents()
+
+        finished.assert_called_once_with("minimize_all", {"0x1": True, "0x2": True})
+        assert threading.current_thread() not in callers
+        assert ops.operations_run == 1
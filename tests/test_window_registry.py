@@ -0,0 +1,170 @@
+"""
+Unit tests for the Window Registry module.
+
+Tests cover:
+- wmctrl -lpG parsing (desktop, pid, geometry, character)
+- Snapshot sharing within max_age and invalidation
+- Generation counter on added/removed/changed windows
+- Failed queries keeping the last snapshot
+- The client map-state table
+- Consumers reading through the registry
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from argus_overview.core.discovery import AutoDiscovery, scan_eve_windows
+from argus_overview.core.window_capture_threaded import WindowCaptureThreaded
+from argus_overview.core.window_registry import (
+    WindowInfo,
+    WindowRegistry,
+    character_from_title,
+)
+
+WMCTRL = (
+    "0x03800003  0 4101 0    0    1920 1080 host EVE - Pilot One\n"
+    "0x03a00003 -1 4202 1920 0    1280 720  host EVE - Pilot Two\n"
+    "0x01200007  1 999  10   20   800  600  host Firefox\n"
+)
+
+
+def wmctrl(stdout, returncode=0):
+    return patch(
+        "argus_overview.core.window_registry.subprocess.run",
+        return_value=MagicMock(returncode=returncode, stdout=stdout),
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    WindowRegistry.reset_instance()
+    yield
+    WindowRegistry.reset_instance()
+
+
+@pytest.fixture
+def registry():
+    return WindowRegistry.get_instance()
+
+
+class TestParsing:
+    """Tests for the wmctrl -lpG snapshot"""
+
+    def test_fields(self, registry):
+        """Every field comes from the one query"""
+        with wmctrl(WMCTRL) as run:
+            windows = registry.snapshot()
+
+        run.assert_called_once()
+        assert run.call_args[0][0] == ["wmctrl", "-lpG"]
+        assert windows[1] == WindowInfo(
+            window_id="0x03a00003",
+            title="EVE - Pilot Two",
+            character="Pilot Two",
+            desktop=-1,
+            geometry=(1920, 0, 1280, 720),
+            pid=4202,
+        )
+        assert windows[2].character is None
+        assert [info.window_id for info in registry.eve_windows()] == ["0x03800003", "0x03a00003"]
+
+    def test_malformed_lines_skipped(self, registry):
+        """Short lines and non-numeric fields are ignored"""
+        with wmctrl("0x1 short\n0x2  0 x 0 0 1 1 host Bad\n\n" + WMCTRL):
+            assert len(registry.snapshot()) == 3
+
+    def test_character_from_title(self):
+        """Both EVE title forms; empty names don't count"""
+        assert character_from_title("EVE Online - Pilot") == "Pilot"
+        assert character_from_title("EVE -  ") is None
+        assert character_from_title("Terminal") is None
+
+
+class TestSnapshot:
+    """Tests for sharing, invalidation and the generation counter"""
+
+    def test_consumers_share_one_query(self, registry):
+        """Discovery, import and the window list within max_age run one query"""
+        with wmctrl(WMCTRL) as run:
+            AutoDiscovery()._get_eve_windows()
+            imported = scan_eve_windows()
+            listed = WindowCaptureThreaded().get_window_list()
+
+        run.assert_called_once()
+        assert registry.queries == 1
+        assert imported[0] == ("0x03800003", "EVE - Pilot One", "Pilot One")
+        assert len(listed) == 3
+
+    def test_stale_snapshot_requeried(self, registry):
+        """max_age=0 and invalidate() both force a new query"""
+        with wmctrl(WMCTRL) as run:
+            registry.snapshot()
+            registry.snapshot(max_age=0)
+            registry.invalidate()
+            registry.snapshot()
+
+        assert run.call_count == 3
+
+    def test_diff_and_generation(self, registry):
+        """Only real changes bump the generation"""
+        with wmctrl(WMCTRL):
+            assert registry.refresh() is True
+        assert registry.generation == 1
+
+        with wmctrl(WMCTRL):
+            assert registry.refresh() is False
+        restacked = "\n".join(reversed(WMCTRL.strip().split("\n")))
+        with wmctrl(restacked):
+            assert registry.refresh() is False
+        assert registry.generation == 1
+
+        moved = WMCTRL.replace("1920 0    1280", "0    0    1280")
+        with wmctrl(moved.replace("host Firefox", "host EVE - Pilot Three")):
+            assert registry.refresh() is True
+        assert registry.generation == 2
+        assert registry.get("0x03a00003").geometry == (0, 0, 1280, 720)
+        assert registry.get("0x01200007").character == "Pilot Three"
+
+        with wmctrl(WMCTRL.split("\n", 1)[1]):
+            assert registry.refresh() is True
+        assert registry.generation == 3
+        assert registry.get("0x03800003") is None
+
+    def test_failure_keeps_snapshot(self, registry):
+        """A failed or timed-out query leaves the last good snapshot"""
+        with wmctrl(WMCTRL):
+            registry.refresh()
+
+        with wmctrl("", returncode=1):
+            assert registry.snapshot(max_age=0) != []
+        with patch(
+            "argus_overview.core.window_registry.subprocess.run",
+            side_effect=OSError("wmctrl not found"),
+        ):
+            assert len(registry.snapshot(max_age=0)) == 3
+
+        assert registry.query_failures == 2
+        assert registry.generation == 1
+
+
+class TestClientStates:
+    """Tests for the map-state table written by the client watcher"""
+
+    def test_minimized_from_table(self, registry):
+        """Unmapped or hidden clients count as minimized"""
+        registry.set_client_states(
+            {"0x1": (True, False), "0x2": (False, False), "0x3": (True, True)}
+        )
+
+        assert registry.minimized() == {"0x2", "0x3"}
+
+    def test_update_reports_minimized_changes(self, registry):
+        """Updates return True only when a client becomes or stops being minimized"""
+        registry.set_client_states({"0x1": (True, False)})
+
+        assert registry.update_client_state("0x1", hidden=True) is True
+        assert registry.update_client_state("0x1", mapped=False) is False
+        assert registry.update_client_state("0x1", mapped=True, hidden=False) is True
+        assert registry.update_client_state("0x9", mapped=False) is False
+        assert registry.client_states() == {"0x1": (True, False)}